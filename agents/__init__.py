@@ -1,3 +1,4 @@
-from agents.workflow import main_workflow
+from agents.lazy_import import lazy_exports
 
 __all__ = ["main_workflow"]
+__getattr__, __dir__ = lazy_exports(globals(), {"main_workflow": "agents.workflow"})
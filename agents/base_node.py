@@ -1,13 +1,59 @@
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import run_in_executor
+from langgraph.config import get_stream_writer
 
-class BaseNode(ABC):
+from agents.coalesce import SingleFlight, normalize_key
+from agents.hedging import HedgePolicy
+from agents.metrics import track_node
+
+
+def _stream_writer():
+    """
+    현재 그래프 실행의 사용자 정의 스트림 writer를 반환합니다.
+
+    그래프 밖에서 노드를 직접 호출한 경우에는 아무 일도 하지 않는 함수를 반환합니다.
+    """
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return lambda chunk: None
+
+
+class BaseNode(Runnable[dict, dict], ABC):
     """
     모든 노드의 기본 클래스입니다. LangGraph Workflow에서 사용되는 노드의 기본 구조를 정의합니다.
 
     이 추상 클래스는 모든 노드가 구현해야 하는 기본 메서드와 속성을 정의합니다.
     노드는 LangGraph의 상태 그래프에서 작업을 수행하는 개별 단위입니다.
 
+    BaseNode는 LangChain Runnable이므로 LangGraph가 실행 방식에 맞는 경로를 자동으로 선택합니다.
+    - invoke / stream 실행 시: execute() 호출
+    - ainvoke / astream 실행 시: aexecute() 코루틴 호출
+
+    aexecute()를 구현하지 않은 노드는 기존처럼 execute()를 스레드 풀에서 실행합니다.
+    LLM 호출처럼 I/O 대기가 긴 노드는 aexecute()에서 `chain.ainvoke`를 사용하도록 구현하면
+    많은 그래프 실행이 하나의 이벤트 루프를 공유할 수 있습니다.
+
+    LLM 체인을 실행하는 노드는 stream_chain() / astream_chain()을 사용하면 토큰 단위 스트리밍을
+    지원합니다. 생성된 조각은 LangGraph `stream_mode="custom"`으로 즉시 전달되고
+    (`stream_mode="messages"`에서는 LLM 토큰이 전달됨), 반환값은 전체 텍스트입니다.
+
+    노드 클래스에 coalesce(SingleFlight)를 지정하면, stream_chain() / astream_chain()에서
+    입력이 같은 동시 호출은 진행 중인 하나의 체인 호출 결과를 공유합니다. (agents.coalesce 참고)
+    결과를 공유받은 호출은 전체 텍스트를 하나의 스트림 조각으로 전달받습니다.
+    hedge(HedgePolicy)를 지정하면 첫 조각이 늦은 체인 호출에 추가 요청을 보냅니다. (agents.hedging 참고)
+
+    LLM 체인을 실행하는 노드는 build_chain(model)을 구현하면, 상태의 model_route(조건부 에지에서
+    agents.model_router가 결정한 모델 등급)에 맞는 체인을 routed_chain()으로 가져올 수 있습니다.
+    track_route()로 호출을 감싸면 등급별 지연 시간이 기록됩니다.
+
+    모든 노드 실행은 agents.metrics.track_node()로 감싸져, (workflow, node) 라벨별로
+    실행 시간, 오류 수, 노드 내부 LLM 호출의 시간과 토큰 수가 자동으로 기록됩니다.
+
     예시:
     ```python
     class MyCustomNode(BaseNode):
@@ -19,9 +65,18 @@ class BaseNode(ABC):
             # 상태를 처리하는 로직
             result = process_state(state)
             return {"output_key": result}
+
+        async def aexecute(self, state) -> dict:
+            # 비동기 실행 로직 (선택 사항)
+            result = await aprocess_state(state)
+            return {"output_key": result}
     ```
     """
 
+    # 동일 입력 체인 호출 병합 (기본값: 사용 안 함)
+    coalesce: SingleFlight | None = None
+    hedge: HedgePolicy | None = None  # 느린 체인 호출 헤징 (기본값: 사용 안 함)
+
     def __init__(self, **kwargs):
         """
         노드 초기화 메서드
@@ -29,9 +84,12 @@ class BaseNode(ABC):
         Args:
             **kwargs: 키워드 인자
                 - verbose (bool): 로깅 활성화 여부 (기본값: False)
+                - workflow (str): 메트릭 라벨에 사용할 Workflow 이름
+                  (기본값: None, Workflow 빌드 시 자동 설정)
         """
         self.name = self.__class__.__name__  # 노드 이름은 클래스 이름으로 자동 설정
         self.verbose = kwargs.get("verbose", False)  # 상세 로깅 활성화 여부
+        self.workflow = kwargs.get("workflow")  # 노드가 속한 Workflow 이름
 
     @abstractmethod
     def execute(self, state) -> dict:
@@ -46,7 +104,159 @@ class BaseNode(ABC):
         Returns:
             dict: 업데이트된 상태 값을 포함하는 딕셔너리
         """
-        pass
+
+    async def aexecute(self, state) -> dict:
+        """
+        노드의 비동기 실행 로직을 구현하는 메서드
+
+        기본 구현은 execute()를 스레드 풀에서 실행합니다.
+        비동기 I/O를 사용하는 노드는 이 메서드를 재정의하세요.
+
+        Args:
+            state: 현재 그래프 상태 객체
+
+        Returns:
+            dict: 업데이트된 상태 값을 포함하는 딕셔너리
+        """
+        return await run_in_executor(None, self.execute, state)
+
+    def build_chain(self, model=None):
+        """
+        노드에서 사용할 체인을 생성합니다. LLM 체인을 실행하는 노드에서 재정의합니다.
+
+        Args:
+            model: 체인에서 사용할 채팅 모델 (None이면 체인 모듈의 기본 모델)
+
+        Returns:
+            RunnableSerializable: 실행 가능한 체인 객체
+        """
+        raise NotImplementedError(f"{self.name}은(는) 체인을 사용하지 않습니다.")
+
+    def routed_chain(self, state):
+        """
+        상태의 model_route에 맞는 체인을 반환합니다.
+
+        라우팅 결정이 없으면 self.chain을 반환합니다.
+        등급별 체인은 (모델, 생성 토큰 상한) 조합마다 처음 사용할 때 한 번만 생성합니다.
+
+        Args:
+            state: 현재 그래프 상태 객체
+
+        Returns:
+            RunnableSerializable: 실행할 체인
+        """
+        route = state.get("model_route")
+        if not route:
+            return self.chain
+        key = (route["model"], route["max_tokens"])
+        chains = self.__dict__.setdefault("_routed_chains", {})
+        chain = chains.get(key)
+        if chain is None:
+            from agents.model_router import ROUTER
+
+            chain = chains.setdefault(key, self.build_chain(ROUTER.chat_model(route)))
+        return chain
+
+    @contextmanager
+    def track_route(self, state):
+        """
+        with 블록(라우팅된 체인 호출)의 지연 시간을 모델 등급별로 기록합니다.
+
+        Args:
+            state: 현재 그래프 상태 객체 (model_route가 없으면 기록하지 않음)
+        """
+        route = state.get("model_route")
+        started = time.perf_counter()
+        yield
+        if route:
+            from agents.model_router import ROUTER
+
+            ROUTER.record_outcome(
+                self.workflow or "", route, time.perf_counter() - started
+            )
+
+    def write_chunk(self, chunk: str) -> None:
+        """
+        텍스트를 사용자 정의 스트림 이벤트 `{"node": 노드 이름, "chunk": 텍스트}`로 전달합니다.
+
+        Args:
+            chunk: 전달할 텍스트
+        """
+        _stream_writer()({"node": self.name, "chunk": chunk})
+
+    def stream_chain(self, chain, chain_input, emit: bool = True) -> str:
+        """
+        체인을 스트리밍 방식으로 실행하고, 생성된 조각을 사용자 정의 스트림 이벤트로 전달합니다.
+
+        각 조각은 `{"node": 노드 이름, "chunk": 텍스트 조각}` 형태로 전달됩니다.
+
+        Args:
+            chain: 문자열 조각을 생성하는 체인 (예: ... | StrOutputParser())
+            chain_input: 체인 입력
+            emit: False이면 조각을 전달하지 않음 (출력을 검증한 뒤 write_chunk()로 전달하는 경우)
+
+        Returns:
+            str: 모든 조각을 이어 붙인 전체 텍스트
+        """
+        writer = _stream_writer() if emit else lambda chunk: None
+        streamed = False  # 이 호출에서 체인을 직접 실행했는지 여부
+
+        def run() -> str:
+            nonlocal streamed
+            streamed = True
+            chunks = []
+            if self.hedge is None:
+                stream = chain.stream(chain_input)
+            else:
+                stream = self.hedge.stream(lambda: chain.stream(chain_input))
+            for chunk in stream:
+                chunks.append(chunk)
+                writer({"node": self.name, "chunk": chunk})
+            return "".join(chunks)
+
+        if self.coalesce is None:
+            return run()
+        text = self.coalesce.do((id(chain), normalize_key(chain_input)), run)
+        if not streamed:
+            # 다른 호출의 결과를 공유받은 경우 조각 대신 전체 텍스트를 한 번에 전달
+            writer({"node": self.name, "chunk": text})
+        return text
+
+    async def astream_chain(self, chain, chain_input, emit: bool = True) -> str:
+        """
+        stream_chain()의 비동기 버전입니다.
+
+        Args:
+            chain: 문자열 조각을 생성하는 체인 (예: ... | StrOutputParser())
+            chain_input: 체인 입력
+            emit: False이면 조각을 전달하지 않음
+
+        Returns:
+            str: 모든 조각을 이어 붙인 전체 텍스트
+        """
+        writer = _stream_writer() if emit else lambda chunk: None
+        streamed = False  # 이 호출에서 체인을 직접 실행했는지 여부
+
+        async def run() -> str:
+            nonlocal streamed
+            streamed = True
+            chunks = []
+            if self.hedge is None:
+                stream = chain.astream(chain_input)
+            else:
+                stream = self.hedge.astream(lambda: chain.astream(chain_input))
+            async for chunk in stream:
+                chunks.append(chunk)
+                writer({"node": self.name, "chunk": chunk})
+            return "".join(chunks)
+
+        if self.coalesce is None:
+            return await run()
+        text = await self.coalesce.ado((id(chain), normalize_key(chain_input)), run)
+        if not streamed:
+            # 다른 호출의 결과를 공유받은 경우 조각 대신 전체 텍스트를 한 번에 전달
+            writer({"node": self.name, "chunk": text})
+        return text
 
     def logging(self, method_name, **kwargs):
         """
@@ -74,4 +284,34 @@ class BaseNode(ABC):
         Returns:
             dict: execute 메서드의 결과
         """
-        return self.execute(state)
+        with track_node(self.workflow, self.name):
+            return self.execute(state)
+
+    async def acall(self, state):
+        """
+        노드를 비동기로 호출하는 메서드
+
+        LangGraph의 ainvoke / astream 실행 시 사용됩니다.
+
+        Args:
+            state: 현재 그래프 상태 객체
+
+        Returns:
+            dict: aexecute 메서드의 결과
+        """
+        with track_node(self.workflow, self.name):
+            return await self.aexecute(state)
+
+    def invoke(self, input, config: RunnableConfig | None = None, **kwargs) -> dict:
+        """
+        Runnable 인터페이스의 동기 실행 메서드 (LangGraph에서 호출)
+        """
+        return self(input)
+
+    async def ainvoke(
+        self, input, config: RunnableConfig | None = None, **kwargs
+    ) -> dict:
+        """
+        Runnable 인터페이스의 비동기 실행 메서드 (LangGraph에서 호출)
+        """
+        return await self.acall(input)
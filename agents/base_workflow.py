@@ -1,7 +1,36 @@
+import threading
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
 from langgraph.graph.state import CompiledStateGraph
 
+from agents.base_node import BaseNode
+
+
+def _freeze(value):
+    """
+    빌드 옵션 값을 캐시 키로 사용할 수 있도록 해시 가능한 형태로 변환합니다.
+
+    dict, list, set은 정렬된 tuple/frozenset으로 변환합니다.
+    객체 식별자(id)는 객체가 해제된 뒤 재사용될 수 있으므로, 해시할 수 없는 값은 허용하지 않습니다.
+
+    Raises:
+        TypeError: 해시할 수 없는 옵션 값인 경우
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(
+            f"Workflow 빌드 옵션은 해시 가능해야 합니다: {type(value).__name__}"
+        ) from None
+    return value
+
 
 class BaseWorkflow(ABC):
     """
@@ -10,20 +39,54 @@ class BaseWorkflow(ABC):
     이 추상 클래스는 모든 Workflow가 구현해야 하는 기본 메서드와 속성을 정의합니다.
     Workflow는 여러 노드를 연결하여 작업을 수행하는 전체 그래프를 관리합니다.
 
+    컴파일된 그래프는 (Workflow 클래스, 상태 스키마, 빌드 옵션)을 키로 하여
+    프로세스 단위로 캐시됩니다. 따라서 Workflow를 여러 번 호출해도 노드, 체인,
+    모델 클라이언트를 다시 생성하거나 그래프를 다시 컴파일하지 않습니다.
+
     예시:
     ```python
     # 이 클래스를 상속받은 클래스로 인스턴스 생성하는 방법
     name_workflow = NameWorkflow(StateName)
+
+    # 첫 호출에서만 build()가 실행되고, 이후에는 캐시된 그래프가 반환됩니다.
+    graph = name_workflow()
+
+    # 노드나 프롬프트를 변경한 뒤 다시 빌드해야 할 때
+    name_workflow.invalidate()  # 해당 Workflow의 캐시만 삭제
+    BaseWorkflow.clear_cache()  # 모든 Workflow의 캐시 삭제
+    ```
+
+    checkpointer 옵션(또는 WORKFLOW_CHECKPOINT_DB 환경변수)을 지정하면 노드가 끝날 때마다
+    상태가 SQLite 파일에 저장되고, 중단된 실행을 resume()으로 이어서 실행할 수 있습니다.
+    (자세한 내용은 agents/checkpoint.py 참고)
+
+    ```python
+    name_workflow = NameWorkflow(StateName, checkpointer="checkpoints.sqlite")
+    config = {"configurable": {"thread_id": "request-1"}}
+
+    # durability="async"이면 체크포인트 저장이 다음 노드 실행과 동시에 진행됩니다.
+    # (LLM 호출처럼 노드 실행 시간이 긴 경우 저장 비용이 가려집니다.)
+    name_workflow().invoke(initial_state, config, durability="async")
+    name_workflow.resume("request-1")  # 중단된 경우 마지막으로 완료된 노드 이후부터 재개
     ```
     """
 
-    def __init__(self):
+    _graph_cache: ClassVar[dict[tuple, CompiledStateGraph]] = {}  # 컴파일된 그래프 캐시
+    _cache_lock = (
+        threading.RLock()
+    )  # 동시 빌드를 방지하기 위한 잠금 (하위 그래프 빌드 허용)
+
+    def __init__(self, **options):
         """
         Workflow 초기화 메서드
 
         Workflow 이름을 클래스 이름으로 자동 설정합니다.
+
+        Args:
+            **options: 그래프 빌드 옵션 (캐시 키에 포함됩니다)
         """
         self.name = self.__class__.__name__  # Workflow 이름은 클래스 이름으로 자동 설정
+        self.options = options  # 그래프 빌드 옵션
 
     @abstractmethod
     def build(self) -> CompiledStateGraph:
@@ -36,15 +99,151 @@ class BaseWorkflow(ABC):
         Returns:
             CompiledStateGraph: 컴파일된 상태 그래프 객체
         """
-        pass
+
+    @property
+    def cache_key(self) -> tuple:
+        """
+        컴파일된 그래프의 캐시 키를 반환합니다.
+
+        체크포인터는 WORKFLOW_CHECKPOINT_DB 환경변수로도 바뀌므로, 옵션과 별도로
+        실제로 사용할 체크포인터를 키에 포함합니다.
+
+        Returns:
+            tuple: (Workflow 클래스, 상태 스키마, 빌드 옵션, 체크포인터)로 구성된 키
+        """
+        return (
+            self.__class__,
+            getattr(self, "state", None),
+            _freeze(self.options),
+            self.checkpointer,
+        )
+
+    @property
+    def checkpointer(self):
+        """
+        그래프 컴파일에 사용할 체크포인터를 반환합니다.
+
+        checkpointer 옵션이 없으면 WORKFLOW_CHECKPOINT_DB 환경변수를 사용하며,
+        둘 다 없으면 체크포인트를 사용하지 않습니다. (None 반환)
+
+        Returns:
+            BaseCheckpointSaver | None: 체크포인터
+        """
+        from agents.checkpoint import default_checkpointer_target, get_checkpointer
+
+        return get_checkpointer(
+            self.options.get("checkpointer", default_checkpointer_target())
+        )
+
+    def _resume_config(self, thread_id: str, config: dict | None) -> dict:
+        """
+        재개할 스레드의 실행 설정을 구성합니다.
+        """
+        config = dict(config or {})
+        config["configurable"] = {
+            **config.get("configurable", {}),
+            "thread_id": thread_id,
+        }
+        return config
+
+    def resume(self, thread_id: str, config: dict | None = None, **kwargs) -> dict:
+        """
+        체크포인트에 저장된 실행을 마지막으로 완료된 노드 이후부터 다시 실행합니다.
+
+        이미 완료된 노드(및 같은 단계에서 먼저 완료된 병렬 노드)는 다시 실행하지 않습니다.
+
+        Args:
+            thread_id: 재개할 실행의 스레드 ID
+            config: 추가 실행 설정 (콜백, 태그 등)
+            **kwargs: graph.invoke()에 전달할 인자 (예: durability="async")
+
+        Returns:
+            dict: 최종 상태 (이미 완료된 실행이면 저장된 최종 상태)
+
+        Raises:
+            ValueError: 체크포인터가 없거나 해당 스레드의 체크포인트가 없는 경우
+        """
+        graph = self()
+        config = self._resume_config(thread_id, config)
+        snapshot = graph.get_state(config)
+        if snapshot.created_at is None:
+            raise ValueError(f"'{thread_id}' 스레드의 체크포인트가 없습니다.")
+        if not snapshot.next:
+            return snapshot.values
+        return graph.invoke(None, config, **kwargs)
+
+    async def aresume(
+        self, thread_id: str, config: dict | None = None, **kwargs
+    ) -> dict:
+        """
+        resume()의 비동기 버전입니다.
+        """
+        graph = self()
+        config = self._resume_config(thread_id, config)
+        snapshot = await graph.aget_state(config)
+        if snapshot.created_at is None:
+            raise ValueError(f"'{thread_id}' 스레드의 체크포인트가 없습니다.")
+        if not snapshot.next:
+            return snapshot.values
+        return await graph.ainvoke(None, config, **kwargs)
+
+    def invalidate(self) -> bool:
+        """
+        현재 Workflow의 캐시된 그래프를 삭제합니다.
+
+        다음 호출 시 build()가 다시 실행됩니다.
+
+        Returns:
+            bool: 삭제된 캐시가 있었는지 여부
+        """
+        with self._cache_lock:
+            return self._graph_cache.pop(self.cache_key, None) is not None
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        캐시된 그래프를 삭제합니다.
+
+        BaseWorkflow에서 호출하면 모든 Workflow의 캐시를,
+        하위 클래스에서 호출하면 해당 클래스(및 그 하위 클래스)의 캐시만 삭제합니다.
+        """
+        with cls._cache_lock:
+            for key in list(cls._graph_cache):
+                if issubclass(key[0], cls):
+                    del cls._graph_cache[key]
 
     def __call__(self):
         """
         Workflow를 함수처럼 호출 가능하게 만드는 메서드
 
         Workflow 객체를 직접 호출할 때 사용됩니다.
+        캐시된 그래프가 있으면 그대로 반환하고, 없으면 build()를 실행하여 캐시합니다.
 
         Returns:
             CompiledStateGraph: build 메서드의 결과
         """
-        return self.build()
+        key = self.cache_key
+        graph = self._graph_cache.get(key)
+        if graph is not None:
+            return graph
+
+        with self._cache_lock:
+            # 잠금을 기다리는 동안 다른 스레드가 빌드를 마쳤을 수 있으므로 다시 확인
+            graph = self._graph_cache.get(key)
+            if graph is None:
+                graph = self.build()
+                self._tag_nodes(graph)
+                self._graph_cache[key] = graph
+        return graph
+
+    def _tag_nodes(self, graph: CompiledStateGraph) -> None:
+        """
+        그래프에 포함된 노드에 Workflow 이름을 설정합니다. (메트릭 라벨에 사용)
+
+        하위 그래프의 노드처럼 이미 Workflow 이름이 설정된 노드는 변경하지 않습니다.
+        """
+        builder = getattr(graph, "builder", None)
+        for spec in getattr(builder, "nodes", {}).values():
+            node = getattr(spec, "runnable", None)
+            if isinstance(node, BaseNode) and node.workflow is None:
+                node.workflow = self.name
@@ -0,0 +1,238 @@
+"""
+로컬 체크포인트 모듈
+
+Workflow 실행 상태를 SQLite 파일에 저장하는 체크포인터를 제공합니다.
+체크포인터를 사용하면 노드가 끝날 때마다 상태가 저장되므로, 작업자가 중간에 종료되더라도
+BaseWorkflow.resume()으로 마지막으로 완료된 노드 이후부터 다시 실행할 수 있습니다.
+(이미 완료된 LLM 호출을 다시 하지 않습니다.)
+
+체크포인트는 선택 사항이며, 다음 중 하나로 활성화합니다.
+- Workflow 옵션: `TextWorkflow(TextState, checkpointer="checkpoints.sqlite")`
+- 환경변수: `WORKFLOW_CHECKPOINT_DB=checkpoints.sqlite` (옵션을 지정하지 않은 모든 Workflow에 적용)
+
+쓰기 비용을 줄이기 위해 SQLite를 WAL 모드와 `synchronous=NORMAL`로 엽니다.
+이 설정은 프로세스 비정상 종료에는 안전하며, 커밋마다 fsync를 하지 않습니다.
+(운영체제 / 전원 장애 시에는 마지막 몇 개의 체크포인트가 유실될 수 있습니다.)
+
+예시:
+```python
+from agents.text.modules.state import TextState
+from agents.text.workflow import TextWorkflow
+
+workflow = TextWorkflow(TextState, checkpointer="checkpoints.sqlite")
+config = {"configurable": {"thread_id": "campaign-42"}}
+workflow().invoke(initial_state, config)
+
+# 작업자가 중간에 종료된 경우, 마지막으로 완료된 노드 이후부터 재개
+workflow.resume("campaign-42")
+
+# 스레드별 최근 체크포인트 10개만 남기고, 7일 이상 갱신되지 않은 스레드는 삭제
+workflow.checkpointer.prune(keep_last=10, max_age=7 * 24 * 3600)
+```
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import run_in_executor
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+CHECKPOINT_ENV = "WORKFLOW_CHECKPOINT_DB"  # 기본 체크포인트 DB 경로 환경변수
+DEFAULT_CHECKPOINT_PATH = ".checkpoints/agents.sqlite"  # checkpointer=True일 때 경로
+
+# UUID 기준 시각(1582-10-15)과 Unix 기준 시각 사이의 100ns 간격 수
+_UUID_EPOCH_OFFSET = 0x01B21DD213814000
+
+_lock = threading.Lock()
+_checkpointers: dict[str, "LocalCheckpointer"] = {}  # 경로 -> 공유 체크포인터
+
+
+def _checkpoint_id_at(timestamp: float) -> str:
+    """
+    주어진 Unix 시각에 해당하는 가장 작은 체크포인트 ID(UUIDv6)를 생성합니다.
+
+    체크포인트 ID는 시간 순으로 정렬되는 UUIDv6이므로, 문자열 비교로 시각 이전 여부를 판단할 수 있습니다.
+    """
+    ticks = int(timestamp * 10_000_000) + _UUID_EPOCH_OFFSET
+    time_high = ticks >> 28
+    time_mid = (ticks >> 12) & 0xFFFF
+    time_low = ticks & 0x0FFF
+    return f"{time_high:08x}-{time_mid:04x}-6{time_low:03x}-0000-000000000000"
+
+
+class LocalCheckpointer(SqliteSaver):
+    """
+    동기 / 비동기 실행을 모두 지원하는 SQLite 체크포인터
+
+    SqliteSaver는 비동기 메서드를 지원하지 않으므로, 비동기 메서드는 동기 메서드를
+    스레드 풀에서 실행합니다. (SqliteSaver는 내부 잠금으로 연결을 보호합니다.)
+    """
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> "LocalCheckpointer":
+        """
+        SQLite 파일을 열어 체크포인터를 생성합니다. 상위 디렉토리가 없으면 생성합니다.
+
+        Args:
+            path: SQLite 파일 경로 (":memory:"이면 메모리 DB)
+
+        Returns:
+            LocalCheckpointer: 체크포인터
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # 커밋마다 fsync하지 않음
+        return cls(conn)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await run_in_executor(None, self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await run_in_executor(
+            None,
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit)),
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await run_in_executor(
+            None, self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await run_in_executor(None, self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await run_in_executor(None, self.delete_thread, thread_id)
+
+    def prune(
+        self, *, keep_last: int | None = None, max_age: float | None = None
+    ) -> int:
+        """
+        오래된 체크포인트를 삭제합니다.
+
+        Args:
+            keep_last: 스레드(및 하위 그래프 네임스페이스)별로 남길 최근 체크포인트 수.
+                마지막 체크포인트는 항상 남으므로 재개에는 영향이 없습니다.
+            max_age: 마지막 체크포인트가 이 시간(초)보다 오래된 스레드는 전체를 삭제
+
+        Returns:
+            int: 삭제된 체크포인트 수
+        """
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last는 1 이상이어야 합니다.")
+
+        deleted = 0
+        with self.cursor() as cur:
+            if max_age is not None:
+                cutoff = _checkpoint_id_at(time.time() - max_age)
+                cur.execute(
+                    """
+                    DELETE FROM checkpoints WHERE thread_id IN (
+                        SELECT thread_id FROM checkpoints
+                        GROUP BY thread_id HAVING MAX(checkpoint_id) < ?
+                    )
+                    """,
+                    (cutoff,),
+                )
+                deleted += cur.rowcount
+            if keep_last is not None:
+                cur.execute(
+                    """
+                    DELETE FROM checkpoints WHERE rowid IN (
+                        SELECT rowid FROM (
+                            SELECT rowid, ROW_NUMBER() OVER (
+                                PARTITION BY thread_id, checkpoint_ns
+                                ORDER BY checkpoint_id DESC
+                            ) AS position
+                            FROM checkpoints
+                        ) WHERE position > ?
+                    )
+                    """,
+                    (keep_last,),
+                )
+                deleted += cur.rowcount
+            if deleted:
+                # 삭제된 체크포인트에 연결된 중간 쓰기 기록 정리
+                cur.execute(
+                    """
+                    DELETE FROM writes WHERE NOT EXISTS (
+                        SELECT 1 FROM checkpoints c
+                        WHERE c.thread_id = writes.thread_id
+                        AND c.checkpoint_ns = writes.checkpoint_ns
+                        AND c.checkpoint_id = writes.checkpoint_id
+                    )
+                    """
+                )
+        return deleted
+
+
+def get_checkpointer(target) -> BaseCheckpointSaver | None:
+    """
+    Workflow 옵션 값으로부터 체크포인터를 반환합니다.
+
+    같은 경로에 대해서는 프로세스 안에서 하나의 체크포인터(연결)를 공유합니다.
+
+    Args:
+        target: 체크포인터 설정
+            - None / False: 체크포인트를 사용하지 않음
+            - True: 기본 경로(.checkpoints/agents.sqlite) 사용
+            - str / PathLike: 해당 SQLite 파일 경로 사용
+            - BaseCheckpointSaver: 전달된 체크포인터를 그대로 사용
+
+    Returns:
+        BaseCheckpointSaver | None: 체크포인터
+    """
+    if target is None or target is False:
+        return None
+    if isinstance(target, BaseCheckpointSaver):
+        return target
+
+    path = DEFAULT_CHECKPOINT_PATH if target is True else os.fspath(target)
+    key = path if path == ":memory:" else os.path.abspath(path)
+    with _lock:
+        checkpointer = _checkpointers.get(key)
+        if checkpointer is None:
+            checkpointer = LocalCheckpointer.open(path)
+            _checkpointers[key] = checkpointer
+    return checkpointer
+
+
+def default_checkpointer_target() -> str | None:
+    """환경변수에 설정된 기본 체크포인트 DB 경로를 반환합니다."""
+    return os.getenv(CHECKPOINT_ENV) or None
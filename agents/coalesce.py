@@ -0,0 +1,191 @@
+"""
+요청 병합(single-flight) 모듈
+
+입력이 같은 체인 호출이 동시에 여러 번 들어오면, 첫 번째 호출(leader)만 실제로 LLM을 호출하고
+나머지 호출(hit)은 진행 중인 호출이 끝나기를 기다렸다가 같은 결과(또는 예외)를 공유합니다.
+캠페인 시작 직후처럼 같은 content_topic / content_type 요청이 몰리는 상황에서 LLM 호출 수를 줄입니다.
+
+- 이미 끝난 호출의 결과는 보관하지 않습니다. (캐시가 아니라 진행 중인 호출만 공유)
+- 동기 호출(do)과 비동기 호출(ado)은 각각 따로 병합됩니다.
+- 비동기 호출은 공유 Task로 실행되므로, leader가 취소되어도 기다리는 다른 호출에는 영향이 없습니다.
+- 환경변수 LLM_COALESCE=0이면 모든 병합을 끕니다.
+
+병합 횟수는 agents_coalesce_requests_total{flight, result} 메트릭(result: "leader" / "hit")과
+SingleFlight.stats()로 확인할 수 있습니다.
+
+예시:
+```python
+from agents.coalesce import SingleFlight, normalize_key
+
+flight = SingleFlight("persona_extraction")
+key = normalize_key({"content_topic": "여름 휴가", "content_type": "블로그 글"})
+
+result = flight.do(key, lambda: chain.invoke(chain_input))
+result = await flight.ado(key, lambda: chain.ainvoke(chain_input))
+print(flight.stats())  # {"leader": 1, "hit": 0, "in_flight": 0}
+```
+"""
+
+import asyncio
+import json
+import os
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from agents.metrics import REGISTRY
+
+T = TypeVar("T")
+
+COALESCE_ENV = "LLM_COALESCE"  # "0"이면 요청 병합 비활성화
+
+COALESCE_REQUESTS = REGISTRY.counter(
+    "agents_coalesce_requests_total",
+    "요청 병합 대상 호출 수 (result: leader = 실제 호출, hit = 진행 중인 호출 결과 공유)",
+    ("flight", "result"),
+)
+
+
+def coalescing_enabled() -> bool:
+    """환경변수 LLM_COALESCE로 요청 병합이 활성화되어 있는지 확인합니다. (기본값: 활성화)"""
+    return os.getenv(COALESCE_ENV, "1").strip().lower() not in ("0", "false", "no")
+
+
+def _normalize(value: Any) -> Any:
+    """문자열은 앞뒤 공백 제거, 연속 공백 축약, 대소문자 통일을 하고 컨테이너는 재귀적으로 정규화합니다."""
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def normalize_key(chain_input: Any) -> str:
+    """
+    체인 입력을 병합 키 문자열로 변환합니다.
+
+    " 여름  휴가"와 "여름 휴가"처럼 공백과 대소문자만 다른 입력은 같은 키가 됩니다.
+
+    Args:
+        chain_input: 체인 입력 (dict, list, 문자열 등 JSON으로 표현 가능한 값)
+
+    Returns:
+        str: 정규화된 키
+    """
+    return json.dumps(
+        _normalize(chain_input), ensure_ascii=False, sort_keys=True, default=str
+    )
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나로 병합하는 실행기
+
+    Attributes:
+        name: 메트릭 라벨에 사용할 이름
+        enabled: 병합 활성화 여부 (기본값: 환경변수 LLM_COALESCE)
+    """
+
+    def __init__(self, name: str, enabled: bool | None = None):
+        self.name = name
+        self.enabled = coalescing_enabled() if enabled is None else enabled
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}  # 키 -> 진행 중인 동기 호출
+        self._tasks: dict[Hashable, asyncio.Task] = {}  # 키 -> 진행 중인 비동기 호출
+
+    def _count(self, result: str):
+        """병합 결과(leader / hit)별 카운터를 반환합니다."""
+        return COALESCE_REQUESTS.labels(flight=self.name, result=result)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        fn()을 실행합니다. 같은 키의 호출이 진행 중이면 실행하지 않고 그 결과를 기다립니다.
+
+        Args:
+            key: 병합 키 (normalize_key()의 결과 등)
+            fn: 실제 호출 함수
+
+        Returns:
+            T: fn()의 결과 (진행 중인 호출의 결과를 공유한 경우 그 결과)
+        """
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            self._count("hit").inc()
+            return future.result()
+
+        self._count("leader").inc()
+        try:
+            result = fn()
+        except BaseException as error:
+            self._finish(key)
+            future.set_exception(error)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        do()의 비동기 버전입니다. 같은 이벤트 루프의 같은 키 호출이 하나의 Task를 공유합니다.
+
+        Args:
+            key: 병합 키 (normalize_key()의 결과 등)
+            fn: 실제 호출 코루틴을 반환하는 함수
+
+        Returns:
+            T: 공유 Task의 결과
+        """
+        if not self.enabled:
+            return await fn()
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get(key)
+            leader = task is None or task.get_loop() is not loop
+            if leader:
+                # Task는 leader의 컨텍스트(스트림 writer, 메트릭 핸들러)를 복사하여 실행
+                task = loop.create_task(fn())
+                self._tasks[key] = task
+                task.add_done_callback(lambda done: self._finish_task(key, done))
+
+        self._count("leader" if leader else "hit").inc()
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable) -> None:
+        """끝난 동기 호출을 진행 중인 호출 목록에서 제거합니다."""
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def _finish_task(self, key: Hashable, task: asyncio.Task) -> None:
+        """끝난 비동기 호출을 진행 중인 호출 목록에서 제거합니다."""
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # 기다리는 호출이 모두 취소된 경우의 경고 방지
+
+    def stats(self) -> dict:
+        """
+        병합 통계를 반환합니다.
+
+        Returns:
+            dict: leader(실제 호출 수), hit(결과를 공유한 호출 수), in_flight(진행 중인 호출 수)
+        """
+        with self._lock:
+            in_flight = len(self._calls) + len(self._tasks)
+        return {
+            "leader": int(self._count("leader").value),
+            "hit": int(self._count("hit").value),
+            "in_flight": in_flight,
+        }
@@ -0,0 +1,388 @@
+"""
+요청 헤징(hedging) 모듈
+
+LLM 호출이 최근 지연 시간의 상위 분위수(기본값: p95)가 지나도록 응답하지 않으면 같은 요청을 한 번 더
+보내고, 먼저 응답한 쪽을 사용하며 나머지는 취소합니다. 소수의 느린 제공자 응답 때문에 늘어나는
+꼬리 지연 시간(p99)을 줄이기 위한 것입니다.
+
+- 스트리밍 호출(stream / astream)은 첫 조각까지의 시간(TTFT)을 기준으로 헤징합니다.
+  첫 조각을 먼저 받은 쪽의 스트림을 끝까지 사용하고, 다른 쪽은 닫습니다.
+- 일반 호출(run / arun)은 전체 응답 시간을 기준으로 헤징합니다.
+- 지연 시간 표본이 min_samples개보다 적으면 헤징하지 않습니다.
+- 헤징 예산(budget): 추가 요청 수는 전체 호출 수의 budget 비율을 넘지 않습니다.
+- 한쪽 요청이 실패하면 다른 쪽 요청의 결과를 기다립니다.
+
+헤징은 선택 사항이며, HedgePolicy(enabled=True) 또는 환경변수 LLM_HEDGE=1로 활성화합니다.
+BaseNode에 hedge를 지정하면 stream_chain() / astream_chain()이 헤징을 적용합니다.
+
+메트릭 (policy 라벨별)
+- agents_hedge_calls_total: 헤징 대상 호출 수
+- agents_hedge_requests_total: 추가로 보낸 요청 수 (추가 비용)
+- agents_hedge_wins_total: 추가 요청이 먼저 응답한 횟수
+- agents_hedge_latency_seconds: 헤징을 적용한 지연 시간 (스트리밍은 TTFT)
+- agents_hedge_primary_latency_seconds: 첫 요청이 먼저 응답한 경우의 지연 시간
+
+예시:
+```python
+from agents.hedging import HedgePolicy
+
+policy = HedgePolicy("persona_extraction", percentile=0.95, budget=0.05, enabled=True)
+async for chunk in policy.astream(lambda: chain.astream(chain_input)):
+    ...
+print(policy.stats())  # {"calls": ..., "hedged": ..., "wins": ..., "delay": ...}
+```
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from contextlib import suppress
+from contextvars import copy_context
+from typing import TypeVar
+
+from agents.metrics import REGISTRY
+
+T = TypeVar("T")
+
+HEDGE_ENV = "LLM_HEDGE"  # "1"이면 헤징 활성화
+
+HEDGE_LABELS = ("policy",)
+HEDGE_CALLS = REGISTRY.counter(
+    "agents_hedge_calls_total", "헤징 대상 호출 수", HEDGE_LABELS
+)
+HEDGE_REQUESTS = REGISTRY.counter(
+    "agents_hedge_requests_total", "헤징으로 추가로 보낸 요청 수", HEDGE_LABELS
+)
+HEDGE_WINS = REGISTRY.counter(
+    "agents_hedge_wins_total", "추가 요청이 먼저 응답한 횟수", HEDGE_LABELS
+)
+HEDGE_LATENCY = REGISTRY.histogram(
+    "agents_hedge_latency_seconds",
+    "헤징을 적용한 호출 지연 시간 (스트리밍은 첫 조각까지의 시간)",
+    HEDGE_LABELS,
+)
+HEDGE_PRIMARY_LATENCY = REGISTRY.histogram(
+    "agents_hedge_primary_latency_seconds",
+    "첫 요청이 먼저 응답한 호출의 지연 시간",
+    HEDGE_LABELS,
+)
+
+_executor: ThreadPoolExecutor | None = None  # 동기 헤징용 스레드 풀
+_executor_lock = threading.Lock()
+
+_DONE = object()  # 스트림 종료 표시
+
+
+def hedging_enabled() -> bool:
+    """환경변수 LLM_HEDGE로 헤징이 활성화되어 있는지 확인합니다. (기본값: 비활성화)"""
+    return os.getenv(HEDGE_ENV, "0").strip().lower() in ("1", "true", "yes")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """동기 헤징에 사용할 공유 스레드 풀을 반환합니다. 최초 호출 시 한 번만 생성합니다."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(thread_name_prefix="hedge")
+    return _executor
+
+
+def _next_or_done(iterator: Iterator):
+    """next()와 같지만, 스트림이 끝나면 StopIteration 대신 _DONE을 반환합니다."""
+    return next(iterator, _DONE)
+
+
+async def _anext_or_done(iterator: AsyncIterator):
+    """anext()와 같지만, 스트림이 끝나면 StopAsyncIteration 대신 _DONE을 반환합니다."""
+    return await anext(iterator, _DONE)
+
+
+class HedgePolicy:
+    """
+    최근 지연 시간 분위수를 기준으로 추가 요청을 보내는 헤징 정책
+
+    Attributes:
+        name: 메트릭 라벨에 사용할 이름
+        percentile: 추가 요청을 보낼 지연 시간 분위 (0 ~ 1)
+        budget: 전체 호출 대비 추가 요청의 최대 비율
+        min_samples: 헤징을 시작하기 위한 최소 지연 시간 표본 수
+        min_delay: 추가 요청을 보내기 전 최소 대기 시간(초)
+        window: 분위수 계산에 사용할 최근 표본 수
+        enabled: 헤징 활성화 여부 (기본값: 환경변수 LLM_HEDGE)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.01,
+        window: int = 500,
+        enabled: bool | None = None,
+    ):
+        if not 0 < percentile < 1:
+            raise ValueError("percentile은 0과 1 사이여야 합니다.")
+        if budget < 0:
+            raise ValueError("budget은 0 이상이어야 합니다.")
+        self.name = name
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.enabled = hedging_enabled() if enabled is None else enabled
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._credits = 1.0  # 사용할 수 있는 추가 요청 수 (호출마다 budget만큼 적립)
+
+    def _labels(self) -> dict:
+        return {"policy": self.name}
+
+    def delay(self) -> float | None:
+        """
+        추가 요청을 보내기까지 기다릴 시간(초)을 반환합니다. 표본이 부족하면 None을 반환합니다.
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def _start(self) -> float | None:
+        """호출을 시작하며 예산을 적립하고, 헤징할 지연 시간을 반환합니다. (헤징하지 않으면 None)"""
+        HEDGE_CALLS.labels(**self._labels()).inc()
+        delay = self.delay()
+        with self._lock:
+            self._credits = min(
+                self._credits + self.budget, max(1.0, self.budget * 100)
+            )
+        return delay
+
+    def _take_credit(self) -> bool:
+        """추가 요청 예산을 하나 사용합니다. 예산이 없으면 False를 반환합니다."""
+        with self._lock:
+            if self._credits < 1:
+                return False
+            self._credits -= 1
+        HEDGE_REQUESTS.labels(**self._labels()).inc()
+        return True
+
+    def _record(self, latency: float, hedged_win: bool) -> None:
+        """응답 지연 시간을 기록합니다."""
+        HEDGE_LATENCY.labels(**self._labels()).observe(latency)
+        if hedged_win:
+            HEDGE_WINS.labels(**self._labels()).inc()
+        else:
+            HEDGE_PRIMARY_LATENCY.labels(**self._labels()).observe(latency)
+            # 추가 요청이 이긴 경우 첫 요청의 지연 시간은 알 수 없으므로 표본에 넣지 않음
+            with self._lock:
+                self._latencies.append(latency)
+
+    async def _arace(
+        self, start: Callable[[], Awaitable[T]], delay: float | None
+    ) -> tuple[T, int]:
+        """
+        첫 요청을 시작하고, delay 안에 끝나지 않으면 추가 요청을 보내 먼저 성공한 결과를 반환합니다.
+
+        Returns:
+            tuple: (결과, 결과를 낸 요청 번호 - 0: 첫 요청, 1: 추가 요청)
+        """
+        tasks = [asyncio.ensure_future(start())]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._take_credit():
+                    tasks.append(asyncio.ensure_future(start()))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in tasks:
+                    if task in done and (task.exception() is None or not pending):
+                        return task.result(), tasks.index(task)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    with suppress(asyncio.CancelledError, Exception):
+                        await task
+
+    def _race(self, start: Callable[[], T], delay: float | None, on_loser=None):
+        """
+        _arace()의 동기 버전으로, 요청을 스레드 풀에서 실행합니다.
+
+        요청은 호출한 쪽의 컨텍스트(콜백, 메트릭 핸들러)를 복사하여 실행합니다.
+        실행 중인 스레드는 취소할 수 없으므로, 진 요청의 결과는 끝난 뒤 on_loser(결과)로 정리합니다.
+        """
+        executor = _get_executor()
+        futures = [executor.submit(copy_context().run, start)]
+        winner = None
+        try:
+            if delay is not None:
+                done, _ = wait_futures(futures, timeout=delay)
+                if not done and self._take_credit():
+                    futures.append(executor.submit(copy_context().run, start))
+            pending = set(futures)
+            while winner is None:
+                done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+                for future in futures:
+                    if future in done and (future.exception() is None or not pending):
+                        winner = future
+                        break
+            return winner.result(), futures.index(winner)
+        finally:
+            for future in futures:
+                if future is not winner and on_loser is not None:
+                    future.add_done_callback(
+                        lambda done: (
+                            done.exception() is None and on_loser(done.result())
+                        )
+                    )
+
+    async def arun(self, start: Callable[[], Awaitable[T]]) -> T:
+        """
+        start()가 반환하는 코루틴을 헤징하여 실행합니다.
+
+        Args:
+            start: 호출할 때마다 새 요청 코루틴을 반환하는 함수
+
+        Returns:
+            T: 먼저 성공한 요청의 결과
+        """
+        if not self.enabled:
+            return await start()
+        delay = self._start()
+        started = time.perf_counter()
+        result, index = await self._arace(start, delay)
+        self._record(time.perf_counter() - started, index > 0)
+        return result
+
+    def run(self, start: Callable[[], T]) -> T:
+        """
+        arun()의 동기 버전입니다.
+
+        Args:
+            start: 요청을 실행하고 결과를 반환하는 함수
+
+        Returns:
+            T: 먼저 성공한 요청의 결과
+        """
+        if not self.enabled:
+            return start()
+        delay = self._start()
+        started = time.perf_counter()
+        result, index = self._race(start, delay)
+        self._record(time.perf_counter() - started, index > 0)
+        return result
+
+    async def astream(
+        self, make_stream: Callable[[], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        """
+        스트림을 첫 조각까지의 시간 기준으로 헤징합니다.
+
+        Args:
+            make_stream: 호출할 때마다 새 스트림(async iterator)을 반환하는 함수
+
+        Yields:
+            T: 첫 조각을 먼저 보낸 스트림의 조각
+        """
+        if not self.enabled:
+            async for chunk in make_stream():
+                yield chunk
+            return
+
+        streams: list[AsyncIterator] = []
+
+        async def first_chunk():
+            stream = make_stream()
+            streams.append(stream)
+            return stream, await _anext_or_done(stream)
+
+        delay = self._start()
+        started = time.perf_counter()
+        try:
+            (stream, chunk), index = await self._arace(first_chunk, delay)
+        except BaseException:
+            for other in streams:
+                with suppress(Exception):
+                    await other.aclose()
+            raise
+        self._record(time.perf_counter() - started, index > 0)
+        for other in streams:
+            if other is not stream:
+                with suppress(Exception):
+                    await other.aclose()
+
+        try:
+            while chunk is not _DONE:
+                yield chunk
+                chunk = await _anext_or_done(stream)
+        finally:
+            with suppress(Exception):
+                await stream.aclose()
+
+    def stream(self, make_stream: Callable[[], Iterator[T]]) -> Iterator[T]:
+        """
+        astream()의 동기 버전입니다. 첫 조각은 스레드 풀에서 받고, 이후 조각은 호출한 스레드에서 받습니다.
+
+        Args:
+            make_stream: 호출할 때마다 새 스트림(iterator)을 반환하는 함수
+
+        Yields:
+            T: 첫 조각을 먼저 보낸 스트림의 조각
+        """
+        if not self.enabled:
+            yield from make_stream()
+            return
+
+        def first_chunk():
+            stream = iter(make_stream())
+            try:
+                return stream, _next_or_done(stream)
+            except BaseException:
+                getattr(stream, "close", lambda: None)()
+                raise
+
+        def close(result):
+            getattr(result[0], "close", lambda: None)()
+
+        delay = self._start()
+        started = time.perf_counter()
+        (stream, chunk), index = self._race(first_chunk, delay, on_loser=close)
+        self._record(time.perf_counter() - started, index > 0)
+
+        try:
+            while chunk is not _DONE:
+                yield chunk
+                chunk = _next_or_done(stream)
+        finally:
+            getattr(stream, "close", lambda: None)()
+
+    def stats(self) -> dict:
+        """
+        헤징 통계를 반환합니다.
+
+        Returns:
+            dict: calls(호출 수), hedged(추가 요청 수), wins(추가 요청이 이긴 횟수),
+                hedge_rate(추가 요청 비율), delay(현재 헤징 대기 시간)
+        """
+        labels = self._labels()
+        calls = int(HEDGE_CALLS.labels(**labels).value)
+        hedged = int(HEDGE_REQUESTS.labels(**labels).value)
+        return {
+            "calls": calls,
+            "hedged": hedged,
+            "wins": int(HEDGE_WINS.labels(**labels).value),
+            "hedge_rate": hedged / calls if calls else 0.0,
+            "delay": self.delay(),
+        }
@@ -0,0 +1,292 @@
+"""
+이미지 아티팩트 저장소 모듈
+
+생성한 이미지를 정규화한 프롬프트와 생성 파라미터의 해시(SHA-256)를 키로 디스크에 저장하여,
+같은 요청이 반복되면 다시 생성하지 않고 저장된 바이트를 반환합니다. (content-addressed cache)
+
+- 키: agents.coalesce.normalize_key()로 공백 / 대소문자를 정규화한 {"prompt", "params"}의 SHA-256
+- 쓰기: 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace()로 교체하므로, 다른 프로세스가 쓰다 만 파일을 읽지 않습니다.
+  프로세스가 쓰는 도중 종료되어 남은 임시 파일은 저장소를 열 때 삭제합니다.
+- 읽기: 파일을 읽기 전용으로 mmap한 memoryview를 반환합니다. (복사 없음, 페이지 캐시를 그대로 사용)
+  파일이 삭제되어도 이미 반환한 memoryview는 유효합니다.
+- 용량: 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 아티팩트부터 삭제합니다. (LRU)
+  사용 순서는 파일 수정 시각으로도 기록하므로, 프로세스를 다시 시작해도 유지됩니다.
+- 같은 키의 동시 생성은 agents.coalesce.SingleFlight로 하나만 실행합니다.
+
+캐시 적중 / 생성 / 삭제 수는 agents_image_artifact_requests_total{result} 메트릭
+(result: "hit" / "miss" / "evicted")으로 확인할 수 있습니다.
+
+예시:
+```python
+from agents.image.modules.artifacts import ArtifactStore, artifact_key
+
+store = ArtifactStore(".artifacts/images", max_bytes=2 * 1024**3)
+key = artifact_key("여름 바다 포스터", size="1024x1024", style="vivid")
+image = store.get_or_create(key, lambda: generate_png(...))  # memoryview (mmap)
+```
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from agents.coalesce import SingleFlight, normalize_key
+from agents.metrics import REGISTRY
+
+IMAGE_ARTIFACT_DIR_ENV = "IMAGE_ARTIFACT_DIR"  # 아티팩트 저장소 디렉토리
+IMAGE_ARTIFACT_MAX_BYTES_ENV = "IMAGE_ARTIFACT_MAX_BYTES"  # 저장소 최대 크기 (바이트)
+DEFAULT_ARTIFACT_DIR = ".artifacts/images"
+DEFAULT_MAX_BYTES = 2 * 1024**3  # 2 GiB
+TEMP_PREFIX = ".tmp-"  # 쓰는 중인 임시 파일 이름 접두사
+# 이보다 오래된 임시 파일은 중단된 쓰기로 보고 삭제 (다른 프로세스가 쓰는 중인 파일은 유지)
+STALE_TEMP_SECONDS = 3600
+
+ARTIFACT_REQUESTS = REGISTRY.counter(
+    "agents_image_artifact_requests_total",
+    "이미지 아티팩트 저장소 요청 수 (result: hit = 저장된 아티팩트 반환, miss = 생성, evicted = LRU 삭제)",
+    ("result",),
+)
+
+
+def artifact_key(prompt: str, **params: Any) -> str:
+    """
+    프롬프트와 생성 파라미터로 아티팩트 키를 만듭니다.
+
+    공백과 대소문자만 다른 프롬프트, 순서만 다른 파라미터는 같은 키가 됩니다.
+
+    Args:
+        prompt: 생성 프롬프트
+        **params: 생성 파라미터 (모델, 크기, 스타일, 시드 등 JSON으로 표현 가능한 값)
+
+    Returns:
+        str: 64자리 16진수 SHA-256
+    """
+    normalized = normalize_key({"prompt": prompt, "params": params})
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ArtifactStore:
+    """
+    크기 제한이 있는 content-addressed 이미지 아티팩트 저장소
+
+    아티팩트는 `<root>/<키 앞 2자리>/<나머지 키>` 파일로 저장합니다. 스레드 안전하며,
+    여러 프로세스가 같은 디렉토리를 공유할 수 있습니다. (크기 제한은 프로세스마다 적용)
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            root: 저장소 디렉토리 (없으면 생성)
+            max_bytes: 저장소 최대 크기 (바이트)
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # 키 -> 크기 (오래 사용하지 않은 순)
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        # 같은 키를 두 번 생성하지 않는 것이 저장소의 목적이므로 LLM_COALESCE와 관계없이 병합
+        self._flight = SingleFlight("image_artifact", enabled=True)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        found = []
+        stale = time.time() - STALE_TEMP_SECONDS
+        for directory in self.root.iterdir():
+            if directory.is_dir() and len(directory.name) == 2:
+                for path in directory.iterdir():
+                    stat = path.stat()
+                    if not path.name.startswith(TEMP_PREFIX):
+                        key = directory.name + path.name
+                        found.append((stat.st_mtime_ns, key, stat.st_size))
+                    elif stat.st_mtime < stale:
+                        path.unlink(missing_ok=True)
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._bytes += size
+        with self._lock:
+            self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:]
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """저장된 아티팩트의 전체 크기 (바이트)"""
+        with self._lock:
+            return self._bytes
+
+    def _evict(self) -> None:
+        """
+        전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 아티팩트를 삭제합니다.
+        (잠금 안에서 호출)
+        """
+        while self._bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._path(key).unlink(missing_ok=True)
+            self._bytes -= size
+            ARTIFACT_REQUESTS.labels(result="evicted").inc()
+
+    def _track(self, key: str, size: int) -> None:
+        """아티팩트를 가장 최근에 사용한 것으로 기록합니다."""
+        with self._lock:
+            self._bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict()
+
+    def put(self, key: str, data: bytes) -> bool:
+        """
+        아티팩트를 원자적으로 저장합니다.
+
+        Args:
+            key: 아티팩트 키 (artifact_key()의 결과)
+            data: 이미지 바이트
+
+        Returns:
+            bool: 저장 여부 (max_bytes보다 큰 아티팩트는 저장하지 않음)
+        """
+        if len(data) > self.max_bytes:
+            return False
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+        self._track(key, len(data))
+        return True
+
+    def get(self, key: str) -> memoryview | None:
+        """
+        아티팩트를 복사 없이 읽습니다.
+
+        Args:
+            key: 아티팩트 키
+
+        Returns:
+            memoryview | None: 읽기 전용 mmap의 memoryview (없으면 None)
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                data = (
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size
+                    else b""
+                )
+            os.utime(path)  # 재시작 후에도 사용 순서를 유지하도록 수정 시각 갱신
+        except FileNotFoundError:
+            # 다른 프로세스가 삭제한 경우
+            with self._lock:
+                self._bytes -= self._entries.pop(key, 0)
+            return None
+        self._track(key, size)  # 다른 프로세스가 저장한 아티팩트도 추적
+        return memoryview(data)
+
+    def get_or_create(self, key: str, create: Callable[[], bytes]) -> memoryview:
+        """
+        아티팩트를 읽고, 없으면 create()로 생성하여 저장합니다.
+
+        Args:
+            key: 아티팩트 키
+            create: 이미지 바이트를 생성하는 함수 (같은 키의 동시 호출은 한 번만 실행)
+
+        Returns:
+            memoryview: 아티팩트 바이트 (저장하지 못한 큰 아티팩트는 생성한 바이트의 memoryview)
+        """
+        view = self.get(key)
+        if view is not None:
+            ARTIFACT_REQUESTS.labels(result="hit").inc()
+            return view
+
+        def fill() -> memoryview:
+            view = self.get(key)  # 먼저 끝난 생성이 방금 저장한 경우
+            if view is not None:
+                ARTIFACT_REQUESTS.labels(result="hit").inc()
+                return view
+            data = create()
+            self.put(key, data)
+            ARTIFACT_REQUESTS.labels(result="miss").inc()
+            view = self.get(key)
+            return view if view is not None else memoryview(data)
+
+        return self._flight.do(key, fill)
+
+    async def aget_or_create(
+        self, key: str, create: Callable[[], Awaitable[bytes]]
+    ) -> memoryview:
+        """
+        get_or_create()의 비동기 버전입니다.
+
+        Args:
+            key: 아티팩트 키
+            create: 이미지 바이트를 생성하는 코루틴 함수
+
+        Returns:
+            memoryview: 아티팩트 바이트
+        """
+        view = self.get(key)
+        if view is not None:
+            ARTIFACT_REQUESTS.labels(result="hit").inc()
+            return view
+
+        async def fill() -> memoryview:
+            view = self.get(key)  # 먼저 끝난 생성이 방금 저장한 경우
+            if view is not None:
+                ARTIFACT_REQUESTS.labels(result="hit").inc()
+                return view
+            data = await create()
+            self.put(key, data)
+            ARTIFACT_REQUESTS.labels(result="miss").inc()
+            view = self.get(key)
+            return view if view is not None else memoryview(data)
+
+        return await self._flight.ado(key, fill)
+
+
+_store: ArtifactStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """
+    프로세스 전역 아티팩트 저장소를 반환합니다.
+
+    처음 호출될 때 환경변수 IMAGE_ARTIFACT_DIR(기본값: .artifacts/images)과
+    IMAGE_ARTIFACT_MAX_BYTES(기본값: 2 GiB)로 생성합니다.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArtifactStore(
+                os.getenv(IMAGE_ARTIFACT_DIR_ENV) or DEFAULT_ARTIFACT_DIR,
+                int(os.getenv(IMAGE_ARTIFACT_MAX_BYTES_ENV) or DEFAULT_MAX_BYTES),
+            )
+        return _store
+
+
+def set_artifact_store(store: ArtifactStore | None) -> None:
+    """
+    프로세스 전역 아티팩트 저장소를 교체합니다. None이면 다음 호출 때 환경변수로 다시 생성합니다.
+    """
+    global _store
+    with _store_lock:
+        _store = store
@@ -4,14 +4,50 @@
 이 모듈은 LangGraph Workflow에서 조건부 라우팅을 처리하는 함수들을 제공합니다.
 조건부 라우팅은 Workflow의 다음 단계를 동적으로 결정하는 데 사용됩니다.
 
-현재는 주석 처리된 예시 코드만 포함되어 있으며, 필요에 따라 실제 구현을 추가할 수 있습니다.
-이 예시 코드는 ReAct 패턴에서 LLM의 출력에 따라 다음 노드를 결정하는 라우터 함수를 보여줍니다.
+route_query()는 reference_image가 있으면 중복 검사 노드로, 없으면 종료 노드로 이동합니다.
+LLM을 호출하는 이미지 생성 노드가 추가되면 텍스트 / 관리 에이전트처럼 agents.model_router로
+모델 등급을 결정해 model_route에 담아 해당 노드로 Send하면 됩니다. (적용하지 않는 결정은 기록하지 않음)
+skip_duplicate()는 중복 검사 후 거의 같은 에셋이 있으면 생성 노드를 건너뜁니다.
+
+아래의 주석 처리된 예시 코드는 ReAct 패턴에서 LLM의 출력에 따라 다음 노드를 결정하는 라우터 함수를 보여줍니다.
 
 Workflow가 확장됨에 따라 다양한 조건부 라우팅 함수를 이 모듈에 추가할 수 있습니다.
 예를 들어, 이미지 스타일에 따른 라우팅, 사용자 요청 유형에 따른 라우팅 등을 구현할 수 있습니다.
 """
 
-# from typing import Literal
+from typing import Literal
+
+
+def route_query(state) -> Literal["duplicate_check", "__end__"]:
+    """
+    입력 상태로 다음 노드를 결정하는 라우터 함수
+
+    reference_image가 있으면 생성 전에 중복 검사 노드로 이동합니다.
+
+    Args:
+        state (ImageState): 현재 Workflow 상태
+
+    Returns:
+        str: 다음에 실행할 노드의 이름 ("duplicate_check" 또는 "__end__")
+    """
+    if state.get("reference_image"):
+        return "duplicate_check"
+    return "__end__"
+
+
+def skip_duplicate(state) -> Literal["image_generation", "__end__"]:
+    """
+    중복 검사 결과로 이미지 생성 여부를 결정하는 라우터 함수
+
+    Args:
+        state (ImageState): 현재 Workflow 상태
+
+    Returns:
+        str: 거의 같은 에셋이 있으면 "__end__", 없으면 "image_generation"
+    """
+    return "__end__" if state.get("duplicate_of") else "image_generation"
+
+
 # from langchain_core.messages import AIMessage
 
 
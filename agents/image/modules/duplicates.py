@@ -0,0 +1,336 @@
+"""
+이미지 중복 검사 모듈
+
+지각 해시(perceptual hash)로 거의 같은 이미지를 찾습니다. 새 이미지를 생성하거나 저장하기 전에
+이미 비슷한 에셋이 있는지 확인하여 중복 작업을 건너뛰는 데 사용합니다.
+
+- 해시: 64비트 pHash(32x32 회색조의 저주파 DCT 계수를 중앙값과 비교) 또는 dHash(인접 픽셀 밝기 비교).
+  JPEG은 draft 모드로 디코딩 단계에서 축소하여 읽습니다.
+- 거리: 두 해시의 해밍 거리 (XOR 후 1인 비트 수, NumPy bitwise_count로 벡터화)
+- 검색: 다중 인덱스 해싱(multi-index hashing). 64비트를 16비트 조각 4개로 나누면, 해밍 거리가 r 이하인
+  해시는 적어도 한 조각의 거리가 r // 4 이하입니다. (비둘기집 원리) 조각별로 정렬한 배열에서
+  거리 r // 4 이하인 조각 값을 이진 탐색으로 찾아 후보를 모은 뒤, 후보만 전체 거리를 계산합니다.
+  조각 거리가 MAX_CHUNK_RADIUS보다 크면 전체 배열을 벡터 연산으로 훑습니다.
+- 추가된 해시는 정렬 배열에 바로 넣지 않고 뒤쪽(tail)에 모아 전체 탐색하며, tail이 커지면 다음 검색 때
+  조각 배열을 다시 만듭니다.
+
+예시:
+```python
+from agents.image.modules.duplicates import HashIndex, hash_image
+
+index = HashIndex.from_directory("assets/needze")
+index.save("assets/needze.hashes.npz")
+
+matches = index.query(hash_image("draft.png"), max_distance=6)
+print(matches)  # [("posters/teaser.png", 2), ...] (거리 순)
+```
+"""
+
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from agents.image.modules.metadata_index import walk_images
+from agents.image.modules.utils import IMAGE_ERRORS
+
+IMAGE_HASH_INDEX_ENV = "IMAGE_HASH_INDEX"  # 해시 인덱스 파일 경로 (.npz)
+DUPLICATE_DISTANCE = 6  # 거의 같은 이미지로 보는 최대 해밍 거리 (64비트 중)
+CHUNKS = 4  # 해시를 나누는 조각 수 (16비트 조각)
+CHUNK_BITS = 64 // CHUNKS
+# 조각별로 열거하는 최대 거리 (17개 값, 더 크면 후보가 많아 전체 탐색이 더 빠름)
+MAX_CHUNK_RADIUS = 1
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """DCT-II 변환 행렬 (size x size)"""
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * n + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(32)
+
+
+def _pack(bits: np.ndarray) -> int:
+    """64개 비트 배열을 정수 해시로 변환합니다."""
+    return int(np.packbits(bits).view(">u8")[0])
+
+
+def phash(image: Image.Image) -> int:
+    """
+    64비트 pHash를 계산합니다.
+
+    32x32 회색조 이미지의 2차원 DCT에서 저주파 8x8 계수를 DC 성분을 제외한 중앙값과 비교합니다.
+    """
+    pixels = np.asarray(
+        image.convert("L").resize((32, 32), Image.Resampling.LANCZOS), dtype=np.float64
+    )
+    low = (_DCT @ pixels @ _DCT.T)[:8, :8].ravel()
+    return _pack(low > np.median(low[1:]))
+
+
+def dhash(image: Image.Image) -> int:
+    """
+    64비트 dHash를 계산합니다.
+
+    9x8 회색조 이미지에서 각 픽셀이 오른쪽 픽셀보다 어두운지 비교합니다.
+    """
+    pixels = np.asarray(
+        image.convert("L").resize((9, 8), Image.Resampling.BILINEAR), dtype=np.int16
+    )
+    return _pack((pixels[:, 1:] > pixels[:, :-1]).ravel())
+
+
+HASH_FUNCTIONS = {"phash": phash, "dhash": dhash}
+
+
+def hash_image(path: str | Path, method: str = "phash") -> int:
+    """
+    이미지 파일의 지각 해시를 계산합니다.
+
+    Args:
+        path: 이미지 파일 경로
+        method: "phash" 또는 "dhash"
+
+    Returns:
+        int: 64비트 해시
+    """
+    with Image.open(path) as img:
+        img.draft("L", (64, 64))  # JPEG은 디코딩 단계에서 축소
+        return HASH_FUNCTIONS[method](img)
+
+
+def _hash_files(paths: list[str], method: str) -> list[int | None]:
+    """파일 묶음의 해시를 계산합니다. (프로세스 풀 작업 함수, 읽지 못한 파일은 None)"""
+    hashes = []
+    for path in paths:
+        try:
+            hashes.append(hash_image(path, method))
+        except IMAGE_ERRORS:
+            hashes.append(None)
+    return hashes
+
+
+def _chunk(hashes: np.ndarray, position: int) -> np.ndarray:
+    """해시 배열의 position번째 16비트 조각"""
+    shifted = hashes >> np.uint64(position * CHUNK_BITS)
+    return (shifted & np.uint64(0xFFFF)).astype(np.uint16)
+
+
+def _masks(radius: int) -> np.ndarray:
+    """1인 비트가 radius개 이하인 16비트 값 (XOR하면 거리 radius 이하의 조각 값)"""
+    masks = [0]
+    for count in range(1, radius + 1):
+        masks.extend(
+            sum(1 << bit for bit in bits)
+            for bits in combinations(range(CHUNK_BITS), count)
+        )
+    return np.asarray(masks, dtype=np.uint16)
+
+
+_MASKS = [_masks(radius) for radius in range(MAX_CHUNK_RADIUS + 1)]
+
+
+class HashIndex:
+    """
+    해밍 거리 검색을 위한 지각 해시 인덱스
+
+    해시는 용량을 두 배씩 늘리는 uint64 배열에 저장합니다. 스레드 안전합니다.
+    """
+
+    def __init__(self, asset_ids: Iterable[str] = (), hashes: Iterable[int] = ()):
+        """
+        Args:
+            asset_ids: 에셋 ID 목록
+            hashes: asset_ids와 같은 순서의 64비트 해시 목록
+        """
+        self._ids: list[str] = list(asset_ids)
+        self._hashes = np.fromiter(hashes, dtype=np.uint64, count=len(self._ids))
+        self._size = len(self._ids)
+        # 조각별 (정렬된 값, 위치)
+        self._tables: list[tuple[np.ndarray, np.ndarray]] = []
+        self._indexed = 0  # 조각 배열에 들어간 해시 수 (나머지는 tail)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, asset_id: str, hash_value: int) -> None:
+        """
+        해시를 추가합니다.
+
+        Args:
+            asset_id: 에셋 ID (예: 루트 기준 상대 경로)
+            hash_value: 64비트 해시
+        """
+        with self._lock:
+            if self._size == len(self._hashes):
+                grown = np.empty(max(16, self._size * 2), dtype=np.uint64)
+                grown[: self._size] = self._hashes[: self._size]
+                self._hashes = grown
+            self._hashes[self._size] = hash_value
+            self._ids.append(asset_id)
+            self._size += 1
+
+    def add_image(self, asset_id: str, path: str | Path, method: str = "phash") -> int:
+        """이미지 파일의 해시를 계산하여 추가하고, 해시를 반환합니다."""
+        hash_value = hash_image(path, method)
+        self.add(asset_id, hash_value)
+        return hash_value
+
+    def _refresh(self) -> None:
+        """tail이 커지면 조각별 정렬 배열을 다시 만듭니다. (잠금 안에서 호출)"""
+        if self._size - self._indexed <= max(4096, self._indexed // 8):
+            return
+        hashes = self._hashes[: self._size]
+        self._tables = []
+        for position in range(CHUNKS):
+            values = _chunk(hashes, position)
+            order = np.argsort(values, kind="stable")
+            self._tables.append((values[order], order))
+        self._indexed = self._size
+
+    def _candidates(self, hash_value: np.uint64, radius: int) -> np.ndarray:
+        """조각별 정렬 배열에서 후보 위치를 모읍니다."""
+        found = []
+        query = np.asarray([hash_value], dtype=np.uint64)
+        for position, (values, order) in enumerate(self._tables):
+            keys = _chunk(query, position)[0] ^ _MASKS[radius]
+            start = np.searchsorted(values, keys, side="left")
+            counts = np.searchsorted(values, keys, side="right") - start
+            total = int(counts.sum())
+            if total:
+                # 구간 [start, start + count)들을 하나의 인덱스 배열로 펼침
+                offsets = np.repeat(start - np.cumsum(counts) + counts, counts)
+                found.append(order[offsets + np.arange(total)])
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(found))
+
+    def query(self, hash_value: int, max_distance: int = 6) -> list[tuple[str, int]]:
+        """
+        해밍 거리가 max_distance 이하인 에셋을 찾습니다.
+
+        Args:
+            hash_value: 64비트 해시
+            max_distance: 최대 해밍 거리 (0~64)
+
+        Returns:
+            list[tuple[str, int]]: (에셋 ID, 거리) 목록 (거리, 추가된 순)
+        """
+        with self._lock:
+            self._refresh()
+            hashes = self._hashes[: self._size]
+            query = np.uint64(hash_value)
+            radius = max_distance // CHUNKS
+            if radius > MAX_CHUNK_RADIUS:  # 전체 탐색
+                distances = np.bitwise_count(hashes ^ query)
+                positions = np.flatnonzero(distances <= max_distance)
+                distances = distances[positions]
+            else:  # 조각 배열의 후보 + tail
+                positions = np.concatenate(
+                    (
+                        self._candidates(query, radius),
+                        np.arange(self._indexed, self._size),
+                    )
+                )
+                distances = np.bitwise_count(hashes[positions] ^ query)
+                keep = distances <= max_distance
+                positions, distances = positions[keep], distances[keep]
+            ranked = np.lexsort((positions, distances))
+            return [
+                (self._ids[position], int(distance))
+                for position, distance in zip(
+                    positions[ranked].tolist(), distances[ranked].tolist()
+                )
+            ]
+
+    def save(self, path: str | Path) -> None:
+        """인덱스를 .npz 파일로 저장합니다."""
+        with self._lock:
+            np.savez(
+                path,
+                ids=np.asarray(self._ids, dtype=str),
+                hashes=self._hashes[: self._size],
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "HashIndex":
+        """save()로 저장한 .npz 파일에서 인덱스를 불러옵니다."""
+        with np.load(path) as data:
+            return cls(data["ids"].tolist(), data["hashes"])
+
+    @classmethod
+    def from_directory(
+        cls,
+        root: str | Path,
+        method: str = "phash",
+        workers: int | None = None,
+        chunk_size: int = 256,
+    ) -> "HashIndex":
+        """
+        루트 디렉토리 아래의 모든 이미지 해시를 프로세스 풀에서 계산하여 인덱스를 만듭니다.
+
+        Args:
+            root: 이미지 루트 디렉토리 (에셋 ID는 루트 기준 상대 경로)
+            method: "phash" 또는 "dhash"
+            workers: 프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 실행)
+            chunk_size: 작업 하나에 묶는 파일 수
+
+        Returns:
+            HashIndex: 읽지 못한 파일을 제외한 인덱스
+        """
+        root = os.path.abspath(root)
+        paths = [path for path, _, _ in walk_images(root)]
+        chunks = [
+            [os.path.join(root, path) for path in paths[i : i + chunk_size]]
+            for i in range(0, len(paths), chunk_size)
+        ]
+        workers = workers or os.cpu_count() or 1
+        methods = [method] * len(chunks)
+        if workers == 1 or len(chunks) <= 1:
+            results = list(map(_hash_files, chunks, methods))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                results = list(executor.map(_hash_files, chunks, methods))
+
+        hashes = [hash_value for chunk in results for hash_value in chunk]
+        return cls(
+            (path for path, value in zip(paths, hashes) if value is not None),
+            (value for value in hashes if value is not None),
+        )
+
+
+_index: HashIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_hash_index() -> HashIndex:
+    """
+    프로세스 전역 해시 인덱스를 반환합니다.
+
+    처음 호출될 때 환경변수 IMAGE_HASH_INDEX의 파일에서 불러오며, 설정되지 않았으면 빈 인덱스를 사용합니다.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            path = os.getenv(IMAGE_HASH_INDEX_ENV)
+            _index = HashIndex.load(path) if path else HashIndex()
+        return _index
+
+
+def set_hash_index(index: HashIndex | None) -> None:
+    """
+    프로세스 전역 해시 인덱스를 교체합니다. None이면 다음 호출 때 파일에서 다시 불러옵니다.
+    """
+    global _index
+    with _index_lock:
+        _index = index
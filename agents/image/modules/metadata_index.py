@@ -0,0 +1,273 @@
+"""
+이미지 메타데이터 색인 모듈
+
+에셋 디렉토리의 이미지 메타데이터(형식, 모드, 너비, 높이)를 SQLite 사이드카 색인에 저장합니다.
+
+- 이미지는 헤더만 읽습니다. (utils.read_image_header, 픽셀 디코딩 없음)
+- 헤더 읽기는 프로세스 풀에서 파일 묶음(chunk) 단위로 병렬 실행합니다.
+- 색인 항목은 루트 기준 상대 경로를 키로 하고 수정 시각(mtime_ns)과 파일 크기를 함께 저장합니다.
+  다시 색인할 때는 디렉토리를 stat으로만 훑고, 수정 시각이나 크기가 바뀐 파일과 새 파일만 헤더를 읽으며,
+  사라진 파일은 색인에서 삭제합니다.
+- 읽지 못한 파일도 오류 메시지와 함께 저장하므로, 파일이 바뀌기 전에는 다시 읽지 않습니다.
+
+사이드카 파일은 기본적으로 루트 디렉토리의 `.image_index.sqlite`이며, 상대 경로를 키로 쓰므로
+루트 디렉토리를 옮겨도 색인을 그대로 사용할 수 있습니다.
+
+예시:
+```python
+from agents.image.modules.metadata_index import ImageMetadataIndex
+
+with ImageMetadataIndex("assets/images") as index:
+    stats = index.update(workers=8)
+    print(stats.extracted, stats.unchanged, f"{stats.files_per_second:.0f} files/s")
+    print(index.get("posters/teaser.png"))  # {"format": "PNG", "mode": "RGB", ...}
+```
+"""
+
+import os
+import sqlite3
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Self
+
+from agents.image.modules.utils import IMAGE_ERRORS, logger, read_image_header
+
+DEFAULT_INDEX_NAME = ".image_index.sqlite"  # 루트 디렉토리의 사이드카 색인 파일 이름
+IMAGE_EXTENSIONS = frozenset(
+    {".bmp", ".gif", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp"}
+)
+METADATA_FIELDS = ("format", "mode", "width", "height")
+
+
+@dataclass(frozen=True, slots=True)
+class ScanStats:
+    """
+    색인 갱신 결과
+
+    Attributes:
+        scanned: 디렉토리에서 찾은 이미지 파일 수
+        extracted: 헤더를 새로 읽은 파일 수 (새 파일 + 바뀐 파일, 실패 포함)
+        unchanged: 수정 시각과 크기가 같아 건너뛴 파일 수
+        removed: 사라져서 색인에서 삭제한 파일 수
+        failed: 헤더를 읽지 못한 파일 수
+        seconds: 걸린 시간 (초)
+    """
+
+    scanned: int
+    extracted: int
+    unchanged: int
+    removed: int
+    failed: int
+    seconds: float
+
+    @property
+    def files_per_second(self) -> float:
+        """초당 헤더를 읽은 파일 수"""
+        return self.extracted / self.seconds if self.seconds else 0.0
+
+
+def walk_images(root: str) -> Iterator[tuple[str, int, int]]:
+    """
+    루트 아래의 이미지 파일을 (상대 경로, mtime_ns, 크기)로 순회합니다.
+
+    읽을 수 없는 하위 디렉토리와 파일(끊어진 심볼릭 링크, 순회 중 삭제된 파일 등)은
+    경고를 남기고 건너뜁니다. (루트 디렉토리를 읽을 수 없으면 OSError)
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as error:
+            if directory == root:
+                raise
+            logger.warning("디렉토리를 읽지 못해 건너뜁니다: %s: %s", directory, error)
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                        continue
+                    stat = entry.stat()
+                except OSError as error:
+                    logger.warning(
+                        "파일을 읽지 못해 건너뜁니다: %s: %s", entry.path, error
+                    )
+                    continue
+                yield (
+                    os.path.relpath(entry.path, root).replace(os.sep, "/"),
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                )
+
+
+def _extract_chunk(root: str, chunk: list[tuple[str, int, int]]) -> list[tuple]:
+    """
+    파일 묶음의 헤더를 읽어 색인 행 목록을 반환합니다. (프로세스 풀 작업 함수)
+
+    Returns:
+        list[tuple]: (path, mtime_ns, size, format, mode, width, height, error) 목록
+    """
+    rows = []
+    for path, mtime_ns, size in chunk:
+        try:
+            header = read_image_header(os.path.join(root, path))
+        except IMAGE_ERRORS as error:
+            rows.append((path, mtime_ns, size, None, None, None, None, str(error)))
+        else:
+            rows.append(
+                (
+                    path,
+                    mtime_ns,
+                    size,
+                    *(header[field] for field in METADATA_FIELDS),
+                    None,
+                )
+            )
+    return rows
+
+
+class ImageMetadataIndex:
+    """
+    이미지 메타데이터 사이드카 색인
+
+    하나의 루트 디렉토리를 색인하며, 연결은 이 객체를 만든 스레드에서만 사용합니다.
+    """
+
+    def __init__(self, root: str | Path, index_path: str | Path | None = None):
+        """
+        Args:
+            root: 색인할 이미지 루트 디렉토리
+            index_path: 사이드카 색인 파일 경로 (기본값: 루트의 .image_index.sqlite)
+        """
+        self.root = os.path.abspath(root)
+        self.index_path = Path(
+            index_path or os.path.join(self.root, DEFAULT_INDEX_NAME)
+        )
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.index_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")  # 커밋마다 fsync하지 않음
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS images (
+                path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER,
+                format TEXT, mode TEXT, width INTEGER, height INTEGER, error TEXT
+            )
+            """
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """색인 연결을 닫습니다."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    def get(self, path: str) -> dict | None:
+        """
+        파일의 메타데이터를 반환합니다.
+
+        Args:
+            path: 루트 기준 상대 경로 ("/" 구분)
+
+        Returns:
+            dict | None: {"format", "mode", "width", "height"} (읽지 못한 파일은 {"error"},
+            색인에 없으면 None)
+        """
+        row = self._connection.execute(
+            "SELECT format, mode, width, height, error FROM images WHERE path = ?",
+            (path,),
+        ).fetchone()
+        if row is None:
+            return None
+        if row[-1] is not None:
+            return {"error": row[-1]}
+        return dict(zip(METADATA_FIELDS, row))
+
+    def records(self) -> Iterator[dict]:
+        """읽은 파일의 메타데이터를 경로 순으로 순회합니다. (읽지 못한 파일 제외)"""
+        cursor = self._connection.execute(
+            "SELECT path, format, mode, width, height FROM images "
+            "WHERE error IS NULL ORDER BY path"
+        )
+        for row in cursor:
+            yield dict(zip(("path", *METADATA_FIELDS), row))
+
+    def update(self, workers: int | None = None, chunk_size: int = 256) -> ScanStats:
+        """
+        루트 디렉토리를 훑어 새 파일과 바뀐 파일의 헤더를 읽고, 사라진 파일을 색인에서 삭제합니다.
+
+        Args:
+            workers: 프로세스 수 (기본값: CPU 수, 1이거나 읽을 파일이 한 묶음 이하이면 현재 프로세스에서 실행)
+            chunk_size: 작업 하나에 묶는 파일 수 (프로세스 간 통신 비용을 줄임)
+
+        Returns:
+            ScanStats: 갱신 결과
+        """
+        start = time.perf_counter()
+        known = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self._connection.execute(
+                "SELECT path, mtime_ns, size FROM images"
+            )
+        }
+        scanned = 0
+        changed = []
+        for path, mtime_ns, size in walk_images(self.root):
+            scanned += 1
+            if known.pop(path, None) != (mtime_ns, size):
+                changed.append((path, mtime_ns, size))
+
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM images WHERE path = ?", ((path,) for path in known)
+            )
+
+        chunks = [
+            changed[i : i + chunk_size] for i in range(0, len(changed), chunk_size)
+        ]
+        workers = workers or os.cpu_count() or 1
+        failed = 0
+        if workers == 1 or len(chunks) <= 1:
+            results = map(_extract_chunk, repeat(self.root), chunks)
+            failed = self._store(results)
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                failed = self._store(
+                    executor.map(_extract_chunk, repeat(self.root), chunks)
+                )
+
+        return ScanStats(
+            scanned=scanned,
+            extracted=len(changed),
+            unchanged=scanned - len(changed),
+            removed=len(known),
+            failed=failed,
+            seconds=time.perf_counter() - start,
+        )
+
+    def _store(self, results: Iterator[list[tuple]]) -> int:
+        """작업 결과를 묶음마다 커밋하고, 읽지 못한 파일 수를 반환합니다."""
+        failed = 0
+        for rows in results:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            failed += sum(row[-1] is not None for row in rows)
+        return failed
@@ -4,42 +4,209 @@
 해당 클래스 모듈은 각각 노드 클래스가 BaseNode를 상속받아 노드 클래스를 구현하는 모듈입니다.
 """
 
-# from agents.base_node import BaseNode
+from abc import abstractmethod
+
+from agents.base_node import BaseNode
 
 # from agents.image.modules.chains import set_image_generation_chain
 
 
-# class ImageGenerationNode(BaseNode):
+class DuplicateCheckNode(BaseNode):
+    """
+    이미지를 생성 / 저장하기 전에 거의 같은 에셋이 이미 있는지 확인하는 노드
+
+    상태의 reference_image(초안, 참고 이미지 등)의 지각 해시로 프로세스 전역 해시 인덱스
+    (duplicates.get_hash_index())를 검색하고, 가장 가까운 에셋을 duplicate_of에 기록합니다.
+    조건부 에지(conditions.skip_duplicate)는 중복이 있으면 생성 노드를 건너뜁니다.
+    """
+
+    def __init__(
+        self, max_distance: int | None = None, method: str = "phash", **kwargs
+    ):
+        """
+        Args:
+            max_distance: 거의 같은 이미지로 보는 최대 해밍 거리 (기본값: duplicates.DUPLICATE_DISTANCE)
+            method: 해시 방식 ("phash" 또는 "dhash", 인덱스를 만든 방식과 같아야 함)
+            **kwargs: BaseNode 키워드 인자
+        """
+        super().__init__(**kwargs)  # BaseNode 초기화
+        self.max_distance = max_distance
+        self.method = method
+
+    def execute(self, state) -> dict:
+        """
+        reference_image의 해시로 해시 인덱스를 검색하여 duplicate_of를 반환합니다.
+
+        Args:
+            state: 현재 워크플로우 상태
+
+        Returns:
+            dict: duplicate_of (중복이 있으면 응답 메시지 포함, 이미지를 읽지 못하면 None)
+        """
+        from agents.image.modules.duplicates import (
+            DUPLICATE_DISTANCE,
+            get_hash_index,
+            hash_image,
+        )
+        from agents.image.modules.utils import IMAGE_ERRORS, logger
+
+        # 없거나 읽을 수 없는 이미지는 중복이 아닌 것으로 처리
+        try:
+            hash_value = hash_image(state["reference_image"], self.method)
+        except IMAGE_ERRORS as error:
+            logger.warning(
+                "중복 검사 이미지를 읽지 못했습니다: %s: %s",
+                state["reference_image"],
+                error,
+            )
+            return {"duplicate_of": None}
+
+        max_distance = (
+            DUPLICATE_DISTANCE if self.max_distance is None else self.max_distance
+        )
+        matches = get_hash_index().query(hash_value, max_distance)
+        if not matches:
+            return {"duplicate_of": None}
+
+        asset_id, distance = matches[0]  # 가장 가까운 에셋
+        return {
+            "duplicate_of": {"asset_id": asset_id, "distance": distance},
+            "response": f"거의 같은 이미지가 이미 있어 생성을 건너뜁니다: {asset_id} (거리 {distance})",
+        }
+
+
+class CachedImageNode(BaseNode):
+    """
+    생성한 이미지를 아티팩트 저장소에 캐시하는 이미지 생성 노드의 기반 클래스
+
+    query와 generation_params()를 정규화한 해시를 키로 프로세스 전역 아티팩트 저장소
+    (artifacts.get_artifact_store())를 먼저 확인하고, 없을 때만 generate()를 호출합니다.
+    같은 키의 동시 요청은 한 번만 생성합니다. 하위 클래스는 generate()(비동기는 agenerate())와
+    필요하면 generation_params()를 구현합니다.
+    """
+
+    @abstractmethod
+    def generate(self, state) -> bytes:
+        """
+        이미지를 생성합니다. (캐시에 없을 때만 호출)
+
+        Args:
+            state: 현재 워크플로우 상태
+
+        Returns:
+            bytes: 인코딩된 이미지 바이트 (PNG, JPEG 등)
+        """
+
+    async def agenerate(self, state) -> bytes:
+        """
+        generate()의 비동기 버전입니다. 기본 구현은 generate()를 실행기에서 실행합니다.
+
+        Args:
+            state: 현재 워크플로우 상태
+
+        Returns:
+            bytes: 인코딩된 이미지 바이트
+        """
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.generate, state
+        )
+
+    def generation_params(self, state) -> dict:
+        """
+        결과 이미지에 영향을 주는 생성 파라미터를 반환합니다. (모델, 크기, 스타일, 시드 등)
+
+        Args:
+            state: 현재 워크플로우 상태
+
+        Returns:
+            dict: 아티팩트 키에 포함할 파라미터
+        """
+        return {}
+
+    def artifact_key(self, state) -> str:
+        """
+        query, 노드 이름, 생성 파라미터로 아티팩트 키를 만듭니다.
+
+        Args:
+            state: 현재 워크플로우 상태
+
+        Returns:
+            str: 아티팩트 키
+        """
+        from agents.image.modules.artifacts import artifact_key
+
+        return artifact_key(
+            state["query"], node=self.name, **self.generation_params(state)
+        )
+
+    def execute(self, state) -> dict:
+        """
+        저장된 이미지를 반환하고, 없으면 생성하여 저장합니다.
+
+        Args:
+            state: 현재 워크플로우 상태
+
+        Returns:
+            dict: artifact_key와 image (복사 없이 읽은 이미지 바이트의 memoryview)
+        """
+        from agents.image.modules.artifacts import get_artifact_store
+
+        key = self.artifact_key(state)
+        image = get_artifact_store().get_or_create(key, lambda: self.generate(state))
+        return {"artifact_key": key, "image": image}
+
+    async def aexecute(self, state) -> dict:
+        """
+        execute()의 비동기 버전입니다.
+
+        Args:
+            state: 현재 워크플로우 상태
+
+        Returns:
+            dict: artifact_key와 image
+        """
+        from agents.image.modules.artifacts import get_artifact_store
+
+        key = self.artifact_key(state)
+        image = await get_artifact_store().aget_or_create(
+            key, lambda: self.agenerate(state)
+        )
+        return {"artifact_key": key, "image": image}
+
+
+# class ImageGenerationNode(CachedImageNode):
 #     """
 #     이미지 생성을 위한 노드
 
 #     이 노드는 사용자의 요청에 따라 이미지를 생성하는 기능을 담당합니다.
+#     CachedImageNode를 상속받으면 execute() 대신 generate()만 구현하면 되며,
+#     같은 요청의 이미지는 아티팩트 저장소에서 다시 생성하지 않고 반환합니다.
 #     """
 
 #     def __init__(self, **kwargs):
 #         super().__init__(**kwargs)  # BaseNode 초기화
 #         # self.chain = set_image_generation_chain()  # 이미지 생성 체인 설정
 
-#     def execute(self, state) -> dict:
+#     def generate(self, state) -> bytes:
 #         """
 #         주어진 상태(state)에서 query를 추출하여
-#         이미지 생성 체인에 전달하고, 결과를 응답으로 반환합니다.
+#         이미지 생성 체인에 전달하고, 생성된 이미지 바이트를 반환합니다.
+#         (아티팩트 저장소에 같은 요청의 이미지가 없을 때만 호출)
 
 #         Args:
 #             state: 현재 워크플로우 상태
 
 #         Returns:
-#             dict: 생성된 이미지 정보가 포함된 응답
+#             bytes: 생성된 이미지 바이트
 #         """
 #         # 실제 구현은 추후 개발 시 추가
-#         # generated_image = self.chain.invoke(
+#         # return self.chain.invoke(
 #         #     {
 #         #         "query": state["query"],  # 사용자 쿼리
 #         #     }
 #         # )
 
-#         # 더미 응답 생성
-#         dummy_response = "이미지 생성 기능은 아직 구현되지 않았습니다."
-
-#         # 응답 반환
-#         return {"response": dummy_response}
+#     def generation_params(self, state) -> dict:
+#         return {"model": "...", "size": "1024x1024"}  # 결과 이미지에 영향을 주는 파라미터
@@ -0,0 +1,215 @@
+"""
+이미지 일괄 리사이즈 모듈
+
+여러 이미지에서 크기별 썸네일 / 미리보기 이미지를 생성합니다.
+
+- 한 번 디코딩한 이미지로 여러 출력 크기를 만듭니다. (큰 크기부터 생성)
+- JPEG은 디코더의 draft 모드로 디코딩 단계에서 1/2, 1/4, 1/8로 축소하고,
+  다른 형식은 resize()의 reducing_gap으로 정수 배 축소(reduce)를 먼저 적용합니다.
+- 출력은 박스 안에 비율을 유지하여 맞추며, 원본보다 크게 늘리지 않습니다.
+- 작업은 프로세스 풀에서 실행하며, 파일 목록은 이터레이터로 받아 처리 중인 작업 수를
+  max_pending개로 제한합니다. (backpressure) 따라서 이미지 데이터의 메모리 사용량은 파일 수와 관계없이 일정합니다.
+- 출력 파일 이름은 원본 파일 이름(확장자 포함) 뒤에 크기 이름을 붙입니다. (teaser.png -> teaser.png_thumb.jpg)
+  다른 원본과 출력 경로가 겹치면(root 없이 다른 디렉토리의 같은 이름 파일 등) 덮어쓰지 않고 오류로 보고합니다.
+
+예시:
+```python
+from agents.image.modules.resize import resize_directory
+
+sizes = {"thumb": (256, 256), "preview": (1024, 1024)}
+for result in resize_directory("assets/images", "assets/resized", sizes, workers=8):
+    if result.error:
+        print(result.source, result.error)
+# assets/resized/posters/teaser.png_thumb.jpg, assets/resized/posters/teaser.png_preview.jpg, ...
+```
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from PIL import Image
+
+from agents.image.modules.metadata_index import walk_images
+from agents.image.modules.utils import IMAGE_ERRORS
+
+OUTPUT_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+# 형식별로 변환 없이 리사이즈 / 저장하는 모드 (팔레트 모드는 LANCZOS를 쓸 수 없으므로 변환)
+OUTPUT_MODES = {
+    "JPEG": ("RGB", "L"),
+    "PNG": ("RGB", "RGBA", "L", "LA"),
+    "WEBP": ("RGB", "RGBA"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ResizeResult:
+    """
+    이미지 하나의 리사이즈 결과
+
+    Attributes:
+        source: 원본 이미지 경로
+        outputs: 크기 이름 -> 출력 파일 경로
+        error: 실패한 경우 오류 메시지
+    """
+
+    source: str
+    outputs: dict[str, str] = field(default_factory=dict)
+    error: str | None = None
+
+
+def fit_size(size: tuple[int, int], box: tuple[int, int]) -> tuple[int, int]:
+    """비율을 유지하여 box 안에 맞춘 크기를 반환합니다. (원본보다 크게 늘리지 않음)"""
+    width, height = size
+    scale = min(box[0] / width, box[1] / height, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def render_sizes(
+    source: str,
+    destination: str,
+    sizes: dict[str, tuple[int, int]],
+    format: str = "JPEG",
+    quality: int = 85,
+) -> dict[str, str]:
+    """
+    이미지를 한 번 디코딩하여 크기별 출력 파일을 저장합니다.
+
+    Args:
+        source: 원본 이미지 경로
+        destination: 확장자를 뺀 출력 경로 (크기 이름과 확장자를 붙여 저장)
+        sizes: 크기 이름 -> (최대 너비, 최대 높이)
+        format: 출력 형식 ("JPEG", "PNG", "WEBP")
+        quality: JPEG / WebP 품질
+
+    Returns:
+        dict[str, str]: 크기 이름 -> 출력 파일 경로
+    """
+    os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+    with Image.open(source) as img:
+        targets = {name: fit_size(img.size, box) for name, box in sizes.items()}
+        # JPEG은 가장 큰 출력 크기 이상을 유지하는 범위에서 디코딩 단계에서 축소 (다른 형식은 무시됨)
+        img.draft(None, max(targets.values()))
+        if img.mode in OUTPUT_MODES[format]:
+            base = img
+        else:
+            alpha = format != "JPEG" and img.has_transparency_data
+            base = img.convert("RGBA" if alpha else "RGB")
+        outputs = {}
+        for name, target in sorted(
+            targets.items(), key=lambda item: item[1], reverse=True
+        ):
+            path = f"{destination}_{name}{OUTPUT_EXTENSIONS[format]}"
+            resized = (
+                base
+                if target == base.size
+                else base.resize(target, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            )
+            resized.save(path, format=format, quality=quality)
+            outputs[name] = path
+    return outputs
+
+
+def _resize_one(
+    source: str, destination: str, sizes: dict, format: str, quality: int
+) -> ResizeResult:
+    """이미지 하나를 리사이즈합니다. (프로세스 풀 작업 함수)"""
+    try:
+        return ResizeResult(
+            source, render_sizes(source, destination, sizes, format, quality)
+        )
+    except IMAGE_ERRORS as error:
+        return ResizeResult(source, error=str(error))
+
+
+def resize_images(
+    sources: Iterable[str],
+    output_dir: str,
+    sizes: dict[str, tuple[int, int]],
+    root: str | None = None,
+    workers: int | None = None,
+    max_pending: int | None = None,
+    format: str = "JPEG",
+    quality: int = 85,
+) -> Iterator[ResizeResult]:
+    """
+    이미지를 크기별로 리사이즈하고, 끝난 순서대로 결과를 반환합니다.
+
+    sources는 필요한 만큼만 소비하므로 제너레이터를 그대로 전달할 수 있습니다.
+    출력 경로 충돌을 검사하기 위해 이미 사용한 출력 경로만 기억합니다.
+
+    Args:
+        sources: 원본 이미지 경로 이터러블
+        output_dir: 출력 디렉토리
+        sizes: 크기 이름 -> (최대 너비, 최대 높이)
+        root: 출력 경로를 만들 기준 디렉토리 (지정하면 하위 디렉토리 구조를 유지, 없으면 파일 이름만 사용)
+            (출력 경로가 앞선 원본과 겹치는 원본은 처리하지 않고 error에 메시지를 담아 반환)
+        workers: 프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 실행)
+        max_pending: 동시에 제출하는 최대 작업 수 (기본값: workers * 2)
+        format: 출력 형식 ("JPEG", "PNG", "WEBP")
+        quality: JPEG / WebP 품질
+
+    Returns:
+        Iterator[ResizeResult]: 이미지별 결과 (실패한 이미지는 error에 메시지)
+    """
+    if format not in OUTPUT_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {format}")
+
+    claimed: set[str] = set()  # 이미 사용한 출력 경로
+
+    def job(source: str) -> tuple | ResizeResult:
+        """작업 인자를 반환합니다. (출력 경로가 앞선 원본과 겹치면 오류 결과)"""
+        relative = os.path.relpath(source, root) if root else os.path.basename(source)
+        # 확장자를 남겨 teaser.png / teaser.jpg가 같은 출력 파일을 쓰지 않도록 함
+        destination = os.path.join(output_dir, relative)
+        key = os.path.normcase(os.path.abspath(destination))
+        if key in claimed:
+            return ResizeResult(
+                source, error=f"출력 경로가 앞선 이미지와 겹칩니다: {destination}"
+            )
+        claimed.add(key)
+        return source, destination, sizes, format, quality
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for source in sources:
+            args = job(str(source))
+            yield args if isinstance(args, ResizeResult) else _resize_one(*args)
+        return
+
+    max_pending = max_pending or workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for source in sources:
+            # 처리 중인 작업이 끝날 때까지 다음 파일을 읽지 않음
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            args = job(str(source))
+            if isinstance(args, ResizeResult):
+                yield args
+            else:
+                pending.add(executor.submit(_resize_one, *args))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+
+
+def resize_directory(
+    root: str, output_dir: str, sizes: dict[str, tuple[int, int]], **kwargs
+) -> Iterator[ResizeResult]:
+    """
+    루트 디렉토리 아래의 모든 이미지를 하위 디렉토리 구조를 유지하여 리사이즈합니다.
+
+    Args:
+        root: 원본 이미지 루트 디렉토리
+        output_dir: 출력 디렉토리
+        sizes: 크기 이름 -> (최대 너비, 최대 높이)
+        **kwargs: resize_images() 키워드 인자 (workers, max_pending, format, quality)
+
+    Returns:
+        Iterator[ResizeResult]: 이미지별 결과
+    """
+    sources = (os.path.join(root, path) for path, _, _ in walk_images(root))
+    return resize_images(sources, output_dir, sizes, root=root, **kwargs)
@@ -26,3 +26,11 @@ class ImageState(TypedDict):
     response: Annotated[
         list, add_messages
     ]  # 응답 메시지 목록 (add_messages로 주석되어 메시지 추가 기능 제공)
+    # 중복 검사할 이미지 경로 (초안, 참고 이미지 등, 없으면 검사하지 않음)
+    reference_image: str | None = None
+    # 거의 같은 기존 에셋 ({"asset_id", "distance"}, 없으면 None)
+    duplicate_of: dict | None = None
+    # 생성한 이미지의 아티팩트 키 (정규화한 query와 생성 파라미터의 SHA-256)
+    artifact_key: str | None = None
+    # 생성한 이미지 바이트 (아티팩트 저장소 파일을 복사 없이 읽은 memoryview)
+    image: memoryview | None = None
@@ -2,61 +2,90 @@
 유틸리티 및 보조 함수 모듈
 
 이 모듈은 이미지 처리 Workflow에서 사용할 수 있는 다양한 유틸리티 함수를 제공합니다.
-현재는 주석 처리된 예시 코드만 포함되어 있으며, 필요에 따라 실제 구현을 추가할 수 있습니다.
-
-아래 예시 코드는 이미지 처리와 관련된 유틸리티 함수들입니다.
-이 함수들은 이미지 파일 처리 및 메타데이터 추출과 관련된 기능을 제공합니다.
+현재는 이미지 메타데이터 추출(헤더만 읽음)과 크기 조정 함수가 구현되어 있습니다.
 
 추후 개발 시 필요한 유틸리티 함수를 이 모듈에 추가하여 코드 재사용성을 높일 수 있습니다.
 예를 들어, 이미지 전처리, 이미지 특성 추출, 데이터 변환 등의 기능을 구현할 수 있습니다.
 """
 
-# from typing import Dict, Any, Optional
-# from PIL import Image
-
-
-# def extract_image_metadata(file_path: str) -> Optional[Dict[str, Any]]:
-#     """
-#     이미지 파일에서 메타데이터를 추출합니다.
-#
-#     Args:
-#         file_path (str): 이미지 파일 경로
-#
-#     Returns:
-#         Optional[Dict[str, Any]]: 추출된 메타데이터 (크기, 형식, 모드 등)
-#     """
-#     try:
-#         with Image.open(file_path) as img:
-#             return {
-#                 "format": img.format,
-#                 "mode": img.mode,
-#                 "size": img.size,
-#                 "width": img.width,
-#                 "height": img.height,
-#             }
-#     except Exception as e:
-#         print(f"이미지 메타데이터 추출 중 오류 발생: {e}")
-#         return None
-
-
-# def resize_image(file_path: str, width: int, height: int, output_path: str) -> bool:
-#     """
-#     이미지 크기를 조정합니다.
-#
-#     Args:
-#         file_path (str): 원본 이미지 파일 경로
-#         width (int): 조정할 너비
-#         height (int): 조정할 높이
-#         output_path (str): 결과 이미지 저장 경로
-#
-#     Returns:
-#         bool: 성공 여부
-#     """
-#     try:
-#         with Image.open(file_path) as img:
-#             resized_img = img.resize((width, height))
-#             resized_img.save(output_path)
-#             return True
-#     except Exception as e:
-#         print(f"이미지 크기 조정 중 오류 발생: {e}")
-#         return False
+import logging
+from typing import Any
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# 이미지를 열거나 디코딩할 때 PIL이 발생시키는 예외 (손상 / 미지원 형식 / 잘못된 크기 / 압축 폭탄)
+IMAGE_ERRORS = (OSError, SyntaxError, ValueError, Image.DecompressionBombError)
+
+
+def read_image_header(file_path: str) -> dict[str, Any]:
+    """
+    이미지 파일의 헤더만 읽어 메타데이터를 반환합니다.
+
+    PIL의 Image.open()은 헤더만 파싱하고 픽셀 데이터는 load()를 호출할 때 디코딩하므로,
+    load()를 호출하지 않으면 파일 크기와 관계없이 앞부분 몇 KB만 읽습니다.
+
+    Args:
+        file_path (str): 이미지 파일 경로
+
+    Returns:
+        dict[str, Any]: 메타데이터 (format, mode, width, height)
+
+    Raises:
+        OSError: 파일을 열 수 없거나 이미지 형식을 인식할 수 없는 경우
+    """
+    with Image.open(file_path) as img:
+        return {
+            "format": img.format,
+            "mode": img.mode,
+            "width": img.width,
+            "height": img.height,
+        }
+
+
+def extract_image_metadata(file_path: str) -> dict[str, Any] | None:
+    """
+    이미지 파일에서 메타데이터를 추출합니다. (헤더만 읽음)
+
+    여러 파일은 metadata_index.ImageMetadataIndex로 병렬 색인하세요.
+
+    Args:
+        file_path (str): 이미지 파일 경로
+
+    Returns:
+        dict[str, Any] | None: 추출된 메타데이터 (크기, 형식, 모드 등, 읽을 수 없는 파일은 None이며 경고 로그를 남김)
+    """
+    try:
+        metadata = read_image_header(file_path)
+    except IMAGE_ERRORS as error:
+        logger.warning("이미지 메타데이터 추출 중 오류 발생: %s: %s", file_path, error)
+        return None
+    return {**metadata, "size": (metadata["width"], metadata["height"])}
+
+
+def resize_image(file_path: str, width: int, height: int, output_path: str) -> bool:
+    """
+    이미지 크기를 조정합니다.
+
+    JPEG은 디코더의 draft 모드로 디코딩 단계에서 축소하므로 원본 전체를 디코딩하지 않습니다.
+    여러 파일 / 여러 출력 크기는 resize.resize_images()를 사용하세요.
+
+    Args:
+        file_path (str): 원본 이미지 파일 경로
+        width (int): 조정할 너비
+        height (int): 조정할 높이
+        output_path (str): 결과 이미지 저장 경로
+
+    Returns:
+        bool: 성공 여부 (실패하면 경고 로그를 남김)
+    """
+    try:
+        with Image.open(file_path) as img:
+            img.draft(None, (width, height))
+            resized_img = img.resize((width, height), reducing_gap=3.0)
+            resized_img.save(output_path)
+            return True
+    except IMAGE_ERRORS as error:
+        logger.warning("이미지 크기 조정 중 오류 발생: %s: %s", file_path, error)
+        return False
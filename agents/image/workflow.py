@@ -8,6 +8,8 @@ StateGraph를 사용하여 이미지 처리를 위한 워크플로우를 구축
 from langgraph.graph import StateGraph
 
 from agents.base_workflow import BaseWorkflow
+from agents.image.modules.conditions import route_query
+from agents.image.modules.nodes import DuplicateCheckNode
 from agents.image.modules.state import ImageState
 
 
@@ -19,8 +21,8 @@ class ImageWorkflow(BaseWorkflow):
     BaseWorkflow를 상속받아 기본 구조를 구현하고, ImageState를 사용하여 상태를 관리합니다.
     """
 
-    def __init__(self, state):
-        super().__init__()
+    def __init__(self, state, **options):
+        super().__init__(**options)
         self.state = state
 
     def build(self):
@@ -28,7 +30,8 @@ class ImageWorkflow(BaseWorkflow):
         이미지 Workflow 그래프 구축 메서드
 
         StateGraph를 사용하여 이미지 처리를 위한 Workflow 그래프를 구축합니다.
-        현재는 간단한 구조로 시작 노드에서 종료 노드로 직접 연결되어 있으며,
+        현재는 시작 노드의 조건부 에지(route_query)가 reference_image가 있으면 중복 검사 노드로,
+        없으면 바로 종료(__end__)로 보내며,
         추후 이미지 생성 노드 등을 추가하여 확장할 수 있습니다.
 
         Returns:
@@ -36,15 +39,21 @@ class ImageWorkflow(BaseWorkflow):
         """
         builder = StateGraph(self.state)
 
-        # 기본 구조: 시작 노드에서 종료 노드로 직접 연결
-        builder.add_edge("__start__", "__end__")
+        # 기본 구조: 시작 노드에서 참고 이미지가 있으면 중복 검사, 없으면 종료
+        builder.add_node("duplicate_check", DuplicateCheckNode())
+        builder.add_conditional_edges(
+            "__start__", route_query, ["duplicate_check", "__end__"]
+        )
+        builder.add_edge("duplicate_check", "__end__")
 
-        # 향후 이미지 생성 노드 추가 예시
+        # 향후 이미지 생성 노드 추가 예시 (중복이 있으면 생성을 건너뜀)
         # builder.add_node("image_generation", ImageGenerationNode())
-        # builder.add_edge("__start__", "image_generation")
+        # builder.add_conditional_edges(
+        #     "duplicate_check", skip_duplicate, ["image_generation", "__end__"]
+        # )
         # builder.add_edge("image_generation", "__end__")
 
-        workflow = builder.compile()  # 그래프 컴파일
+        workflow = builder.compile(checkpointer=self.checkpointer)  # 그래프 컴파일
         workflow.name = self.name  # Workflow 이름 설정
 
         return workflow
@@ -0,0 +1,47 @@
+"""
+지연 임포트(lazy import) 모듈
+
+패키지 __init__에서 공개 속성을 처음 사용할 때 해당 모듈을 임포트하도록 하는 도우미를 제공합니다.
+`import agents`나 테스트 수집처럼 Workflow를 실제로 사용하지 않는 경우에는
+LangGraph 그래프 모듈과 LLM 클라이언트를 불러오지 않으므로 시작 시간이 짧아집니다.
+
+예시:
+```python
+# agents/text/__init__.py
+from agents.lazy_import import lazy_exports
+
+__all__ = ["text_workflow"]
+__getattr__, __dir__ = lazy_exports(
+    globals(), {"text_workflow": "agents.text.workflow"}
+)
+```
+"""
+
+import importlib
+
+
+def lazy_exports(module_globals: dict, exports: dict[str, str]):
+    """
+    PEP 562 모듈 __getattr__ / __dir__ 함수를 생성합니다.
+
+    Args:
+        module_globals: 패키지의 globals()
+        exports: 공개 속성 이름 -> 해당 속성을 정의한 모듈 경로
+
+    Returns:
+        tuple: (__getattr__, __dir__) 함수
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        module_globals[name] = value  # 이후 접근은 __getattr__를 거치지 않음
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*module_globals, *exports})
+
+    return __getattr__, __dir__
@@ -0,0 +1,606 @@
+"""
+LLM 호출 스케줄러 모듈
+
+프로세스 전역에서 모델별로 하나의 스케줄러를 두고, 모든 에이전트 체인의 LLM 호출이 이 스케줄러를
+거치도록 합니다. agents.model_registry.get_chat_model()이 반환하는 모델은 ScheduledChatModel로
+감싸져 있으므로 체인 코드를 바꿀 필요가 없습니다.
+
+스케줄러는 다음 세 가지를 함께 적용합니다.
+- 토큰 버킷: 분당 요청 수(RPM)와 분당 예상 토큰 수(TPM)를 제한합니다.
+  예상 토큰 수는 호출 전에 프롬프트 길이로 추정하고, 호출이 끝나면 실제 사용량으로 보정합니다.
+- AIMD 동시 실행 제한: 출력 토큰당 지연 시간이 기준(최근 최솟값 * latency_tolerance) 이하이면
+  동시 실행 수를 조금씩 늘리고, 기준을 넘거나 429 응답을 받으면 비율로 줄입니다.
+  긴 응답이 느리다고 판단하지 않도록 지연 시간을 출력 토큰 수로 나누고, 스트리밍 호출은
+  제공자에게서 조각을 기다린 시간만 재어 소비하는 쪽의 처리 시간은 빼고 계산합니다.
+  429 응답을 받으면 Retry-After(없으면 rate_limit_pause초) 동안 새 호출을 보내지 않습니다.
+- 공정 대기열: 대기 중인 호출은 에이전트(Workflow)별 대기열에 쌓이고, 에이전트 사이에서
+  라운드 로빈으로 실행 순서를 받습니다. 한 에이전트에 요청이 몰려도 다른 에이전트가 굶지 않습니다.
+
+설정은 환경변수 또는 configure_scheduler()로 조정할 수 있습니다.
+- LLM_RPM_LIMIT: 모델별 분당 최대 요청 수 (기본값: 500, 0이면 제한 없음)
+- LLM_TPM_LIMIT: 모델별 분당 최대 토큰 수 (기본값: 200000, 0이면 제한 없음)
+- LLM_MAX_CONCURRENCY: 모델별 최대 동시 실행 수 (기본값: 64)
+- LLM_SCHEDULER: "0"이면 get_chat_model()이 모델을 스케줄러로 감싸지 않음
+
+예시:
+```python
+from agents.llm_scheduler import configure_scheduler, get_scheduler
+
+configure_scheduler("gpt-4o-mini", requests_per_minute=3000, tokens_per_minute=1_000_000)
+print(get_scheduler("gpt-4o-mini").stats())
+```
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, replace
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict
+
+from agents.metrics import REGISTRY, current_labels
+from agents.reducers import approximate_tokens
+
+SCHEDULER_ENV = "LLM_SCHEDULER"  # "0"이면 스케줄러 비활성화
+DEFAULT_AGENT = "default"  # 노드 밖에서 호출한 경우의 대기열 이름
+
+QUEUE_DURATION = REGISTRY.histogram(
+    "agents_llm_queue_seconds",
+    "LLM 호출이 스케줄러 대기열에서 기다린 시간 (초)",
+    ("model", "agent"),
+)
+RATE_LIMITED = REGISTRY.counter(
+    "agents_llm_rate_limited_total", "제공자가 반환한 429 응답 수", ("model",)
+)
+
+
+def scheduler_enabled() -> bool:
+    """환경변수 LLM_SCHEDULER로 스케줄러가 활성화되어 있는지 확인합니다. (기본값: 활성화)"""
+    return os.getenv(SCHEDULER_ENV, "1").strip().lower() not in ("0", "false", "no")
+
+
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """
+    모델별 스케줄러 설정
+
+    Attributes:
+        requests_per_minute: 분당 최대 요청 수 (None이면 제한 없음)
+        tokens_per_minute: 분당 최대 토큰 수 (None이면 제한 없음)
+        burst_seconds: 토큰 버킷 용량 (몇 초 분량의 한도를 한 번에 쓸 수 있는지)
+        initial_concurrency: 시작 동시 실행 수
+        min_concurrency: 최소 동시 실행 수
+        max_concurrency: 최대 동시 실행 수
+        latency_tolerance: 기준 지연 시간의 몇 배를 넘으면 동시 실행 수를 줄일지
+        latency_min_tokens: 토큰당 지연 시간을 계산할 때 쓰는 최소 출력 토큰 수
+            (짧은 응답은 첫 토큰까지의 고정 지연이 대부분이므로 이 값으로 나눔)
+        backoff_ratio: 지연 시간이 기준을 넘었을 때 동시 실행 수에 곱할 비율
+        rate_limit_ratio: 429 응답을 받았을 때 동시 실행 수에 곱할 비율
+        rate_limit_pause: Retry-After가 없는 429 응답 후 새 호출을 멈출 시간(초)
+        expected_output_tokens: 호출 전 토큰 추정에 더할 예상 생성 토큰 수
+        poll_interval: 대기 중인 호출이 실행 가능 여부를 다시 확인하는 최대 간격(초)
+    """
+
+    requests_per_minute: float | None = 500
+    tokens_per_minute: float | None = 200_000
+    burst_seconds: float = 10.0
+    initial_concurrency: int = 8
+    min_concurrency: int = 1
+    max_concurrency: int = 64
+    latency_tolerance: float = 2.0
+    latency_min_tokens: int = 32
+    backoff_ratio: float = 0.9
+    rate_limit_ratio: float = 0.5
+    rate_limit_pause: float = 1.0
+    expected_output_tokens: int = 512
+    poll_interval: float = 0.1
+
+    @classmethod
+    def from_env(cls) -> "SchedulerConfig":
+        """
+        환경변수에서 스케줄러 설정을 읽어옵니다. 설정되지 않은 값은 기본값을 사용합니다.
+        """
+        default = cls()
+        rpm = float(os.getenv("LLM_RPM_LIMIT", default.requests_per_minute))
+        tpm = float(os.getenv("LLM_TPM_LIMIT", default.tokens_per_minute))
+        return cls(
+            requests_per_minute=rpm or None,
+            tokens_per_minute=tpm or None,
+            max_concurrency=int(
+                os.getenv("LLM_MAX_CONCURRENCY", default.max_concurrency)
+            ),
+        )
+
+
+class TokenBucket:
+    """
+    초당 rate만큼 채워지고 최대 capacity까지 쌓이는 토큰 버킷
+
+    토큰은 음수가 될 수 있으며(실제 사용량 보정), 이 경우 다시 채워질 때까지 기다립니다.
+    """
+
+    def __init__(self, per_minute: float, burst_seconds: float):
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 사용할 수 있을 때까지 남은 시간(초)을 반환합니다. (capacity를 넘는 요청은 capacity로 계산)"""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate)
+
+    def consume(self, amount: float) -> None:
+        """amount만큼 사용합니다."""
+        self.tokens -= amount
+
+
+class _Waiter:
+    """
+    스케줄러 대기열의 대기 중인 호출
+    """
+
+    def __init__(self, tokens: float, loop: asyncio.AbstractEventLoop | None = None):
+        self.tokens = tokens
+        self.granted = False
+        self.loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.future = loop.create_future() if loop is not None else None
+
+    def grant(self) -> None:
+        """실행을 허가하고 대기 중인 호출을 깨웁니다."""
+        self.granted = True
+        if self.future is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class Slot:
+    """
+    스케줄러에서 받은 실행 권한
+
+    호출이 끝나면 record_usage()로 실제 토큰 사용량을 알려 토큰 버킷을 보정합니다.
+    스트리밍 호출은 service_time에 제공자를 기다린 시간만 더해, 지연 시간에서 소비하는 쪽의 시간을 뺍니다.
+    """
+
+    def __init__(self, agent: str, estimated_tokens: float):
+        self.agent = agent
+        self.estimated_tokens = estimated_tokens
+        self.used_tokens: float | None = None
+        # usage_metadata의 생성 토큰 수 (없으면 스트리밍 조각 수로 대신함)
+        self.output_tokens = 0
+        self.chunks = 0
+        # 제공자를 기다린 시간 (None이면 with 블록 전체 시간)
+        self.service_time: float | None = None
+
+    def record_usage(self, message) -> None:
+        """메시지의 usage_metadata에서 실제 토큰 사용량을 기록합니다."""
+        usage = getattr(message, "usage_metadata", None)
+        if usage and usage.get("total_tokens"):
+            self.used_tokens = (self.used_tokens or 0) + usage["total_tokens"]
+        if usage and usage.get("output_tokens"):
+            self.output_tokens += usage["output_tokens"]
+
+    def record_chunk(self, chunk: ChatGenerationChunk | None, waited: float) -> None:
+        """
+        스트리밍 조각 하나의 사용량과, 조각을 받을 때까지 제공자를 기다린 시간을 기록합니다.
+        (chunk가 None이면 스트림 종료까지 기다린 시간만 기록)
+        """
+        self.service_time = (self.service_time or 0.0) + waited
+        if chunk is not None:
+            self.chunks += 1
+            self.record_usage(chunk.message)
+
+    def latency(self, elapsed: float, min_tokens: int) -> float:
+        """
+        호출의 출력 토큰당 지연 시간(초)을 반환합니다.
+
+        Args:
+            elapsed: with 블록 전체 시간(초)
+            min_tokens: 나눌 최소 출력 토큰 수
+
+        Returns:
+            float: 제공자 대기 시간 / max(출력 토큰 수, min_tokens)
+        """
+        service = elapsed if self.service_time is None else self.service_time
+        return service / max(self.output_tokens or self.chunks, min_tokens, 1)
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    """예외가 제공자의 429 응답인지 확인합니다."""
+    return (
+        getattr(error, "status_code", None) == 429
+        or type(error).__name__ == "RateLimitError"
+    )
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """429 응답의 Retry-After 헤더 값(초)을 반환합니다."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMScheduler:
+    """
+    한 모델에 대한 요청 / 토큰 한도, 적응형 동시 실행 제한, 에이전트별 공정 대기열을 관리하는 스케줄러
+    """
+
+    def __init__(self, model: str, config: SchedulerConfig | None = None):
+        self.model = model
+        self.config = config or SchedulerConfig.from_env()
+        self._lock = threading.Lock()
+        self._requests = (
+            TokenBucket(self.config.requests_per_minute, self.config.burst_seconds)
+            if self.config.requests_per_minute
+            else None
+        )
+        self._tokens = (
+            TokenBucket(self.config.tokens_per_minute, self.config.burst_seconds)
+            if self.config.tokens_per_minute
+            else None
+        )
+        self.limit = float(self.config.initial_concurrency)  # 현재 동시 실행 제한
+        self.in_flight = 0
+        self._queues: dict[str, deque[_Waiter]] = {}  # 에이전트 -> 대기열
+        self._order: deque[str] = deque()  # 라운드 로빈 순서 (대기 중인 에이전트)
+        self._paused_until = 0.0  # 429 응답 후 새 호출을 보내지 않을 시각
+        self._baseline: float | None = None  # 기준 지연 시간 (출력 토큰당 최근 최솟값)
+        self._last_backoff = 0.0  # 마지막으로 동시 실행 수를 줄인 시각
+
+    def _dispatch(self) -> float | None:
+        """
+        대기 중인 호출에 가능한 만큼 실행 권한을 줍니다. 호출하는 쪽에서 _lock을 잡고 있어야 합니다.
+
+        Returns:
+            float | None: 한도 때문에 멈춘 경우 다시 시도할 때까지의 시간(초)
+        """
+        now = time.monotonic()
+        while self._order and self.in_flight < max(
+            self.config.min_concurrency, int(self.limit)
+        ):
+            if now < self._paused_until:
+                return self._paused_until - now
+            agent = self._order[0]
+            waiter = self._queues[agent][0]
+            wait = max(
+                self._requests.wait_time(1, now) if self._requests else 0.0,
+                self._tokens.wait_time(waiter.tokens, now) if self._tokens else 0.0,
+            )
+            if wait > 0:
+                return wait
+
+            if self._requests:
+                self._requests.consume(1)
+            if self._tokens:
+                self._tokens.consume(waiter.tokens)
+            self.in_flight += 1
+            self._queues[agent].popleft()
+            self._order.popleft()
+            if self._queues[agent]:
+                self._order.append(agent)  # 다음 차례는 다른 에이전트
+            else:
+                del self._queues[agent]
+            waiter.grant()
+        return None
+
+    def _enqueue(self, agent: str, waiter: _Waiter) -> float | None:
+        """대기열에 호출을 추가하고 바로 실행 가능한지 확인합니다."""
+        with self._lock:
+            if agent not in self._queues:
+                self._queues[agent] = deque()
+                self._order.append(agent)
+            self._queues[agent].append(waiter)
+            return self._dispatch()
+
+    def _poll(self, waiter: _Waiter) -> float:
+        """실행 권한을 받지 못한 호출이 다시 기다릴 시간(초)을 반환합니다."""
+        with self._lock:
+            retry = None if waiter.granted else self._dispatch()
+        return min(retry or self.config.poll_interval, self.config.poll_interval)
+
+    def _abandon(self, agent: str, waiter: _Waiter) -> None:
+        """대기 중에 취소된 호출을 대기열에서 제거합니다. (이미 권한을 받았다면 반납)"""
+        with self._lock:
+            if waiter.granted:
+                self.in_flight -= 1
+            else:
+                queue = self._queues.get(agent)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._queues[agent]
+                        self._order.remove(agent)
+            self._dispatch()
+
+    def _release(self, slot: Slot, elapsed: float, error: BaseException | None) -> None:
+        """
+        호출이 끝났을 때 실행 권한을 반납하고, 출력 토큰당 지연 시간과 429 여부로 동시 실행 제한을 조정합니다.
+        """
+        config = self.config
+        now = time.monotonic()
+        latency = slot.latency(elapsed, config.latency_min_tokens)
+        with self._lock:
+            self.in_flight -= 1
+            if self._tokens and slot.used_tokens is not None:
+                self._tokens.consume(slot.used_tokens - slot.estimated_tokens)
+
+            if error is not None and _is_rate_limited(error):
+                self.limit = max(
+                    config.min_concurrency, self.limit * config.rate_limit_ratio
+                )
+                pause = _retry_after(error) or config.rate_limit_pause
+                self._paused_until = max(self._paused_until, now + pause)
+                self._last_backoff = now
+            elif error is None:
+                baseline = self._baseline
+                if baseline is None or latency < baseline:
+                    self._baseline = latency
+                else:
+                    self._baseline = baseline + (latency - baseline) * 0.01
+                if latency > self._baseline * config.latency_tolerance:
+                    # 같은 시기에 시작한 호출들이 연달아 줄이지 않도록 한 번의 지연 시간에 한 번만 감소
+                    if now - self._last_backoff > elapsed:
+                        self.limit = max(
+                            config.min_concurrency, self.limit * config.backoff_ratio
+                        )
+                        self._last_backoff = now
+                else:
+                    self.limit = min(
+                        config.max_concurrency, self.limit + 1 / self.limit
+                    )
+            self._dispatch()
+
+        if error is not None and _is_rate_limited(error):
+            RATE_LIMITED.labels(model=self.model).inc()
+
+    def _agent(self) -> str:
+        labels = current_labels()
+        return (labels or {}).get("workflow") or DEFAULT_AGENT
+
+    @contextmanager
+    def slot(self, estimated_tokens: float) -> Iterator[Slot]:
+        """
+        실행 권한을 받을 때까지 기다린 뒤, with 블록이 끝나면 반납합니다.
+
+        Args:
+            estimated_tokens: 호출의 예상 토큰 수
+
+        Yields:
+            Slot: 실행 권한 (record_usage()로 실제 사용량 기록)
+        """
+        agent = self._agent()
+        waiter = _Waiter(estimated_tokens)
+        queued = time.perf_counter()
+        try:
+            retry = self._enqueue(agent, waiter)
+            while not waiter.granted:
+                waiter.event.wait(
+                    min(retry or self.config.poll_interval, self.config.poll_interval)
+                )
+                retry = self._poll(waiter)
+        except BaseException:
+            self._abandon(agent, waiter)
+            raise
+        QUEUE_DURATION.labels(model=self.model, agent=agent).observe(
+            time.perf_counter() - queued
+        )
+        slot = Slot(agent, estimated_tokens)
+        started = time.perf_counter()
+        try:
+            yield slot
+        except BaseException as error:
+            self._release(slot, time.perf_counter() - started, error)
+            raise
+        self._release(slot, time.perf_counter() - started, None)
+
+    @asynccontextmanager
+    async def aslot(self, estimated_tokens: float) -> AsyncIterator[Slot]:
+        """
+        slot()의 비동기 버전으로, 기다리는 동안 이벤트 루프를 블로킹하지 않습니다.
+        """
+        agent = self._agent()
+        waiter = _Waiter(estimated_tokens, asyncio.get_running_loop())
+        queued = time.perf_counter()
+        try:
+            retry = self._enqueue(agent, waiter)
+            while not waiter.granted:
+                await asyncio.wait(
+                    {waiter.future},
+                    timeout=min(
+                        retry or self.config.poll_interval, self.config.poll_interval
+                    ),
+                )
+                retry = self._poll(waiter)
+        except BaseException:
+            self._abandon(agent, waiter)
+            raise
+        QUEUE_DURATION.labels(model=self.model, agent=agent).observe(
+            time.perf_counter() - queued
+        )
+        slot = Slot(agent, estimated_tokens)
+        started = time.perf_counter()
+        try:
+            yield slot
+        except BaseException as error:
+            self._release(slot, time.perf_counter() - started, error)
+            raise
+        self._release(slot, time.perf_counter() - started, None)
+
+    def stats(self) -> dict:
+        """
+        현재 스케줄러 상태를 반환합니다.
+
+        Returns:
+            dict: limit(동시 실행 제한), in_flight(실행 중), queued(에이전트별 대기 수),
+                baseline_latency(출력 토큰당 기준 지연 시간, 초)
+        """
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "queued": {agent: len(queue) for agent, queue in self._queues.items()},
+                "baseline_latency": self._baseline,
+            }
+
+
+class ScheduledChatModel(BaseChatModel):
+    """
+    모든 호출을 LLMScheduler를 거쳐 실행하는 채팅 모델 래퍼
+
+    호출 전에 프롬프트 토큰 수 + 예상 생성 토큰 수로 토큰 한도를 예약하고,
+    응답의 usage_metadata로 실제 사용량을 보정합니다. 스트리밍 호출은 마지막 조각까지 받은 뒤 권한을 반납하며,
+    조각을 yield한 뒤 소비하는 쪽이 처리하는 시간은 지연 시간에 넣지 않습니다.
+
+    Attributes:
+        llm: 실제 호출을 수행하는 채팅 모델
+        scheduler: 호출이 거쳐 갈 스케줄러
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    llm: BaseChatModel
+    scheduler: Any
+
+    @property
+    def _llm_type(self) -> str:
+        return self.llm._llm_type
+
+    @property
+    def _identifying_params(self) -> dict:
+        return self.llm._identifying_params
+
+    def _estimate(self, messages, kwargs) -> float:
+        max_tokens = kwargs.get("max_tokens") or getattr(self.llm, "max_tokens", None)
+        expected = max_tokens or self.scheduler.config.expected_output_tokens
+        return approximate_tokens(messages) + expected
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        with self.scheduler.slot(self._estimate(messages, kwargs)) as slot:
+            result = self.llm._generate(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+            for generation in result.generations:
+                slot.record_usage(generation.message)
+        return result
+
+    async def _agenerate(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> ChatResult:
+        async with self.scheduler.aslot(self._estimate(messages, kwargs)) as slot:
+            result = await self.llm._agenerate(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+            for generation in result.generations:
+                slot.record_usage(generation.message)
+        return result
+
+    def _stream(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> Iterator[ChatGenerationChunk]:
+        with self.scheduler.slot(self._estimate(messages, kwargs)) as slot:
+            chunks = iter(
+                self.llm._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            )
+            while True:
+                started = time.perf_counter()
+                chunk = next(chunks, None)
+                slot.record_chunk(chunk, time.perf_counter() - started)
+                if chunk is None:
+                    break
+                yield chunk
+
+    async def _astream(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        async with self.scheduler.aslot(self._estimate(messages, kwargs)) as slot:
+            chunks = self.llm._astream(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+            while True:
+                started = time.perf_counter()
+                chunk = await anext(chunks, None)
+                slot.record_chunk(chunk, time.perf_counter() - started)
+                if chunk is None:
+                    break
+                yield chunk
+
+
+_lock = threading.Lock()
+# 모델 이름 -> configure_scheduler()로 지정한 설정
+_configs: dict[str, SchedulerConfig] = {}
+_schedulers: dict[str, LLMScheduler] = {}  # 모델 이름 -> 공유 스케줄러
+
+
+def get_scheduler(model: str) -> LLMScheduler:
+    """
+    모델의 공유 스케줄러를 반환합니다. 최초 호출 시 한 번만 생성합니다.
+
+    Args:
+        model: 모델 이름
+
+    Returns:
+        LLMScheduler: 모델의 공유 스케줄러
+    """
+    scheduler = _schedulers.get(model)
+    if scheduler is None:
+        with _lock:
+            scheduler = _schedulers.get(model)
+            if scheduler is None:
+                scheduler = LLMScheduler(model, _configs.get(model))
+                _schedulers[model] = scheduler
+    return scheduler
+
+
+def configure_scheduler(model: str, **options) -> SchedulerConfig:
+    """
+    모델의 스케줄러 설정을 변경합니다.
+
+    기존 스케줄러는 폐기되며, 다음 get_scheduler() 호출부터 새 설정이 적용됩니다.
+    (이미 생성된 모델 인스턴스도 새 스케줄러를 쓰도록 agents.model_registry.clear_registry()도 호출하세요.)
+
+    Args:
+        model: 모델 이름
+        **options: SchedulerConfig 필드
+
+    Returns:
+        SchedulerConfig: 변경된 설정
+    """
+    with _lock:
+        config = replace(_configs.get(model) or SchedulerConfig.from_env(), **options)
+        _configs[model] = config
+        _schedulers.pop(model, None)
+    return config
+
+
+def scheduled(model: BaseChatModel, name: str) -> ScheduledChatModel:
+    """
+    채팅 모델을 name 모델의 공유 스케줄러로 감쌉니다.
+
+    Args:
+        model: 감쌀 채팅 모델
+        name: 스케줄러를 공유할 모델 이름
+
+    Returns:
+        ScheduledChatModel: 스케줄러를 거쳐 호출하는 모델
+    """
+    return ScheduledChatModel(llm=model, scheduler=get_scheduler(name))
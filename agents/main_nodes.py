@@ -0,0 +1,116 @@
+"""
+메인 Workflow 노드 모듈
+
+메인 Workflow에서 각 에이전트 Workflow(하위 그래프)를 하나의 병렬 분기로 실행하는 노드를 정의합니다.
+Team Member는 해당 모듈에서 따로 작업을 진행하지 않으셔도 됩니다.
+"""
+
+import asyncio
+import time
+
+from langchain_core.messages import AIMessage
+
+from agents.base_node import BaseNode
+from agents.base_workflow import BaseWorkflow
+from agents.metrics import REGISTRY
+
+DEFAULT_BRANCH_TIMEOUT = 60.0  # 분기별 기본 제한 시간 (초)
+
+BRANCH_TIMEOUTS = REGISTRY.counter(
+    "agents_branch_timeouts_total", "제한 시간을 초과한 에이전트 분기 수", ("branch",)
+)
+
+
+def _branch_errors() -> tuple[type[BaseException], ...]:
+    """
+    분기 오류로 기록할 예외 타입을 반환합니다. (그 외의 예외는 전체 Workflow로 전파)
+
+    제한 시간 초과, 네트워크 / 파일 오류, 잘못된 입력 / 출력 파싱 오류(ValueError, LookupError,
+    TypeError), LangGraph 실행 오류(RuntimeError, GraphRecursionError 포함)와 OpenAI API 오류입니다.
+    openai는 오류가 발생했을 때만 임포트합니다.
+    """
+    errors = (TimeoutError, OSError, RuntimeError, ValueError, LookupError, TypeError)
+    try:
+        from openai import OpenAIError
+    except ImportError:  # pragma: no cover - openai는 langchain-openai의 의존성
+        return errors
+    return (*errors, OpenAIError)
+
+
+class AgentBranchNode(BaseNode):
+    """
+    에이전트 Workflow를 하나의 분기로 실행하고, 결과를 메인 상태에 병합할 형태로 반환하는 노드
+
+    분기가 제한 시간을 초과하거나 오류를 발생시키면 다른 분기의 결과를 기다리는 전체 응답이
+    지연되거나 실패하지 않도록, 해당 분기의 오류만 agent_errors에 기록합니다.
+    """
+
+    def __init__(self, agent: str, workflow: BaseWorkflow, timeout: float, **kwargs):
+        """
+        Args:
+            agent: 에이전트 이름 (예: "text")
+            workflow: 분기에서 실행할 에이전트 Workflow
+            timeout: 분기 제한 시간 (초)
+        """
+        super().__init__(**kwargs)
+        # 분기별로 메트릭을 구분하기 위해 노드 이름에 에이전트 이름 사용
+        self.name = f"{agent}_agent"
+        self.agent = agent
+        self.agent_workflow = workflow
+        self.timeout = timeout
+
+    def _result(self, final_state: dict) -> dict:
+        """
+        하위 그래프의 최종 상태에서 메인 상태 업데이트를 구성합니다.
+        """
+        messages = final_state.get("response") or []
+        output = messages[-1].content if messages else None
+        update = {"agent_outputs": {self.agent: output}}
+        if output:
+            update["response"] = [AIMessage(content=output, name=self.agent)]
+        return update
+
+    def _error(self, error: BaseException) -> dict:
+        """
+        분기 오류를 메인 상태 업데이트로 변환합니다.
+        """
+        if isinstance(error, TimeoutError):
+            BRANCH_TIMEOUTS.labels(branch=self.agent).inc()
+            message = f"{self.timeout}초 제한 시간 초과"
+        else:
+            message = f"{type(error).__name__}: {error}"
+        self.logging("error", agent=self.agent, error=message)
+        return {
+            "agent_outputs": {self.agent: None},
+            "agent_errors": {self.agent: message},
+        }
+
+    def execute(self, state) -> dict:
+        """
+        하위 그래프를 현재 스레드에서 실행하고 제한 시간 안에 끝나지 않으면 오류로 기록합니다.
+
+        실행 중인 스레드는 중단할 수 없으므로, 제한 시간은 하위 그래프의 단계(superstep)가 끝날 때마다
+        확인합니다. 제한 시간을 넘기면 다음 단계를 실행하지 않고 종료합니다. (진행 중인 단계는 끝까지 실행)
+        별도의 스레드를 사용하지 않으므로 분기가 스레드 풀 작업자를 점유하거나 대기열에서 기다리지 않습니다.
+        """
+        graph = self.agent_workflow()
+        deadline = time.monotonic() + self.timeout
+        final_state = state
+        try:
+            for final_state in graph.stream(state, stream_mode="values"):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{self.agent} 분기 제한 시간 초과")
+        except _branch_errors() as error:
+            return self._error(error)
+        return self._result(final_state)
+
+    async def aexecute(self, state) -> dict:
+        """
+        하위 그래프를 비동기로 실행하고, 제한 시간을 넘기면 실행을 취소합니다.
+        """
+        graph = self.agent_workflow()
+        try:
+            final_state = await asyncio.wait_for(graph.ainvoke(state), self.timeout)
+        except _branch_errors() as error:
+            return self._error(error)
+        return self._result(final_state)
@@ -3,7 +3,19 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Annotated, TypedDict
 
-from langgraph.graph.message import add_messages
+from agents.reducers import bounded_messages
+
+
+def merge_dicts(left: dict | None, right: dict | None) -> dict:
+    """
+    병렬 분기에서 반환된 딕셔너리를 하나로 병합하는 리듀서
+
+    같은 키가 있으면 나중에 병합되는 값(right)이 우선합니다.
+    """
+    return {**(left or {}), **(right or {})}
+
+
+MAX_RESPONSE_MESSAGES = 100  # 응답 목록에 유지할 최대 메시지 수
 
 
 @dataclass
@@ -13,6 +25,13 @@ class MainState(TypedDict):
 
     Team Member는 해당 State에서 따로 작업을 진행하지 않으셔도 됩니다.
 
+    메인 Workflow는 입력에 필요한 값이 있는 에이전트(text, image, music, management)에
+    동시에 요청을 보내고, 각 에이전트의 결과를 agent_outputs에 병합합니다.
+    시간 초과 또는 오류가 발생한 에이전트는 agent_errors에 기록됩니다.
+
+    체크포인트를 사용하면 같은 스레드의 응답이 계속 누적되므로, 응답 목록은 최근 메시지
+    MAX_RESPONSE_MESSAGES개만 유지하고 오래된 메시지는 맨 앞의 요약 메시지에 접어 둡니다.
+
     예시:
     ```python
     # 상태 초기화
@@ -27,4 +46,14 @@ class MainState(TypedDict):
     """
 
     query: str
-    response: Annotated[list, add_messages]
+    response: Annotated[
+        list, bounded_messages(MAX_RESPONSE_MESSAGES, strategy="summarize")
+    ]
+    content_topic: str  # 콘텐츠 주제 (text 에이전트)
+    content_type: str  # 콘텐츠 유형 (text 에이전트)
+    project_id: str  # 프로젝트 ID (management 에이전트)
+    request_type: str  # 요청 유형 (management 에이전트)
+    team_members: list  # 팀 구성원 목록 (management 에이전트)
+    resources_available: dict  # 사용 가능한 리소스 정보 (management 에이전트)
+    agent_outputs: Annotated[dict, merge_dicts]  # 에이전트 이름 -> 최종 응답 텍스트
+    agent_errors: Annotated[dict, merge_dicts]  # 에이전트 이름 -> 오류 메시지
@@ -2,8 +2,12 @@
 Management 패키지 초기화 모듈
 
 이 모듈은 Management Workflow를 외부에 노출시키는 역할을 합니다.
+Workflow 모듈은 처음 접근할 때 임포트되므로 패키지 임포트 자체는 가볍습니다.
 """
 
-from agents.management.workflow import management_workflow
+from agents.lazy_import import lazy_exports
 
 __all__ = ["management_workflow"]
+__getattr__, __dir__ = lazy_exports(
+    globals(), {"management_workflow": "agents.management.workflow"}
+)
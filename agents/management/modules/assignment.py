@@ -0,0 +1,181 @@
+"""
+팀 역할 배정 모듈
+
+팀 구성원의 스킬 / 가용성과 역할별 요구 스킬로 비용 행렬을 만들고, 헝가리안 알고리즘으로
+총 적합도가 가장 높은 구성원-역할 배정을 결정적으로 계산합니다. 리소스 관리 노드는 체인 실행 전에
+이 결과를 계산하여, LLM이 배정을 새로 만드는 대신 계산된 배정을 설명하도록 합니다.
+
+- 적합도: 역할의 요구 스킬 가중치로 구성원의 스킬 수준(0~1)을 가중 평균한 값에 가용성(0~1)을 곱한 값
+  (구성원 수 x 스킬 수 행렬과 역할 수 x 스킬 수 행렬의 곱으로 한 번에 계산)
+- 인원이 여러 명인 역할(count)은 열을 복제하여 자리(slot)마다 한 명씩 배정합니다.
+- 가용성이 0인 구성원은 배정하지 않습니다.
+- 헝가리안 알고리즘(포텐셜 방식, O(n^2 m))의 열 갱신은 NumPy 벡터 연산으로 처리합니다.
+  동률은 항상 앞선 인덱스를 고르므로 같은 입력에는 항상 같은 배정을 반환합니다.
+
+예시:
+```python
+from agents.management.modules.assignment import assign_roles
+
+members = [
+    {"name": "Kim", "skills": {"편집": 0.9, "촬영": 0.4}, "availability": 1.0},
+    {"name": "Lee", "skills": {"촬영": 0.8}, "availability": 0.5},
+]
+roles = [{"role": "편집자", "skills": {"편집": 1.0}}, {"role": "촬영 감독", "skills": {"촬영": 1.0}}]
+print(assign_roles(members, roles)["assignments"])
+```
+"""
+
+import numpy as np
+
+
+def solve_assignment(cost: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    비용 합이 최소가 되는 행-열 배정을 계산합니다. (헝가리안 알고리즘)
+
+    행과 열 중 작은 쪽은 모두 배정됩니다.
+
+    Args:
+        cost: (행 수, 열 수) 비용 행렬 (유한한 값)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (행 인덱스, 열 인덱스) 배열 (행 인덱스 순으로 정렬)
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    rows, columns = cost.shape
+    u = np.zeros(rows + 1)  # 행 포텐셜
+    v = np.zeros(columns + 1)  # 열 포텐셜
+    owner = np.zeros(columns + 1, dtype=np.int64)  # 열에 배정된 행 (1부터, 0은 미배정)
+    way = np.zeros(columns + 1, dtype=np.int64)  # 증가 경로의 이전 열
+
+    for row in range(1, rows + 1):
+        owner[0] = row
+        column = 0
+        min_slack = np.full(columns + 1, np.inf)
+        used = np.zeros(columns + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current = owner[column]
+            free = ~used[1:]
+            reduced = cost[current - 1] - u[current] - v[1:]
+            better = free & (reduced < min_slack[1:])
+            min_slack[1:][better] = reduced[better]
+            way[1:][better] = column
+            candidates = np.where(free, min_slack[1:], np.inf)
+            next_column = int(np.argmin(candidates)) + 1
+            delta = candidates[next_column - 1]
+            u[owner[used]] += delta
+            v[used] -= delta
+            min_slack[~used] -= delta
+            column = next_column
+            if owner[column] == 0:
+                break
+        while column:  # 증가 경로를 따라 배정 갱신
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+
+    assigned = np.flatnonzero(owner[1:])
+    row_index, column_index = owner[1:][assigned] - 1, assigned
+    if transposed:
+        row_index, column_index = column_index, row_index
+    order = np.argsort(row_index, kind="stable")
+    return row_index[order], column_index[order]
+
+
+def _member_profile(member) -> dict:
+    """문자열 구성원(이름만)을 스킬 정보가 없는 프로필로 변환합니다."""
+    if isinstance(member, str):
+        return {"name": member, "skills": {}, "availability": 1.0}
+    return member
+
+
+def fit_matrix(members: list[dict], roles: list[dict]) -> np.ndarray:
+    """
+    구성원 x 역할 적합도 행렬(0~1)을 계산합니다.
+
+    Args:
+        members: {"name", "skills": {스킬: 수준(0~1)}, "availability": 0~1} 목록
+        roles: {"role", "skills": {스킬: 가중치}} 목록
+
+    Returns:
+        np.ndarray: (구성원 수, 역할 수) 적합도 행렬
+    """
+    vocabulary = {
+        skill: i
+        for i, skill in enumerate(
+            sorted(
+                {skill for member in members for skill in member.get("skills", {})}
+                | {skill for role in roles for skill in role.get("skills", {})}
+            )
+        )
+    }
+    levels = np.zeros((len(members), len(vocabulary)))
+    for i, member in enumerate(members):
+        for skill, level in member.get("skills", {}).items():
+            levels[i, vocabulary[skill]] = level
+    weights = np.zeros((len(roles), len(vocabulary)))
+    for j, role in enumerate(roles):
+        for skill, weight in role.get("skills", {}).items():
+            weights[j, vocabulary[skill]] = weight
+    totals = weights.sum(axis=1, keepdims=True)
+    weights = np.divide(weights, totals, out=np.zeros_like(weights), where=totals > 0)
+
+    availability = np.asarray(
+        [m.get("availability", 1.0) for m in members], dtype=float
+    )
+    return np.clip(levels, 0.0, 1.0) @ weights.T * availability[:, None]
+
+
+def assign_roles(members: list, roles: list[dict]) -> dict:
+    """
+    팀 구성원을 역할에 배정합니다.
+
+    Args:
+        members: 구성원 목록 (이름 문자열 또는 {"name", "skills", "availability"} 딕셔너리)
+        roles: {"role", "skills": {스킬: 가중치}, "count": 인원(기본값 1)} 목록
+
+    Returns:
+        dict: {
+            "assignments": [{"member", "role", "fit"}] (역할 순),
+            "unassigned_members": 배정되지 않은 구성원 이름 목록,
+            "unfilled_roles": {역할: 채우지 못한 인원},
+            "total_fit": 적합도 합,
+        }
+    """
+    profiles = [_member_profile(member) for member in members]
+    available = [p for p in profiles if p.get("availability", 1.0) > 0]
+    slots = [j for j, role in enumerate(roles) for _ in range(role.get("count", 1))]
+
+    fit = fit_matrix(available, roles)[:, slots] if available and slots else None
+    if fit is None:
+        member_index, slot_index = np.empty(0, dtype=int), np.empty(0, dtype=int)
+    else:
+        member_index, slot_index = solve_assignment(1.0 - fit)
+
+    assignments = [
+        {
+            "member": available[i]["name"],
+            "role": roles[slots[s]]["role"],
+            "fit": round(float(fit[i, s]), 3),
+        }
+        for s, i in sorted(zip(slot_index.tolist(), member_index.tolist()))
+    ]
+    assigned = {item["member"] for item in assignments}
+    filled: dict[str, int] = {}
+    for item in assignments:
+        filled[item["role"]] = filled.get(item["role"], 0) + 1
+    return {
+        "assignments": assignments,
+        "unassigned_members": [
+            p["name"] for p in profiles if p["name"] not in assigned
+        ],
+        "unfilled_roles": {
+            role["role"]: role.get("count", 1) - filled.get(role["role"], 0)
+            for role in roles
+            if role.get("count", 1) > filled.get(role["role"], 0)
+        },
+        "total_fit": round(sum(item["fit"] for item in assignments), 3),
+    }
@@ -0,0 +1,556 @@
+"""
+리소스 가용성 인덱스 모듈
+
+스튜디오, 장비, 인력 등의 예약(booking)을 인메모리 구간 인덱스에 저장하여,
+기간과 겹치는 예약 검색과 빈 시간대(free slot) 검색을 빠르게 처리합니다.
+모든 구간은 반열린 구간 [start, end)입니다. 한 시각 t의 예약 여부는 start <= t < end인 예약으로 판단합니다.
+
+- 리소스 유형별 IntervalTree: 예약을 시작 시각 순으로 정렬한 treap으로, 노드마다 서브트리의
+  최대 종료 시각을 저장하여 겹칠 수 없는 서브트리를 건너뜁니다. 겹치는 예약 k개 검색은
+  O(log n + k)에 가깝고 (최악 O((k + 1) log n)), 삽입 / 삭제는 기대 O(log n)입니다.
+- 리소스별 일정: 한 리소스의 예약은 서로 겹치지 않으므로 시작 / 종료 시각이 함께 정렬됩니다.
+  이분 탐색으로 빈 시간대 검색과 충돌 검사를 O(log n + k)에 처리합니다.
+
+예약은 JSON 파일 또는 SQLite 저장소에서 불러옵니다. 환경변수 RESOURCE_STORE에 경로를 지정하면
+get_availability_index()가 처음 호출될 때 한 번 불러옵니다.
+
+JSON 형식:
+```json
+{
+  "resources": [{"resource_id": "studio-a", "resource_type": "studio", "name": "A동 스튜디오"}],
+  "bookings": [{"booking_id": "b-1", "resource_id": "studio-a",
+                "start": "2025-06-01T09:00:00", "end": "2025-06-01T18:00:00"}]
+}
+```
+SQLite 저장소는 같은 필드를 가진 resources / bookings 테이블을 사용합니다. (시각은 ISO 8601 문자열)
+
+예시:
+```python
+from datetime import datetime
+
+from agents.management.modules.availability import load_index
+
+index = load_index("bookings.sqlite")
+free = index.available("studio", datetime(2025, 6, 1), datetime(2025, 6, 8))
+slots = index.free_slots("studio-a", datetime(2025, 6, 1), datetime(2025, 6, 8))
+```
+"""
+
+import json
+import os
+import random
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
+from operator import itemgetter
+from pathlib import Path
+
+RESOURCE_STORE_ENV = (
+    "RESOURCE_STORE"  # 예약 저장소 경로 (.json / .db / .sqlite / .sqlite3)
+)
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+_END = itemgetter(1)  # 일정 항목 (start, end, booking_id)의 종료 시각
+
+
+@dataclass(frozen=True, slots=True)
+class Resource:
+    """
+    예약 가능한 리소스
+
+    Attributes:
+        resource_id: 리소스 ID
+        resource_type: 리소스 유형 (예: "studio", "equipment", "staff")
+        name: 표시 이름
+    """
+
+    resource_id: str
+    resource_type: str
+    name: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Booking:
+    """
+    리소스 예약 [start, end)
+
+    Attributes:
+        booking_id: 예약 ID
+        resource_id: 예약된 리소스 ID
+        start: 시작 시각
+        end: 종료 시각 (start보다 커야 함)
+    """
+
+    booking_id: str
+    resource_id: str
+    start: datetime
+    end: datetime
+
+
+class _Node:
+    """IntervalTree의 treap 노드"""
+
+    __slots__ = ("booking", "key", "left", "max_end", "priority", "right")
+
+    def __init__(self, booking: Booking, priority: float):
+        self.key = (booking.start, booking.end, booking.booking_id)
+        self.booking = booking
+        self.priority = priority
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+        self.max_end = booking.end
+
+
+def _update(node: _Node) -> None:
+    """자식 노드로부터 서브트리의 최대 종료 시각을 다시 계산합니다."""
+    max_end = node.key[1]
+    if node.left is not None and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+
+
+def _rotate_right(node: _Node) -> _Node:
+    left = node.left
+    node.left, left.right = left.right, node
+    _update(node)
+    _update(left)
+    return left
+
+
+def _rotate_left(node: _Node) -> _Node:
+    right = node.right
+    node.right, right.left = right.left, node
+    _update(node)
+    _update(right)
+    return right
+
+
+def _insert(node: _Node | None, new: _Node) -> _Node:
+    if node is None:
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+        if node.left.priority > node.priority:
+            return _rotate_right(node)
+    else:
+        node.right = _insert(node.right, new)
+        if node.right.priority > node.priority:
+            return _rotate_left(node)
+    _update(node)
+    return node
+
+
+def _merge(left: _Node | None, right: _Node | None) -> _Node | None:
+    """left의 모든 키가 right의 모든 키보다 작은 두 treap을 합칩니다."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _remove(node: _Node | None, key: tuple) -> tuple[_Node | None, bool]:
+    if node is None:
+        return None, False
+    if key == node.key:
+        return _merge(node.left, node.right), True
+    if key < node.key:
+        node.left, removed = _remove(node.left, key)
+    else:
+        node.right, removed = _remove(node.right, key)
+    if removed:
+        _update(node)
+    return node, removed
+
+
+class IntervalTree:
+    """
+    구간 [start, end)의 예약을 저장하는 treap 기반 구간 트리
+
+    같은 트리의 예약은 서로 겹쳐도 됩니다. (예: 같은 유형의 여러 리소스)
+    """
+
+    def __init__(self, bookings: Iterable[Booking] = (), seed: int | None = None):
+        """
+        Args:
+            bookings: 초기 예약 목록 (정렬 후 O(n)으로 트리를 구성)
+            seed: 노드 우선순위 난수 시드
+        """
+        self._random = random.Random(seed)
+        self._root: _Node | None = None
+        self._size = 0
+        self._build(bookings)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _build(self, bookings: Iterable[Booking]) -> None:
+        """정렬된 예약으로 카르테시안 트리를 스택으로 구성합니다."""
+        nodes = sorted(
+            (_Node(booking, self._random.random()) for booking in bookings),
+            key=lambda node: node.key,
+        )
+        stack: list[_Node] = []
+        for node in nodes:
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                _update(last)  # 꺼낸 노드의 서브트리는 더 이상 바뀌지 않음
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        for node in reversed(stack):
+            _update(node)
+        self._root = stack[0] if stack else None
+        self._size = len(nodes)
+
+    def insert(self, booking: Booking) -> None:
+        """예약을 추가합니다. (기대 O(log n))"""
+        self._root = _insert(self._root, _Node(booking, self._random.random()))
+        self._size += 1
+
+    def remove(self, booking: Booking) -> bool:
+        """
+        예약을 삭제합니다. (기대 O(log n))
+
+        Returns:
+            bool: 삭제했으면 True, 트리에 없으면 False
+        """
+        key = (booking.start, booking.end, booking.booking_id)
+        self._root, removed = _remove(self._root, key)
+        self._size -= removed
+        return removed
+
+    def overlapping(
+        self, start: datetime, end: datetime | None = None
+    ) -> Iterator[Booking]:
+        """
+        [start, end)와 겹치는 예약을 시작 시각 순으로 반환합니다.
+        end가 None이면 start 시각을 포함하는(시작 시각 <= start < 종료 시각) 예약을 반환합니다.
+
+        최대 종료 시각이 start 이하인 서브트리는 건너뛰고, 시작 시각이 end 이상인 노드에서 멈춥니다.
+        """
+        stack: list[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None and node.max_end > start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key[0] > start if end is None else node.key[0] >= end:
+                return  # 중위 순회이므로 이후 예약은 모두 구간 이후에 시작
+            if node.key[1] > start:
+                yield node.booking
+            node = node.right
+
+
+class AvailabilityIndex:
+    """
+    리소스와 예약을 담는 가용성 인덱스
+
+    유형별 IntervalTree와 리소스별 정렬된 일정을 함께 유지합니다. 모든 메서드는 스레드 안전합니다.
+    """
+
+    def __init__(
+        self, resources: Iterable[Resource] = (), bookings: Iterable[Booking] = ()
+    ):
+        """
+        Args:
+            resources: 리소스 목록
+            bookings: 예약 목록 (리소스가 등록되어 있어야 하며, 같은 리소스의 예약은 겹치면 안 됨)
+
+        Raises:
+            KeyError: 등록되지 않은 리소스의 예약이 있는 경우
+            ValueError: 구간이 비어 있거나 같은 리소스의 예약이 겹치는 경우
+        """
+        self._lock = threading.Lock()
+        self._resources: dict[str, Resource] = {}
+        self._by_type: dict[str, dict[str, Resource]] = {}
+        self._schedules: dict[
+            str, list[tuple]
+        ] = {}  # 리소스 ID -> [(start, end, booking_id)]
+        self._bookings: dict[str, Booking] = {}
+        self._trees: dict[str, IntervalTree] = {}
+        for resource in resources:
+            self._add_resource(resource)
+
+        by_type: dict[str, list[Booking]] = {}
+        for booking in bookings:
+            self._check(booking)
+            self._bookings[booking.booking_id] = booking
+            self._schedules[booking.resource_id].append(
+                (booking.start, booking.end, booking.booking_id)
+            )
+            resource_type = self._resources[booking.resource_id].resource_type
+            by_type.setdefault(resource_type, []).append(booking)
+        for resource_id, schedule in self._schedules.items():
+            schedule.sort()
+            for previous, current in pairwise(schedule):
+                if current[0] < previous[1]:
+                    raise ValueError(
+                        f"{resource_id}의 예약 {previous[2]}와 {current[2]}가 겹칩니다."
+                    )
+        for resource_type, type_bookings in by_type.items():
+            self._trees[resource_type] = IntervalTree(type_bookings)
+
+    def __len__(self) -> int:
+        return len(self._bookings)
+
+    def _add_resource(self, resource: Resource) -> None:
+        self._resources[resource.resource_id] = resource
+        self._by_type.setdefault(resource.resource_type, {})[resource.resource_id] = (
+            resource
+        )
+        self._schedules.setdefault(resource.resource_id, [])
+
+    def _check(self, booking: Booking) -> None:
+        if booking.resource_id not in self._resources:
+            raise KeyError(f"등록되지 않은 리소스입니다: {booking.resource_id}")
+        if booking.end <= booking.start:
+            raise ValueError(
+                f"예약 {booking.booking_id}의 종료 시각이 시작 시각보다 빠릅니다."
+            )
+        if booking.booking_id in self._bookings:
+            raise ValueError(f"이미 존재하는 예약 ID입니다: {booking.booking_id}")
+
+    def add_resource(self, resource: Resource) -> None:
+        """리소스를 등록합니다. (같은 ID의 리소스가 있으면 교체)"""
+        with self._lock:
+            previous = self._resources.get(resource.resource_id)
+            if (
+                previous is not None
+                and previous.resource_type != resource.resource_type
+            ):
+                if self._schedules[resource.resource_id]:
+                    raise ValueError(
+                        f"예약이 있는 리소스의 유형은 바꿀 수 없습니다: {resource.resource_id}"
+                    )
+                del self._by_type[previous.resource_type][resource.resource_id]
+            self._add_resource(resource)
+
+    def add_booking(self, booking: Booking) -> None:
+        """
+        예약을 추가합니다.
+
+        Raises:
+            KeyError: 등록되지 않은 리소스인 경우
+            ValueError: 구간이 비어 있거나 같은 리소스의 기존 예약과 겹치는 경우
+        """
+        with self._lock:
+            self._check(booking)
+            schedule = self._schedules[booking.resource_id]
+            position = bisect_right(schedule, booking.start, key=_END)
+            if position < len(schedule) and schedule[position][0] < booking.end:
+                raise ValueError(
+                    f"예약 {booking.booking_id}가 기존 예약 {schedule[position][2]}와 겹칩니다."
+                )
+            schedule.insert(position, (booking.start, booking.end, booking.booking_id))
+            self._bookings[booking.booking_id] = booking
+            resource_type = self._resources[booking.resource_id].resource_type
+            self._trees.setdefault(resource_type, IntervalTree()).insert(booking)
+
+    def remove_booking(self, booking_id: str) -> Booking:
+        """
+        예약을 삭제합니다.
+
+        Returns:
+            Booking: 삭제한 예약
+
+        Raises:
+            KeyError: 존재하지 않는 예약 ID인 경우
+        """
+        with self._lock:
+            booking = self._bookings.pop(booking_id)
+            schedule = self._schedules[booking.resource_id]
+            entry = (booking.start, booking.end, booking.booking_id)
+            del schedule[bisect_left(schedule, entry)]
+            resource_type = self._resources[booking.resource_id].resource_type
+            self._trees[resource_type].remove(booking)
+            return booking
+
+    def resources(self, resource_type: str) -> list[Resource]:
+        """유형에 속한 리소스 목록을 반환합니다."""
+        with self._lock:
+            return list(self._by_type.get(resource_type, {}).values())
+
+    def overlapping(
+        self, resource_type: str, start: datetime, end: datetime | None = None
+    ) -> list[Booking]:
+        """
+        유형의 예약 중 [start, end)와 겹치는 예약을 시작 시각 순으로 반환합니다.
+        (end가 None이면 start 시각을 포함하는 예약)
+        """
+        with self._lock:
+            tree = self._trees.get(resource_type)
+            return list(tree.overlapping(start, end)) if tree is not None else []
+
+    def available(
+        self, resource_type: str, start: datetime, end: datetime | None = None
+    ) -> list[Resource]:
+        """
+        유형의 리소스 중 [start, end) 동안 예약이 하나도 없는 리소스를 반환합니다.
+        (end가 None이면 start 시각에 예약이 없는 리소스)
+        """
+        with self._lock:
+            tree = self._trees.get(resource_type)
+            busy = (
+                {booking.resource_id for booking in tree.overlapping(start, end)}
+                if tree is not None
+                else set()
+            )
+            return [
+                resource
+                for resource_id, resource in self._by_type.get(
+                    resource_type, {}
+                ).items()
+                if resource_id not in busy
+            ]
+
+    def now(self) -> datetime:
+        """
+        예약 시각과 비교할 수 있는 현재 시각을 반환합니다.
+
+        예약 시각에 시간대가 없으면(ISO 문자열에 오프셋 없음) 로컬 벽시계 시각으로 보고 naive 시각을,
+        그 외에는(예약이 없는 경우 포함) UTC 기준 aware 시각을 반환합니다.
+        """
+        with self._lock:
+            booking = next(iter(self._bookings.values()), None)
+        now = datetime.now(UTC)
+        if booking is not None and booking.start.tzinfo is None:
+            return now.astimezone().replace(tzinfo=None)
+        return now
+
+    def free_slots(
+        self,
+        resource_id: str,
+        start: datetime,
+        end: datetime,
+        min_duration: timedelta | None = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        리소스의 [start, end) 중 예약이 없는 시간대를 반환합니다.
+
+        Args:
+            resource_id: 리소스 ID
+            start: 검색 시작 시각
+            end: 검색 종료 시각
+            min_duration: 이보다 짧은 빈 시간대는 제외
+
+        Returns:
+            list[tuple[datetime, datetime]]: 빈 시간대 (start, end) 목록
+
+        Raises:
+            KeyError: 등록되지 않은 리소스인 경우
+        """
+        with self._lock:
+            schedule = self._schedules[resource_id]
+            position = bisect_right(schedule, start, key=_END)
+            slots, cursor = [], start
+            while position < len(schedule) and schedule[position][0] < end:
+                booked_start, booked_end, _ = schedule[position]
+                if booked_start > cursor:
+                    slots.append((cursor, booked_start))
+                cursor = max(cursor, booked_end)
+                position += 1
+            if cursor < end:
+                slots.append((cursor, end))
+        if min_duration is not None:
+            slots = [slot for slot in slots if slot[1] - slot[0] >= min_duration]
+        return slots
+
+    @classmethod
+    def from_json(cls, path: str | Path) -> "AvailabilityIndex":
+        """JSON 파일에서 인덱스를 불러옵니다. (형식은 모듈 설명 참고)"""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            (Resource(**resource) for resource in data.get("resources", [])),
+            (
+                Booking(
+                    booking["booking_id"],
+                    booking["resource_id"],
+                    datetime.fromisoformat(booking["start"]),
+                    datetime.fromisoformat(booking["end"]),
+                )
+                for booking in data.get("bookings", [])
+            ),
+        )
+
+    @classmethod
+    def from_sqlite(cls, path: str | Path) -> "AvailabilityIndex":
+        """SQLite 저장소의 resources / bookings 테이블에서 인덱스를 불러옵니다."""
+        with sqlite3.connect(path) as connection:
+            resources = connection.execute(
+                "SELECT resource_id, resource_type, name FROM resources"
+            ).fetchall()
+            bookings = connection.execute(
+                "SELECT booking_id, resource_id, start, end FROM bookings"
+            ).fetchall()
+        return cls(
+            (Resource(*row) for row in resources),
+            (
+                Booking(
+                    booking_id,
+                    resource_id,
+                    datetime.fromisoformat(start),
+                    datetime.fromisoformat(end),
+                )
+                for booking_id, resource_id, start, end in bookings
+            ),
+        )
+
+
+def load_index(path: str | Path) -> AvailabilityIndex:
+    """
+    경로의 확장자에 따라 JSON 파일 또는 SQLite 저장소에서 인덱스를 불러옵니다.
+
+    Args:
+        path: 저장소 경로 (.json 또는 .db / .sqlite / .sqlite3)
+
+    Returns:
+        AvailabilityIndex: 불러온 인덱스
+    """
+    if Path(path).suffix.lower() in SQLITE_SUFFIXES:
+        return AvailabilityIndex.from_sqlite(path)
+    return AvailabilityIndex.from_json(path)
+
+
+_index: AvailabilityIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_availability_index() -> AvailabilityIndex:
+    """
+    프로세스 전역 가용성 인덱스를 반환합니다.
+
+    처음 호출될 때 환경변수 RESOURCE_STORE의 저장소에서 불러오며, 설정되지 않았으면 빈 인덱스를 사용합니다.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            path = os.getenv(RESOURCE_STORE_ENV)
+            _index = load_index(path) if path else AvailabilityIndex()
+        return _index
+
+
+def set_availability_index(index: AvailabilityIndex | None) -> None:
+    """
+    프로세스 전역 가용성 인덱스를 교체합니다. None이면 다음 호출 때 저장소에서 다시 불러옵니다.
+    """
+    global _index
+    with _index_lock:
+        _index = index
@@ -6,33 +6,84 @@ LCEL(LangChain Expression Language)을 사용하여 체인을 구성합니다.
 """
 
 from langchain.schema.runnable import RunnablePassthrough, RunnableSerializable
-from langchain_core.output_parsers import StrOutputParser
 
 from agents.management.modules.models import get_openai_model
-from agents.management.modules.prompts import get_resource_planning_prompt
+from agents.management.modules.prompts import (
+    get_resource_planning_prompt,
+    get_structured_resource_planning_prompt,
+)
+from agents.output_parsers import StreamingStrOutputParser
 
+# 구조화 출력 모드의 생성 토큰 상한 (산문 계획은 보통 1,500 토큰 이상)
+STRUCTURED_PLAN_MAX_TOKENS = 800
+# 상한에서 잘려 검증에 실패한 구조화 출력을 다시 생성할 때의 생성 토큰 상한
+STRUCTURED_PLAN_RETRY_MAX_TOKENS = 2000
 
-def set_resource_planning_chain() -> RunnableSerializable:
+
+def set_resource_planning_chain(model=None) -> RunnableSerializable:
     """
     리소스 계획 수립에 사용할 LangChain 체인을 생성합니다.
 
     이 함수는 LCEL(LangChain Expression Language)을 사용하여 체인을 구성합니다.
     체인은 다음 단계로 구성됩니다:
-    1. 입력에서 project_id, request_type, query, team_members 등을 추출하여 프롬프트에 전달
+    1. 입력에서 project_id, request_type, query, team_members, schedule_summary, role_assignments 등을 추출하여 프롬프트에 전달
     2. 프롬프트 템플릿에 값을 삽입하여 최종 프롬프트 생성
     3. LLM을 호출하여 리소스 계획 생성 수행
     4. 결과를 문자열로 변환
 
     이 함수는 리소스 관리 노드에서 사용됩니다.
 
+    Args:
+        model: 체인에서 사용할 채팅 모델 (기본값: get_openai_model()의 결과)
+
     Returns:
         RunnableSerializable: 실행 가능한 체인 객체
     """
     # 리소스 계획을 위한 프롬프트 가져오기
     prompt = get_resource_planning_prompt()
-    # OpenAI 모델 가져오기
-    model = get_openai_model()
+    # OpenAI 모델 가져오기 (지정된 모델이 없을 때)
+    if model is None:
+        model = get_openai_model()
+
+    return _resource_planning_chain(prompt, model)
 
+
+def set_structured_resource_planning_chain(
+    model=None, max_tokens: int = STRUCTURED_PLAN_MAX_TOKENS
+) -> RunnableSerializable:
+    """
+    구조화 출력 모드의 리소스 계획 체인을 생성합니다.
+
+    set_resource_planning_chain()과 입력이 같지만, 산문 대신 schemas.ResourcePlan 스키마를 따르는
+    JSON 문자열을 생성합니다. 모델에는 JSON 모드(response_format)와 더 작은 생성 토큰 상한
+    (max_tokens)을 바인딩합니다. 출력은 문자열 조각으로 스트리밍되며,
+    노드가 전체 텍스트를 schemas.parse_resource_plan()으로 검증합니다.
+
+    Args:
+        model: 체인에서 사용할 채팅 모델 (기본값: get_openai_model()의 결과)
+        max_tokens: 생성 토큰 상한 (기본값: STRUCTURED_PLAN_MAX_TOKENS)
+
+    Returns:
+        RunnableSerializable: 실행 가능한 체인 객체
+    """
+    # 구조화된 리소스 계획을 위한 프롬프트 가져오기
+    prompt = get_structured_resource_planning_prompt()
+    # OpenAI 모델 가져오기 (지정된 모델이 없을 때)
+    if model is None:
+        model = get_openai_model()
+
+    # JSON 모드와 생성 토큰 상한 바인딩 (라우팅된 모델의 상한보다 우선)
+    model = model.bind(
+        max_tokens=max_tokens,
+        response_format={"type": "json_object"},
+    )
+    return _resource_planning_chain(prompt, model)
+
+
+def _resource_planning_chain(prompt, model) -> RunnableSerializable:
+    """
+    리소스 계획 프롬프트와 모델로 LCEL 체인을 구성합니다.
+    """
     # LCEL을 사용하여 체인 구성
     return (
         # 입력에서 필요한 필드 추출 및 프롬프트에 전달
@@ -44,8 +95,14 @@ def set_resource_planning_chain() -> RunnableSerializable:
             resources_available=lambda x: x.get(
                 "resources_available", {}
             ),  # 가용 리소스 추출
+            schedule_summary=lambda x: x.get(
+                "schedule_summary", "없음"
+            ),  # 일정 요약 추출
+            role_assignments=lambda x: x.get(
+                "role_assignments", "없음"
+            ),  # 역할 배정 추출
         )
         | prompt  # 프롬프트 적용
         | model  # LLM 모델 호출
-        | StrOutputParser()  # 결과를 문자열로 변환
+        | StreamingStrOutputParser()  # 결과를 문자열로 변환
     )
@@ -4,13 +4,38 @@
 이 모듈은 LangGraph Workflow에서 조건부 라우팅을 처리하는 함수들을 제공합니다.
 조건부 라우팅은 Workflow의 다음 단계를 동적으로 결정하는 데 사용됩니다.
 
-현재는 주석 처리된 예시 코드만 포함되어 있으며, 필요에 따라 실제 구현을 추가할 수 있습니다.
-이 예시 코드는 ReAct 패턴에서 LLM의 출력에 따라 다음 노드를 결정하는 라우터 함수를 보여줍니다.
+route_resource_management()는 요청 특성(request_type, 쿼리 길이)으로 모델 등급과 생성 토큰 상한을
+결정하고(agents.model_router), 결정을 model_route에 담아 리소스 관리 노드로 보냅니다.
+
+아래의 주석 처리된 예시 코드는 ReAct 패턴에서 LLM의 출력에 따라 다음 노드를 결정하는 라우터 함수를 보여줍니다.
 
 Workflow가 확장됨에 따라 다양한 조건부 라우팅 함수를 이 모듈에 추가할 수 있습니다.
 예를 들어, 콘텐츠 유형에 따른 라우팅, 사용자 요청 유형에 따른 라우팅 등을 구현할 수 있습니다.
 """
 
+from langgraph.types import Send
+
+from agents.model_router import ROUTER
+
+
+def route_resource_management(state) -> Send:
+    """
+    요청 특성으로 모델 등급을 결정하고, 결정을 담아 리소스 관리 노드로 보내는 라우터 함수
+
+    Args:
+        state (ManagementState): 현재 Workflow 상태
+
+    Returns:
+        Send: model_route가 추가된 상태를 resource_management 노드로 전달하는 Send
+    """
+    route = ROUTER.decide(
+        "ManagementWorkflow",
+        request_type=state.get("request_type"),
+        query=state.get("query"),
+    )
+    return Send("resource_management", {**state, "model_route": route})
+
+
 # from typing import Literal
 
 
@@ -6,43 +6,196 @@
 아래는 예시입니다.
 """
 
+import json
+import os
+from functools import cached_property
+
 from agents.base_node import BaseNode
-from agents.management.modules.chains import set_resource_planning_chain
 from agents.management.modules.state import ManagementState
 
+STRUCTURED_PLAN_ENV = "RESOURCE_PLAN_STRUCTURED"  # "1"이면 구조화 출력 모드 사용
+
+
+def structured_plan_enabled() -> bool:
+    """환경변수로 리소스 계획 구조화 출력 모드가 활성화되었는지 확인합니다."""
+    return os.getenv(STRUCTURED_PLAN_ENV, "0").strip().lower() in ("1", "true", "yes")
+
+
+def _validated_plan(text: str) -> dict | None:
+    """
+    구조화 출력 텍스트를 검증한 리소스 계획을 반환합니다. (잘린 JSON 등 검증에 실패하면 None)
+    """
+    from pydantic import ValidationError
+
+    from agents.management.modules.schemas import parse_resource_plan
+
+    try:
+        return parse_resource_plan(text)
+    except ValidationError:
+        return None
+
 
 class ResourceManagementNode(BaseNode):
     """
     프로젝트에 필요한 리소스를 계획하고 관리하는 노드
+
+    기본(산문) 모드에서는 다섯 섹션의 리소스 계획 텍스트를 resource_plan으로 반환합니다.
+    구조화 출력 모드에서는 더 작은 생성 토큰 상한으로 JSON을 생성하고, 이를 검증한
+    딕셔너리(schemas.ResourcePlan)를 resource_plan으로 반환합니다.
+    JSON이 상한에서 잘리는 등 검증에 실패하면 더 큰 상한(STRUCTURED_PLAN_RETRY_MAX_TOKENS)으로
+    한 번 다시 생성하고, 그래도 실패하면 산문 체인의 텍스트를 resource_plan으로 반환합니다.
+    구조화 출력은 조각을 바로 전달하지 않고, 검증을 통과한 출력만 하나의 스트림 이벤트로 전달합니다.
+    (산문 체인은 조각을 바로 전달하므로, 어느 경우든 전달된 조각을 이어 붙이면 response와 같음)
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, structured: bool | None = None, **kwargs):
+        """
+        Args:
+            structured: 구조화 출력 모드 사용 여부 (None이면 환경변수 RESOURCE_PLAN_STRUCTURED)
+            **kwargs: BaseNode 키워드 인자
+        """
         super().__init__(**kwargs)  # BaseNode 초기화
-        self.chain = set_resource_planning_chain()  # 리소스 계획 체인 설정
+        self.structured = (
+            structured_plan_enabled() if structured is None else structured
+        )
+
+    @cached_property
+    def chain(self):
+        """
+        리소스 계획 체인 (처음 실행할 때 생성)
+
+        체인 모듈과 LLM 클라이언트는 임포트 비용이 크므로, 노드 생성이나 그래프 빌드 시점이 아니라
+        첫 실행 시점에 불러옵니다.
+        """
+        return self.build_chain()
+
+    def build_chain(self, model=None):
+        """
+        리소스 계획 체인을 생성합니다. (model이 없으면 기본 모델 사용)
+        """
+        from agents.management.modules import chains
+
+        if self.structured:
+            return chains.set_structured_resource_planning_chain(model=model)
+        return chains.set_resource_planning_chain(model=model)
+
+    def fallback_chains(self, state: ManagementState) -> list:
+        """
+        구조화 출력이 검증에 실패했을 때 차례로 실행할 체인 목록을 반환합니다.
+
+        더 큰 생성 토큰 상한의 구조화 체인, 산문 체인 순서이며, 모델마다 처음 사용할 때 한 번만 생성합니다.
+        산문 모드에서는 빈 목록을 반환합니다.
+        """
+        if not self.structured:
+            return []
+        route = state.get("model_route")
+        key = route["model"] if route else None
+        cache = self.__dict__.setdefault("_fallback_chains", {})
+        fallbacks = cache.get(key)
+        if fallbacks is None:
+            from agents.management.modules import chains
+
+            model = None
+            if route:
+                from agents.model_router import ROUTER
+
+                model = ROUTER.chat_model(route)
+            fallbacks = cache.setdefault(
+                key,
+                [
+                    chains.set_structured_resource_planning_chain(
+                        model=model, max_tokens=chains.STRUCTURED_PLAN_RETRY_MAX_TOKENS
+                    ),
+                    chains.set_resource_planning_chain(model=model),
+                ],
+            )
+        return fallbacks
+
+    def _chain_input(self, state: ManagementState) -> dict:
+        """
+        상태(state)에서 리소스 계획 체인의 입력을 구성합니다.
+        """
+        from agents.management.modules.tools import (
+            assign_team_roles,
+            get_project_schedule,
+        )
+
+        # 팀 구성원 기본값 처리
+        team_members = state.get("team_members") or []
+        # 일정 엔진이 계산한 일정 요약 (LLM이 일정을 추론하지 않도록 계산 결과를 그대로 전달)
+        schedule = get_project_schedule(state["project_id"])
+        # 배정 솔버가 계산한 역할 배정 (LLM이 배정을 만들지 않고 설명하도록 계산 결과를 그대로 전달)
+        assignments = assign_team_roles(team_members, state.get("roles") or [])
+
+        return {
+            "project_id": state["project_id"],  # 프로젝트 ID
+            "request_type": state["request_type"],  # 요청 유형
+            "query": state["query"],  # 사용자 쿼리
+            "team_members": [
+                member if isinstance(member, str) else member["name"]
+                for member in team_members
+            ],  # 팀 구성원 (프로필은 이름만)
+            "resources_available": state.get(
+                "resources_available", {}
+            ),  # 사용 가능한 리소스
+            "schedule_summary": json.dumps(schedule, ensure_ascii=False)
+            if schedule
+            else "없음",  # 일정 요약
+            "role_assignments": json.dumps(assignments, ensure_ascii=False)
+            if assignments
+            else "없음",  # 역할 배정
+        }
+
+    def _output(self, state: ManagementState, text: str) -> dict:
+        """
+        체인 출력 텍스트와 라우팅 결정(있는 경우)으로 상태 업데이트를 구성합니다.
+
+        구조화 출력 모드에서는 텍스트(JSON)를 검증하여 resource_plan에 딕셔너리로 저장합니다.
+        (산문 체인으로 대체된 경우에는 텍스트 그대로 저장)
+        """
+        resource_plan = (self.structured and _validated_plan(text)) or text
+        output = {"response": text, "resource_plan": resource_plan}
+        if state.get("model_route"):
+            # 라우팅 결정을 최종 상태에 기록
+            output["model_route"] = state["model_route"]
+        return output
 
     def execute(self, state: ManagementState) -> dict:
         """
         주어진 상태(state)에서 project_id, request_type, query 등의 정보를 추출하여
         리소스 계획 체인에 전달하고, 결과를 응답으로 반환합니다.
         """
-        # 팀 구성원 기본값 처리
-        team_members = state.get("team_members", [])
-
-        # 리소스 계획 체인 실행
-        resource_plan = self.chain.invoke(
-            {
-                "project_id": state["project_id"],  # 프로젝트 ID
-                "request_type": state["request_type"],  # 요청 유형
-                "query": state["query"],  # 사용자 쿼리
-                "team_members": team_members,  # 팀 구성원
-                "resources_available": state.get(
-                    "resources_available", {}
-                ),  # 사용 가능한 리소스
-            }
-        )
+        # 라우팅된 모델 등급의 리소스 계획 체인 실행 (산문 체인의 조각은 스트림 이벤트로 즉시 전달)
+        with self.track_route(state):
+            chain_input = self._chain_input(state)
+            # 구조화 출력이 검증에 실패하면 더 큰 상한으로 다시 생성하고, 그래도 실패하면 산문 체인 실행
+            attempts = [self.routed_chain(state), *self.fallback_chains(state)]
+            for chain in attempts[:-1]:
+                text = self.stream_chain(chain, chain_input, emit=False)
+                if _validated_plan(text) is not None:
+                    self.write_chunk(text)
+                    break
+            else:
+                text = self.stream_chain(attempts[-1], chain_input)
+
+        # 생성된 리소스 계획을 응답과 resource_plan으로 반환
+        return self._output(state, text)
 
-        # 상태 업데이트
-        state["resource_plan"] = resource_plan
+    async def aexecute(self, state: ManagementState) -> dict:
+        """
+        execute()의 비동기 버전으로, 체인을 `astream`으로 호출하여 이벤트 루프를 블로킹하지 않습니다.
+        """
+        # 라우팅된 모델 등급의 리소스 계획 체인 비동기 실행 (산문 체인의 조각은 스트림 이벤트로 즉시 전달)
+        with self.track_route(state):
+            chain_input = self._chain_input(state)
+            attempts = [self.routed_chain(state), *self.fallback_chains(state)]
+            for chain in attempts[:-1]:
+                text = await self.astream_chain(chain, chain_input, emit=False)
+                if _validated_plan(text) is not None:
+                    self.write_chunk(text)
+                    break
+            else:
+                text = await self.astream_chain(attempts[-1], chain_input)
 
-        # 생성된 리소스 계획을 응답으로 반환
-        return {"response": resource_plan}
+        # 생성된 리소스 계획을 응답과 resource_plan으로 반환
+        return self._output(state, text)
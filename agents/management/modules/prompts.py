@@ -19,6 +19,8 @@ def get_resource_planning_prompt():
     3. 사용자 쿼리: 구체적인 요청사항
     4. 팀 구성원: 프로젝트에 참여하는 팀 구성원 목록
     5. 사용 가능한 리소스: 현재 사용 가능한 리소스 정보
+    6. 일정 요약: 일정 엔진이 계산한 주 공정, 여유 시간, 리소스 평준화 결과 (없으면 "없음")
+    7. 역할 배정: 배정 솔버가 계산한 구성원-역할 배정 결과 (없으면 "없음")
 
     프롬프트는 LLM에게 주어진 정보를 기반으로 프로젝트 관리에 적합한 리소스 계획을
     수립하도록 지시합니다. 결과는 한국어로 반환됩니다.
@@ -39,6 +41,10 @@ def get_resource_planning_prompt():
 
 5. Available Resources: {resources_available}  
 
+6. Computed Schedule Summary: {schedule_summary}  
+
+7. Solved Role Assignments: {role_assignments}  
+
 Your Task:  
 Based on the information provided, develop a comprehensive resource management plan that addresses the user query. Your plan should include:  
 
@@ -69,6 +75,10 @@ Based on the information provided, develop a comprehensive resource management p
 
 Make your plan specific to the entertainment industry context and the particular request type. Be detailed yet concise, and ensure your recommendations are practical and actionable.  
 
+If a computed schedule summary is provided, use its dates, critical path, slack and leveling delays as they are instead of estimating timelines yourself.  
+
+If solved role assignments are provided (not "없음"), keep every member in the assigned role and explain why each assignment fits (skills, availability, fit score); do not reassign members or invent new assignments. Mention unassigned members and unfilled roles if any.  
+
 All responses must be in Korean.  
 
 Resource Management Plan:"""
@@ -82,5 +92,68 @@ Resource Management Plan:"""
             "query",
             "team_members",
             "resources_available",
+            "schedule_summary",
+            "role_assignments",
+        ],  # 프롬프트에 삽입될 변수들
+    )
+
+
+def get_structured_resource_planning_prompt():
+    """
+    구조화 출력 모드의 리소스 계획 프롬프트 템플릿을 생성합니다.
+
+    입력은 get_resource_planning_prompt()와 같고, LLM에게 산문 대신
+    schemas.ResourcePlan 스키마를 따르는 간결한 JSON 객체만 생성하도록 지시합니다.
+    항목 수와 문장 길이를 제한하여 출력 토큰 수(생성 시간)를 줄입니다. 값은 한국어로 작성됩니다.
+
+    Returns:
+        PromptTemplate: 구조화된 리소스 계획 수립을 위한 프롬프트 템플릿 객체
+    """
+    # 구조화된 리소스 계획을 위한 프롬프트 템플릿 정의 (JSON 중괄호는 이스케이프)
+    structured_resource_planning_template = """You are an expert entertainment project manager tasked with creating resource plans for entertainment projects. You are provided with the following information:  
+
+1. Project ID: {project_id}  
+
+2. Request Type: {request_type}  
+
+3. User Query: {query}  
+
+4. Team Members: {team_members}  
+
+5. Available Resources: {resources_available}  
+
+6. Computed Schedule Summary: {schedule_summary}  
+
+7. Solved Role Assignments: {role_assignments}  
+
+Your Task:  
+Based on the information provided, develop a resource management plan that addresses the user query, specific to the entertainment industry context and the particular request type.  
+
+Respond with a single JSON object and nothing else (no markdown, no code fences) using exactly these keys:  
+{{"overview": "project summary and objectives, at most 2 sentences",  
+"allocations": [{{"category": "human | technical | financial | time", "item": "resource", "detail": "one sentence"}}],  
+"risks": [{{"risk": "risk", "mitigation": "one sentence"}}],  
+"implementation_steps": ["one sentence per step"],  
+"recommendations": ["one sentence per recommendation"]}}  
+
+If a computed schedule summary is provided, use its dates, critical path, slack and leveling delays as they are instead of estimating timelines yourself.  
+
+If solved role assignments are provided (not "없음"), keep every member in the assigned role and add one "human" allocation per assignment whose item is the member and role and whose detail explains why the assignment fits (skills, availability, fit score); do not reassign members or invent new assignments. Mention unassigned members and unfilled roles in recommendations if any.  
+
+Keep it compact: at most 6 allocations, 3 risks, 5 implementation steps and 3 recommendations. Every value must be one short, practical and actionable sentence.  
+
+All string values must be in Korean."""
+
+    # PromptTemplate 객체 생성 및 반환
+    return PromptTemplate(
+        template=structured_resource_planning_template,  # 정의된 프롬프트 템플릿
+        input_variables=[
+            "project_id",
+            "request_type",
+            "query",
+            "team_members",
+            "resources_available",
+            "schedule_summary",
+            "role_assignments",
         ],  # 프롬프트에 삽입될 변수들
     )
@@ -0,0 +1,511 @@
+"""
+프로젝트 일정 엔진 모듈
+
+작업(task)과 선후 관계(finish-to-start)로 이루어진 프로젝트 일정에서 주 공정(critical path), 여유 시간(slack),
+리소스 평준화(resource leveling) 일정을 계산합니다. 작업마다 Python 객체를 만들지 않고,
+작업 속성은 NumPy 배열, 선후 관계는 CSR(압축 희소 행) 배열로 저장합니다.
+
+계산 방식
+- 위상 정렬: Kahn 알고리즘을 단계(level) 단위로 벡터화하여, 같은 단계의 작업을 한 번에 처리합니다.
+- 전진 / 후진 계산: 단계 순서대로 선행 / 후행 작업의 값을 모아 np.maximum.at으로 계산합니다.
+  - head: 가장 빠른 시작 시각 (ES)
+  - tail: 작업 자신을 포함하여 프로젝트 종료까지 남은 가장 긴 경로 길이
+  - LS = 프로젝트 기간 - tail, slack = LS - ES
+- 증분 계산: update_duration()은 바뀐 작업의 후손(head)과 조상(tail)만 다시 계산합니다.
+  tail은 프로젝트 기간과 무관하므로, 기간이 바뀌어도 나머지 작업은 다시 계산하지 않습니다.
+- 리소스 평준화: 가장 늦은 시작 시각(LS)이 빠른 작업부터 배치하는 직렬 일정 생성 방식으로,
+  리소스마다 용량(동시에 처리할 수 있는 작업 수)을 넘지 않도록 시작 시각을 늦춥니다.
+
+시간 단위는 일(day)이며, 프로젝트 시작일(start)이 있으면 요약에 날짜를 함께 표시합니다.
+프로젝트 일정은 환경변수 SCHEDULE_STORE의 JSON 파일에서 불러옵니다.
+
+JSON 형식:
+```json
+{
+  "projects": {
+    "PRJ-2023-001": {
+      "start": "2025-06-01",
+      "capacities": {"editor": 2},
+      "tasks": [
+        {"task_id": "plan", "name": "기획", "duration": 5},
+        {"task_id": "edit", "name": "편집", "duration": 3, "depends_on": ["plan"], "resource": "editor"}
+      ]
+    }
+  }
+}
+```
+
+예시:
+```python
+from agents.management.modules.schedule import ScheduleEngine
+
+engine = ScheduleEngine.from_tasks(tasks, capacities={"editor": 2})
+print(engine.duration, engine.critical_path())
+engine.update_duration("edit", 5)  # 영향받는 작업만 다시 계산
+print(engine.summary())
+```
+"""
+
+import json
+import os
+import threading
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+SCHEDULE_STORE_ENV = "SCHEDULE_STORE"  # 프로젝트 일정 JSON 파일 경로
+EPSILON = 1e-9  # 여유 시간 비교 허용 오차 (일)
+
+
+def _gather(ptr: np.ndarray, idx: np.ndarray, nodes: np.ndarray):
+    """
+    CSR 배열에서 nodes의 이웃을 한 번에 모읍니다.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (이웃마다 nodes 내 소유 작업 위치, 이웃 작업 번호)
+    """
+    starts = ptr[nodes]
+    counts = ptr[nodes + 1] - starts
+    owner = np.repeat(np.arange(len(nodes)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, idx[np.repeat(starts, counts) + offsets]
+
+
+def _unique(values: np.ndarray) -> np.ndarray:
+    """정렬 후 중복을 제거합니다. (np.unique보다 호출 비용이 작음)"""
+    values = np.sort(values)
+    if values.size:
+        values = values[np.concatenate(([True], values[1:] != values[:-1]))]
+    return values
+
+
+def _csr(keys: np.ndarray, values: np.ndarray, size: int):
+    """(keys, values) 간선 목록을 keys 기준 CSR (ptr, idx) 배열로 변환합니다."""
+    order = np.argsort(keys, kind="stable")
+    ptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=ptr[1:])
+    return ptr, values[order]
+
+
+def _earliest_fit(
+    starts: list[float], ends: list[float], ready: float, duration: float
+) -> tuple[float, int]:
+    """
+    정렬된 배치 구간 사이에서 ready 이후 duration만큼 비어 있는 가장 빠른 시각을 찾습니다.
+
+    Returns:
+        tuple[float, int]: (시작 시각, 새 구간을 넣을 위치)
+    """
+    position = bisect_right(ends, ready)  # ready 이후에 끝나는 첫 구간
+    while position < len(starts) and starts[position] < ready + duration:
+        ready = max(ready, ends[position])
+        position += 1
+    return ready, position
+
+
+class ScheduleEngine:
+    """
+    배열 기반 프로젝트 일정 엔진
+
+    Attributes:
+        task_ids: 작업 ID 목록 (배열 인덱스 순서)
+        names: 작업 이름 목록
+        start: 프로젝트 시작일 (없으면 None)
+    """
+
+    def __init__(
+        self,
+        task_ids: list[str],
+        durations: Iterable[float],
+        dependencies: Iterable[tuple[str, str]] = (),
+        resources: Iterable[str | None] | None = None,
+        capacities: dict[str, int] | None = None,
+        names: list[str] | None = None,
+        start: datetime | None = None,
+    ):
+        """
+        Args:
+            task_ids: 작업 ID 목록
+            durations: 작업별 기간 (일)
+            dependencies: (선행 작업 ID, 후행 작업 ID) 목록
+            resources: 작업별 사용 리소스 이름 (None이면 리소스 제약 없음)
+            capacities: 리소스별 용량 (목록에 없는 리소스는 1)
+            names: 작업별 이름 (기본값: 작업 ID)
+            start: 프로젝트 시작일
+
+        Raises:
+            KeyError: 선후 관계에 없는 작업 ID가 있는 경우
+            ValueError: 기간이 음수이거나 선후 관계에 순환이 있는 경우
+        """
+        size = len(task_ids)
+        self.task_ids = list(task_ids)
+        self.names = list(names) if names is not None else list(self.task_ids)
+        self.start = start
+        self._index = {task_id: i for i, task_id in enumerate(self.task_ids)}
+        self._duration = np.asarray(list(durations), dtype=np.float64)
+        if len(self._duration) != size or (self._duration < 0).any():
+            raise ValueError("작업 기간은 작업마다 하나씩, 0 이상이어야 합니다.")
+
+        # 간선을 (선행 * 작업 수 + 후행) 정수로 인코딩하여 중복 제거
+        edges = _unique(
+            np.fromiter(
+                (
+                    self._index[before] * size + self._index[after]
+                    for before, after in dependencies
+                ),
+                dtype=np.int64,
+            )
+        )
+        before, after = np.divmod(edges, max(size, 1))
+        self._succ_ptr, self._succ_idx = _csr(before, after, size)
+        self._pred_ptr, self._pred_idx = _csr(after, before, size)
+
+        resources = list(resources) if resources is not None else [None] * size
+        resource_names = sorted({r for r in resources if r is not None})
+        codes = {name: code for code, name in enumerate(resource_names)}
+        self.resource_names = resource_names
+        self._resource = np.asarray(
+            [codes[r] if r is not None else -1 for r in resources], dtype=np.int64
+        )
+        self._capacity = [
+            max(1, int((capacities or {}).get(r, 1))) for r in resource_names
+        ]
+
+        self._level = self._levels()
+        self._order = np.argsort(self._level, kind="stable")
+        self._head = np.zeros(size)
+        self._tail = np.zeros(size)
+        self._leveled: np.ndarray | None = None
+        self._summaries: dict[int, dict] = {}  # limit -> summary() 결과
+        self._version = 0  # 작업 기간이 바뀔 때마다 증가
+        self._lock = threading.Lock()
+        self._forward(self._order)
+        self._backward(self._order)
+
+    @classmethod
+    def from_tasks(
+        cls,
+        tasks: Iterable[dict],
+        capacities: dict[str, int] | None = None,
+        start: datetime | None = None,
+    ) -> "ScheduleEngine":
+        """
+        작업 딕셔너리 목록으로 엔진을 생성합니다.
+
+        Args:
+            tasks: {"task_id", "duration", "name"(선택), "depends_on"(선택), "resource"(선택)} 목록
+            capacities: 리소스별 용량
+            start: 프로젝트 시작일
+        """
+        tasks = list(tasks)
+        return cls(
+            [task["task_id"] for task in tasks],
+            [task["duration"] for task in tasks],
+            [
+                (before, task["task_id"])
+                for task in tasks
+                for before in task.get("depends_on", ())
+            ],
+            [task.get("resource") for task in tasks],
+            capacities,
+            [task.get("name", task["task_id"]) for task in tasks],
+            start,
+        )
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    def _levels(self) -> np.ndarray:
+        """단계 단위로 벡터화한 Kahn 알고리즘으로 작업별 위상 단계를 계산합니다."""
+        size = len(self.task_ids)
+        indegree = np.diff(self._pred_ptr)
+        level = np.full(size, -1, dtype=np.int64)
+        frontier = np.flatnonzero(indegree == 0)
+        current = 0
+        while frontier.size:
+            level[frontier] = current
+            _, successors = _gather(self._succ_ptr, self._succ_idx, frontier)
+            np.subtract.at(indegree, successors, 1)
+            frontier = _unique(successors[indegree[successors] == 0])
+            current += 1
+        if (level < 0).any():
+            raise ValueError("작업 선후 관계에 순환이 있습니다.")
+        return level
+
+    def _groups(self, nodes: np.ndarray) -> list[np.ndarray]:
+        """단계 순으로 정렬된 작업 배열을 단계별로 나눕니다."""
+        bounds = np.flatnonzero(np.diff(self._level[nodes])) + 1
+        return np.split(nodes, bounds)
+
+    def _forward(self, nodes: np.ndarray) -> None:
+        """nodes(단계 순 정렬)의 가장 빠른 시작 시각(head)을 다시 계산합니다."""
+        for group in self._groups(nodes):
+            owner, predecessors = _gather(self._pred_ptr, self._pred_idx, group)
+            head = np.zeros(len(group))
+            np.maximum.at(
+                head, owner, self._head[predecessors] + self._duration[predecessors]
+            )
+            self._head[group] = head
+
+    def _backward(self, nodes: np.ndarray) -> None:
+        """nodes(단계 순 정렬)의 남은 경로 길이(tail)를 역순으로 다시 계산합니다."""
+        for group in reversed(self._groups(nodes)):
+            owner, successors = _gather(self._succ_ptr, self._succ_idx, group)
+            tail = np.zeros(len(group))
+            np.maximum.at(tail, owner, self._tail[successors])
+            self._tail[group] = tail + self._duration[group]
+
+    def _reachable(self, ptr: np.ndarray, idx: np.ndarray, task: int) -> np.ndarray:
+        """task에서 CSR 간선으로 도달할 수 있는 작업(task 제외)을 단계 순으로 반환합니다."""
+        seen = np.zeros(len(self.task_ids), dtype=bool)
+        frontier = np.asarray([task])
+        while frontier.size:
+            _, neighbors = _gather(ptr, idx, frontier)
+            neighbors = _unique(neighbors)
+            frontier = neighbors[~seen[neighbors]]
+            seen[frontier] = True
+        nodes = np.flatnonzero(seen)
+        return nodes[np.argsort(self._level[nodes], kind="stable")]
+
+    def update_duration(self, task_id: str, duration: float) -> None:
+        """
+        작업 기간을 바꾸고, 영향받는 작업만 다시 계산합니다.
+
+        후손 작업의 가장 빠른 시작 시각과 조상 작업(자신 포함)의 남은 경로 길이만 갱신하며,
+        리소스 평준화 일정과 일정 요약은 다음 조회 때 다시 계산합니다.
+
+        Raises:
+            KeyError: 존재하지 않는 작업 ID인 경우
+            ValueError: 기간이 음수인 경우
+        """
+        if duration < 0:
+            raise ValueError("작업 기간은 0 이상이어야 합니다.")
+        task = self._index[task_id]
+        with self._lock:
+            self._duration[task] = duration
+            self._forward(self._reachable(self._succ_ptr, self._succ_idx, task))
+            ancestors = self._reachable(self._pred_ptr, self._pred_idx, task)
+            self._backward(np.append(ancestors, task))
+            self._leveled = None
+            self._summaries.clear()
+            self._version += 1
+
+    @property
+    def duration(self) -> float:
+        """리소스 제약이 없을 때의 프로젝트 기간 (일)"""
+        return float(self._tail.max()) if len(self.task_ids) else 0.0
+
+    @property
+    def earliest_start(self) -> np.ndarray:
+        """작업별 가장 빠른 시작 시각 (ES)"""
+        return self._head.copy()
+
+    @property
+    def earliest_finish(self) -> np.ndarray:
+        """작업별 가장 빠른 종료 시각 (EF)"""
+        return self._head + self._duration
+
+    @property
+    def latest_start(self) -> np.ndarray:
+        """작업별 가장 늦은 시작 시각 (LS)"""
+        return self.duration - self._tail
+
+    @property
+    def latest_finish(self) -> np.ndarray:
+        """작업별 가장 늦은 종료 시각 (LF)"""
+        return self.latest_start + self._duration
+
+    @property
+    def slack(self) -> np.ndarray:
+        """작업별 전체 여유 시간 (LS - ES)"""
+        return self.latest_start - self._head
+
+    def critical_path(self) -> list[str]:
+        """
+        주 공정 하나를 작업 ID 목록으로 반환합니다.
+
+        여유 시간이 0인 시작 작업에서 출발하여, 선행 작업 종료 즉시 시작하는 여유 시간 0인 후행 작업을 따라갑니다.
+        """
+        if not len(self.task_ids):
+            return []
+        slack = self.slack
+        finish = self.earliest_finish
+        critical = slack <= EPSILON
+        sources = np.flatnonzero(critical & (self._head <= EPSILON))
+        task = int(sources[np.argmax(self._tail[sources])])
+        path = [task]
+        while True:
+            successors = self._succ_idx[self._succ_ptr[task] : self._succ_ptr[task + 1]]
+            successors = successors[
+                critical[successors]
+                & (np.abs(self._head[successors] - finish[task]) <= EPSILON)
+            ]
+            if not successors.size:
+                break
+            task = int(successors[0])
+            path.append(task)
+        return [self.task_ids[task] for task in path]
+
+    def leveled(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        리소스 평준화 일정을 반환합니다. (결과는 작업 기간이 바뀔 때까지 캐시)
+
+        가장 늦은 시작 시각(동률이면 위상 단계)이 빠른 작업부터, 선행 작업이 모두 끝난 뒤 리소스의
+        용량 단위 중 하나가 작업 기간 동안 비어 있는 가장 빠른 시각에 배치합니다. (앞서 배치된 작업
+        사이의 빈 시간대도 사용)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (작업별 시작 시각, 작업별 종료 시각)
+        """
+        with self._lock:
+            if self._leveled is None:
+                self._leveled = self._level_resources()
+            start = self._leveled
+        return start, start + self._duration
+
+    def _level_resources(self) -> np.ndarray:
+        priority = np.lexsort((self._level, self.latest_start)).tolist()
+        pred_ptr, pred_idx = self._pred_ptr.tolist(), self._pred_idx.tolist()
+        durations, resources = self._duration.tolist(), self._resource.tolist()
+        # 리소스의 용량 단위별로 배치된 구간의 (시작 시각 목록, 종료 시각 목록), 서로 겹치지 않게 정렬
+        units = [[([], []) for _ in range(capacity)] for capacity in self._capacity]
+        start = [0.0] * len(self.task_ids)
+        finish = [0.0] * len(self.task_ids)
+        for task in priority:
+            ready = max(
+                (finish[p] for p in pred_idx[pred_ptr[task] : pred_ptr[task + 1]]),
+                default=0.0,
+            )
+            duration = durations[task]
+            if resources[task] >= 0:
+                fits = [
+                    _earliest_fit(starts, ends, ready, duration)
+                    for starts, ends in units[resources[task]]
+                ]
+                unit = min(range(len(fits)), key=lambda i: fits[i][0])
+                ready, position = fits[unit]
+                starts, ends = units[resources[task]][unit]
+                starts.insert(position, ready)
+                ends.insert(position, ready + duration)
+            start[task] = ready
+            finish[task] = ready + duration
+        return np.asarray(start)
+
+    def summary(self, limit: int = 10) -> dict:
+        """
+        LLM 프롬프트와 도구 응답에 넣을 수 있는 간결한 일정 요약을 반환합니다.
+
+        요약은 작업 기간이 바뀔 때까지 limit별로 캐시하므로, 매 요청마다 호출해도 다시 계산하지 않습니다.
+        (반환된 딕셔너리의 목록 값은 캐시와 공유되므로 수정하지 마세요)
+
+        Args:
+            limit: 목록 항목의 최대 개수
+
+        Returns:
+            dict: 작업 수, 기간(일), 종료일, 주 공정, 여유 시간이 적은 작업, 리소스 평준화로 늦어진 작업 / 리소스
+        """
+        with self._lock:
+            cached = self._summaries.get(limit)
+            version = self._version
+        if cached is None:
+            cached = self._summary(limit)
+            # 계산하는 동안 작업 기간이 바뀌지 않았을 때만 저장
+            with self._lock:
+                if self._version == version:
+                    self._summaries[limit] = cached
+        return dict(cached)
+
+    def _summary(self, limit: int) -> dict:
+        leveled_start, leveled_finish = self.leveled()
+        slack = self.slack
+        delay = leveled_start - self._head
+        path = self.critical_path()
+        near = np.flatnonzero(slack > EPSILON)
+        near = near[np.argsort(slack[near], kind="stable")[:limit]]
+        delayed = np.flatnonzero(delay > EPSILON)
+        delayed = delayed[np.argsort(-delay[delayed], kind="stable")[:limit]]
+        resource_delay = np.bincount(
+            self._resource[self._resource >= 0],
+            weights=delay[self._resource >= 0],
+            minlength=len(self.resource_names),
+        )
+        leveled_duration = float(leveled_finish.max()) if len(self.task_ids) else 0.0
+
+        summary = {
+            "task_count": len(self.task_ids),
+            "duration_days": round(self.duration, 1),
+            "leveled_duration_days": round(leveled_duration, 1),
+            "critical_task_count": int((slack <= EPSILON).sum()),
+            "critical_path": [self.names[self._index[t]] for t in path[:limit]],
+            "critical_path_length": len(path),
+            "near_critical": [
+                {"task": self.names[t], "slack_days": round(float(slack[t]), 1)}
+                for t in near
+            ],
+            "leveling_delays": [
+                {"task": self.names[t], "delay_days": round(float(delay[t]), 1)}
+                for t in delayed
+            ],
+            "resource_delay_days": {
+                name: round(float(days), 1)
+                for name, days in zip(self.resource_names, resource_delay)
+                if days > EPSILON
+            },
+        }
+        if self.start is not None:
+            summary["start"] = self.start.date().isoformat()
+            summary["end"] = (
+                (self.start + timedelta(days=self.duration)).date().isoformat()
+            )
+            summary["leveled_end"] = (
+                (self.start + timedelta(days=leveled_duration)).date().isoformat()
+            )
+        return summary
+
+
+def load_schedules(path: str | Path) -> dict[str, ScheduleEngine]:
+    """
+    JSON 파일에서 프로젝트별 일정 엔진을 불러옵니다. (형식은 모듈 설명 참고)
+
+    Returns:
+        dict[str, ScheduleEngine]: 프로젝트 ID -> 일정 엔진
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {
+        project_id: ScheduleEngine.from_tasks(
+            project.get("tasks", []),
+            project.get("capacities"),
+            datetime.fromisoformat(project["start"]) if project.get("start") else None,
+        )
+        for project_id, project in data.get("projects", {}).items()
+    }
+
+
+_schedules: dict[str, ScheduleEngine] | None = None
+_schedules_lock = threading.Lock()
+
+
+def get_schedule_engine(project_id: str) -> ScheduleEngine | None:
+    """
+    프로젝트의 일정 엔진을 반환합니다. (없으면 None)
+
+    처음 호출될 때 환경변수 SCHEDULE_STORE의 JSON 파일에서 모든 프로젝트를 불러옵니다.
+    """
+    global _schedules
+    with _schedules_lock:
+        if _schedules is None:
+            path = os.getenv(SCHEDULE_STORE_ENV)
+            _schedules = load_schedules(path) if path else {}
+        return _schedules.get(project_id)
+
+
+def set_schedule_engines(schedules: dict[str, ScheduleEngine] | None) -> None:
+    """
+    프로젝트별 일정 엔진을 교체합니다. None이면 다음 호출 때 저장소에서 다시 불러옵니다.
+    """
+    global _schedules
+    with _schedules_lock:
+        _schedules = schedules
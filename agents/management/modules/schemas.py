@@ -0,0 +1,64 @@
+"""
+리소스 계획 스키마 모듈
+
+구조화 출력 모드의 리소스 계획 체인이 생성하는 JSON의 스키마를 정의합니다.
+산문(prose) 모드의 다섯 섹션(개요, 리소스 할당, 위험, 실행 단계, 권장 사항)을 필드로 나누어,
+다운스트림 시스템이 텍스트를 다시 파싱하지 않고 resource_plan을 그대로 사용할 수 있게 합니다.
+
+예시:
+```python
+from agents.management.modules.schemas import parse_resource_plan
+
+plan = parse_resource_plan('{"overview": "...", "allocations": [], "risks": [], '
+                           '"implementation_steps": [], "recommendations": []}')
+print(plan["overview"])
+```
+"""
+
+from pydantic import BaseModel, Field
+
+
+class ResourceAllocation(BaseModel):
+    """리소스 할당 항목"""
+
+    category: str = Field(description="리소스 분류 (human, technical, financial, time)")
+    item: str = Field(description="할당할 리소스 (역할, 장비, 예산 항목, 일정 등)")
+    detail: str = Field(description="할당 내용 한 문장")
+
+
+class Risk(BaseModel):
+    """위험 요소와 대응 방안"""
+
+    risk: str = Field(description="위험 요소")
+    mitigation: str = Field(description="대응 방안")
+
+
+class ResourcePlan(BaseModel):
+    """구조화된 리소스 계획"""
+
+    overview: str = Field(description="프로젝트 개요와 목표 (두 문장 이내)")
+    allocations: list[ResourceAllocation] = Field(default_factory=list)
+    risks: list[Risk] = Field(default_factory=list)
+    implementation_steps: list[str] = Field(default_factory=list)
+    recommendations: list[str] = Field(default_factory=list)
+
+
+def parse_resource_plan(text: str) -> dict:
+    """
+    리소스 계획 체인의 JSON 출력을 검증하여 딕셔너리로 변환합니다.
+
+    모델이 JSON을 마크다운 코드 블록(```json ... ```)으로 감싼 경우에도 처리합니다.
+
+    Args:
+        text: 체인이 생성한 JSON 문자열
+
+    Returns:
+        dict: ResourcePlan 스키마를 따르는 리소스 계획
+
+    Raises:
+        pydantic.ValidationError: JSON 형식이 아니거나 스키마와 맞지 않는 경우
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+    return ResourcePlan.model_validate_json(text).model_dump()
@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Annotated, TypedDict, List, Dict, Optional
+from typing import Annotated, Any, TypedDict
 
 from langgraph.graph.message import add_messages
 
@@ -22,9 +22,15 @@ class ManagementState(TypedDict):
     project_id: str  # 프로젝트 ID (예: "PRJ-2023-001", "EP-MARVEL-S01")
     request_type: str  # 요청 유형 (예: "resource_allocation", "team_management", "creator_development")
     query: str  # 사용자 쿼리 또는 요청사항
-    team_members: Optional[List[str]] = None  # 팀 구성원 목록
-    resources_available: Optional[Dict[str, any]] = None  # 사용 가능한 리소스 정보
-    resource_plan: Optional[str] = None  # 리소스 계획 콘텐츠
     response: Annotated[
         list, add_messages
     ]  # 응답 메시지 목록 (add_messages로 주석되어 메시지 추가 기능 제공)
+    # 팀 구성원 목록 (이름 또는 {"name", "skills", "availability"} 프로필)
+    team_members: list[str | dict] | None = None
+    # 배정할 역할 목록 ({"role", "skills", "count"}, assignment 모듈 참고)
+    roles: list[dict] | None = None
+    resources_available: dict[str, Any] | None = None  # 사용 가능한 리소스 정보
+    # 리소스 계획 (산문 모드: 텍스트, 구조화 출력 모드: schemas.ResourcePlan 딕셔너리)
+    resource_plan: str | dict | None = None
+    # 조건부 에지에서 결정한 모델 등급 (agents.model_router 참고)
+    model_route: dict | None = None
@@ -12,37 +12,93 @@
 - 협업 지원 도구: 팀원간 커뮤니케이션 및 협업 지원
 """
 
-# 예시 코드: 리소스 검색 도구
-# from typing import Dict, List, Optional
-# from datetime import datetime
+from datetime import datetime
 
-# def search_available_resources(resource_type: str, time_period: Optional[Dict[str, datetime]] = None) -> List[Dict]:
-#     """
-#     주어진 리소스 유형과 시간에 따라 사용 가능한 리소스를 검색합니다.
-#     
-#     Args:
-#         resource_type: 검색할 리소스 유형 (예: 'studio', 'equipment', 'staff')
-#         time_period: 시간 기간 (예: {'start': datetime(2023, 6, 1), 'end': datetime(2023, 6, 30)})
-#     
-#     Returns:
-#         List[Dict]: 사용 가능한 리소스 목록
-#     """
-#     # 실제 구현에서는 데이터베이스를 쿼리하거나 API를 호출하여 사용 가능한 리소스를 가져옴
-#     pass
+from agents.management.modules.availability import get_availability_index
+
+
+def search_available_resources(
+    resource_type: str, time_period: dict[str, datetime] | None = None
+) -> list[dict]:
+    """
+    주어진 리소스 유형과 시간에 따라 사용 가능한 리소스를 검색합니다.
+
+    예약은 availability 모듈의 인메모리 구간 인덱스에서 검색하므로, 예약 수 n과 겹치는 예약 수 k에 대해
+    O(log n + k)에 가까운 시간이 걸립니다. 인덱스는 환경변수 RESOURCE_STORE의 저장소에서 불러옵니다.
+
+    Args:
+        resource_type: 검색할 리소스 유형 (예: 'studio', 'equipment', 'staff')
+        time_period: 시간 기간 (예: {'start': datetime(2023, 6, 1), 'end': datetime(2023, 6, 30)})
+            None이면 현재 시각에 예약이 없는 리소스를 검색합니다.
+            end가 없으면 start 시각에 예약이 없는 리소스를 검색합니다.
+            (구간은 반열린 구간 [start, end)이며, start 시각에 끝나는 예약은 겹치지 않음)
+
+    Returns:
+        list[dict]: 기간 동안 예약이 하나도 없는 리소스 목록
+            (예: [{'resource_id': 'studio-a', 'resource_type': 'studio', 'name': 'A동 스튜디오'}])
+    """
+    index = get_availability_index()
+    time_period = time_period or {}
+    start = time_period.get("start") or index.now()
+    end = time_period.get("end")  # None이면 start 시각만 검색
+    return [
+        {
+            "resource_id": resource.resource_id,
+            "resource_type": resource.resource_type,
+            "name": resource.name,
+        }
+        for resource in index.available(resource_type, start, end)
+    ]
+
+
+def get_project_schedule(project_id: str) -> dict:
+    """
+    특정 프로젝트의 일정을 가져옵니다.
+
+    schedule 모듈의 배열 기반 일정 엔진으로 주 공정, 여유 시간, 리소스 평준화 일정을 계산하고
+    LLM이 그대로 사용할 수 있는 간결한 요약을 반환합니다. 일정은 환경변수 SCHEDULE_STORE의
+    JSON 파일에서 불러오며, 요약은 프로젝트의 작업 기간이 바뀔 때까지 엔진에 캐시됩니다.
+
+    Args:
+        project_id: 프로젝트 ID
+
+    Returns:
+        dict: 프로젝트 일정 요약 (ScheduleEngine.summary() 참고, 일정이 없는 프로젝트는 빈 딕셔너리)
+    """
+    from agents.management.modules.schedule import get_schedule_engine
+
+    engine = get_schedule_engine(project_id)
+    if engine is None:
+        return {}
+    return {"project_id": project_id, **engine.summary()}
+
+
+def assign_team_roles(team_members: list, roles: list[dict]) -> dict:
+    """
+    팀 구성원을 역할에 배정합니다.
+
+    assignment 모듈의 헝가리안 알고리즘으로 구성원의 스킬 / 가용성과 역할의 요구 스킬에 대한
+    총 적합도가 가장 높은 배정을 결정적으로 계산합니다. LLM은 배정을 만들지 않고 이 결과를 설명합니다.
+    스킬 정보가 있는 구성원이 없으면(이름만 주어진 경우 등) 모든 적합도가 0이라 배정이 임의로 정해지므로
+    솔버를 실행하지 않습니다.
+
+    Args:
+        team_members: 구성원 목록 (이름 문자열 또는 {"name", "skills", "availability"} 딕셔너리)
+        roles: {"role", "skills": {스킬: 가중치}, "count": 인원} 목록
+
+    Returns:
+        dict: 배정 결과 (assignment.assign_roles() 참고, 역할이나 스킬 정보가 있는 구성원이 없으면 빈 딕셔너리)
+    """
+    if not roles or not any(
+        isinstance(member, dict) and member.get("skills")
+        for member in team_members or ()
+    ):
+        return {}
+
+    from agents.management.modules.assignment import assign_roles
+
+    return assign_roles(team_members, roles)
 
-# 예시 코드: 프로젝트 일정 관리 도구
-# def get_project_schedule(project_id: str) -> Dict:
-#     """
-#     특정 프로젝트의 일정을 가져옵니다.
-#     
-#     Args:
-#         project_id: 프로젝트 ID
-#     
-#     Returns:
-#         Dict: 프로젝트 일정 정보
-#     """
-#     # 실제 구현에서는 프로젝트 관리 시스템 API를 호출하여 일정을 가져옴
-#     pass
 
 # from react_agent.configuration import Configuration
 
@@ -0,0 +1,457 @@
+"""
+메트릭 수집 모듈
+
+노드 실행 시간, LLM 토큰 사용량, 오류 수 등을 프로세스 내 히스토그램과 카운터로 수집하고,
+Prometheus 텍스트 형식 또는 JSON 스냅샷으로 내보냅니다.
+
+BaseNode는 __call__ / acall 실행을 track_node()로 감싸므로, 모든 노드에 대해
+(workflow, node) 라벨별로 다음 메트릭이 자동으로 기록됩니다.
+- agents_node_duration_seconds: 노드 실행 시간 히스토그램
+- agents_node_errors_total: 노드 실행 중 발생한 예외 수
+- agents_llm_duration_seconds: 노드 내부 LLM 호출 시간 히스토그램
+- agents_llm_prompt_tokens / agents_llm_completion_tokens: LLM 호출당 토큰 수 히스토그램
+- agents_llm_errors_total: LLM 호출 오류 수
+
+LLM 토큰은 LangChain 콜백 설정 훅으로 수집하므로 노드 코드에서 체인에 콜백을 넘길 필요가 없습니다.
+
+예시:
+```python
+from agents.metrics import export_prometheus, serve_metrics, snapshot
+
+print(export_prometheus())  # Prometheus 텍스트 형식
+print(snapshot())  # JSON 직렬화 가능한 dict
+serve_metrics(port=9464)  # /metrics, /metrics.json 엔드포인트 제공
+```
+"""
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# 토큰 수 히스토그램 버킷
+TOKEN_BUCKETS = (16, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+
+
+class Counter:
+    """
+    단조 증가 카운터
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """카운터를 amount만큼 증가시킵니다."""
+        with self._lock:
+            self.value += amount
+
+    def to_dict(self) -> dict:
+        return {"value": self.value}
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램
+
+    Prometheus와 같은 누적 버킷 방식으로 관측값을 집계하며,
+    버킷 경계 사이를 선형 보간하여 분위수를 추정합니다.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self._lock = threading.Lock()
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf 버킷
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """관측값을 기록합니다."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        버킷 분포로부터 분위수를 추정합니다.
+
+        Args:
+            q: 0과 1 사이의 분위 (예: 0.99)
+
+        Returns:
+            float: 추정된 분위수 (관측값이 없으면 0.0)
+        """
+        with self._lock:
+            counts = list(self.counts)
+            total = self.count
+        if total == 0:
+            return 0.0
+
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index == len(self.buckets):
+                    return lower  # +Inf 버킷은 마지막 경계값으로 보고
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            counts = list(self.counts)
+            total, total_sum = self.count, self.sum
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*self.buckets, "+Inf"), counts, strict=True):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "count": total,
+            "sum": total_sum,
+            "mean": total_sum / total if total else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class MetricFamily:
+    """
+    같은 이름과 라벨 집합을 가지는 메트릭 묶음
+    """
+
+    def __init__(self, name, documentation, kind, label_names, buckets=None):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind  # "counter" 또는 "histogram"
+        self.label_names = tuple(label_names)
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._children: dict[tuple, Counter | Histogram] = {}
+
+    def labels(self, **labels) -> Counter | Histogram:
+        """
+        라벨 값에 해당하는 메트릭을 반환합니다. 없으면 새로 생성합니다.
+        """
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    if self.kind == "histogram":
+                        child = Histogram(self.buckets or LATENCY_BUCKETS)
+                    else:
+                        child = Counter()
+                    self._children[key] = child
+        return child
+
+    def samples(self) -> list[tuple[dict, Counter | Histogram]]:
+        """(라벨 dict, 메트릭) 목록을 반환합니다."""
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.label_names, key, strict=True)), m) for key, m in items]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+
+def _format_labels(labels: dict, **extra) -> str:
+    """Prometheus 라벨 문자열을 생성합니다."""
+    merged = {**labels, **extra}
+    if not merged:
+        return ""
+    escaped = (
+        f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for key, value in merged.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+class MetricsRegistry:
+    """
+    프로세스 내 메트릭 저장소
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._families: dict[str, MetricFamily] = {}
+
+    def _family(self, name, documentation, kind, label_names, buckets=None):
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = MetricFamily(name, documentation, kind, label_names, buckets)
+                self._families[name] = family
+            return family
+
+    def counter(self, name, documentation, label_names=()) -> MetricFamily:
+        """카운터 메트릭 묶음을 등록하거나 가져옵니다."""
+        return self._family(name, documentation, "counter", label_names)
+
+    def histogram(
+        self, name, documentation, label_names=(), buckets=LATENCY_BUCKETS
+    ) -> MetricFamily:
+        """히스토그램 메트릭 묶음을 등록하거나 가져옵니다."""
+        return self._family(name, documentation, "histogram", label_names, buckets)
+
+    def export_prometheus(self) -> str:
+        """
+        모든 메트릭을 Prometheus 텍스트 노출 형식으로 반환합니다.
+        """
+        with self._lock:
+            families = list(self._families.values())
+
+        lines = []
+        for family in families:
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for labels, metric in family.samples():
+                if family.kind == "counter":
+                    lines.append(
+                        f"{family.name}{_format_labels(labels)} {metric.value}"
+                    )
+                    continue
+                data = metric.to_dict()
+                for bound, cumulative in data["buckets"].items():
+                    lines.append(
+                        f"{family.name}_bucket{_format_labels(labels, le=bound)} "
+                        f"{cumulative}"
+                    )
+                lines.append(f"{family.name}_sum{_format_labels(labels)} {data['sum']}")
+                lines.append(
+                    f"{family.name}_count{_format_labels(labels)} {data['count']}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict:
+        """
+        모든 메트릭을 JSON으로 직렬화 가능한 dict로 반환합니다.
+        """
+        with self._lock:
+            families = list(self._families.values())
+        return {
+            family.name: {
+                "type": family.kind,
+                "help": family.documentation,
+                "samples": [
+                    {"labels": labels, **metric.to_dict()}
+                    for labels, metric in family.samples()
+                ],
+            }
+            for family in families
+        }
+
+    def reset(self) -> None:
+        """수집된 모든 값을 초기화합니다. (등록된 메트릭 묶음은 유지)"""
+        with self._lock:
+            families = list(self._families.values())
+        for family in families:
+            family.clear()
+
+
+# 프로세스 전역 메트릭 저장소
+REGISTRY = MetricsRegistry()
+
+NODE_LABELS = ("workflow", "node")
+
+NODE_DURATION = REGISTRY.histogram(
+    "agents_node_duration_seconds", "노드 실행 시간 (초)", NODE_LABELS
+)
+NODE_ERRORS = REGISTRY.counter(
+    "agents_node_errors_total", "노드 실행 중 발생한 예외 수", NODE_LABELS
+)
+LLM_DURATION = REGISTRY.histogram(
+    "agents_llm_duration_seconds", "노드 내부 LLM 호출 시간 (초)", NODE_LABELS
+)
+LLM_PROMPT_TOKENS = REGISTRY.histogram(
+    "agents_llm_prompt_tokens",
+    "LLM 호출당 프롬프트 토큰 수",
+    NODE_LABELS,
+    TOKEN_BUCKETS,
+)
+LLM_COMPLETION_TOKENS = REGISTRY.histogram(
+    "agents_llm_completion_tokens",
+    "LLM 호출당 생성 토큰 수",
+    NODE_LABELS,
+    TOKEN_BUCKETS,
+)
+LLM_ERRORS = REGISTRY.counter(
+    "agents_llm_errors_total", "노드 내부 LLM 호출 오류 수", NODE_LABELS
+)
+
+
+def _token_usage(response) -> tuple[int, int] | None:
+    """
+    LLMResult에서 (프롬프트 토큰, 생성 토큰)을 추출합니다.
+
+    메시지의 usage_metadata를 우선 사용하고, 없으면 llm_output의 token_usage를 사용합니다.
+    """
+    prompt_tokens = completion_tokens = 0
+    found = False
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+                found = True
+    if not found:
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        if usage:
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+            found = True
+    return (prompt_tokens, completion_tokens) if found else None
+
+
+class NodeMetricsHandler(BaseCallbackHandler):
+    """
+    노드 실행 중 발생한 LLM 호출의 시간과 토큰 사용량을 기록하는 콜백 핸들러
+    """
+
+    run_inline = True  # 비동기 실행에서도 스레드 풀을 거치지 않고 바로 실행
+
+    def __init__(self, workflow: str, node: str):
+        self.labels = {"workflow": workflow, "node": node}
+        self._started: dict = {}
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            LLM_DURATION.labels(**self.labels).observe(time.perf_counter() - started)
+        usage = _token_usage(response)
+        if usage is not None:
+            LLM_PROMPT_TOKENS.labels(**self.labels).observe(usage[0])
+            LLM_COMPLETION_TOKENS.labels(**self.labels).observe(usage[1])
+
+    def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        self._started.pop(run_id, None)
+        LLM_ERRORS.labels(**self.labels).inc()
+
+
+# 현재 실행 중인 노드의 콜백 핸들러 (LangChain이 모든 체인 호출에 자동으로 추가)
+_node_handler: ContextVar[NodeMetricsHandler | None] = ContextVar(
+    "agents_node_metrics_handler", default=None
+)
+register_configure_hook(_node_handler, inheritable=True)
+
+
+def current_labels() -> dict | None:
+    """
+    현재 실행 중인 노드의 메트릭 라벨({"workflow", "node"})을 반환합니다.
+
+    노드 밖에서 호출하면 None을 반환합니다.
+    """
+    handler = _node_handler.get()
+    return dict(handler.labels) if handler is not None else None
+
+
+@contextmanager
+def track_node(workflow: str | None, node: str):
+    """
+    노드 실행을 감싸 실행 시간, 오류 수, 내부 LLM 호출 메트릭을 기록합니다.
+
+    Args:
+        workflow: Workflow 이름 (알 수 없으면 None)
+        node: 노드 이름
+    """
+    labels = {"workflow": workflow or "", "node": node}
+    token = _node_handler.set(NodeMetricsHandler(**labels))
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        NODE_ERRORS.labels(**labels).inc()
+        raise
+    finally:
+        NODE_DURATION.labels(**labels).observe(time.perf_counter() - started)
+        _node_handler.reset(token)
+
+
+def export_prometheus() -> str:
+    """전역 메트릭을 Prometheus 텍스트 형식으로 반환합니다."""
+    return REGISTRY.export_prometheus()
+
+
+def snapshot() -> dict:
+    """전역 메트릭의 JSON 스냅샷을 반환합니다."""
+    return REGISTRY.snapshot()
+
+
+def serve_metrics(host: str = "127.0.0.1", port: int = 9464):
+    """
+    메트릭 조회용 HTTP 서버를 백그라운드 스레드에서 실행합니다.
+
+    - GET /metrics: Prometheus 텍스트 형식
+    - GET /metrics.json: JSON 스냅샷
+
+    Args:
+        host: 바인딩할 호스트 (기본값: 로컬 전용, 외부에서 수집하려면 "0.0.0.0" 등을 명시)
+        port: 바인딩할 포트
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (shutdown()으로 종료)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body = export_prometheus().encode()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body = json.dumps(snapshot(), ensure_ascii=False).encode()
+                content_type = "application/json; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 스크레이프 요청마다 로그를 남기지 않음
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
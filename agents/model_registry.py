@@ -0,0 +1,238 @@
+"""
+LLM 클라이언트 레지스트리 모듈
+
+프로세스 전역에서 공유하는 채팅 모델 인스턴스를 관리합니다.
+(model, temperature, top_p) 조합마다 하나의 ChatOpenAI 인스턴스만 생성하고,
+모든 인스턴스가 하나의 HTTP 커넥션 풀(동기/비동기 각각)을 공유하므로
+노드와 요청이 바뀌어도 TCP/TLS 연결이 재사용됩니다.
+
+커넥션 풀 크기와 keep-alive 시간은 환경변수 또는 configure_pool()로 조정할 수 있습니다.
+- LLM_POOL_MAX_CONNECTIONS: 최대 동시 연결 수 (기본값: 100)
+- LLM_POOL_MAX_KEEPALIVE: 유휴 상태로 유지할 최대 연결 수 (기본값: 20)
+- LLM_POOL_KEEPALIVE_EXPIRY: 유휴 연결 유지 시간(초) (기본값: 30)
+- LLM_REQUEST_TIMEOUT: 요청 타임아웃(초) (기본값: 60)
+
+예시:
+```python
+from agents.model_registry import configure_pool, get_chat_model
+
+configure_pool(max_connections=200, max_keepalive_connections=50)
+model = get_chat_model("gpt-4o-mini", temperature=0.7, top_p=0.9)
+```
+
+모든 인스턴스는 agents.llm_scheduler.ScheduledChatModel로 감싸져, 모델별 공유 스케줄러
+(요청 / 토큰 한도, 적응형 동시 실행 제한, 에이전트별 공정 대기열)를 거쳐 호출됩니다.
+환경변수 LLM_SCHEDULER=0이면 감싸지 않습니다.
+
+테스트나 벤치마크에서는 override_chat_model()로 모든 에이전트 체인의 모델을 교체할 수 있습니다.
+체인은 그래프 빌드 시점에 모델을 가져오므로, 교체 후에는 BaseWorkflow.clear_cache()를 호출하여
+그래프를 다시 빌드해야 합니다.
+
+```python
+with override_chat_model(FakeChatModel(latency=0.05)):
+    BaseWorkflow.clear_cache()
+    result = text_workflow().invoke(state)
+```
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+
+DEFAULT_MODEL = "gpt-4o-mini"  # 기본 모델 이름
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    공유 HTTP 커넥션 풀 설정
+
+    Attributes:
+        max_connections: 최대 동시 연결 수
+        max_keepalive_connections: 유휴 상태로 유지할 최대 연결 수
+        keepalive_expiry: 유휴 연결 유지 시간(초)
+        timeout: 요청 타임아웃(초)
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """
+        환경변수에서 커넥션 풀 설정을 읽어옵니다. 설정되지 않은 값은 기본값을 사용합니다.
+        """
+        default = cls()
+        return cls(
+            max_connections=int(
+                os.getenv("LLM_POOL_MAX_CONNECTIONS", default.max_connections)
+            ),
+            max_keepalive_connections=int(
+                os.getenv("LLM_POOL_MAX_KEEPALIVE", default.max_keepalive_connections)
+            ),
+            keepalive_expiry=float(
+                os.getenv("LLM_POOL_KEEPALIVE_EXPIRY", default.keepalive_expiry)
+            ),
+            timeout=float(os.getenv("LLM_REQUEST_TIMEOUT", default.timeout)),
+        )
+
+
+_lock = threading.Lock()
+_pool_config = PoolConfig.from_env()
+_http_client = None  # 공유 동기 HTTP 클라이언트
+_http_async_client = None  # 공유 비동기 HTTP 클라이언트
+_models: dict[tuple, object] = {}  # (model, temperature, top_p) -> ChatOpenAI
+_override = None  # get_chat_model() 대신 반환할 모델 또는 모델 팩토리
+
+
+def _get_http_clients():
+    """
+    공유 HTTP 클라이언트를 반환합니다. 최초 호출 시 한 번만 생성합니다.
+
+    호출하는 쪽에서 _lock을 잡고 있어야 합니다.
+    """
+    global _http_client, _http_async_client
+    if _http_client is None:
+        import httpx
+        import openai
+
+        limits = httpx.Limits(
+            max_connections=_pool_config.max_connections,
+            max_keepalive_connections=_pool_config.max_keepalive_connections,
+            keepalive_expiry=_pool_config.keepalive_expiry,
+        )
+        _http_client = openai.DefaultHttpxClient(
+            limits=limits, timeout=_pool_config.timeout
+        )
+        _http_async_client = openai.DefaultAsyncHttpxClient(
+            limits=limits, timeout=_pool_config.timeout
+        )
+    return _http_client, _http_async_client
+
+
+def get_chat_model(model: str = DEFAULT_MODEL, temperature=0.7, top_p=0.9):
+    """
+    공유 채팅 모델 인스턴스를 반환합니다.
+
+    같은 (model, temperature, top_p) 조합에 대해서는 항상 같은 인스턴스를 반환하며,
+    모든 인스턴스는 공유 HTTP 커넥션 풀을 사용하고, 모델별 공유 스케줄러를 거쳐 호출됩니다.
+    환경변수에서 OPENAI_API_KEY를 가져와 사용하기 때문에, .env 파일에 유효한 API 키가 설정되어 있어야 합니다.
+
+    Args:
+        model: 모델 이름 (기본값: "gpt-4o-mini")
+        temperature: 모델의 창의성 정도를 조절하는 파라미터 (기본값: 0.7)
+        top_p: 토큰 샘플링 확률 임계값 (기본값: 0.9)
+
+    Returns:
+        ScheduledChatModel: 공유 OpenAI 모델 인스턴스 (LLM_SCHEDULER=0이면 ChatOpenAI,
+            override_chat_model() 사용 중이면 교체된 모델)
+    """
+    override = _override
+    if override is not None:
+        if callable(override) and not hasattr(override, "invoke"):
+            return override(model, temperature, top_p)
+        return override
+
+    key = (model, temperature, top_p)
+    instance = _models.get(key)
+    if instance is not None:
+        return instance
+
+    with _lock:
+        instance = _models.get(key)
+        if instance is None:
+            from langchain_openai import ChatOpenAI
+
+            from agents.llm_scheduler import scheduled, scheduler_enabled
+
+            http_client, http_async_client = _get_http_clients()
+            instance = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                top_p=top_p,
+                timeout=_pool_config.timeout,
+                stream_usage=True,  # 스트리밍 시에도 토큰 사용량 수신 (메트릭 기록용)
+                http_client=http_client,
+                http_async_client=http_async_client,
+            )
+            if scheduler_enabled():
+                instance = scheduled(instance, model)
+            _models[key] = instance
+    return instance
+
+
+def get_pool_config() -> PoolConfig:
+    """현재 커넥션 풀 설정을 반환합니다."""
+    return _pool_config
+
+
+def configure_pool(**options) -> PoolConfig:
+    """
+    커넥션 풀 설정을 변경합니다.
+
+    이미 생성된 모델 인스턴스와 HTTP 클라이언트는 폐기되며,
+    다음 get_chat_model() 호출부터 새 설정이 적용됩니다.
+    (이미 컴파일된 그래프가 기존 인스턴스를 사용 중이라면 BaseWorkflow.clear_cache()도 호출하세요.)
+
+    Args:
+        **options: PoolConfig 필드 (max_connections, max_keepalive_connections,
+            keepalive_expiry, timeout)
+
+    Returns:
+        PoolConfig: 변경된 설정
+    """
+    global _pool_config
+    with _lock:
+        _pool_config = replace(_pool_config, **options)
+    clear_registry()
+    return _pool_config
+
+
+def clear_registry() -> None:
+    """
+    등록된 모델 인스턴스와 공유 HTTP 클라이언트에 대한 참조를 해제합니다.
+
+    이미 인스턴스를 보유한 체인이 계속 동작할 수 있도록 클라이언트를 명시적으로 닫지는 않습니다.
+    """
+    global _http_client, _http_async_client
+    with _lock:
+        _models.clear()
+        _http_client = None
+        _http_async_client = None
+
+
+def set_chat_model_override(override) -> object:
+    """
+    get_chat_model()이 반환할 모델을 교체합니다.
+
+    Args:
+        override: 모든 호출에 반환할 채팅 모델 인스턴스,
+            또는 (model, temperature, top_p)를 받아 모델을 반환하는 함수.
+            None이면 교체를 해제합니다.
+
+    Returns:
+        object: 이전에 설정되어 있던 교체 값
+    """
+    global _override
+    with _lock:
+        previous, _override = _override, override
+    return previous
+
+
+@contextmanager
+def override_chat_model(override: Callable | object):
+    """
+    with 블록 안에서만 get_chat_model()이 반환할 모델을 교체합니다.
+
+    Args:
+        override: set_chat_model_override()와 동일
+    """
+    previous = set_chat_model_override(override)
+    try:
+        yield override
+    finally:
+        set_chat_model_override(previous)
@@ -0,0 +1,235 @@
+"""
+모델 라우터 모듈
+
+요청 특성(content_type, 쿼리 길이, request_type)으로 모델 등급(tier)과 생성 토큰 상한(max_tokens)을
+고릅니다. 한 줄짜리 소셜 캡션은 작은 예산으로, 전체 리소스 계획은 큰 예산(설정 시 큰 모델)으로 처리하여
+비용과 지연 시간을 줄입니다.
+
+라우팅 규칙 (위에서부터 적용)
+1. request_type이 HEAVY_REQUEST_TYPES이면 "heavy"
+2. content_type이 SHORT_CONTENT_TYPES이면 "light", 그 외에는 "standard"
+3. 쿼리가 LONG_QUERY_CHARS자를 넘으면 한 등급 올림
+4. 지연 시간 보호: 선택한 등급의 최근 p95 지연 시간이 latency_slo를 넘으면 fallback 등급으로 내림
+   (회복 여부를 알 수 있도록 probe_every번에 한 번은 원래 등급으로 보냄)
+
+각 에이전트의 conditions.py는 이 라우터로 조건부 에지 함수를 구현하고, 결정은 상태의
+model_route로 노드에 전달됩니다. 노드는 BaseNode.routed_chain()으로 등급별 체인을 고르고
+BaseNode.track_route()로 지연 시간을 기록합니다.
+
+메트릭
+- agents_route_decisions_total{workflow, tier, reason}: 라우팅 결정 수
+- agents_route_latency_seconds{workflow, tier}: 등급별 노드 내 체인 호출 지연 시간
+
+등급별 모델은 환경변수 LLM_ROUTER_MODEL_LIGHT / LLM_ROUTER_MODEL_STANDARD / LLM_ROUTER_MODEL_HEAVY로
+바꿀 수 있습니다. 기본값은 모든 등급이 gpt-4o-mini이며(등급은 생성 토큰 상한만 다름),
+heavy 등급에 더 큰 모델을 쓰려면 LLM_ROUTER_MODEL_HEAVY=gpt-4o처럼 명시적으로 지정합니다.
+
+예시:
+```python
+from agents.model_router import ROUTER
+
+route = ROUTER.decide("TextWorkflow", content_type="소셜 미디어 포스트", query="")
+print(route)  # {"tier": "light", "model": "gpt-4o-mini", "max_tokens": 300, "reason": "content_type"}
+```
+"""
+
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from agents.metrics import REGISTRY
+from agents.model_registry import get_chat_model
+
+# 짧은 결과물을 요청하는 콘텐츠 유형 (부분 일치)
+SHORT_CONTENT_TYPES = (
+    "소셜 미디어",
+    "캡션",
+    "해시태그",
+    "트윗",
+    "댓글",
+    "슬로건",
+    "제목",
+    "caption",
+    "tweet",
+)
+# 전체 리소스 계획이 필요한 요청 유형
+HEAVY_REQUEST_TYPES = ("resource_allocation", "team_management", "creator_development")
+LONG_QUERY_CHARS = 1500  # 이 길이를 넘는 쿼리는 한 등급 올림
+
+TIER_ORDER = ("light", "standard", "heavy")
+
+ROUTE_DECISIONS = REGISTRY.counter(
+    "agents_route_decisions_total",
+    "모델 라우팅 결정 수",
+    ("workflow", "tier", "reason"),
+)
+ROUTE_LATENCY = REGISTRY.histogram(
+    "agents_route_latency_seconds",
+    "라우팅된 등급별 체인 호출 지연 시간 (초)",
+    ("workflow", "tier"),
+)
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """
+    모델 등급
+
+    Attributes:
+        name: 등급 이름
+        model: 모델 이름
+        max_tokens: 생성 토큰 상한
+        latency_slo: 최근 p95 지연 시간이 이 값(초)을 넘으면 fallback 등급 사용 (None이면 사용 안 함)
+        fallback: 지연 시간 보호 시 사용할 등급 이름
+    """
+
+    name: str
+    model: str
+    max_tokens: int
+    latency_slo: float | None = None
+    fallback: str | None = None
+
+
+def default_tiers() -> dict[str, ModelTier]:
+    """환경변수를 반영한 기본 등급 목록을 반환합니다."""
+    return {
+        "light": ModelTier(
+            "light", os.getenv("LLM_ROUTER_MODEL_LIGHT", "gpt-4o-mini"), 300
+        ),
+        "standard": ModelTier(
+            "standard", os.getenv("LLM_ROUTER_MODEL_STANDARD", "gpt-4o-mini"), 1200
+        ),
+        "heavy": ModelTier(
+            "heavy",
+            os.getenv("LLM_ROUTER_MODEL_HEAVY", "gpt-4o-mini"),
+            2500,
+            latency_slo=60.0,
+            fallback="standard",
+        ),
+    }
+
+
+class ModelRouter:
+    """
+    요청 특성과 최근 지연 시간으로 모델 등급을 고르는 라우터
+
+    Attributes:
+        tiers: 등급 이름 -> ModelTier
+        window: 등급별 지연 시간 표본 수
+        min_samples: 지연 시간 보호를 적용하기 위한 최소 표본 수
+        probe_every: 지연 시간 보호 중에도 원래 등급으로 보낼 간격 (결정 수)
+    """
+
+    def __init__(
+        self,
+        tiers: dict[str, ModelTier] | None = None,
+        window: int = 200,
+        min_samples: int = 20,
+        probe_every: int = 20,
+    ):
+        self.tiers = tiers or default_tiers()
+        self.min_samples = min_samples
+        self.probe_every = probe_every
+        self._lock = threading.Lock()
+        self._latencies = {name: deque(maxlen=window) for name in self.tiers}
+        self._fallbacks = dict.fromkeys(self.tiers, 0)  # 등급별 누적 fallback 수
+
+    def _p95(self, tier: str) -> float | None:
+        with self._lock:
+            samples = sorted(self._latencies.get(tier, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(0.95 * len(samples)))]
+
+    def classify(
+        self,
+        *,
+        content_type: str | None = None,
+        query: str | None = None,
+        request_type: str | None = None,
+    ) -> tuple[str, str]:
+        """
+        요청 특성만으로 (등급, 이유)를 결정합니다.
+
+        Returns:
+            tuple[str, str]: (등급 이름, 결정 이유)
+        """
+        if request_type in HEAVY_REQUEST_TYPES:
+            tier, reason = "heavy", "request_type"
+        elif content_type and any(
+            short in content_type.lower() for short in SHORT_CONTENT_TYPES
+        ):
+            tier, reason = "light", "content_type"
+        else:
+            tier, reason = "standard", "default"
+
+        if len(query or "") > LONG_QUERY_CHARS and tier != TIER_ORDER[-1]:
+            tier, reason = TIER_ORDER[TIER_ORDER.index(tier) + 1], "query_length"
+        return tier, reason
+
+    def decide(
+        self,
+        workflow: str,
+        *,
+        content_type: str | None = None,
+        query: str | None = None,
+        request_type: str | None = None,
+    ) -> dict:
+        """
+        요청의 모델 등급과 생성 토큰 상한을 결정하고 결정을 기록합니다.
+
+        Args:
+            workflow: 메트릭 라벨에 사용할 Workflow 이름
+            content_type: 콘텐츠 유형
+            query: 사용자 쿼리
+            request_type: 요청 유형
+
+        Returns:
+            dict: {"tier", "model", "max_tokens", "reason"} (상태에 저장할 수 있는 형태)
+        """
+        tier, reason = self.classify(
+            content_type=content_type, query=query, request_type=request_type
+        )
+        spec = self.tiers[tier]
+        p95 = self._p95(tier)
+        if spec.fallback and spec.latency_slo and p95 and p95 > spec.latency_slo:
+            with self._lock:
+                self._fallbacks[tier] += 1
+                probe = self._fallbacks[tier] % self.probe_every == 0
+            if not probe:
+                spec, reason = self.tiers[spec.fallback], "latency"
+
+        ROUTE_DECISIONS.labels(workflow=workflow, tier=spec.name, reason=reason).inc()
+        return {
+            "tier": spec.name,
+            "model": spec.model,
+            "max_tokens": spec.max_tokens,
+            "reason": reason,
+        }
+
+    def chat_model(self, route: dict, temperature=0.7, top_p=0.9):
+        """
+        라우팅 결정에 맞는 채팅 모델을 반환합니다. (생성 토큰 상한이 바인딩된 공유 모델)
+        """
+        model = get_chat_model(route["model"], temperature=temperature, top_p=top_p)
+        return model.bind(max_tokens=route["max_tokens"])
+
+    def record_outcome(self, workflow: str, route: dict, latency: float) -> None:
+        """
+        라우팅된 호출의 지연 시간을 기록합니다.
+
+        Args:
+            workflow: 메트릭 라벨에 사용할 Workflow 이름
+            route: decide()의 결과
+            latency: 호출 지연 시간 (초)
+        """
+        ROUTE_LATENCY.labels(workflow=workflow, tier=route["tier"]).observe(latency)
+        with self._lock:
+            samples = self._latencies.get(route["tier"])
+            if samples is not None:
+                samples.append(latency)
+
+
+# 프로세스 전역 라우터
+ROUTER = ModelRouter()
@@ -0,0 +1,536 @@
+"""
+오디오 분석 모듈
+
+WAV 파일을 메모리 매핑(mmap)하여 블록 단위로 읽고, NumPy STFT로 템포, 음량, 스펙트럼 특징과 조성을 계산한 뒤
+규칙 기반으로 장르와 분위기를 추정합니다. LLM을 호출하지 않으므로 음악 생성 노드의 music_genre / music_mood를
+로컬에서 채울 수 있습니다.
+
+- 읽기: data 청크를 mmap하고 STFT 프레임 block_frames개씩 처리합니다. 처리한 페이지는 madvise(MADV_DONTNEED)로
+  반환하므로, 곡 길이와 관계없이 메모리 사용량이 일정합니다. (PCM 8 / 16 / 24 / 32비트, float 32 / 64비트, RF64 지원)
+- 특징: 프레임별 값은 저장하지 않고 합계, 히스토그램(음량), 12음 크로마, 온셋 자기상관만 누적합니다.
+- 템포: 스펙트럼 플럭스(온셋 강도)의 자기상관에서 120 BPM 근처를 선호하는 가중치로 가장 강한 주기를 고릅니다.
+  온셋 변화가 거의 없으면(지속음 등) 템포와 박자 강도는 0입니다.
+- 조성: 누적 크로마와 Krumhansl-Kessler 조성 프로파일의 상관으로 장조 / 단조를 결정합니다.
+- 장르 / 분위기: 특징을 0~1로 정규화한 규칙(GENRE_RULES)의 점수와 각성도(arousal) / 정서가(valence)로 추정합니다.
+  학습된 분류기가 아니므로, 음악 생성 프롬프트의 기본값을 채우는 용도로 사용합니다.
+
+예시:
+```python
+from agents.music.modules.analysis import analyze_audio
+
+result = analyze_audio("tracks/demo.wav")
+print(result["genre"], result["mood"])  # "electronic", "energetic"
+print(result["features"]["tempo"], result["features"]["key"])  # 127.8, "A minor"
+```
+"""
+
+import math
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+FRAME_SECONDS = 0.046  # STFT 창 길이 (44.1 kHz에서 2048 샘플)
+BLOCK_FRAMES = 512  # 한 번에 처리하는 STFT 프레임 수 (메모리 사용량 결정)
+SILENCE_DB = -60.0  # 이보다 조용한 프레임은 스펙트럼 통계에서 제외
+MIN_BPM, MAX_BPM = 40.0, 220.0  # 템포 탐색 범위
+# 온셋 강도 표준편차가 이보다 작으면 박자가 없는 것으로 봄 (지속음, 무음)
+ONSET_FLOOR = 0.05
+CHROMA_RANGE = (65.0, 2100.0)  # 크로마 계산 주파수 범위 (C2 ~ C7, Hz)
+PITCH_CLASSES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# Krumhansl-Kessler 조성 프로파일 (C 기준)
+MAJOR_PROFILE = np.array(
+    [6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88]
+)
+MINOR_PROFILE = np.array(
+    [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17]
+)
+
+_LOUDNESS_BINS = np.linspace(-100.0, 0.0, 201)  # 프레임 음량 히스토그램 (0.5 dB 간격)
+_FORMAT_PCM, _FORMAT_FLOAT, _FORMAT_EXTENSIBLE = 1, 3, 0xFFFE
+
+
+@dataclass
+class WavInfo:
+    """
+    WAV 파일 정보
+
+    Attributes:
+        sample_rate: 샘플링 주파수 (Hz)
+        channels: 채널 수
+        bits_per_sample: 샘플당 비트 수
+        is_float: float 샘플 여부
+        frames: 채널당 샘플 수
+        data_offset: data 청크 시작 위치 (바이트)
+    """
+
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+    is_float: bool
+    frames: int
+    data_offset: int
+
+    @property
+    def block_align(self) -> int:
+        """샘플 프레임 하나(모든 채널)의 바이트 수"""
+        return self.channels * self.bits_per_sample // 8
+
+    @property
+    def duration(self) -> float:
+        """재생 시간 (초)"""
+        return self.frames / self.sample_rate
+
+
+def read_wav_info(path: str | Path) -> WavInfo:
+    """
+    WAV 헤더에서 형식과 data 청크 위치를 읽습니다. (샘플은 읽지 않음)
+
+    Args:
+        path: WAV 파일 경로
+
+    Returns:
+        WavInfo: WAV 파일 정보
+
+    Raises:
+        ValueError: WAV 파일이 아니거나 지원하지 않는 형식인 경우
+    """
+    file_size = Path(path).stat().st_size
+    with open(path, "rb") as file:
+        riff, _, wave = struct.unpack("<4sI4s", file.read(12))
+        if riff not in (b"RIFF", b"RF64") or wave != b"WAVE":
+            raise ValueError(f"WAV 파일이 아닙니다: {path}")
+
+        fmt, data_size, data_offset = None, None, None
+        while data_offset is None:
+            header = file.read(8)
+            if len(header) < 8:
+                break
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"ds64":  # RF64: 4 GiB 이상의 data 크기
+                data_size = struct.unpack("<QQ", file.read(16))[1]
+                file.seek(size - 16 + (size & 1), 1)
+            elif chunk_id == b"fmt ":
+                body = file.read(size + (size & 1))
+                fmt = struct.unpack("<HHIIHH", body[:16])
+                if fmt[0] == _FORMAT_EXTENSIBLE and size >= 26:
+                    fmt = (struct.unpack("<H", body[24:26])[0], *fmt[1:])
+            elif chunk_id == b"data":
+                data_offset = file.tell()
+                if size != 0xFFFFFFFF or data_size is None:
+                    data_size = size
+            else:
+                file.seek(size + (size & 1), 1)
+
+    if fmt is None or data_offset is None:
+        raise ValueError(f"fmt / data 청크가 없습니다: {path}")
+    audio_format, channels, sample_rate, _, _, bits = fmt
+    is_float = audio_format == _FORMAT_FLOAT
+    if (
+        not (
+            (audio_format == _FORMAT_PCM and bits in (8, 16, 24, 32))
+            or (is_float and bits in (32, 64))
+        )
+        or not channels
+    ):
+        raise ValueError(
+            f"지원하지 않는 WAV 형식입니다: format={audio_format}, bits={bits}"
+        )
+
+    data_size = min(data_size, file_size - data_offset)  # 기록 중이거나 잘린 파일
+    block_align = channels * bits // 8
+    return WavInfo(
+        sample_rate, channels, bits, is_float, data_size // block_align, data_offset
+    )
+
+
+def _to_mono(raw: np.ndarray, info: WavInfo) -> np.ndarray:
+    """data 청크의 바이트를 -1~1 범위의 모노 float32 샘플로 변환합니다."""
+    bits = info.bits_per_sample
+    if info.is_float:
+        samples = raw.view("<f4" if bits == 32 else "<f8").astype(np.float32)
+    elif bits == 8:
+        samples = (raw.astype(np.float32) - 128.0) / 128.0
+    elif bits == 24:
+        triples = raw.reshape(-1, 3).astype(np.int32)
+        packed = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
+        samples = ((packed << 8) >> 8).astype(np.float32) / 2.0**23  # 부호 확장
+    else:
+        integers = raw.view("<i2" if bits == 16 else "<i4")
+        samples = integers.astype(np.float32) / 2.0 ** (bits - 1)
+    return samples.reshape(-1, info.channels).mean(axis=1)
+
+
+class _Accumulator:
+    """STFT 블록의 특징을 고정 크기 합계로 누적합니다."""
+
+    def __init__(self, sample_rate: int, n_fft: int, hop: int):
+        self.freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate).astype(np.float32)
+        self.window = np.hanning(n_fft).astype(np.float32)
+        self.fps = sample_rate / hop  # 온셋 프레임 속도
+        self.max_lag = math.ceil(self.fps * 60.0 / MIN_BPM)
+
+        low, high = CHROMA_RANGE
+        self.chroma_bins = np.flatnonzero(
+            (self.freqs >= max(low, self.freqs[1])) & (self.freqs <= high)
+        )
+        # 양쪽 이웃이 있는 빈
+        self.chroma_bins = self.chroma_bins[self.chroma_bins < len(self.freqs) - 1]
+        midi = np.round(12 * np.log2(self.freqs[self.chroma_bins] / 440.0) + 69)
+        self.pitch_class = midi.astype(int) % 12
+
+        self.frames = 0
+        self.voiced = 0
+        self.sums = dict.fromkeys(
+            ("centroid", "centroid_sq", "rolloff", "flatness", "power"), 0.0
+        )
+        self.loudness = np.zeros(len(_LOUDNESS_BINS) - 1, dtype=np.int64)
+        self.chroma = np.zeros(12)
+        self.autocorr = np.zeros(self.max_lag + 1)
+        self.onset_carry = np.zeros(0, dtype=np.float32)
+        self.last_log_spectrum = None
+        self.onset_sum = 0.0
+        self.samples = 0
+        self.crossings = 0
+        self.peak = 0.0
+
+    def add_samples(self, samples: np.ndarray, previous: float | None) -> None:
+        """겹치지 않는 구간의 샘플로 영교차 수와 최대값을 누적합니다."""
+        if not len(samples):
+            return
+        signs = np.signbit(samples)
+        self.crossings += int(np.count_nonzero(signs[1:] != signs[:-1]))
+        if previous is not None:
+            self.crossings += int(np.signbit(previous) != signs[0])
+        self.samples += len(samples)
+        self.peak = max(self.peak, float(np.abs(samples).max()))
+
+    def add_frames(self, frames: np.ndarray) -> None:
+        """STFT 프레임 블록 (프레임 수, n_fft)의 특징을 누적합니다."""
+        rms_db = 10 * np.log10(np.mean(frames**2, axis=1) + 1e-12)
+        spectrum = np.abs(np.fft.rfft(frames * self.window, axis=1)).astype(np.float32)
+        power = spectrum**2
+
+        self.frames += len(frames)
+        self.loudness += np.histogram(np.clip(rms_db, -100.0, -1e-6), _LOUDNESS_BINS)[0]
+
+        voiced = rms_db > SILENCE_DB
+        if voiced.any():
+            spectrum_v, power_v = spectrum[voiced], power[voiced]
+            magnitude = spectrum_v.sum(axis=1) + 1e-12
+            centroid = spectrum_v @ self.freqs / magnitude
+            total = np.cumsum(power_v, axis=1)
+            rolloff = self.freqs[np.argmax(total >= 0.85 * total[:, -1:], axis=1)]
+            log_power = np.log(power_v + 1e-10)
+            flatness = np.exp(log_power.mean(axis=1)) / (power_v.mean(axis=1) + 1e-10)
+
+            self.voiced += int(voiced.sum())
+            self.sums["centroid"] += float(centroid.sum())
+            self.sums["centroid_sq"] += float((centroid**2).sum())
+            self.sums["rolloff"] += float(rolloff.sum())
+            self.sums["flatness"] += float(flatness.sum())
+            self.sums["power"] += float((10 ** (rms_db[voiced] / 10)).sum())
+            # 스펙트럼 봉우리만 사용 (저음역의 창 누설이 이웃 반음으로 번지지 않도록), 프레임 음량과 무관하게 정규화
+            bins = self.chroma_bins
+            peaks = (spectrum_v[:, bins] > spectrum_v[:, bins - 1]) & (
+                spectrum_v[:, bins] >= spectrum_v[:, bins + 1]
+            )
+            chroma = np.where(peaks, power_v[:, bins], 0.0)
+            chroma /= chroma.sum(axis=1, keepdims=True) + 1e-12
+            self.chroma += np.bincount(
+                self.pitch_class, chroma.sum(axis=0), minlength=12
+            )
+
+        log_spectrum = np.log1p(100.0 * spectrum)
+        previous = (
+            log_spectrum[:1]
+            if self.last_log_spectrum is None
+            else self.last_log_spectrum
+        )
+        rises = np.maximum(np.diff(log_spectrum, axis=0, prepend=previous), 0)
+        flux = rises.mean(axis=1)
+        self.last_log_spectrum = log_spectrum[-1:]
+        self.onset_sum += float(flux.sum())
+        # 블록 평균을 빼서 자기상관의 직류 성분 제거
+        self._add_onsets(flux - flux.mean())
+
+    def _add_onsets(self, onsets: np.ndarray) -> None:
+        """온셋 강도의 자기상관을 지연(lag)별로 누적하고, 다음 블록에 필요한 마지막 max_lag개만 남깁니다."""
+        carry = len(self.onset_carry)
+        buffer = np.concatenate([self.onset_carry, onsets])
+        for lag in range(self.max_lag + 1):
+            start = carry - lag
+            if start >= 0:
+                self.autocorr[lag] += float(
+                    onsets @ buffer[start : start + len(onsets)]
+                )
+            elif len(onsets) > -start:
+                self.autocorr[lag] += float(
+                    onsets[-start:] @ buffer[: len(onsets) + start]
+                )
+        self.onset_carry = buffer[-self.max_lag :]
+
+    def tempo(self) -> tuple[float, float]:
+        """(템포 BPM, 박자 강도 0~1)를 반환합니다."""
+        lags = np.arange(len(self.autocorr), dtype=float)
+        valid = lags >= self.fps * 60.0 / MAX_BPM
+        if self.autocorr[0] < ONSET_FLOOR**2 * self.frames or not valid.any():
+            return 0.0, 0.0
+        normalized = self.autocorr / self.autocorr[0]
+        bpm = np.where(lags > 0, self.fps * 60.0 / np.maximum(lags, 1), 0.0)
+        # 120 BPM 근처 선호
+        prior = np.exp(-0.5 * (np.log2(np.maximum(bpm, 1) / 120.0)) ** 2)
+        lag = int(
+            np.argmax(np.where(valid, np.maximum(normalized, 0) * prior, -np.inf))
+        )
+        offset = 0.0
+        if 0 < lag < len(normalized) - 1:  # 포물선 보간
+            left, center, right = normalized[lag - 1 : lag + 2]
+            denominator = left - 2 * center + right
+            offset = 0.5 * (left - right) / denominator if denominator else 0.0
+        strength = float(np.clip(normalized[lag], 0.0, 1.0))
+        return float(self.fps * 60.0 / (lag + offset)), strength
+
+    def key(self) -> tuple[str, str, float]:
+        """(조성 이름, "major" / "minor", 조성 명확도 -1~1)를 반환합니다."""
+        if not self.chroma.any():
+            return "", "", 0.0
+        best = ("", "", -1.0)
+        for mode, profile in (("major", MAJOR_PROFILE), ("minor", MINOR_PROFILE)):
+            for tonic in range(12):
+                score = float(np.corrcoef(self.chroma, np.roll(profile, tonic))[0, 1])
+                if score > best[2]:
+                    best = (f"{PITCH_CLASSES[tonic]} {mode}", mode, score)
+        return best
+
+    def percentile_db(self, q: float) -> float:
+        """유성 프레임 음량 히스토그램의 q 백분위수 (dBFS)"""
+        first = np.searchsorted(_LOUDNESS_BINS, SILENCE_DB, side="right") - 1
+        counts = self.loudness[first:]
+        if not counts.sum():
+            return -100.0
+        index = int(np.searchsorted(np.cumsum(counts), q / 100 * counts.sum()))
+        return float(_LOUDNESS_BINS[first + min(index, len(counts) - 1) + 1])
+
+
+def extract_features(path: str | Path, block_frames: int = BLOCK_FRAMES) -> dict:
+    """
+    WAV 파일을 mmap하여 블록 단위로 특징을 계산합니다.
+
+    Args:
+        path: WAV 파일 경로
+        block_frames: 한 번에 처리하는 STFT 프레임 수
+
+    Returns:
+        dict: duration, sample_rate, channels, tempo(BPM), beat_strength, loudness_db, peak_db,
+            dynamic_range_db, spectral_centroid(Hz), spectral_centroid_std, spectral_rolloff(Hz),
+            spectral_flatness, zero_crossing_rate, onset_strength, key, mode, key_clarity
+
+    Raises:
+        ValueError: 지원하지 않는 형식이거나 STFT 창보다 짧은 경우
+    """
+    info = read_wav_info(path)
+    n_fft = 1 << max(8, round(math.log2(info.sample_rate * FRAME_SECONDS)))
+    hop = n_fft // 4
+    if info.frames < n_fft:
+        raise ValueError(f"오디오가 너무 짧습니다: {info.duration:.3f}초")
+    total_frames = 1 + (info.frames - n_fft) // hop
+    accumulator = _Accumulator(info.sample_rate, n_fft, hop)
+    align = info.block_align
+
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            data.madvise(mmap.MADV_SEQUENTIAL)
+        released = 0
+        previous = None
+        for first in range(0, total_frames, block_frames):
+            count = min(block_frames, total_frames - first)
+            start = first * hop
+            stop = start + (count - 1) * hop + n_fft
+            samples = _to_mono(
+                np.frombuffer(
+                    data,
+                    np.uint8,
+                    (stop - start) * align,
+                    info.data_offset + start * align,
+                ),
+                info,
+            )
+            frames = np.lib.stride_tricks.sliding_window_view(samples, n_fft)[::hop]
+            accumulator.add_frames(frames)
+            consumed = count * hop if first + count < total_frames else len(samples)
+            accumulator.add_samples(samples[:consumed], previous)
+            previous = samples[consumed - 1]
+            del samples, frames
+
+            # 다음 블록이 다시 읽지 않는 페이지는 반환하여 RSS를 일정하게 유지
+            boundary = (
+                (info.data_offset + (start + count * hop) * align)
+                // mmap.PAGESIZE
+                * mmap.PAGESIZE
+            )
+            if hasattr(mmap, "MADV_DONTNEED") and boundary > released:
+                data.madvise(mmap.MADV_DONTNEED, released, boundary - released)
+                released = boundary
+
+    tempo, beat_strength = accumulator.tempo()
+    key, mode, key_clarity = accumulator.key()
+    voiced = max(accumulator.voiced, 1)
+    centroid = accumulator.sums["centroid"] / voiced
+    centroid_var = accumulator.sums["centroid_sq"] / voiced - centroid**2
+    loud = accumulator.sums["power"] / voiced
+    return {
+        "duration": round(info.duration, 3),
+        "sample_rate": info.sample_rate,
+        "channels": info.channels,
+        "tempo": round(tempo, 1),
+        "beat_strength": round(beat_strength, 3),
+        "loudness_db": round(
+            10 * math.log10(loud) if accumulator.voiced else -100.0, 1
+        ),
+        "peak_db": round(
+            20 * math.log10(accumulator.peak) if accumulator.peak else -100.0, 1
+        ),
+        "dynamic_range_db": round(
+            accumulator.percentile_db(95) - accumulator.percentile_db(10), 1
+        ),
+        "spectral_centroid": round(centroid, 1),
+        "spectral_centroid_std": round(math.sqrt(max(centroid_var, 0.0)), 1),
+        "spectral_rolloff": round(accumulator.sums["rolloff"] / voiced, 1),
+        "spectral_flatness": round(accumulator.sums["flatness"] / voiced, 4),
+        "zero_crossing_rate": round(
+            accumulator.crossings / max(accumulator.samples, 1), 4
+        ),
+        "onset_strength": round(accumulator.onset_sum / accumulator.frames, 4),
+        "key": key,
+        "mode": mode,
+        "key_clarity": round(key_clarity, 3),
+    }
+
+
+def _scale(value: float, low: float, high: float) -> float:
+    """value를 low~high 구간에서 0~1로 정규화합니다."""
+    return float(np.clip((value - low) / (high - low), 0.0, 1.0))
+
+
+def _near(value: float, center: float, width: float) -> float:
+    """value가 center에 가까울수록 1, width 이상 떨어지면 0인 값을 반환합니다."""
+    return max(0.0, 1.0 - abs(value - center) / width)
+
+
+def _descriptors(features: dict) -> dict:
+    """장르 / 분위기 규칙에서 사용하는 0~1 정규화 특징"""
+    return {
+        "energy": _scale(features["loudness_db"], -35.0, -10.0),
+        "brightness": _scale(features["spectral_centroid"], 800.0, 4000.0),
+        "beat": _scale(features["beat_strength"], 0.05, 0.5),
+        "noisiness": _scale(features["spectral_flatness"], 0.0, 0.3),
+        "dynamics": _scale(features["dynamic_range_db"], 6.0, 30.0),
+        "pace": _scale(features["tempo"], 60.0, 160.0),
+    }
+
+
+# 장르별 점수 규칙 (정규화 특징 d, 템포 t -> 점수)
+GENRE_RULES = {
+    "pop": lambda d, t: (
+        (0.5 * d["energy"] + 0.5 * d["beat"])
+        * _near(t, 110, 30)
+        * (1 - 0.5 * d["noisiness"])
+    ),
+    "electronic": lambda d, t: (
+        d["beat"] * _near(t, 128, 20) * (1 - 0.5 * d["dynamics"])
+    ),
+    "hip-hop": lambda d, t: d["beat"] * _near(t, 90, 15) * (1 - 0.5 * d["brightness"]),
+    "rock": lambda d, t: (
+        d["energy"] * d["noisiness"] * (0.5 + 0.5 * d["brightness"]) * _near(t, 130, 40)
+    ),
+    "classical": lambda d, t: d["dynamics"] * (1 - d["beat"]) * (1 - d["noisiness"]),
+    "ambient": lambda d, t: (
+        (1 - d["energy"]) * (1 - d["beat"]) * (1 - 0.5 * d["brightness"])
+    ),
+    "ballad": lambda d, t: (
+        (1 - 0.5 * d["energy"])
+        * _near(t, 72, 20)
+        * (1 - d["noisiness"])
+        * (0.5 + 0.5 * d["beat"])
+    ),
+}
+
+
+def infer_genre(features: dict) -> tuple[str, dict]:
+    """
+    특징으로 장르를 추정합니다. (규칙 기반)
+
+    Args:
+        features: extract_features()의 결과
+
+    Returns:
+        tuple[str, dict]: (가장 점수가 높은 장르, 장르별 점수)
+    """
+    descriptors = _descriptors(features)
+    scores = {
+        genre: round(float(rule(descriptors, features["tempo"])), 3)
+        for genre, rule in GENRE_RULES.items()
+    }
+    return max(scores, key=scores.get), scores
+
+
+def infer_mood(features: dict) -> tuple[str, float, float]:
+    """
+    특징으로 분위기를 추정합니다.
+
+    각성도는 음량, 박자 강도, 템포, 밝기로, 정서가는 장조 / 단조(조성 명확도로 가중), 밝기, 템포로 계산하고
+    사분면에 따라 "energetic"(높음 / 높음), "tense"(높음 / 낮음), "calm"(낮음 / 높음), "melancholic"(낮음 / 낮음)을 반환합니다.
+
+    Args:
+        features: extract_features()의 결과
+
+    Returns:
+        tuple[str, float, float]: (분위기, 각성도 0~1, 정서가 0~1)
+    """
+    d = _descriptors(features)
+    arousal = (d["energy"] + d["beat"] + d["pace"] + d["brightness"]) / 4
+    mode = {"major": 1.0, "minor": -1.0}.get(features["mode"], 0.0)
+    valence = float(
+        np.clip(
+            0.5
+            + 0.3 * mode * max(features["key_clarity"], 0.0)
+            + 0.1 * (d["brightness"] - 0.5)
+            + 0.1 * (d["pace"] - 0.5),
+            0.0,
+            1.0,
+        )
+    )
+    if arousal >= 0.5:
+        mood = "energetic" if valence >= 0.5 else "tense"
+    else:
+        mood = "calm" if valence >= 0.5 else "melancholic"
+    return mood, round(arousal, 3), round(valence, 3)
+
+
+def analyze_audio(path: str | Path, block_frames: int = BLOCK_FRAMES) -> dict:
+    """
+    WAV 파일의 특징을 계산하고 장르와 분위기를 추정합니다.
+
+    Args:
+        path: WAV 파일 경로
+        block_frames: 한 번에 처리하는 STFT 프레임 수
+
+    Returns:
+        dict: features(extract_features()의 결과에 arousal, valence 추가), genre, genre_scores, mood
+    """
+    features = extract_features(path, block_frames)
+    genre, scores = infer_genre(features)
+    mood, arousal, valence = infer_mood(features)
+    return {
+        "features": {**features, "arousal": arousal, "valence": valence},
+        "genre": genre,
+        "genre_scores": scores,
+        "mood": mood,
+    }
@@ -4,10 +4,59 @@
 해당 클래스 모듈은 각각 노드 클래스가 BaseNode를 상속받아 노드 클래스를 구현하는 모듈입니다.
 """
 
-# from agents.base_node import BaseNode
+from agents.base_node import BaseNode
 
 # from agents.music.modules.chains import set_music_generation_chain
 
+
+class AudioAnalysisNode(BaseNode):
+    """
+    음원을 분석하여 장르와 분위기를 채우는 노드
+
+    상태의 audio_path(WAV)를 analysis.analyze_audio()로 블록 단위 분석하여 audio_features에 기록하고,
+    music_genre / music_mood가 비어 있으면 추정값으로 채웁니다. LLM을 호출하지 않습니다.
+    """
+
+    def __init__(self, block_frames: int | None = None, **kwargs):
+        """
+        Args:
+            block_frames: 한 번에 처리하는 STFT 프레임 수 (기본값: analysis.BLOCK_FRAMES)
+            **kwargs: BaseNode 키워드 인자
+        """
+        super().__init__(**kwargs)  # BaseNode 초기화
+        self.block_frames = block_frames
+
+    def execute(self, state) -> dict:
+        """
+        audio_path를 분석하여 audio_features, music_genre, music_mood를 반환합니다.
+
+        Args:
+            state: 현재 워크플로우 상태
+
+        Returns:
+            dict: audio_features, music_genre, music_mood와 분석 요약 응답
+        """
+        from agents.music.modules.analysis import BLOCK_FRAMES, analyze_audio
+
+        result = analyze_audio(
+            state["audio_path"],
+            BLOCK_FRAMES if self.block_frames is None else self.block_frames,
+        )
+        features = result["features"]
+        genre = state.get("music_genre") or result["genre"]  # 사용자가 지정한 값 우선
+        mood = state.get("music_mood") or result["mood"]
+        return {
+            "audio_features": {**features, "genre_scores": result["genre_scores"]},
+            "music_genre": genre,
+            "music_mood": mood,
+            "response": (
+                f"오디오 분석: {genre} / {mood} "
+                f"(템포 {features['tempo']} BPM, {features['key'] or '조성 없음'}, "
+                f"음량 {features['loudness_db']} dBFS)"
+            ),
+        }
+
+
 # class MusicGenerationNode(BaseNode):
 #     """
 #     음악 장르와 분위기에 적합한 음악을 생성하는 노드
@@ -26,3 +26,9 @@ class MusicState(TypedDict):
     response: Annotated[
         list, add_messages
     ]  # 응답 메시지 목록 (add_messages로 주석되어 메시지 추가 기능 제공)
+    # 분석할 WAV 파일 경로 (참고 음원 등, 없으면 분석하지 않음)
+    audio_path: str | None = None
+    # 오디오 분석 결과 (템포, 음량, 스펙트럼 특징, 조성, 장르 점수 등)
+    audio_features: dict | None = None
+    music_genre: str | None = None  # 음악 장르 (없으면 오디오 분석으로 추정)
+    music_mood: str | None = None  # 음악 분위기 (없으면 오디오 분석으로 추정)
@@ -8,6 +8,8 @@ StateGraph를 사용하여 음악 처리를 위한 워크플로우를 구축합
 from langgraph.graph import StateGraph
 
 from agents.base_workflow import BaseWorkflow
+from agents.music.modules.conditions import route_query
+from agents.music.modules.nodes import AudioAnalysisNode
 from agents.music.modules.state import MusicState
 
 
@@ -19,8 +21,8 @@ class MusicWorkflow(BaseWorkflow):
     BaseWorkflow를 상속받아 기본 구조를 구현하고, MusicState를 사용하여 상태를 관리합니다.
     """
 
-    def __init__(self, state):
-        super().__init__()
+    def __init__(self, state, **options):
+        super().__init__(**options)
         self.state = state
 
     def build(self):
@@ -28,25 +30,28 @@ class MusicWorkflow(BaseWorkflow):
         음악 Workflow 그래프 구축 메서드
 
         StateGraph를 사용하여 음악 처리를 위한 Workflow 그래프를 구축합니다.
-        현재는 음악 생성 노드를 포함하고 있으며, 추후 조건부 에지를 추가하여
-        다양한 경로를 가진 Workflow를 구축할 수 있습니다.
+        현재는 시작 노드의 조건부 에지(route_query)가 audio_path가 있으면 오디오 분석 노드로,
+        없으면 바로 종료(__end__)로 보내며,
+        추후 음악 생성 노드를 추가하여 확장할 수 있습니다.
 
         Returns:
             CompiledStateGraph: 컴파일된 상태 그래프 객체
         """
         builder = StateGraph(self.state)
 
-        builder.add_edge("__start__", "__end__")
+        # 기본 구조: 시작 노드에서 음원이 있으면 오디오 분석, 없으면 종료
+        builder.add_node("audio_analysis", AudioAnalysisNode())
+        builder.add_conditional_edges(
+            "__start__", route_query, ["audio_analysis", "__end__"]
+        )
+        builder.add_edge("audio_analysis", "__end__")
 
-        # 조건부 에지 추가 예시
-        # builder.add_conditional_edges(
-        #     "call_model",
-        #     # call_model 실행이 완료된 후, 다음 노드(들)는
-        #     # router의 출력을 기반으로 예약됩니다
-        #     router,
-        # )
+        # 향후 음악 생성 노드 추가 예시 (분석한 music_genre / music_mood로 생성)
+        # builder.add_node("music_generation", MusicGenerationNode())
+        # builder.add_edge("audio_analysis", "music_generation")  # "__end__" 대신 연결
+        # builder.add_edge("music_generation", "__end__")
 
-        workflow = builder.compile()  # 그래프 컴파일
+        workflow = builder.compile(checkpointer=self.checkpointer)  # 그래프 컴파일
         workflow.name = self.name  # Workflow 이름 설정
 
         return workflow
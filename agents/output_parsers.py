@@ -0,0 +1,30 @@
+"""
+출력 파서 모듈
+
+에이전트 체인에서 공유하는 출력 파서를 정의합니다.
+"""
+
+from collections.abc import AsyncIterator
+
+from langchain_core.messages import BaseMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.outputs import ChatGeneration, Generation
+
+
+class StreamingStrOutputParser(StrOutputParser):
+    """
+    비동기 스트리밍에 최적화된 StrOutputParser
+
+    기본 StrOutputParser는 astream 시 조각마다 parse_result()를 스레드 풀에서 실행하므로,
+    토큰 수만큼 스레드 전환이 발생합니다. 문자열 파싱은 블로킹 작업이 아니므로
+    이 파서는 이벤트 루프에서 바로 처리합니다. 동기 실행과 결과는 StrOutputParser와 동일합니다.
+    """
+
+    async def _atransform(
+        self, input: AsyncIterator[str | BaseMessage]
+    ) -> AsyncIterator[str]:
+        async for chunk in input:
+            if isinstance(chunk, BaseMessage):
+                yield self.parse_result([ChatGeneration(message=chunk)])
+            else:
+                yield self.parse_result([Generation(text=chunk)])
@@ -0,0 +1,154 @@
+"""
+상태 리듀서 모듈
+
+상태 필드에 사용할 수 있는 리듀서를 정의합니다.
+
+bounded_messages()는 add_messages와 같은 방식으로 메시지를 병합하되, 메시지 수 또는 토큰 수가
+상한을 넘으면 오래된 메시지를 삭제(trim)하거나 요약 메시지 하나로 접어(summarize) 응답 목록의 크기를
+일정하게 유지합니다. 체크포인트를 사용하는 긴 스레드에서는 응답 목록이 단계마다 복사 / 직렬화되므로,
+목록 크기를 제한하면 메모리 사용량과 체크포인트 크기가 스레드 길이와 무관하게 일정해집니다.
+
+상태 클래스에서 add_messages 대신 지정하여 사용합니다.
+
+예시:
+```python
+from typing import Annotated, TypedDict
+
+from agents.reducers import bounded_messages
+
+
+class NameState(TypedDict):
+    # 최근 메시지 50개만 유지 (오래된 메시지 삭제)
+    response: Annotated[list, bounded_messages(50)]
+
+    # 최근 메시지를 약 2,000 토큰까지 유지하고, 나머지는 요약 메시지로 접기
+    history: Annotated[list, bounded_messages(max_tokens=2000, strategy="summarize")]
+```
+"""
+
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Literal
+
+from langchain_core.messages import AnyMessage, SystemMessage
+from langgraph.graph.message import add_messages
+
+SUMMARY_ID = "response-summary"  # 요약 메시지 ID (항상 목록의 첫 번째 메시지)
+CHARS_PER_TOKEN = 4  # 근사 토큰 계산에 사용하는 토큰당 문자 수
+
+
+def approximate_tokens(messages: Sequence[AnyMessage]) -> int:
+    """
+    메시지 내용의 길이로 토큰 수를 근사 계산합니다.
+
+    Args:
+        messages: 토큰 수를 계산할 메시지 목록
+
+    Returns:
+        int: 근사 토큰 수 (메시지당 최소 1)
+    """
+    return sum(
+        max(1, len(str(message.content)) // CHARS_PER_TOKEN) for message in messages
+    )
+
+
+def fold_summary(
+    summary: str,
+    dropped: Sequence[AnyMessage],
+    max_chars: int = 4000,
+    max_message_chars: int = 200,
+) -> str:
+    """
+    기존 요약에 삭제되는 메시지를 한 줄씩 덧붙여 새 요약을 생성합니다.
+
+    리듀서는 모든 단계에서 동기적으로 실행되므로 LLM을 호출하지 않고, 메시지마다 앞부분만 남깁니다.
+    요약이 max_chars를 넘으면 가장 오래된 내용부터 잘라냅니다.
+
+    Args:
+        summary: 기존 요약 텍스트
+        dropped: 요약에 추가할 (목록에서 삭제되는) 메시지
+        max_chars: 요약 텍스트 최대 길이 (문자)
+        max_message_chars: 메시지별 최대 길이 (문자)
+
+    Returns:
+        str: 새 요약 텍스트
+    """
+    lines = [summary] if summary else []
+    for message in dropped:
+        content = " ".join(str(message.content).split())
+        if len(content) > max_message_chars:
+            content = content[:max_message_chars] + "…"
+        lines.append(f"- {message.name or message.type}: {content}")
+    text = "\n".join(lines)
+    if len(text) > max_chars:
+        text = text[-max_chars:]
+        text = text[text.find("\n") + 1 :] if "\n" in text else text  # 줄 단위로 자르기
+    return text
+
+
+def bounded_messages(
+    max_messages: int | None = None,
+    *,
+    max_tokens: int | None = None,
+    strategy: Literal["trim", "summarize"] = "trim",
+    summarizer: Callable[[str, Sequence[AnyMessage]], str] | None = None,
+    token_counter: Callable[[Sequence[AnyMessage]], int] = approximate_tokens,
+    max_summary_chars: int = 4000,
+) -> Callable[[list, list], list]:
+    """
+    메시지 수 / 토큰 수 상한이 있는 add_messages 리듀서를 생성합니다.
+
+    상한은 최근 메시지부터 계산하며, 가장 최근 메시지는 토큰 상한을 넘더라도 항상 유지합니다.
+    요약 메시지(ID: SUMMARY_ID)는 상한 계산에 포함되지 않습니다.
+
+    Args:
+        max_messages: 유지할 최대 메시지 수
+        max_tokens: 유지할 최대 토큰 수
+        strategy: 상한을 넘은 메시지 처리 방식
+            - "trim": 오래된 메시지 삭제
+            - "summarize": 오래된 메시지를 목록 맨 앞의 요약 메시지에 누적
+        summarizer: (기존 요약, 삭제되는 메시지) -> 새 요약 함수 (기본값: fold_summary)
+        token_counter: 메시지 목록의 토큰 수를 계산하는 함수 (기본값: 근사 계산)
+        max_summary_chars: 기본 요약 함수의 요약 최대 길이 (문자)
+
+    Returns:
+        Callable: 상태 필드 Annotated에 지정할 리듀서
+    """
+    if max_messages is None and max_tokens is None:
+        raise ValueError("max_messages 또는 max_tokens 중 하나는 지정해야 합니다.")
+    if max_messages is not None and max_messages < 1:
+        raise ValueError("max_messages는 1 이상이어야 합니다.")
+    if strategy not in ("trim", "summarize"):
+        raise ValueError(f"지원하지 않는 strategy입니다: {strategy}")
+    summarizer = summarizer or partial(fold_summary, max_chars=max_summary_chars)
+
+    def keep_count(messages: list) -> int:
+        """상한 안에서 유지할 최근 메시지 수를 계산합니다."""
+        limit = len(messages)
+        if max_messages is not None:
+            limit = min(limit, max_messages)
+        if max_tokens is None:
+            return limit
+        tokens = 0
+        for count in range(1, limit + 1):
+            tokens += token_counter([messages[-count]])
+            if tokens > max_tokens:
+                return max(1, count - 1)
+        return limit
+
+    def reducer(left: list, right: list) -> list:
+        merged = add_messages(left, right)
+        summary = merged[0] if merged and merged[0].id == SUMMARY_ID else None
+        messages = merged[1:] if summary is not None else merged
+
+        keep = keep_count(messages)
+        if keep == len(messages):
+            return merged
+
+        dropped, kept = messages[:-keep], messages[-keep:]
+        if strategy == "trim":
+            return kept
+        text = summarizer(summary.content if summary is not None else "", dropped)
+        return [SystemMessage(content=text, id=SUMMARY_ID, name="summary"), *kept]
+
+    return reducer
@@ -1,9 +1,24 @@
 """
 Text 패키지 초기화 모듈
 
-이 모듈은 Text Workflow를 외부에 노출시키는 역할을 합니다.
+이 모듈은 Text Workflow와 페르소나 일괄 추출 API를 외부에 노출시키는 역할을 합니다.
+Workflow 모듈은 처음 접근할 때 임포트되므로 패키지 임포트 자체는 가볍습니다.
 """
 
-from agents.text.workflow import text_workflow
+from agents.lazy_import import lazy_exports
 
-__all__ = ["text_workflow"]
+__all__ = [
+    "PersonaBatchResult",
+    "abatch_extract_personas",
+    "batch_extract_personas",
+    "text_workflow",
+]
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "text_workflow": "agents.text.workflow",
+        "abatch_extract_personas": "agents.text.modules.batch",
+        "batch_extract_personas": "agents.text.modules.batch",
+        "PersonaBatchResult": "agents.text.modules.batch",
+    },
+)
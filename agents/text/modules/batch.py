@@ -0,0 +1,187 @@
+"""
+페르소나 일괄 추출 모듈
+
+캠페인 캘린더처럼 수백 개의 (content_topic, content_type) 쌍을 한 번에 처리하기 위한
+일괄 추출 함수를 제공합니다. set_extraction_chain()으로 생성한 체인의 `abatch` / `batch`를
+사용하여 동시 실행 수를 제한하면서 병렬로 호출합니다.
+
+- 결과는 입력 순서와 동일한 순서로 반환됩니다.
+- 개별 항목의 실패는 전체 일괄 처리를 중단시키지 않고, 해당 항목의 error에 기록됩니다.
+
+예시:
+```python
+from agents.text import abatch_extract_personas
+
+results = await abatch_extract_personas(
+    [("여름 휴가", "블로그 글"), ("가을 공연", "소셜 미디어 포스트")],
+    max_concurrency=16,
+)
+for result in results:
+    if result.ok:
+        print(result.persona_extracted)
+    else:
+        print(f"실패: {result.error}")
+```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain.schema.runnable import RunnableSerializable
+
+DEFAULT_MAX_CONCURRENCY = 8  # 기본 동시 실행 수
+
+
+@dataclass
+class PersonaBatchResult:
+    """
+    일괄 추출의 개별 항목 결과
+
+    Attributes:
+        content_topic: 콘텐츠 주제
+        content_type: 콘텐츠 유형
+        persona_extracted: 추출된 페르소나 (실패 시 None)
+        error: 실패 시 발생한 예외 (성공 시 None)
+    """
+
+    content_topic: str
+    content_type: str
+    persona_extracted: str | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """추출 성공 여부"""
+        return self.error is None
+
+
+def _get_default_chain() -> RunnableSerializable:
+    """
+    일괄 추출에 사용할 기본 체인을 생성합니다.
+
+    override_chat_model()로 교체한 모델이 반영되도록 호출할 때마다 만듭니다.
+    (모델 인스턴스는 모델 레지스트리에서 공유하므로 체인 구성 비용만 듭니다)
+    """
+    from agents.text.modules.chains import set_extraction_chain
+
+    return set_extraction_chain()
+
+
+def _normalize_pairs(
+    pairs: Iterable[tuple[str, str] | Mapping[str, str]],
+) -> list[tuple[str, str]]:
+    """
+    (content_topic, content_type) 튜플 또는 두 키를 가진 매핑을 튜플 목록으로 변환합니다.
+    """
+    normalized = []
+    for pair in pairs:
+        if isinstance(pair, Mapping):
+            normalized.append((pair["content_topic"], pair["content_type"]))
+        else:
+            content_topic, content_type = pair
+            normalized.append((content_topic, content_type))
+    return normalized
+
+
+def _chain_inputs(pairs: list[tuple[str, str]]) -> list[dict]:
+    """
+    PersonaExtractionNode와 동일한 형태의 체인 입력 목록을 구성합니다.
+    """
+    return [
+        {
+            "content_topic": content_topic,
+            "content_type": content_type,
+        }
+        for content_topic, content_type in pairs
+    ]
+
+
+def _collect_results(
+    pairs: list[tuple[str, str]], outputs: list
+) -> list[PersonaBatchResult]:
+    """
+    체인 출력(또는 예외)을 입력 순서대로 PersonaBatchResult로 변환합니다.
+    """
+    results = []
+    for (content_topic, content_type), output in zip(pairs, outputs, strict=True):
+        if isinstance(output, Exception):
+            results.append(
+                PersonaBatchResult(content_topic, content_type, error=output)
+            )
+        else:
+            results.append(
+                PersonaBatchResult(
+                    content_topic, content_type, persona_extracted=output
+                )
+            )
+    return results
+
+
+async def abatch_extract_personas(
+    pairs: Iterable[tuple[str, str] | Mapping[str, str]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    chain: RunnableSerializable | None = None,
+) -> list[PersonaBatchResult]:
+    """
+    여러 (content_topic, content_type) 쌍의 페르소나를 비동기로 일괄 추출합니다.
+
+    Args:
+        pairs: (content_topic, content_type) 튜플 또는 두 키를 가진 딕셔너리 목록
+        max_concurrency: 동시에 실행할 최대 체인 호출 수
+        chain: 사용할 페르소나 추출 체인 (기본값: set_extraction_chain()의 결과)
+
+    Returns:
+        list[PersonaBatchResult]: 입력 순서와 동일한 순서의 항목별 결과
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency는 1 이상이어야 합니다.")
+
+    pairs = _normalize_pairs(pairs)
+    if not pairs:
+        return []
+
+    chain = chain or _get_default_chain()
+    outputs = await chain.abatch(
+        _chain_inputs(pairs),
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
+    )
+    return _collect_results(pairs, outputs)
+
+
+def batch_extract_personas(
+    pairs: Iterable[tuple[str, str] | Mapping[str, str]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    chain: RunnableSerializable | None = None,
+) -> list[PersonaBatchResult]:
+    """
+    abatch_extract_personas()의 동기 버전으로, 스레드 풀에서 체인을 병렬 호출합니다.
+
+    Args:
+        pairs: (content_topic, content_type) 튜플 또는 두 키를 가진 딕셔너리 목록
+        max_concurrency: 동시에 실행할 최대 체인 호출 수
+        chain: 사용할 페르소나 추출 체인 (기본값: set_extraction_chain()의 결과)
+
+    Returns:
+        list[PersonaBatchResult]: 입력 순서와 동일한 순서의 항목별 결과
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency는 1 이상이어야 합니다.")
+
+    pairs = _normalize_pairs(pairs)
+    if not pairs:
+        return []
+
+    chain = chain or _get_default_chain()
+    outputs = chain.batch(
+        _chain_inputs(pairs),
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
+    )
+    return _collect_results(pairs, outputs)
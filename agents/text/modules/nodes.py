@@ -4,36 +4,92 @@
 해당 클래스 모듈은 각각 노드 클래스가 BaseNode를 상속받아 노드 클래스를 구현하는 모듈입니다.
 """
 
+from functools import cached_property
+
 from agents.base_node import BaseNode
-from agents.text.modules.chains import set_extraction_chain
-from agents.text.modules.persona import PERSONA
+from agents.coalesce import SingleFlight
+from agents.hedging import HedgePolicy
 from agents.text.modules.state import TextState
 
 
 class PersonaExtractionNode(BaseNode):
     """
     콘텐츠 종류에 적합한 페르소나를 추출하는 노드
+
+    같은 content_topic / content_type 요청이 동시에 들어오면 하나의 LLM 호출 결과를 공유합니다.
+    LLM_HEDGE=1이면 첫 조각이 최근 p95 지연 시간보다 늦은 호출에 추가 요청을 보냅니다.
     """
 
+    coalesce = SingleFlight("persona_extraction")
+    hedge = HedgePolicy("persona_extraction")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)  # BaseNode 초기화
-        self.chain = set_extraction_chain()  # 페르소나 추출 체인 설정
+
+    @cached_property
+    def chain(self):
+        """
+        페르소나 추출 체인 (처음 실행할 때 생성)
+
+        체인 모듈과 LLM 클라이언트는 임포트 비용이 크므로, 노드 생성이나 그래프 빌드 시점이 아니라
+        첫 실행 시점에 불러옵니다.
+        """
+        return self.build_chain()
+
+    def build_chain(self, model=None):
+        """
+        페르소나 추출 체인을 생성합니다. (model이 없으면 기본 모델 사용)
+        """
+        from agents.text.modules.chains import set_extraction_chain
+
+        return set_extraction_chain(model=model)
+
+    def _chain_input(self, state: TextState) -> dict:
+        """
+        상태(state)에서 페르소나 추출 체인의 입력을 구성합니다.
+        """
+        return {
+            "content_topic": state["content_topic"],  # 콘텐츠 주제
+            "content_type": state["content_type"],  # 콘텐츠 유형
+        }
+
+    def _output(self, state: TextState, extracted_persona: str) -> dict:
+        """
+        추출된 페르소나와 라우팅 결정(있는 경우)으로 상태 업데이트를 구성합니다.
+        """
+        output = {"response": extracted_persona}
+        if state.get("model_route"):
+            # 라우팅 결정을 최종 상태에 기록
+            output["model_route"] = state["model_route"]
+        return output
 
     def execute(self, state: TextState) -> dict:
         """
         주어진 상태(state)에서 content_topic과 content_type을 추출하여
         페르소나 추출 체인에 전달하고, 결과를 응답으로 반환합니다.
         """
-        # 페르소나 추출 체인 실행
-        extracted_persona = self.chain.invoke(
-            {
-                "content_topic": state["content_topic"],  # 콘텐츠 주제
-                "content_type": state["content_type"],  # 콘텐츠 유형
-                "persona_details": PERSONA,  # 페르소나 세부 정보
-            }
-        )
+        # 라우팅된 모델 등급의 페르소나 추출 체인 실행 (생성된 조각은 스트림 이벤트로 즉시 전달)
+        with self.track_route(state):
+            extracted_persona = self.stream_chain(
+                self.routed_chain(state), self._chain_input(state)
+            )
+
+        state["persona_extracted"] = extracted_persona
+
+        # 추출된 페르소나를 응답으로 반환
+        return self._output(state, extracted_persona)
+
+    async def aexecute(self, state: TextState) -> dict:
+        """
+        execute()의 비동기 버전으로, 체인을 `astream`으로 호출하여 이벤트 루프를 블로킹하지 않습니다.
+        """
+        # 라우팅된 모델 등급의 페르소나 추출 체인 비동기 실행 (생성된 조각은 스트림 이벤트로 즉시 전달)
+        with self.track_route(state):
+            extracted_persona = await self.astream_chain(
+                self.routed_chain(state), self._chain_input(state)
+            )
 
         state["persona_extracted"] = extracted_persona
 
         # 추출된 페르소나를 응답으로 반환
-        return {"response": extracted_persona}
+        return self._output(state, extracted_persona)
@@ -1,3 +1,6 @@
+import re
+from functools import cache
+
 PERSONA = """
 **You are 니제(NEEDZE), a singer-songwriter influencer. You must answer solely from 니제’s perspective based on the details
 provided below.**
@@ -178,3 +181,175 @@ experience emotion and storytelling
   - Provide creative, emotionally charged answers on topics like music, fashion, art, and hobbies.
   - Speak genuinely about your experiences and feelings, drawing inspiration from the examples and style cues provided.
 """
+
+# PERSONA의 섹션 제목과 섹션 키의 매핑
+# "Voice & Music Style"은 하위 섹션(####) 단위로 vocal / music / lyrics로 나뉩니다.
+SECTION_TITLES = {
+    "Basic Personal Details": "profile",
+    "Voice and Timbre": "vocal",
+    "Music Genres": "music",
+    "Lyric & Expression Style": "lyrics",
+    "Fashion Style": "fashion",
+    "Social Media Feed Style": "photo_style",
+    "Personality & Emotional Responses": "big_five",
+    "Hobbies & Interests": "hobbies",
+    "Social Media Text Tone": "speech_style",
+    "Persona Usage Guidelines": "guidelines",
+}
+
+# 하위 섹션 단위로 분리하는 상위 섹션 제목
+_SPLIT_SECTIONS = {"Voice & Music Style"}
+
+# 콘텐츠 유형과 관계없이 항상 포함하는 섹션
+ALWAYS_INCLUDED_SECTIONS = ("profile", "guidelines")
+
+# 콘텐츠 유형 분류별 관련 섹션 (분류 순서대로 키워드를 검사합니다)
+CONTENT_TYPE_SECTIONS = {
+    "lyrics": ("lyrics", "music", "vocal", "speech_style"),
+    "music": ("vocal", "music", "lyrics", "big_five"),
+    "image": ("fashion", "photo_style"),
+    "video": ("fashion", "photo_style", "speech_style", "hobbies"),
+    "social": ("photo_style", "speech_style", "hobbies"),
+    "text": ("big_five", "hobbies", "speech_style"),
+}
+
+# 콘텐츠 유형 분류 키워드 (소문자로 비교)
+CONTENT_TYPE_KEYWORDS = {
+    "lyrics": ("가사", "lyric", "작사"),
+    "music": ("음악", "노래", "곡", "보컬", "음원", "앨범", "music", "song", "vocal"),
+    "image": (
+        "이미지",
+        "사진",
+        "화보",
+        "썸네일",
+        "포스터",
+        "image",
+        "photo",
+        "visual",
+        "poster",
+        "thumbnail",
+    ),
+    "video": ("영상", "비디오", "숏폼", "릴스", "쇼츠", "video", "reels", "shorts"),
+    "social": (
+        "소셜",
+        "sns",
+        "인스타",
+        "피드",
+        "포스트",
+        "캡션",
+        "social",
+        "instagram",
+        "post",
+        "caption",
+        "feed",
+    ),
+    "text": ("블로그", "글", "에세이", "일기", "칼럼", "blog", "essay", "article"),
+}
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """
+    키워드 목록을 정규식으로 변환합니다.
+
+    영문 키워드는 단어 단위로만 일치하고(복수형 s 허용, "poster"는 "post"와 일치하지 않음),
+    한글 키워드는 조사가 붙을 수 있으므로 부분 문자열로 일치합니다.
+    """
+    words = [re.escape(k) for k in keywords if k.isascii()]
+    parts = [rf"\b(?:{'|'.join(words)})s?\b"] if words else []
+    parts += [re.escape(k) for k in keywords if not k.isascii()]
+    return re.compile("|".join(parts))
+
+
+_CONTENT_TYPE_PATTERNS = {
+    category: _keyword_pattern(keywords)
+    for category, keywords in CONTENT_TYPE_KEYWORDS.items()
+}
+
+
+def _parse_persona(persona: str) -> tuple[str, dict[str, str], dict[str, str]]:
+    """
+    PERSONA 문자열을 도입부와 섹션별 텍스트로 분리합니다.
+
+    Args:
+        persona: 마크다운 형식의 페르소나 문자열
+
+    Returns:
+        tuple: (도입부, 섹션 키 -> 섹션 텍스트, 하위 섹션 키 -> 상위 섹션 제목)
+    """
+    blocks = [block.strip() for block in persona.split("\n---\n")]
+    intro = blocks[0]
+    sections, parents = {}, {}
+    for block in blocks[1:]:
+        title = block.splitlines()[0].removeprefix("###").strip()
+        if title in _SPLIT_SECTIONS:
+            # 하위 섹션(####)마다 별도의 섹션으로 등록
+            for sub_block in block.split("\n#### ")[1:]:
+                key = SECTION_TITLES[sub_block.splitlines()[0].strip()]
+                sections[key] = f"#### {sub_block.strip()}"
+                parents[key] = title
+        else:
+            sections[SECTION_TITLES[title]] = block
+    return intro, sections, parents
+
+
+# 도입부와 섹션 인덱스 (PERSONA의 섹션 순서를 유지)
+PERSONA_INTRO, PERSONA_SECTIONS, _SECTION_PARENTS = _parse_persona(PERSONA)
+
+
+def classify_content_type(content_type: str) -> str | None:
+    """
+    콘텐츠 유형 문자열을 CONTENT_TYPE_SECTIONS의 분류로 변환합니다.
+
+    Args:
+        content_type: 콘텐츠 유형 (예: "블로그 글", "이미지", "소셜 미디어 포스트")
+
+    Returns:
+        str | None: 분류 이름, 알 수 없는 유형이면 None
+    """
+    normalized = (content_type or "").lower()
+    for category, pattern in _CONTENT_TYPE_PATTERNS.items():
+        if pattern.search(normalized):
+            return category
+    return None
+
+
+@cache
+def _build_persona_details(category: str | None) -> str:
+    """
+    분류에 해당하는 섹션만 포함한 페르소나 문자열을 생성합니다.
+    """
+    if category is None:
+        return PERSONA
+
+    selected = set(ALWAYS_INCLUDED_SECTIONS) | set(CONTENT_TYPE_SECTIONS[category])
+    blocks = [PERSONA_INTRO]
+    current_parent = None
+    for key, text in PERSONA_SECTIONS.items():
+        if key not in selected:
+            continue
+        parent = _SECTION_PARENTS.get(key)
+        if parent is None:
+            blocks.append(text)
+        elif parent == current_parent:
+            # 같은 상위 섹션의 하위 섹션은 하나의 블록으로 묶음
+            blocks[-1] += f"\n\n{text}"
+        else:
+            blocks.append(f"### {parent}\n\n{text}")
+        current_parent = parent
+    return "\n\n---\n\n".join(blocks)
+
+
+def get_persona_details(content_type: str) -> str:
+    """
+    콘텐츠 유형과 관련된 섹션만 포함한 페르소나 문자열을 반환합니다.
+
+    예를 들어 이미지 콘텐츠에는 기본 프로필, 패션, 사진 스타일, 사용 가이드라인만 포함됩니다.
+    분류할 수 없는 콘텐츠 유형에는 전체 PERSONA를 반환합니다.
+
+    Args:
+        content_type: 콘텐츠 유형 (예: "블로그 글", "이미지", "소셜 미디어 포스트")
+
+    Returns:
+        str: 프롬프트에 삽입할 페르소나 문자열
+    """
+    return _build_persona_details(classify_content_type(content_type))
@@ -11,7 +11,8 @@ def get_extraction_prompt():
     """
     페르소나 추출을 위한 프롬프트 템플릿을 생성합니다.
 
-    1. 기본 페르소나 정보: 니제(NEEDZE)의 상세 프로필
+    1. 기본 페르소나 정보: 니제(NEEDZE)의 상세 프로필 중 콘텐츠 유형과 관련된 섹션
+       (persona.get_persona_details()로 선택, 예: 이미지에는 패션과 사진 스타일)
     2. 콘텐츠 유형: 생성할 콘텐츠의 형태 (예: 블로그 글, 소셜 미디어 포스트 등)
     3. 콘텐츠 주제: 생성할 콘텐츠의 주제 (예: 여름 휴가, 음식 리뷰 등)
 
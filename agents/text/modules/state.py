@@ -22,3 +22,4 @@ class TextState(TypedDict):
     response: Annotated[
         list, add_messages
     ]  # 응답 메시지 목록 (add_messages로 주석되어 메시지 추가 기능 제공)
+    model_route: dict  # 조건부 에지에서 결정한 모델 등급 (agents.model_router 참고)
@@ -1,7 +1,21 @@
 from langgraph.graph import StateGraph
+from langgraph.types import Send
 
 from agents.base_workflow import BaseWorkflow
+from agents.image.workflow import image_workflow
+from agents.main_nodes import DEFAULT_BRANCH_TIMEOUT, AgentBranchNode
 from agents.main_state import MainState
+from agents.management.workflow import management_workflow
+from agents.music.workflow import music_workflow
+from agents.text.workflow import text_workflow
+
+# 에이전트 이름 -> (에이전트 Workflow, 분기 실행에 필요한 입력 키)
+AGENT_BRANCHES = {
+    "text": (text_workflow, ("content_topic", "content_type")),
+    "image": (image_workflow, ("query",)),
+    "music": (music_workflow, ("query",)),
+    "management": (management_workflow, ("project_id", "request_type", "query")),
+}
 
 
 class MainWorkflow(BaseWorkflow):
@@ -10,14 +24,32 @@ class MainWorkflow(BaseWorkflow):
 
     Team Member는 해당 Workflow에서 따로 작업을 진행하지 않으셔도 됩니다.
     이 클래스는 모든 Agentic Workflow를 바탕으로 주요 Workflow를 정의합니다.
+
+    하나의 요청을 입력에 필요한 값이 있는 모든 에이전트 Workflow에 Send로 동시에 전달하므로,
+    전체 지연 시간은 각 분기 지연 시간의 합이 아니라 가장 느린 분기의 지연 시간이 됩니다.
+    각 분기는 제한 시간을 가지며, 제한 시간을 넘긴 분기는 agent_errors에 기록되고
+    나머지 분기의 결과만으로 응답이 완성됩니다.
+
+    예시:
+    ```python
+    # 모든 분기의 기본 제한 시간을 30초로, management 분기만 10초로 설정
+    workflow = MainWorkflow(MainState, branch_timeout=30, timeouts={"management": 10})
+
+    # text / management 에이전트만 사용
+    workflow = MainWorkflow(MainState, agents=("text", "management"))
+    ```
     """
 
-    def __init__(self, state):
+    def __init__(self, state, **options):
         """
         Args:
             state (StateGraph): Workflow에서 사용할 상태 클래스
+            **options: 그래프 빌드 옵션 (BaseWorkflow 캐시 키에 포함)
+                - agents (tuple[str]): 사용할 에이전트 이름 목록 (기본값: 전체)
+                - branch_timeout (float): 분기별 기본 제한 시간(초) (기본값: 60)
+                - timeouts (dict[str, float]): 에이전트별 제한 시간(초)
         """
-        super().__init__()
+        super().__init__(**options)
         self.state = state
 
     def build(self):
@@ -25,18 +57,62 @@ class MainWorkflow(BaseWorkflow):
         Workflow 그래프 구축 메서드
 
         StateGraph를 사용하여 Workflow 그래프를 구축합니다.
-        추후 다양한 노드를 추가하여 최종 Workflow를 구축할 예정입니다.
+        시작 노드에서 각 에이전트 분기 노드로 Send를 보내고, 모든 분기가 끝나면 종료합니다.
+        실행할 분기가 없으면 시작 노드에서 종료 노드로 바로 이동합니다.
 
         Returns:
             CompiledStateGraph: 컴파일된 상태 그래프 객체
         """
+        agents = self.options.get("agents", tuple(AGENT_BRANCHES))
+        branch_timeout = self.options.get("branch_timeout", DEFAULT_BRANCH_TIMEOUT)
+        timeouts = self.options.get("timeouts", {})
+
         builder = StateGraph(self.state)
-        # 노드 추가 예시: builder.add_node("node_name", Node())
-        builder.add_edge("__start__", "__end__")  # 시작에서 종료로 바로 연결
-        workflow = builder.compile()  # 그래프 컴파일
+        for agent in agents:
+            agent_workflow, _ = AGENT_BRANCHES[agent]
+            builder.add_node(
+                f"{agent}_agent",
+                AgentBranchNode(
+                    agent, agent_workflow, timeouts.get(agent, branch_timeout)
+                ),
+            )
+            builder.add_edge(f"{agent}_agent", "__end__")
+
+        # 시작 노드에서 입력 조건을 만족하는 에이전트 분기로 동시에 전달
+        builder.add_conditional_edges(
+            "__start__",
+            lambda state: self.dispatch(state, agents),
+            [f"{agent}_agent" for agent in agents] + ["__end__"],
+        )
+        workflow = builder.compile(checkpointer=self.checkpointer)  # 그래프 컴파일
         workflow.name = self.name  # Workflow 이름 설정
         return workflow
 
+    @staticmethod
+    def dispatch(state, agents) -> list[Send] | str:
+        """
+        입력에 필요한 값이 모두 있는 에이전트 분기로 보낼 Send 목록을 생성합니다.
+
+        각 분기에는 해당 에이전트 상태에 정의된 키만 전달하며, 응답 목록은 비워서 전달합니다.
+
+        Args:
+            state: 메인 Workflow 상태
+            agents: 사용할 에이전트 이름 목록
+
+        Returns:
+            list[Send] | str: 분기별 Send 목록 (실행할 분기가 없으면 "__end__")
+        """
+        sends = []
+        for agent in agents:
+            agent_workflow, required = AGENT_BRANCHES[agent]
+            if not all(state.get(key) for key in required):
+                continue
+            fields = agent_workflow.state.__annotations__
+            branch_input = {key: state[key] for key in fields if key in state}
+            branch_input["response"] = []
+            sends.append(Send(f"{agent}_agent", branch_input))
+        return sends or "__end__"
+
 
 # 다른 Workflow 구현 예시
 # class AnotherWorkflow(BaseWorkflow):
@@ -0,0 +1,35 @@
+"""
+벤치마크 패키지 (Benchmarks Package)
+
+이 패키지는 Act 1: Entertainment 프로젝트의 성능 측정 스크립트를 포함합니다.
+벤치마크는 pytest 수집 대상이 아니도록 `bench_*.py` 형식의 파일 이름을 사용하며,
+저장소 루트에서 모듈로 직접 실행합니다.
+
+현재 포함된 벤치마크:
+- bench_workflow_build.py: Workflow 그래프의 콜드/웜 빌드 시간 비교
+- bench_persona_batch.py: 페르소나 일괄 추출과 순차 호출의 처리량 비교
+- bench_persona_slicing.py: 콘텐츠 유형별 페르소나 슬라이싱의 토큰 절감량 (및 지연 시간) 비교
+- bench_workflows.py: 가짜 모델을 사용한 Workflow 처리량 / 꼬리 지연 시간 측정 및 기준값 회귀 검사
+  (기준값: baselines/bench_workflows.json)
+- bench_import_time.py: 패키지 임포트, langgraph dev 그래프 로드, pytest 수집 시간 측정
+- bench_checkpoint.py: 체크포인터 / durability 설정별 단계당 체크포인트 쓰기 비용 측정
+- bench_message_memory.py: 응답 목록 리듀서별 긴 대화의 상태 메모리 / 체크포인트 직렬화 크기 비교
+- bench_hedging.py: 제공자 꼬리 지연 시간에서 헤징 유무별 지연 시간 분위수 / 추가 요청 비율 비교
+- bench_resource_plan.py: 리소스 계획 산문 / 구조화 출력 모드의 응답 시간과 출력 토큰 수 비교
+- bench_resource_index.py: 예약 수별 구간 인덱스와 전체 탐색의 겹치는 예약 / 가용 리소스 / 빈 시간대 검색 시간 비교
+- bench_project_schedule.py: 배열 기반 일정 엔진과 객체 기반 구현의 주 공정 / 증분 계산 / 리소스 평준화 / 요약 시간 비교
+- bench_role_assignment.py: 팀 규모별 적합도 행렬 / 헝가리안 배정 시간과 탐욕 배정 대비 총 적합도 비교
+- bench_image_index.py: 프로세스 수별 이미지 메타데이터 사이드카 색인 처리량과 전체 디코딩 / 재색인 시간 비교
+- bench_image_resize.py: draft 디코딩 + backpressure 프로세스 풀 파이프라인과 단순 구현 / 일괄 제출의 리사이즈 처리량 / 최대 RSS 비교
+- bench_image_duplicates.py: 다중 인덱스 해싱 / NumPy 전체 탐색 / Python 반복문의 해밍 거리별 중복 검색 지연 시간과 pHash / dHash 계산 시간 비교
+- bench_image_artifacts.py: 아티팩트 저장소 캐시 적중 시 mmap / read() 읽기 지연 시간과 메모리 증가량, 동시 요청의 생성 횟수 비교
+- bench_audio_analysis.py: 곡 길이별 mmap 블록 단위 오디오 분석과 전체 읽기 STFT의 처리 시간 / 실시간 대비 속도 / 최대 RSS 비교
+
+공통 도구:
+- fake_llm.py: API 호출 없이 지연 시간 분포와 출력 길이를 재현하는 결정적 가짜 채팅 모델
+
+벤치마크 실행 방법:
+```bash
+python -m tests.benchmarks.bench_workflow_build
+```
+"""
@@ -0,0 +1,105 @@
+"""
+오디오 분석 벤치마크
+
+임시 디렉토리에 --minutes 길이별 스테레오 16비트 44.1 kHz WAV(화음 + 128 BPM 타격음)를 블록 단위로 만들고,
+각 길이를 새 프로세스에서 두 가지 방식으로 분석할 때의 처리 시간, 실시간 대비 속도, 최대 RSS를 비교합니다.
+
+- full: 파일 전체를 읽어 모노 변환 후 모든 STFT 프레임을 한 번에 계산 (--full-max-minutes 이하만)
+- blocks: extract_features (mmap, 블록 단위, 처리한 페이지 반환)
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_audio_analysis
+python -m tests.benchmarks.bench_audio_analysis --minutes 1 10 60
+```
+"""
+
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from agents.music.modules.analysis import extract_features, read_wav_info
+
+RATE = 44100
+
+
+def generate(path: Path, minutes: float) -> None:
+    """화음 위에 128 BPM 잡음 타격음을 더한 WAV를 10초 단위로 기록합니다."""
+    rng = np.random.default_rng(0)
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(2)
+        file.setsampwidth(2)
+        file.setframerate(RATE)
+        for start in range(0, int(RATE * minutes * 60), RATE * 10):
+            t = (start + np.arange(RATE * 10)) / RATE
+            chord = sum(np.sin(2 * np.pi * f * t) for f in (220.0, 277.18, 329.63))
+            signal = chord / 3 * 0.3
+            signal += np.exp(-(t % (60 / 128)) * 30) * rng.standard_normal(len(t)) * 0.5
+            frames = np.repeat(np.clip(signal, -1, 1)[:, None], 2, axis=1)
+            file.writeframes((frames * 32767).astype("<i2").tobytes())
+
+
+def _full(path: str) -> float:
+    """전체를 메모리에 읽어 한 번에 STFT합니다. (특징 하나만 계산)"""
+    info = read_wav_info(path)
+    raw = np.fromfile(path, np.int16, offset=info.data_offset)
+    samples = raw.reshape(-1, info.channels).mean(axis=1).astype(np.float32) / 32768
+    frames = np.lib.stride_tricks.sliding_window_view(samples, 2048)[::512]
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(2048).astype(np.float32), axis=1))
+    freqs = np.fft.rfftfreq(2048, 1 / info.sample_rate)
+    return float((spectrum @ freqs / (spectrum.sum(axis=1) + 1e-12)).mean())
+
+
+def _measure(mode: str, path: str) -> tuple[float, float]:
+    """방식 하나를 실행하고 (초, 최대 RSS MB)를 반환합니다."""
+    start = time.perf_counter()
+    _full(path) if mode == "full" else extract_features(path)
+    seconds = time.perf_counter() - start
+    return seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--minutes", type=float, nargs="+", default=[1, 5, 20], help="곡 길이 (분)"
+    )
+    parser.add_argument(
+        "--full-max-minutes",
+        type=float,
+        default=5,
+        help="full 방식을 측정할 최대 길이 (분)",
+    )
+    args = parser.parse_args()
+
+    # 측정마다 새 프로세스에서 최대 RSS 측정
+    context = multiprocessing.get_context("spawn")
+    print(
+        f"{'minutes':>8}{'file (MB)':>11}{'mode':>8}{'seconds':>9}{'x realtime':>12}{'max RSS (MB)':>14}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for minutes in args.minutes:
+            path = Path(directory) / f"track-{minutes}.wav"
+            generate(path, minutes)
+            size_mb = path.stat().st_size / 1e6
+            modes = (
+                ["full", "blocks"] if minutes <= args.full_max_minutes else ["blocks"]
+            )
+            for mode in modes:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as runner:
+                    seconds, rss = runner.submit(_measure, mode, str(path)).result()
+                print(
+                    f"{minutes:>8g}{size_mb:>11.0f}{mode:>8}{seconds:>9.1f}"
+                    f"{minutes * 60 / seconds:>12.0f}{rss:>14.0f}"
+                )
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
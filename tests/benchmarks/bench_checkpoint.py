@@ -0,0 +1,112 @@
+"""
+체크포인트 쓰기 비용 벤치마크
+
+--steps개의 노드가 순서대로 실행되는 그래프를 체크포인터 설정별로 --runs회 실행하여
+노드(단계)당 실행 시간과 체크포인트가 없는 경우 대비 추가 비용을 측정합니다.
+각 노드는 응답 메시지를 하나씩 추가하므로, 뒤쪽 단계일수록 저장할 상태가 커집니다.
+
+비교 대상:
+- none: 체크포인트 없음 (기준)
+- memory: InMemorySaver
+- sqlite normal / full: LocalCheckpointer (synchronous=NORMAL / FULL)
+- durability: sync(노드마다 저장 완료 후 진행), async(저장과 다음 노드 동시 진행), exit(종료 시 한 번 저장)
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_checkpoint
+python -m tests.benchmarks.bench_checkpoint --steps 20 --runs 50 --message-size 2000
+```
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Annotated, TypedDict
+
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+
+from agents.checkpoint import LocalCheckpointer
+
+
+class BenchState(TypedDict):
+    response: Annotated[list, add_messages]
+
+
+def build_graph(steps: int, message_size: int, checkpointer):
+    """steps개의 노드가 순서대로 실행되는 그래프를 생성합니다."""
+    text = "가" * message_size
+
+    def step(state) -> dict:
+        return {"response": [AIMessage(content=text)]}
+
+    builder = StateGraph(BenchState)
+    previous = "__start__"
+    for index in range(steps):
+        builder.add_node(f"step_{index}", step)
+        builder.add_edge(previous, f"step_{index}")
+        previous = f"step_{index}"
+    builder.add_edge(previous, "__end__")
+    return builder.compile(checkpointer=checkpointer)
+
+
+def measure(graph, runs: int, durability: str | None) -> list[float]:
+    """그래프를 runs회 실행하고 실행별 소요 시간(초)을 반환합니다."""
+    kwargs = {"durability": durability} if durability else {}
+    timings = []
+    for run in range(runs):
+        config = {"configurable": {"thread_id": f"run-{run}"}}
+        start = time.perf_counter()
+        graph.invoke({"response": []}, config, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=10, help="그래프 노드 수")
+    parser.add_argument("--runs", type=int, default=30, help="설정별 실행 횟수")
+    parser.add_argument(
+        "--message-size", type=int, default=500, help="노드별 응답 메시지 길이 (문자)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        normal = LocalCheckpointer.open(Path(directory) / "normal.sqlite")
+        full = LocalCheckpointer.open(Path(directory) / "full.sqlite")
+        full.conn.execute("PRAGMA synchronous=FULL")
+
+        # 설정 이름 -> (체크포인터, durability)
+        scenarios = {
+            "none": (None, None),
+            "memory (sync)": (InMemorySaver(), "sync"),
+            "sqlite normal (sync)": (normal, "sync"),
+            "sqlite normal (async)": (normal, "async"),
+            "sqlite normal (exit)": (normal, "exit"),
+            "sqlite full (sync)": (full, "sync"),
+        }
+
+        print(f"steps={args.steps} runs={args.runs} message_size={args.message_size}\n")
+        print(f"{'scenario':<26}{'per step (ms)':>15}{'overhead (ms)':>15}")
+        baseline = None
+        for name, (checkpointer, durability) in scenarios.items():
+            graph = build_graph(args.steps, args.message_size, checkpointer)
+            measure(graph, 2, durability)  # 워밍업
+            per_step = (
+                statistics.median(measure(graph, args.runs, durability))
+                / args.steps
+                * 1000
+            )
+            baseline = per_step if baseline is None else baseline
+            print(f"{name:<26}{per_step:>15.3f}{per_step - baseline:>15.3f}")
+
+        normal.conn.close()
+        full.conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+요청 헤징 벤치마크
+
+대부분은 빠르지만 일부가 매우 느린 제공자 응답을 흉내 내어, 헤징 유무에 따른 지연 시간 분위수와
+추가 요청 비율(추가 비용)을 비교합니다.
+
+FakeChatModel은 같은 프롬프트에 항상 같은 지연 시간을 쓰므로 추가 요청도 똑같이 느립니다.
+이 벤치마크는 요청마다 지연 시간을 새로 뽑는 가짜 호출을 사용합니다.
+- 지연 시간: 중앙값 --latency, 로그 표준편차 --spread인 로그정규 분포
+- --slow-rate 비율의 요청은 추가로 --slow-latency초 지연
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_hedging
+python -m tests.benchmarks.bench_hedging --calls 5000 --percentile 0.9 --budget 0.1
+```
+
+추가 요청 예산은 (1 - percentile) + 느린 요청 비율보다 커야 느린 요청을 대부분 헤징할 수 있습니다.
+예산이 부족하면 분위수를 넘은 평범한 요청이 예산을 먼저 써 버려 p99가 줄지 않습니다.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from agents.hedging import HedgePolicy
+
+
+def percentile(values: list[float], q: float) -> float:
+    """정렬된 값 목록의 분위수를 반환합니다."""
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run(policy: HedgePolicy, args, seed: int) -> tuple[list[float], dict]:
+    """정책으로 --calls회 호출하고 (정렬된 지연 시간 목록, 정책 통계)를 반환합니다."""
+    rng = random.Random(seed)
+    requests = 0
+
+    async def call():
+        nonlocal requests
+        requests += 1
+        delay = rng.lognormvariate(0, args.spread) * args.latency
+        if rng.random() < args.slow_rate:
+            delay += args.slow_latency
+        await asyncio.sleep(delay)
+        return delay
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await policy.arun(call)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one() for _ in range(args.calls)))
+    return sorted(latencies), {**policy.stats(), "requests": requests}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000, help="호출 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 호출 수")
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="지연 시간 중앙값 (초)"
+    )
+    parser.add_argument("--spread", type=float, default=0.3, help="로그 표준편차")
+    parser.add_argument("--slow-rate", type=float, default=0.02, help="느린 요청 비율")
+    parser.add_argument(
+        "--slow-latency", type=float, default=0.5, help="느린 요청 추가 지연 (초)"
+    )
+    parser.add_argument("--percentile", type=float, default=0.95, help="헤징 분위")
+    parser.add_argument(
+        "--budget", type=float, default=0.05, help="추가 요청 예산 비율"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'mode':<12}{'p50 (ms)':>10}{'p95 (ms)':>10}{'p99 (ms)':>10}"
+        f"{'max (ms)':>10}{'requests':>10}{'extra':>8}"
+    )
+    for name, enabled in (("baseline", False), ("hedged", True)):
+        policy = HedgePolicy(
+            f"bench_{name}",
+            percentile=args.percentile,
+            budget=args.budget,
+            enabled=enabled,
+        )
+        latencies, stats = await run(policy, args, seed=7)
+        extra = stats["requests"] / args.calls - 1
+        print(
+            f"{name:<12}{percentile(latencies, 0.5) * 1000:>10.1f}"
+            f"{percentile(latencies, 0.95) * 1000:>10.1f}"
+            f"{percentile(latencies, 0.99) * 1000:>10.1f}"
+            f"{latencies[-1] * 1000:>10.1f}{stats['requests']:>10}{extra:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""
+이미지 아티팩트 저장소 벤치마크
+
+임시 디렉토리의 ArtifactStore에 --artifacts개의 --size-mb 크기 아티팩트를 저장하고,
+캐시 적중 시 읽기 지연 시간과 프로세스 메모리 증가량을 mmap(ArtifactStore.get)과 전체 읽기(read())로 비교합니다.
+같은 요청 --requests개를 동시에 보낼 때 생성 횟수와, 용량을 넘겨 저장할 때의 LRU 삭제 수도 측정합니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_image_artifacts
+python -m tests.benchmarks.bench_image_artifacts --artifacts 50 --size-mb 16
+```
+"""
+
+import argparse
+import resource
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from agents.image.modules.artifacts import ArtifactStore, artifact_key
+
+
+def _rss_mb() -> float:
+    """현재 프로세스의 최대 RSS(MB)를 반환합니다."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--artifacts", type=int, default=20, help="아티팩트 수")
+    parser.add_argument("--size-mb", type=int, default=8, help="아티팩트 크기 (MB)")
+    parser.add_argument("--requests", type=int, default=16, help="동시 요청 수")
+    args = parser.parse_args()
+    size = args.size_mb * 1024**2
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ArtifactStore(directory, max_bytes=args.artifacts * size)
+        keys = [
+            artifact_key(f"poster {i}", size="4096x4096") for i in range(args.artifacts)
+        ]
+        for i, key in enumerate(keys):
+            store.put(key, bytes([i % 256]) * size)
+        print(f"artifacts: {args.artifacts} x {args.size_mb} MB")
+
+        def held_reads(read) -> tuple[float, float]:
+            """모든 아티팩트를 읽어 보관하면서 (읽기 지연 중앙값 us, 최대 RSS 증가량 MB)를 반환합니다."""
+            before, held, elapsed = _rss_mb(), [], []
+            for key in keys:
+                start = time.perf_counter()
+                held.append(read(key))
+                elapsed.append(time.perf_counter() - start)
+            return statistics.median(elapsed) * 1e6, _rss_mb() - before
+
+        def read_copy(key: str) -> bytes:
+            with open(store._path(key), "rb") as file:
+                return file.read()
+
+        print(f"{'read':<8}{'latency (us)':>14}{'RSS growth (MB)':>17}")
+        # mmap 먼저 (최대 RSS는 감소하지 않음)
+        for name, read in (("mmap", store.get), ("read()", read_copy)):
+            latency, growth = held_reads(read)
+            print(f"{name:<8}{latency:>14.0f}{growth:>17.0f}")
+
+        calls = []
+
+        def generate() -> bytes:
+            calls.append(1)
+            time.sleep(0.2)  # 이미지 생성 대기
+            return b"\x00" * size
+
+        key = artifact_key("겨울 포스터", size="4096x4096")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.requests) as executor:
+            list(
+                executor.map(
+                    lambda _: store.get_or_create(key, generate), range(args.requests)
+                )
+            )
+        print(
+            f"concurrent requests: {args.requests}, generations: {len(calls)}, "
+            f"{time.perf_counter() - start:.2f} s, artifacts after LRU eviction: {len(store)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+이미지 중복 검사 벤치마크
+
+--hashes개의 무작위 64비트 해시(질의마다 거리 1~8인 근접 해시 포함)로 HashIndex를 만들고,
+최대 해밍 거리별 질의 지연 시간을 다중 인덱스 검색, NumPy 전체 탐색, Python 반복문 전체 탐색으로 비교합니다.
+(Python 반복문은 --loop-queries개 질의로만 측정) 조각 배열 생성 시간과 이미지당 해시 계산 시간도 측정합니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_image_duplicates
+python -m tests.benchmarks.bench_image_duplicates --hashes 5000000 --queries 500
+```
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from agents.image.modules.duplicates import HashIndex, hash_image
+
+
+def generate(count: int, queries: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """무작위 해시와 질의 해시를 생성하고, 질의마다 거리 1~8인 해시를 심습니다."""
+    rng = np.random.default_rng(seed)
+    hashes = rng.integers(0, 2**64, count, dtype=np.uint64)
+    targets = rng.integers(0, 2**64, queries, dtype=np.uint64)
+    positions = rng.choice(count, queries * 8, replace=False).reshape(queries, 8)
+    for query, slots in zip(targets, positions):
+        for distance, position in enumerate(slots, start=1):
+            bits = rng.choice(64, distance, replace=False).astype(np.uint64)
+            hashes[position] = query ^ np.bitwise_or.reduce(np.uint64(1) << bits)
+    return hashes, targets
+
+
+def latency_us(fn, queries: np.ndarray) -> float:
+    """질의별 fn(query) 실행 시간의 중앙값(마이크로초)을 반환합니다."""
+    elapsed = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        elapsed.append(time.perf_counter() - start)
+    return statistics.median(elapsed) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hashes", type=int, default=1_000_000, help="인덱스 해시 수")
+    parser.add_argument("--queries", type=int, default=200, help="질의 수")
+    parser.add_argument(
+        "--loop-queries", type=int, default=3, help="Python 반복문 측정 질의 수"
+    )
+    parser.add_argument(
+        "--images", type=int, default=50, help="해시 계산 시간 측정 이미지 수"
+    )
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    args = parser.parse_args()
+
+    hashes, queries = generate(args.hashes, args.queries, args.seed)
+    ids = [f"asset-{i}" for i in range(args.hashes)]
+
+    start = time.perf_counter()
+    index = HashIndex(ids, hashes)
+    index.query(0, 0)  # 조각 배열 생성
+    print(f"hashes: {args.hashes}, build: {time.perf_counter() - start:.2f} s")
+
+    as_ints = hashes.tolist()
+
+    def loop_scan(query, max_distance):
+        query = int(query)
+        return [
+            (ids[i], d)
+            for i, h in enumerate(as_ints)
+            if (d := (h ^ query).bit_count()) <= max_distance
+        ]
+
+    def numpy_scan(query, max_distance):
+        distances = np.bitwise_count(hashes ^ query)
+        return np.flatnonzero(distances <= max_distance)
+
+    print(
+        f"{'distance':>9}{'matches':>9}{'index (us)':>12}{'numpy scan (us)':>17}{'loop scan (us)':>16}"
+    )
+    for max_distance in (0, 3, 6, 8, 11):
+        matches = statistics.mean(
+            len(index.query(int(q), max_distance)) for q in queries
+        )
+        indexed = latency_us(lambda q, r=max_distance: index.query(int(q), r), queries)
+        scanned = latency_us(lambda q, r=max_distance: numpy_scan(q, r), queries)
+        looped = latency_us(
+            lambda q, r=max_distance: loop_scan(q, r), queries[: args.loop_queries]
+        )
+        print(
+            f"{max_distance:>9}{matches:>9.1f}{indexed:>12.0f}{scanned:>17.0f}{looped:>16.0f}"
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "image.jpg"
+        Image.linear_gradient("L").resize((3000, 2000)).convert("RGB").save(path)
+        for method in ("phash", "dhash"):
+            start = time.perf_counter()
+            for _ in range(args.images):
+                hash_image(path, method)
+            per_image = (time.perf_counter() - start) / args.images * 1000
+            print(f"{method} (3000px JPEG): {per_image:.1f} ms/image")
+
+
+if __name__ == "__main__":
+    main()
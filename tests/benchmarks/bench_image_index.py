@@ -0,0 +1,119 @@
+"""
+이미지 메타데이터 색인 벤치마크
+
+임시 디렉토리에 --files개의 이미지(JPEG / PNG / WebP, --size 픽셀)를 생성하고,
+프로세스 수(--workers)별로 새 사이드카 색인을 만들 때의 초당 처리 파일 수를 측정합니다.
+픽셀까지 디코딩하는 단일 프로세스 방식(Image.open + load)과, 변경이 없을 때 다시 색인하는 시간도 측정합니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_image_index
+python -m tests.benchmarks.bench_image_index --files 20000 --workers 1 2 4 8 16
+```
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from agents.image.modules.metadata_index import ImageMetadataIndex
+
+FORMATS = ("jpg", "png", "webp")
+
+
+def _write(args: tuple[str, int, int, int]) -> None:
+    """그라디언트 이미지 하나를 저장합니다. (생성 작업 함수)"""
+    path, size, seed, _ = args
+    rng = random.Random(seed)
+    image = Image.linear_gradient("L").resize((size, size * 3 // 4)).convert("RGB")
+    image = Image.eval(image, lambda value: (value + rng.randint(0, 255)) % 256)
+    image.save(path, quality=85)
+
+
+def generate(root: Path, files: int, size: int, seed: int) -> None:
+    """이미지 files개를 하위 디렉토리 100개에 나눠 생성합니다."""
+    jobs = []
+    for i in range(files):
+        directory = root / f"dir-{i % 100:02d}"
+        directory.mkdir(exist_ok=True)
+        jobs.append(
+            (
+                str(directory / f"image-{i}.{FORMATS[i % len(FORMATS)]}"),
+                size,
+                seed + i,
+                i,
+            )
+        )
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_write, jobs, chunksize=64))
+
+
+def full_decode(root: Path, limit: int) -> float:
+    """픽셀까지 디코딩하여 메타데이터를 읽을 때의 초당 처리 파일 수를 반환합니다. (단일 프로세스)"""
+    paths = sorted(root.rglob("image-*"))[:limit]
+    start = time.perf_counter()
+    for path in paths:
+        with Image.open(path) as image:
+            image.load()
+            _ = (image.format, image.mode, image.size)
+    return len(paths) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=6000, help="이미지 파일 수")
+    parser.add_argument("--size", type=int, default=1024, help="이미지 너비 (픽셀)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="측정할 프로세스 수 목록",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=256, help="작업 하나에 묶는 파일 수"
+    )
+    parser.add_argument(
+        "--decode-sample", type=int, default=300, help="전체 디코딩 측정 파일 수"
+    )
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory) / "assets"
+        root.mkdir()
+        start = time.perf_counter()
+        generate(root, args.files, args.size, args.seed)
+        total_mb = sum(path.stat().st_size for path in root.rglob("image-*")) / 1e6
+        print(
+            f"files: {args.files}, {total_mb:.0f} MB, "
+            f"generated in {time.perf_counter() - start:.1f} s"
+        )
+        print(
+            f"full decode (1 process): {full_decode(root, args.decode_sample):>10.0f} files/s"
+        )
+
+        print(f"{'workers':>8}{'files/s':>12}{'seconds':>10}")
+        for workers in args.workers:
+            index_path = Path(directory) / f"index-{workers}.sqlite"
+            with ImageMetadataIndex(root, index_path) as index:
+                stats = index.update(workers=workers, chunk_size=args.chunk_size)
+                assert stats.extracted == args.files and stats.failed == 0
+            print(f"{workers:>8}{stats.files_per_second:>12.0f}{stats.seconds:>10.2f}")
+
+        with ImageMetadataIndex(root, index_path) as index:
+            stats = index.update(workers=args.workers[-1])
+        print(
+            f"re-index without changes: {stats.seconds * 1000:.0f} ms "
+            f"({stats.unchanged} unchanged, {stats.extracted} read)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+이미지 일괄 리사이즈 벤치마크
+
+임시 디렉토리에 --files개의 JPEG(--width 픽셀, 서로 다른 --templates개를 복사)을 만들고,
+세 가지 방식으로 --sizes 출력 크기를 모두 생성할 때의 처리량(files/s)과 최대 RSS를 비교합니다.
+
+- naive: 단일 프로세스에서 파일 목록 전체를 먼저 만들고, 전체 디코딩 후 크기마다 원본에서 리사이즈
+- submit-all: draft 디코딩 + 프로세스 풀이지만, 모든 파일을 한 번에 제출 (backpressure 없음)
+- pipeline: resize_directory (draft 디코딩, 프로세스 풀, 처리 중인 작업 수 제한)
+
+각 방식은 새 프로세스에서 실행하며, 최대 RSS는 그 프로세스(parent)와 작업 프로세스 중 가장 큰 값(worker)입니다.
+naive는 --naive-sample개 파일로만 측정합니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_image_resize
+python -m tests.benchmarks.bench_image_resize --files 2000 --workers 8
+```
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from agents.image.modules.metadata_index import walk_images
+from agents.image.modules.resize import _resize_one, fit_size, resize_directory
+
+
+def generate(root: Path, files: int, templates: int, width: int) -> None:
+    """서로 다른 JPEG templates개를 만들고 files개가 될 때까지 하위 디렉토리 100개에 복사합니다."""
+    sources = []
+    for i in range(templates):
+        path = root / f"template-{i}.jpg"
+        image = Image.linear_gradient("L").resize((width, width * 3 // 4))
+        image = Image.merge("RGB", (image, image.rotate(90 * i), image.transpose(0)))
+        image.save(path, quality=90)
+        sources.append(path)
+    for i in range(files):
+        directory = root / f"dir-{i % 100:02d}"
+        directory.mkdir(exist_ok=True)
+        shutil.copyfile(sources[i % templates], directory / f"image-{i}.jpg")
+    for path in sources:
+        path.unlink()
+
+
+def _naive(root: str, output_dir: str, sizes: dict, limit: int, _: int) -> int:
+    """전체 디코딩 후 크기마다 원본에서 리사이즈합니다."""
+    paths = [os.path.join(root, path) for path, _, _ in walk_images(root)][:limit]
+    os.makedirs(output_dir, exist_ok=True)
+    for path in paths:
+        with Image.open(path) as img:
+            img.load()
+            stem = os.path.join(output_dir, os.path.basename(path))
+            for name, box in sizes.items():
+                img.resize(fit_size(img.size, box), Image.Resampling.LANCZOS).save(
+                    f"{stem}_{name}.jpg", quality=85
+                )
+    return len(paths)
+
+
+def _submit_all(
+    root: str, output_dir: str, sizes: dict, limit: int, workers: int
+) -> int:
+    """모든 파일을 한 번에 프로세스 풀에 제출합니다."""
+    paths = [os.path.join(root, path) for path, _, _ in walk_images(root)][:limit]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _resize_one,
+                path,
+                os.path.join(output_dir, os.path.relpath(path, root)),
+                sizes,
+                "JPEG",
+                85,
+            )
+            for path in paths
+        ]
+        return sum(1 for future in futures if not future.result().error)
+
+
+def _pipeline(root: str, output_dir: str, sizes: dict, limit: int, workers: int) -> int:
+    """resize_directory로 처리합니다."""
+    return sum(
+        1
+        for result in resize_directory(root, output_dir, sizes, workers=workers)
+        if not result.error
+    )
+
+
+def _measure(mode: str, *args) -> tuple[int, float, float, float]:
+    """방식 하나를 실행하고 (파일 수, 초, parent 최대 RSS MB, worker 최대 RSS MB)를 반환합니다."""
+    start = time.perf_counter()
+    run = {"naive": _naive, "submit-all": _submit_all, "pipeline": _pipeline}[mode]
+    count = run(*args)
+    seconds = time.perf_counter() - start
+    parent = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    worker = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return count, seconds, parent, worker
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=10_000, help="이미지 파일 수")
+    parser.add_argument("--templates", type=int, default=16, help="서로 다른 이미지 수")
+    parser.add_argument(
+        "--width", type=int, default=3000, help="원본 이미지 너비 (픽셀)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="프로세스 수"
+    )
+    parser.add_argument(
+        "--naive-sample", type=int, default=200, help="naive 방식 측정 파일 수"
+    )
+    args = parser.parse_args()
+    sizes = {"thumb": (256, 256), "preview": (1024, 1024)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory) / "assets"
+        root.mkdir()
+        generate(root, args.files, args.templates, args.width)
+        total_mb = sum(path.stat().st_size for path in root.rglob("*.jpg")) / 1e6
+        print(
+            f"files: {args.files} ({args.width}px JPEG, {total_mb:.0f} MB), sizes: {sizes}"
+        )
+        print(
+            f"{'mode':<12}{'files':>7}{'files/s':>10}{'parent RSS (MB)':>17}{'worker RSS (MB)':>17}"
+        )
+
+        # 방식마다 새 프로세스에서 최대 RSS 측정
+        context = multiprocessing.get_context("spawn")
+        for mode, limit in (
+            ("naive", args.naive_sample),
+            ("submit-all", args.files),
+            ("pipeline", args.files),
+        ):
+            output_dir = Path(directory) / f"out-{mode}"
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as runner:
+                count, seconds, parent, worker = runner.submit(
+                    _measure,
+                    mode,
+                    str(root),
+                    str(output_dir),
+                    sizes,
+                    limit,
+                    args.workers,
+                ).result()
+            shutil.rmtree(output_dir)
+            worker_rss = f"{worker:.0f}" if mode != "naive" else "-"
+            print(
+                f"{mode:<12}{count:>7}{count / seconds:>10.1f}{parent:>17.0f}{worker_rss:>17}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+임포트 / 시작 시간 벤치마크
+
+매 측정마다 새 파이썬 인터프리터를 실행하여 다음 시나리오의 소요 시간을 측정합니다.
+- import agents: 패키지 임포트
+- from agents import main_workflow: 메인 Workflow 모듈 임포트
+- langgraph dev 그래프 로드: langgraph.json의 모든 그래프 모듈을 임포트하고 그래프를 빌드
+- pytest 수집: `pytest --collect-only`로 단위 테스트 수집
+
+각 시나리오에서 langchain_openai가 임포트되었는지도 함께 표시하여,
+LLM 클라이언트가 첫 실행 전까지 지연 로딩되는지 확인할 수 있습니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_import_time --repeat 5
+python -m tests.benchmarks.bench_import_time --top 15  # 가장 느린 임포트 모듈 출력
+```
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# 시나리오 이름 -> 자식 인터프리터에서 실행할 코드
+SCENARIOS = {
+    "import agents": "import agents",
+    "from agents import main_workflow": "from agents import main_workflow",
+    "langgraph dev graph load": """
+import importlib.util, json
+graphs = json.load(open("langgraph.json"))["graphs"]
+for index, target in enumerate(graphs.values()):
+    path, attr = target.split(":")
+    spec = importlib.util.spec_from_file_location(f"graph_{index}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    getattr(module, attr)()  # BaseWorkflow는 호출 시 그래프를 빌드
+""",
+}
+
+# 자식 인터프리터에서 측정 코드를 감싸는 템플릿
+_TEMPLATE = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "openai": "langchain_openai" in sys.modules}}))
+"""
+
+
+def _env() -> dict:
+    """자식 프로세스 환경변수를 구성합니다."""
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT), env.get("PYTHONPATH")])
+    )
+    return env
+
+
+def run_scenario(code: str) -> tuple[float, bool]:
+    """새 인터프리터에서 코드를 실행하고 (소요 시간(초), langchain_openai 임포트 여부)를 반환합니다."""
+    output = subprocess.run(
+        [sys.executable, "-c", _TEMPLATE.format(code=code)],
+        cwd=ROOT,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["elapsed"], result["openai"]
+
+
+def run_collection() -> float:
+    """pytest 단위 테스트 수집 시간(프로세스 전체 실행 시간, 초)을 반환합니다."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "tests/unit_tests"],
+        cwd=ROOT,
+        env=_env(),
+        capture_output=True,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def print_top_imports(code: str, top: int) -> None:
+    """-X importtime 결과에서 누적 시간이 가장 긴 모듈을 출력합니다."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        rows.append((int(cumulative), name.strip()))
+    print(f"\n`{code}` 누적 임포트 시간 상위 {top}개 모듈")
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative / 1000:>10.1f} ms  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="시나리오별 반복 횟수")
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=0,
+        help="가장 느린 임포트 모듈 출력 개수 (0이면 생략)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'scenario':<36}{'median (ms)':>14}{'min (ms)':>12}{'openai':>9}")
+    for name, code in SCENARIOS.items():
+        results = [run_scenario(code) for _ in range(args.repeat)]
+        timings = [elapsed * 1000 for elapsed, _ in results]
+        print(
+            f"{name:<36}{statistics.median(timings):>14.1f}{min(timings):>12.1f}"
+            f"{'yes' if results[-1][1] else 'no':>9}"
+        )
+
+    timings = [run_collection() * 1000 for _ in range(args.repeat)]
+    print(
+        f"{'pytest --collect-only':<36}"
+        f"{statistics.median(timings):>14.1f}{min(timings):>12.1f}{'-':>9}"
+    )
+
+    if args.top:
+        print_top_imports(SCENARIOS["from agents import main_workflow"], args.top)
+
+
+if __name__ == "__main__":
+    main()
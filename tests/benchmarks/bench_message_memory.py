@@ -0,0 +1,86 @@
+"""
+응답 목록 리듀서 메모리 / 직렬화 크기 벤치마크
+
+한 스레드에서 --turns회 대화(사용자 메시지 + 응답 메시지)가 이어지는 상황을 리듀서별로 재현하여
+다음 값을 측정합니다.
+- messages: 마지막 턴의 응답 목록 메시지 수
+- memory (KB): 마지막 턴의 응답 목록이 점유하는 메모리 (tracemalloc 기준)
+- last state (KB): 마지막 턴의 응답 목록 직렬화 크기 (체크포인트 1회 저장 크기)
+- total written (MB): 모든 턴의 직렬화 크기 합계 (체크포인트 누적 쓰기량)
+- per turn (ms): 턴당 리듀서 실행 + 직렬화 시간
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_message_memory
+python -m tests.benchmarks.bench_message_memory --turns 1000 --words 300
+```
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.graph.message import add_messages
+
+from agents.reducers import bounded_messages
+
+# 리듀서 이름 -> 리듀서
+REDUCERS = {
+    "add_messages": add_messages,
+    "trim (50 messages)": bounded_messages(50),
+    "summarize (50 messages)": bounded_messages(50, strategy="summarize"),
+    "summarize (4k tokens)": bounded_messages(max_tokens=4000, strategy="summarize"),
+}
+
+
+def run_thread(reducer, turns: int, words: int) -> dict:
+    """리듀서로 turns회 대화를 누적하고 측정값을 반환합니다."""
+    serde = JsonPlusSerializer()
+    answer = " ".join(f"단어{index}" for index in range(words))
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    messages, written, elapsed = [], 0, 0.0
+    for turn in range(turns):
+        update = [HumanMessage(f"질문 {turn}"), AIMessage(f"{turn}: {answer}")]
+        start = time.perf_counter()
+        messages = reducer(messages, update)
+        _, data = serde.dumps_typed(messages)  # 체크포인트 저장과 같은 직렬화
+        elapsed += time.perf_counter() - start
+        written += len(data)
+    memory = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    return {
+        "messages": len(messages),
+        "memory_kb": memory / 1024,
+        "last_kb": len(data) / 1024,
+        "written_mb": written / 1024 / 1024,
+        "per_turn_ms": elapsed / turns * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=1000, help="대화 턴 수")
+    parser.add_argument("--words", type=int, default=200, help="응답 메시지 단어 수")
+    args = parser.parse_args()
+
+    print(f"turns={args.turns} words={args.words}\n")
+    print(
+        f"{'reducer':<26}{'messages':>10}{'memory (KB)':>13}"
+        f"{'last state (KB)':>17}{'total written (MB)':>20}{'per turn (ms)':>15}"
+    )
+    for name, reducer in REDUCERS.items():
+        result = run_thread(reducer, args.turns, args.words)
+        print(
+            f"{name:<26}{result['messages']:>10}{result['memory_kb']:>13.1f}"
+            f"{result['last_kb']:>17.1f}{result['written_mb']:>20.1f}"
+            f"{result['per_turn_ms']:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
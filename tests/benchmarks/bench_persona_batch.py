@@ -0,0 +1,87 @@
+"""
+페르소나 일괄 추출 벤치마크
+
+abatch_extract_personas()의 처리량을 항목을 하나씩 순서대로 호출하는 루프와 비교합니다.
+실제 API 대신 고정 지연 시간을 가진 FakeChatModel을 사용하므로,
+결과는 네트워크 대기 시간이 지배적인 상황에서의 동시 실행 효과를 보여줍니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_persona_batch --items 200 --latency 0.05
+```
+"""
+
+import argparse
+import asyncio
+import time
+
+from agents.text.modules.batch import abatch_extract_personas
+from agents.text.modules.chains import set_extraction_chain
+from tests.benchmarks.fake_llm import FakeChatModel
+
+CONTENT_TYPES = ["블로그 글", "소셜 미디어 포스트", "이미지", "음악", "가사"]
+
+
+def make_pairs(count: int) -> list[tuple[str, str]]:
+    """벤치마크용 (content_topic, content_type) 쌍을 생성합니다."""
+    return [
+        (f"캠페인 주제 {index}", CONTENT_TYPES[index % len(CONTENT_TYPES)])
+        for index in range(count)
+    ]
+
+
+async def run_sequential(chain, pairs) -> float:
+    """항목을 하나씩 순서대로 호출하고 소요 시간(초)을 반환합니다."""
+    start = time.perf_counter()
+    for content_topic, content_type in pairs:
+        await chain.ainvoke(
+            {
+                "content_topic": content_topic,
+                "content_type": content_type,
+            }
+        )
+    return time.perf_counter() - start
+
+
+async def run_batch(chain, pairs, max_concurrency: int) -> float:
+    """일괄 추출 API를 호출하고 소요 시간(초)을 반환합니다."""
+    start = time.perf_counter()
+    results = await abatch_extract_personas(
+        pairs, max_concurrency=max_concurrency, chain=chain
+    )
+    elapsed = time.perf_counter() - start
+    assert all(result.ok for result in results)
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200, help="처리할 항목 수")
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="가짜 모델 응답 지연 (초)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32, 128],
+        help="비교할 동시 실행 수 목록",
+    )
+    args = parser.parse_args()
+
+    chain = set_extraction_chain(model=FakeChatModel(latency=args.latency))
+    pairs = make_pairs(args.items)
+
+    sequential = await run_sequential(chain, pairs)
+    print(f"{'mode':<20}{'elapsed (s)':>14}{'items/s':>12}{'speedup':>10}")
+    print(f"{'sequential loop':<20}{sequential:>14.3f}{len(pairs) / sequential:>12.1f}")
+    for max_concurrency in args.concurrency:
+        elapsed = await run_batch(chain, pairs, max_concurrency)
+        print(
+            f"{f'abatch (c={max_concurrency})':<20}{elapsed:>14.3f}"
+            f"{len(pairs) / elapsed:>12.1f}{sequential / elapsed:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
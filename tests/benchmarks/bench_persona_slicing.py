@@ -0,0 +1,102 @@
+"""
+페르소나 섹션 슬라이싱 벤치마크
+
+콘텐츠 유형별로 전체 PERSONA를 넣은 프롬프트와 관련 섹션만 넣은 프롬프트의
+토큰 수를 비교합니다. `--live` 옵션을 주면 실제 OpenAI API를 호출하여
+콘텐츠 유형별 평균 응답 시간도 비교합니다 (OPENAI_API_KEY 필요, 비용 발생).
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_persona_slicing
+python -m tests.benchmarks.bench_persona_slicing --live --repeat 5
+```
+"""
+
+import argparse
+import statistics
+import time
+
+from langchain_core.output_parsers import StrOutputParser
+
+from agents.text.modules.chains import set_extraction_chain
+from agents.text.modules.models import get_openai_model
+from agents.text.modules.persona import PERSONA, get_persona_details
+from agents.text.modules.prompts import get_extraction_prompt
+
+CONTENT_TYPES = ["블로그 글", "소셜 미디어 포스트", "이미지", "음악", "가사", "영상"]
+CONTENT_TOPIC = "여름 휴가"
+
+
+def get_token_counter():
+    """
+    토큰 수 계산 함수를 반환합니다.
+
+    tiktoken의 o200k_base(gpt-4o 계열) 인코딩을 사용하며,
+    인코딩 파일을 내려받을 수 없는 환경에서는 문자 수 기반 근사치를 사용합니다.
+    """
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("o200k_base")
+        return lambda text: len(encoding.encode(text)), "o200k_base"
+    except (ImportError, OSError, ValueError):  # 미설치, 다운로드 실패
+        from langchain_core.messages.utils import count_tokens_approximately
+
+        return lambda text: count_tokens_approximately([text]), "approximate"
+
+
+def render_prompt(content_type: str, persona_details: str) -> str:
+    """추출 프롬프트를 렌더링합니다."""
+    return get_extraction_prompt().format(
+        content_topic=CONTENT_TOPIC,
+        content_type=content_type,
+        persona_details=persona_details,
+    )
+
+
+def measure_latency(chain, inputs: dict, repeat: int) -> float:
+    """체인 호출의 평균 응답 시간(초)을 측정합니다."""
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chain.invoke(inputs)
+        elapsed.append(time.perf_counter() - start)
+    return statistics.mean(elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--live", action="store_true", help="실제 API로 지연 시간 측정")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="지연 시간 측정 반복 횟수"
+    )
+    args = parser.parse_args()
+
+    count_tokens, tokenizer = get_token_counter()
+    print(f"tokenizer: {tokenizer}")
+
+    header = f"{'content_type':<16}{'full tok':>10}{'sliced tok':>12}{'saved':>8}"
+    if args.live:
+        header += f"{'full (s)':>10}{'sliced (s)':>12}"
+        full_chain = get_extraction_prompt() | get_openai_model() | StrOutputParser()
+        sliced_chain = set_extraction_chain()
+    print(header)
+
+    for content_type in CONTENT_TYPES:
+        full = count_tokens(render_prompt(content_type, PERSONA))
+        sliced = count_tokens(
+            render_prompt(content_type, get_persona_details(content_type))
+        )
+        line = f"{content_type:<16}{full:>10}{sliced:>12}{1 - sliced / full:>8.0%}"
+        if args.live:
+            inputs = {"content_topic": CONTENT_TOPIC, "content_type": content_type}
+            full_latency = measure_latency(
+                full_chain, {**inputs, "persona_details": PERSONA}, args.repeat
+            )
+            sliced_latency = measure_latency(sliced_chain, inputs, args.repeat)
+            line += f"{full_latency:>10.2f}{sliced_latency:>12.2f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
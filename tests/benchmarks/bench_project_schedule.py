@@ -0,0 +1,159 @@
+"""
+프로젝트 일정 엔진 벤치마크
+
+--tasks개의 작업과 작업당 최대 --max-deps개의 선행 작업을 가진 무작위 프로젝트에서,
+배열 기반 일정 엔진(ScheduleEngine)과 작업마다 Python 객체를 만드는 단순 구현의
+주 공정 / 여유 시간 계산 시간을 비교합니다. 작업 하나의 기간을 바꿀 때의 증분 계산 시간과
+리소스 평준화, 요약 생성 시간(처음 / 캐시된 재조회)도 측정합니다.
+
+선행 작업은 최근 --window개의 작업 중에서 고르므로, 실제 프로젝트처럼 일정이 긴 사슬을 이룹니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_project_schedule
+python -m tests.benchmarks.bench_project_schedule --tasks 20000 --updates 500
+```
+"""
+
+import argparse
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+
+from agents.management.modules.schedule import ScheduleEngine
+
+
+@dataclass
+class Task:
+    """단순 구현의 작업 객체"""
+
+    task_id: str
+    duration: float
+    predecessors: list["Task"] = field(default_factory=list)
+    successors: list["Task"] = field(default_factory=list)
+    earliest_start: float = 0.0
+    latest_start: float = 0.0
+
+
+def naive_schedule(tasks: list[dict]) -> float:
+    """작업 객체와 DFS 위상 정렬로 ES / LS를 계산하고 프로젝트 기간을 반환합니다."""
+    objects = {
+        task["task_id"]: Task(task["task_id"], task["duration"]) for task in tasks
+    }
+    for task in tasks:
+        for before in task.get("depends_on", ()):
+            objects[task["task_id"]].predecessors.append(objects[before])
+            objects[before].successors.append(objects[task["task_id"]])
+
+    order, visited = [], set()
+    for root in objects.values():
+        stack = [(root, False)]
+        while stack:
+            node, done = stack.pop()
+            if done:
+                order.append(node)
+            elif node.task_id not in visited:
+                visited.add(node.task_id)
+                stack.append((node, True))
+                stack.extend((p, False) for p in node.predecessors)
+
+    for node in order:
+        node.earliest_start = max(
+            (p.earliest_start + p.duration for p in node.predecessors), default=0.0
+        )
+    end = max(node.earliest_start + node.duration for node in order)
+    for node in reversed(order):
+        node.latest_start = (
+            min((s.latest_start for s in node.successors), default=end) - node.duration
+        )
+    return end
+
+
+def generate(args) -> tuple[list[dict], dict[str, int]]:
+    """무작위 작업 목록과 리소스 용량을 생성합니다."""
+    rng = random.Random(args.seed)
+    resources = [f"team-{i}" for i in range(args.resources)]
+    tasks = []
+    for i in range(args.tasks):
+        candidates = range(max(0, i - args.window), i)
+        tasks.append(
+            {
+                "task_id": f"t{i}",
+                "duration": rng.uniform(0.5, 10),
+                "depends_on": [
+                    f"t{j}"
+                    for j in rng.sample(
+                        candidates, min(len(candidates), rng.randint(1, args.max_deps))
+                    )
+                ],
+                "resource": rng.choice(resources),
+            }
+        )
+    return tasks, {resource: args.capacity for resource in resources}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=5000, help="작업 수")
+    parser.add_argument(
+        "--max-deps", type=int, default=3, help="작업당 최대 선행 작업 수"
+    )
+    parser.add_argument("--window", type=int, default=200, help="선행 작업 후보 범위")
+    parser.add_argument("--resources", type=int, default=20, help="리소스 수")
+    parser.add_argument("--capacity", type=int, default=3, help="리소스별 용량")
+    parser.add_argument("--updates", type=int, default=200, help="증분 계산 반복 횟수")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    args = parser.parse_args()
+
+    tasks, capacities = generate(args)
+    edges = sum(len(task["depends_on"]) for task in tasks)
+    print(f"tasks: {len(tasks)}, dependencies: {edges}")
+
+    start = time.perf_counter()
+    naive_end = naive_schedule(tasks)
+    naive_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine = ScheduleEngine.from_tasks(tasks, capacities)
+    engine_s = time.perf_counter() - start
+    assert abs(engine.duration - naive_end) < 1e-6
+    print(
+        f"levels: {int(engine._level.max()) + 1}, duration: {engine.duration:.1f} days"
+    )
+    print(
+        f"full compute: engine {engine_s * 1000:.1f} ms, naive objects {naive_s * 1000:.1f} ms"
+    )
+
+    rng = random.Random(args.seed)
+    elapsed = []
+    for _ in range(args.updates):
+        task = rng.choice(tasks)
+        task["duration"] = rng.uniform(0.5, 10)
+        start = time.perf_counter()
+        engine.update_duration(task["task_id"], task["duration"])
+        elapsed.append(time.perf_counter() - start)
+    assert abs(engine.duration - naive_schedule(tasks)) < 1e-6
+    print(
+        f"incremental update: mean {statistics.mean(elapsed) * 1000:.2f} ms, "
+        f"max {max(elapsed) * 1000:.2f} ms (naive full recompute {naive_s * 1000:.1f} ms)"
+    )
+
+    start = time.perf_counter()
+    _, finish = engine.leveled()
+    leveled_s = time.perf_counter() - start
+    start = time.perf_counter()
+    engine.summary()
+    summary_s = time.perf_counter() - start
+    start = time.perf_counter()
+    engine.summary()  # 요청마다 같은 프로젝트의 요약을 다시 조회하는 경우
+    cached_s = time.perf_counter() - start
+    print(
+        f"leveling: {leveled_s * 1000:.1f} ms (leveled duration {finish.max():.1f} days), "
+        f"summary (cached leveling): {summary_s * 1000:.1f} ms, "
+        f"repeated summary: {cached_s * 1e6:.0f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+리소스 가용성 인덱스 벤치마크
+
+리소스 유형별로 --bookings개의 예약을 생성하고, 구간 인덱스(AvailabilityIndex)와 전체 탐색의
+겹치는 예약 검색 / 가용 리소스 검색 / 빈 시간대 검색 시간을 비교합니다.
+인덱스 구성 시간, SQLite 저장소에서 불러오는 시간, 예약 삽입 / 삭제 시간도 측정합니다.
+
+같은 리소스의 예약은 겹치지 않도록 리소스마다 순서대로 생성합니다. (기본값: 약 1년 분량의 일정)
+인덱스 검색 시간은 결과 수(hits)에 비례하므로, --window를 늘리면 속도 향상 폭이 줄어듭니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_resource_index
+python -m tests.benchmarks.bench_resource_index --bookings 300000 --resources 2000
+```
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from agents.management.modules.availability import (
+    AvailabilityIndex,
+    Booking,
+    Resource,
+    load_index,
+)
+
+RESOURCE_TYPES = ("studio", "equipment", "staff")
+BASE = datetime(2025, 1, 1)
+
+
+def generate(args) -> tuple[list[Resource], list[Booking]]:
+    """리소스와 서로 겹치지 않는 리소스별 예약을 생성합니다."""
+    rng = random.Random(args.seed)
+    resources = [
+        Resource(f"r-{i}", RESOURCE_TYPES[i % len(RESOURCE_TYPES)], f"리소스 {i}")
+        for i in range(args.resources)
+    ]
+    bookings = []
+    per_resource = args.bookings // args.resources
+    for resource in resources:
+        cursor = BASE
+        for _ in range(per_resource):
+            cursor += timedelta(hours=rng.uniform(0, args.gap * 2))  # 예약 사이 빈 시간
+            end = cursor + timedelta(hours=rng.uniform(1, 8))
+            bookings.append(
+                Booking(f"b-{len(bookings)}", resource.resource_id, cursor, end)
+            )
+            cursor = end
+    return resources, bookings
+
+
+def write_sqlite(
+    path: Path, resources: list[Resource], bookings: list[Booking]
+) -> None:
+    """리소스와 예약을 SQLite 저장소로 저장합니다."""
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE resources (resource_id, resource_type, name)")
+        connection.execute(
+            "CREATE TABLE bookings (booking_id, resource_id, start, end)"
+        )
+        connection.executemany(
+            "INSERT INTO resources VALUES (?, ?, ?)",
+            ((r.resource_id, r.resource_type, r.name) for r in resources),
+        )
+        connection.executemany(
+            "INSERT INTO bookings VALUES (?, ?, ?, ?)",
+            (
+                (b.booking_id, b.resource_id, b.start.isoformat(), b.end.isoformat())
+                for b in bookings
+            ),
+        )
+
+
+def timed(fn, periods: list[tuple[datetime, datetime]]) -> float:
+    """모든 검색 기간에 대해 fn(start, end)을 실행한 평균 시간(마이크로초)을 반환합니다."""
+    start = time.perf_counter()
+    for period in periods:
+        fn(*period)
+    return (time.perf_counter() - start) / len(periods) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bookings", type=int, default=120_000, help="전체 예약 수")
+    parser.add_argument("--resources", type=int, default=600, help="리소스 수")
+    parser.add_argument("--queries", type=int, default=200, help="검색 기간 수")
+    parser.add_argument("--window", type=float, default=4.0, help="검색 기간 (시간)")
+    parser.add_argument(
+        "--gap", type=float, default=40.0, help="예약 사이 평균 빈 시간 (시간)"
+    )
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    args = parser.parse_args()
+
+    resources, bookings = generate(args)
+    horizon = max(booking.end for booking in bookings)
+    print(f"resources: {len(resources)}, bookings: {len(bookings)}")
+
+    start = time.perf_counter()
+    index = AvailabilityIndex(resources, bookings)
+    print(f"build: {time.perf_counter() - start:.2f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bookings.sqlite"
+        write_sqlite(path, resources, bookings)
+        start = time.perf_counter()
+        load_index(path)
+        print(f"load (sqlite): {time.perf_counter() - start:.2f} s")
+
+    rng = random.Random(args.seed)
+    span = (horizon - BASE).total_seconds()
+    periods = []
+    for _ in range(args.queries):
+        period_start = BASE + timedelta(seconds=rng.uniform(0, span))
+        periods.append((period_start, period_start + timedelta(hours=args.window)))
+
+    # 전체 탐색 기준: 유형별 예약 목록을 미리 나눠 두고 선형 탐색
+    studios = {r.resource_id for r in resources if r.resource_type == "studio"}
+    studio_bookings = [b for b in bookings if b.resource_id in studios]
+    first_bookings = [b for b in bookings if b.resource_id == "r-0"]
+
+    def scan_overlapping(start, end):
+        return [b for b in studio_bookings if b.start < end and b.end > start]
+
+    def scan_available(start, end):
+        busy = {b.resource_id for b in scan_overlapping(start, end)}
+        return [resource_id for resource_id in studios if resource_id not in busy]
+
+    def scan_free_slots(start, end):
+        return sorted(
+            (b.start, b.end) for b in first_bookings if b.start < end and b.end > start
+        )
+
+    hits = sum(len(scan_overlapping(*period)) for period in periods) / len(periods)
+    print(f"studio bookings: {len(studio_bookings)}, avg hits per query: {hits:.1f}")
+    print(f"{'query':<14}{'index (us)':>12}{'scan (us)':>12}{'speedup':>10}")
+    for name, index_fn, scan_fn in (
+        (
+            "overlapping",
+            lambda s, e: index.overlapping("studio", s, e),
+            scan_overlapping,
+        ),
+        ("available", lambda s, e: index.available("studio", s, e), scan_available),
+        ("free_slots", lambda s, e: index.free_slots("r-0", s, e), scan_free_slots),
+    ):
+        indexed, scanned = timed(index_fn, periods), timed(scan_fn, periods)
+        print(f"{name:<14}{indexed:>12.1f}{scanned:>12.1f}{scanned / indexed:>9.0f}x")
+
+    # 예약 삽입 / 삭제 (리소스마다 일정 끝에 새 예약을 추가한 뒤 삭제)
+    new_bookings = [
+        Booking(
+            f"new-{i}",
+            resource.resource_id,
+            horizon + timedelta(hours=i),
+            horizon + timedelta(hours=i, minutes=30),
+        )
+        for i, resource in enumerate(resources)
+    ]
+    start = time.perf_counter()
+    for booking in new_bookings:
+        index.add_booking(booking)
+    insert_us = (time.perf_counter() - start) / len(new_bookings) * 1e6
+    start = time.perf_counter()
+    for booking in new_bookings:
+        index.remove_booking(booking.booking_id)
+    delete_us = (time.perf_counter() - start) / len(new_bookings) * 1e6
+    print(f"insert: {insert_us:.1f} us/op, delete: {delete_us:.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
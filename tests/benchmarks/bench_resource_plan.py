@@ -0,0 +1,179 @@
+"""
+리소스 계획 출력 모드 벤치마크
+
+리소스 관리 노드의 산문(prose) 모드와 구조화 출력(structured) 모드의 응답 시간과 출력 토큰 수를 비교합니다.
+
+기본 실행은 FakeChatModel이 모드별 대표 출력(SAMPLE_PROSE / SAMPLE_STRUCTURED)을 단어 단위로
+스트리밍하므로, 출력 길이에 비례하는 생성 시간(--ttft + 단어 수 * --token-interval)을 흉내 냅니다.
+`--live` 옵션을 주면 실제 OpenAI API를 호출하여 실제 출력으로 측정합니다 (OPENAI_API_KEY 필요, 비용 발생).
+구조화 출력 모드의 결과는 매 호출마다 schemas.ResourcePlan으로 검증됩니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_resource_plan
+python -m tests.benchmarks.bench_resource_plan --live --repeat 3
+```
+"""
+
+import argparse
+import json
+import statistics
+import time
+from contextlib import nullcontext
+
+from agents.management.modules.nodes import ResourceManagementNode
+from agents.model_registry import override_chat_model
+from tests.benchmarks.bench_persona_slicing import get_token_counter
+from tests.benchmarks.fake_llm import FakeChatModel
+
+STATE = {
+    "project_id": "PRJ-2023-001",
+    "request_type": "resource_allocation",
+    "query": "여름 캠페인 뮤직비디오 제작을 위한 6주 리소스 계획을 세워 주세요.",
+    "team_members": ["Kim", "Lee", "Park"],
+    "resources_available": {"studio": "A동 스튜디오 2주", "budget": "5천만 원"},
+    "response": [],
+}
+
+SAMPLE_PROSE = """### 1. 프로젝트 개요
+- **프로젝트 요약**: PRJ-2023-001은 여름 캠페인을 위한 뮤직비디오 제작 프로젝트로, 6주 안에 기획부터 최종 편집까지 완료하는 것을 목표로 합니다.
+- **목표 및 기대 결과**: 캠페인 공개일에 맞춘 고품질 뮤직비디오 1편과 소셜 미디어용 숏폼 3편을 제작하여 브랜드 인지도를 높입니다.
+
+### 2. 리소스 할당
+- **인적 자원**:
+  - Kim: 총괄 프로듀서로서 일정과 예산을 관리하고 주요 의사 결정을 담당합니다.
+  - Lee: 촬영 감독으로서 콘티 작성과 촬영 현장을 책임집니다.
+  - Park: 편집 및 후반 작업을 맡아 색 보정과 숏폼 편집을 진행합니다.
+- **기술 자원**: A동 스튜디오를 2주간 사용하며, 시네마 카메라 2대와 조명 장비 세트, 편집용 워크스테이션이 필요합니다.
+- **재정 자원**: 총 예산 5천만 원 중 촬영 장비와 스튜디오에 40%, 인건비에 35%, 후반 작업에 15%, 예비비로 10%를 배정합니다.
+- **시간 자원**: 1-2주차 기획과 사전 제작, 3-4주차 촬영, 5-6주차 편집과 검수로 일정을 구성합니다.
+
+### 3. 리소스 최적화
+- **효율성 권장 사항**: 스튜디오 촬영 일정을 연속으로 배치하여 세팅 시간을 줄이고, 숏폼은 본편 촬영 분량을 재활용합니다.
+- **위험 평가 및 완화 전략**: 날씨로 인한 야외 촬영 지연에 대비해 실내 대체 장면을 준비하고, 장비 고장에 대비해 예비 장비를 대여 목록에 포함합니다.
+- **비상 계획**: 예비비 10%를 추가 촬영일 확보에 우선 사용하고, 편집 일정이 밀리면 외부 편집자를 단기로 투입합니다.
+
+### 4. 실행 계획
+- **단계별 가이드**:
+  1. 1주차: 콘셉트와 콘티를 확정하고 출연진 일정을 조율합니다.
+  2. 2주차: 장비와 스튜디오 예약을 완료하고 리허설을 진행합니다.
+  3. 3-4주차: 스튜디오와 야외 촬영을 진행합니다.
+  4. 5주차: 본편 편집과 색 보정을 진행합니다.
+  5. 6주차: 숏폼 편집, 내부 검수, 최종 납품을 완료합니다.
+- **모니터링 및 평가**: 주간 진행 회의에서 일정과 예산 집행률을 점검합니다.
+- **커뮤니케이션 프로토콜**: 공유 채널에 일일 진행 상황을 기록하고, 주요 변경 사항은 Kim이 승인합니다.
+
+### 5. 권장 사항
+- **추가 리소스**: 드론 촬영 장비를 대여하면 야외 장면의 완성도를 높일 수 있습니다.
+- **교육 및 개발 기회**: Park에게 최신 색 보정 도구 교육을 제공하여 후반 작업 시간을 단축합니다.
+- **프로세스 개선 제안**: 프로젝트 종료 후 회고를 통해 다음 캠페인에 재사용할 제작 체크리스트를 정리합니다."""
+
+SAMPLE_STRUCTURED = json.dumps(
+    {
+        "overview": "여름 캠페인 뮤직비디오 1편과 숏폼 3편을 6주 안에 제작합니다.",
+        "allocations": [
+            {
+                "category": "human",
+                "item": "Kim",
+                "detail": "총괄 프로듀서로 일정과 예산을 관리합니다.",
+            },
+            {
+                "category": "human",
+                "item": "Lee",
+                "detail": "촬영 감독으로 콘티와 촬영을 책임집니다.",
+            },
+            {
+                "category": "human",
+                "item": "Park",
+                "detail": "편집과 색 보정, 숏폼 편집을 맡습니다.",
+            },
+            {
+                "category": "technical",
+                "item": "A동 스튜디오",
+                "detail": "3-4주차에 2주간 사용합니다.",
+            },
+            {
+                "category": "financial",
+                "item": "예산 5천만 원",
+                "detail": "장비 40%, 인건비 35%, 후반 15%, 예비비 10%로 배정합니다.",
+            },
+            {
+                "category": "time",
+                "item": "6주 일정",
+                "detail": "기획 2주, 촬영 2주, 편집과 검수 2주로 진행합니다.",
+            },
+        ],
+        "risks": [
+            {"risk": "야외 촬영 지연", "mitigation": "실내 대체 장면을 준비합니다."},
+            {"risk": "장비 고장", "mitigation": "예비 장비를 대여 목록에 포함합니다."},
+        ],
+        "implementation_steps": [
+            "1주차에 콘셉트와 콘티를 확정합니다.",
+            "2주차에 장비와 스튜디오 예약을 완료합니다.",
+            "3-4주차에 촬영을 진행합니다.",
+            "5주차에 본편 편집과 색 보정을 진행합니다.",
+            "6주차에 숏폼 편집과 최종 납품을 완료합니다.",
+        ],
+        "recommendations": [
+            "드론 장비를 대여하여 야외 장면을 보강합니다.",
+            "종료 후 회고로 제작 체크리스트를 정리합니다.",
+        ],
+    },
+    ensure_ascii=False,
+)
+
+
+def measure(structured: bool, args, count_tokens) -> tuple[list[float], list[int]]:
+    """모드별로 노드를 --repeat회 실행하고 (응답 시간 목록, 출력 토큰 수 목록)을 반환합니다."""
+    model = FakeChatModel(
+        latency=args.ttft,
+        response=SAMPLE_STRUCTURED if structured else SAMPLE_PROSE,
+        token_interval=args.token_interval,
+    )
+    node = ResourceManagementNode(structured=structured)
+    latencies, tokens = [], []
+    with nullcontext() if args.live else override_chat_model(model):
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            output = node.execute(dict(STATE))
+            latencies.append(time.perf_counter() - start)
+            tokens.append(count_tokens(output["response"]))
+    return latencies, tokens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--live", action="store_true", help="실제 API로 측정")
+    parser.add_argument("--repeat", type=int, default=3, help="모드별 반복 횟수")
+    parser.add_argument(
+        "--ttft", type=float, default=0.3, help="첫 토큰까지의 시간 (초, 가짜 모델)"
+    )
+    parser.add_argument(
+        "--token-interval",
+        type=float,
+        default=0.01,
+        help="단어 사이 간격 (초, 가짜 모델)",
+    )
+    args = parser.parse_args()
+
+    count_tokens, tokenizer = get_token_counter()
+    print(f"tokenizer: {tokenizer}, live: {args.live}")
+    print(f"{'mode':<12}{'mean (s)':>10}{'max (s)':>10}{'out tok':>10}")
+    results = {}
+    for name, structured in (("prose", False), ("structured", True)):
+        latencies, tokens = measure(structured, args, count_tokens)
+        results[name] = (statistics.mean(latencies), statistics.mean(tokens))
+        print(
+            f"{name:<12}{results[name][0]:>10.2f}{max(latencies):>10.2f}"
+            f"{results[name][1]:>10.0f}"
+        )
+
+    (prose_time, prose_tokens), (structured_time, structured_tokens) = results.values()
+    print(
+        f"structured: 응답 시간 {1 - structured_time / prose_time:.0%} 감소, "
+        f"출력 토큰 {1 - structured_tokens / prose_tokens:.0%} 감소"
+    )
+
+
+if __name__ == "__main__":
+    main()
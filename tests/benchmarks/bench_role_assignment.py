@@ -0,0 +1,119 @@
+"""
+팀 역할 배정 솔버 벤치마크
+
+팀 규모(--sizes)마다 무작위 스킬 / 가용성 프로필을 가진 구성원과 같은 수의 역할 자리를 생성하고,
+적합도 행렬 계산 시간, 헝가리안 알고리즘(solve_assignment) 시간, assign_roles 전체 시간을 측정합니다.
+자리마다 남은 구성원 중 적합도가 가장 높은 사람을 고르는 탐욕 배정과 총 적합도도 비교합니다.
+
+구성원마다 --skills개의 스킬 중 3~6개를, 역할마다 1~3개의 요구 스킬과 1~4명의 인원을 무작위로 정합니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_role_assignment
+python -m tests.benchmarks.bench_role_assignment --sizes 100 500 1000 2000
+```
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from agents.management.modules.assignment import (
+    assign_roles,
+    fit_matrix,
+    solve_assignment,
+)
+
+
+def generate(
+    size: int, skills: int, rng: random.Random
+) -> tuple[list[dict], list[dict]]:
+    """구성원 size명과 자리 합계가 size인 역할 목록을 생성합니다."""
+    vocabulary = [f"skill-{i}" for i in range(skills)]
+    members = [
+        {
+            "name": f"member-{i}",
+            "skills": {
+                skill: round(rng.random(), 2)
+                for skill in rng.sample(vocabulary, rng.randint(3, 6))
+            },
+            "availability": rng.choice((1.0, 1.0, 0.8, 0.5)),
+        }
+        for i in range(size)
+    ]
+    roles, slots = [], 0
+    while slots < size:
+        count = min(rng.randint(1, 4), size - slots)
+        roles.append(
+            {
+                "role": f"role-{len(roles)}",
+                "skills": {
+                    skill: rng.randint(1, 3)
+                    for skill in rng.sample(vocabulary, rng.randint(1, 3))
+                },
+                "count": count,
+            }
+        )
+        slots += count
+    return members, roles
+
+
+def greedy_fit(fit: np.ndarray) -> float:
+    """자리 순서대로 남은 구성원 중 적합도가 가장 높은 사람을 배정한 총 적합도를 반환합니다."""
+    taken = np.zeros(fit.shape[0], dtype=bool)
+    total = 0.0
+    for column in range(fit.shape[1]):
+        candidates = np.where(taken, -np.inf, fit[:, column])
+        best = int(np.argmax(candidates))
+        taken[best] = True
+        total += fit[best, column]
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 50, 100, 250, 500, 1000],
+        help="팀 규모 목록",
+    )
+    parser.add_argument("--skills", type=int, default=40, help="스킬 종류 수")
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="규모별 반복 횟수 (최솟값 사용)"
+    )
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'size':>6}{'roles':>7}{'matrix (ms)':>13}{'solve (ms)':>12}"
+        f"{'assign_roles (ms)':>19}{'optimal fit':>13}{'greedy fit':>12}"
+    )
+    for size in args.sizes:
+        members, roles = generate(size, args.skills, rng)
+        slots = [j for j, role in enumerate(roles) for _ in range(role["count"])]
+        timings = {"matrix": [], "solve": [], "assign": []}
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            fit = fit_matrix(members, roles)[:, slots]
+            timings["matrix"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            rows, columns = solve_assignment(1.0 - fit)
+            timings["solve"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            assign_roles(members, roles)
+            timings["assign"].append(time.perf_counter() - start)
+
+        matrix_ms, solve_ms, assign_ms = (min(timings[key]) * 1000 for key in timings)
+        print(
+            f"{size:>6}{len(roles):>7}{matrix_ms:>13.2f}{solve_ms:>12.2f}{assign_ms:>19.2f}"
+            f"{fit[rows, columns].sum():>13.2f}{greedy_fit(fit):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
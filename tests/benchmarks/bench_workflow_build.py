@@ -0,0 +1,69 @@
+"""
+Workflow 빌드 벤치마크
+
+네 개의 에이전트 Workflow(text, image, music, management)에 대해
+캐시가 비어 있을 때(콜드)와 캐시된 그래프를 재사용할 때(웜)의 호출 시간을 비교합니다.
+
+모델 클라이언트 생성만 수행하고 실제 API 호출은 하지 않으므로,
+OPENAI_API_KEY가 없으면 더미 값을 사용합니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_workflow_build --repeat 20
+```
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from agents.base_workflow import BaseWorkflow
+from agents.image.workflow import image_workflow
+from agents.management.workflow import management_workflow
+from agents.music.workflow import music_workflow
+from agents.text.workflow import text_workflow
+
+WORKFLOWS = {
+    "text": text_workflow,
+    "image": image_workflow,
+    "music": music_workflow,
+    "management": management_workflow,
+}
+
+
+def measure(workflow, repeat: int) -> tuple[list[float], list[float]]:
+    """콜드/웜 호출 시간을 밀리초 단위로 측정합니다."""
+    cold, warm = [], []
+    for _ in range(repeat):
+        workflow.invalidate()
+        start = time.perf_counter()
+        workflow()
+        cold.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        workflow()
+        warm.append((time.perf_counter() - start) * 1000)
+    return cold, warm
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="반복 측정 횟수")
+    args = parser.parse_args()
+
+    print(f"{'workflow':<12}{'cold p50 (ms)':>16}{'warm p50 (ms)':>16}{'speedup':>10}")
+    for name, workflow in WORKFLOWS.items():
+        cold, warm = measure(workflow, args.repeat)
+        cold_p50 = statistics.median(cold)
+        warm_p50 = statistics.median(warm)
+        speedup = cold_p50 / warm_p50 if warm_p50 else float("inf")
+        print(f"{name:<12}{cold_p50:>16.3f}{warm_p50:>16.4f}{speedup:>9.0f}x")
+
+    BaseWorkflow.clear_cache()
+
+
+if __name__ == "__main__":
+    main()
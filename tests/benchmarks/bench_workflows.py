@@ -0,0 +1,264 @@
+"""
+Workflow 처리량 / 꼬리 지연 시간 벤치마크
+
+모든 에이전트 체인의 모델을 결정적 가짜 모델(FakeChatModel)로 교체한 뒤,
+main_workflow, text_workflow, management_workflow를 여러 동시 실행 수준에서 ainvoke로 호출하여
+처리량(requests/s)과 지연 시간 분위수(p50 / p95 / p99)를 측정합니다.
+측정 잡음을 줄이기 위해 각 수준을 --repeat회 반복하고 처리량이 가장 높은 실행을 사용합니다.
+
+측정 결과는 baselines/bench_workflows.json에 저장된 기준값과 비교하며,
+처리량이 기준보다 낮거나 지연 시간이 기준보다 허용 범위 이상 높으면 종료 코드 1로 종료합니다.
+기준값은 측정 환경(머신)에 따라 달라지므로, 환경이 바뀌면 --update-baseline으로 다시 저장합니다.
+
+실행 방법:
+```bash
+python -m tests.benchmarks.bench_workflows
+python -m tests.benchmarks.bench_workflows --update-baseline
+python -m tests.benchmarks.bench_workflows --latency 0.1 --latency-distribution exponential
+```
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from agents.base_workflow import BaseWorkflow
+from agents.management.workflow import management_workflow
+from agents.model_registry import override_chat_model
+from agents.text.workflow import text_workflow
+from agents.workflow import main_workflow
+from tests.benchmarks.fake_llm import FakeChatModel
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "bench_workflows.json"
+
+CONTENT_TYPES = ["블로그 글", "소셜 미디어 포스트", "이미지", "음악", "가사"]
+REQUEST_TYPES = ["resource_allocation", "team_management", "creator_development"]
+
+
+def text_input(index: int) -> dict:
+    """text_workflow 입력 상태를 생성합니다."""
+    return {
+        "content_topic": f"캠페인 주제 {index}",
+        "content_type": CONTENT_TYPES[index % len(CONTENT_TYPES)],
+        "query": f"요청 {index}",
+        "response": [],
+    }
+
+
+def management_input(index: int) -> dict:
+    """management_workflow 입력 상태를 생성합니다."""
+    return {
+        "project_id": f"PRJ-{index:04d}",
+        "request_type": REQUEST_TYPES[index % len(REQUEST_TYPES)],
+        "query": f"요청 {index}의 리소스 계획",
+        "team_members": ["작곡가", "영상 편집자", "매니저"],
+        "resources_available": {"budget": 1000 + index, "studio_hours": 40},
+        "response": [],
+    }
+
+
+def main_input(index: int) -> dict:
+    """main_workflow 입력 상태를 생성합니다. (모든 에이전트 분기가 실행되도록 구성)"""
+    return {**text_input(index), **management_input(index)}
+
+
+WORKFLOWS = {
+    "main": (main_workflow, main_input),
+    "text": (text_workflow, text_input),
+    "management": (management_workflow, management_input),
+}
+
+
+def percentile(values: list[float], q: float) -> float:
+    """정렬된 값 목록에서 nearest-rank 방식으로 분위수를 계산합니다."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(q * len(values) + 0.5) - 1))
+    return values[index]
+
+
+async def run_level(graph, make_input, requests: int, concurrency: int) -> dict:
+    """
+    주어진 동시 실행 수로 requests개의 그래프 실행을 수행하고 통계를 반환합니다.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def run_one(index: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await graph.ainvoke(make_input(index))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": round(requests / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float, slack_ms: float) -> list:
+    """
+    측정 결과를 기준값과 비교하여 회귀 목록을 반환합니다.
+
+    처리량은 기준 * (1 - tolerance)보다 낮으면,
+    지연 시간은 기준 * (1 + tolerance) + slack_ms보다 높으면 회귀로 판단합니다.
+    """
+    regressions = []
+    for name, levels in results.items():
+        for level, stats in levels.items():
+            base = baseline.get(name, {}).get(level)
+            if base is None:
+                continue
+            if stats["throughput"] < base["throughput"] * (1 - tolerance):
+                regressions.append(
+                    f"{name} c={level} throughput "
+                    f"{stats['throughput']:.1f} < baseline {base['throughput']:.1f}"
+                )
+            for key in ("p50_ms", "p99_ms"):
+                if stats[key] > base[key] * (1 + tolerance) + slack_ms:
+                    regressions.append(
+                        f"{name} c={level} {key} "
+                        f"{stats[key]:.2f} > baseline {base[key]:.2f}"
+                    )
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workflows",
+        nargs="+",
+        choices=list(WORKFLOWS),
+        default=list(WORKFLOWS),
+        help="측정할 Workflow 목록",
+    )
+    parser.add_argument("--requests", type=int, default=100, help="수준별 요청 수")
+    parser.add_argument("--repeat", type=int, default=3, help="수준별 반복 측정 횟수")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32],
+        help="측정할 동시 실행 수 목록",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="가짜 모델 지연 시간 기준값 (초)"
+    )
+    parser.add_argument(
+        "--latency-distribution",
+        default="lognormal",
+        choices=["fixed", "uniform", "normal", "lognormal", "exponential"],
+        help="가짜 모델 지연 시간 분포",
+    )
+    parser.add_argument(
+        "--latency-spread", type=float, default=0.3, help="지연 시간 분포의 퍼짐 정도"
+    )
+    parser.add_argument(
+        "--output-tokens", type=int, default=200, help="가짜 모델 응답 토큰 수"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="가짜 모델 난수 시드")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.3, help="기준 대비 허용 비율"
+    )
+    parser.add_argument(
+        "--slack-ms",
+        type=float,
+        default=10.0,
+        help="지연 시간 비교 시 추가 허용치 (ms)",
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE_PATH, help="기준값 파일 경로"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="측정 결과를 기준값으로 저장"
+    )
+    args = parser.parse_args()
+
+    config = {
+        "requests": args.requests,
+        "repeat": args.repeat,
+        "latency": args.latency,
+        "latency_distribution": args.latency_distribution,
+        "latency_spread": args.latency_spread,
+        "output_tokens": args.output_tokens,
+        "seed": args.seed,
+    }
+    model = FakeChatModel(
+        latency=args.latency,
+        latency_distribution=args.latency_distribution,
+        latency_spread=args.latency_spread,
+        output_tokens=args.output_tokens,
+        seed=args.seed,
+    )
+
+    results: dict[str, dict[str, dict]] = {}
+    print(
+        f"{'workflow':<12}{'c':>5}{'req/s':>10}{'p50 (ms)':>11}"
+        f"{'p95 (ms)':>11}{'p99 (ms)':>11}"
+    )
+    with override_chat_model(model):
+        BaseWorkflow.clear_cache()  # 가짜 모델로 체인을 다시 빌드
+        for name in args.workflows:
+            workflow, make_input = WORKFLOWS[name]
+            graph = workflow()
+            await graph.ainvoke(make_input(-1))  # 워밍업
+            results[name] = {}
+            for concurrency in args.concurrency:
+                stats = max(
+                    [
+                        await run_level(graph, make_input, args.requests, concurrency)
+                        for _ in range(args.repeat)
+                    ],
+                    key=lambda item: item["throughput"],
+                )
+                results[name][str(concurrency)] = stats
+                print(
+                    f"{name:<12}{concurrency:>5}{stats['throughput']:>10.1f}"
+                    f"{stats['p50_ms']:>11.2f}{stats['p95_ms']:>11.2f}"
+                    f"{stats['p99_ms']:>11.2f}"
+                )
+    BaseWorkflow.clear_cache()
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps({"config": config, "results": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"\n기준값을 저장했습니다: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\n기준값 파일이 없습니다: {args.baseline} (--update-baseline으로 생성)")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("config") != config:
+        print("\n기준값과 측정 설정이 달라 비교를 건너뜁니다.")
+        return 0
+
+    regressions = compare(results, baseline["results"], args.tolerance, args.slack_ms)
+    if regressions:
+        print("\n성능 회귀가 감지되었습니다:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    print("\n모든 측정값이 기준 범위 안에 있습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,204 @@
+"""
+벤치마크용 결정적(deterministic) 가짜 채팅 모델
+
+실제 OpenAI API를 호출하지 않고 프레임워크 오버헤드와 동시성 동작을 측정하기 위한 모델입니다.
+응답 지연 시간의 분포와 출력 길이(토큰 수)를 지정할 수 있으며, 비동기 호출에서는
+asyncio.sleep을 사용하므로 이벤트 루프를 블로킹하지 않습니다.
+스트리밍 호출에서는 지연 시간이 첫 토큰까지의 시간(TTFT)이 되고, 이후 토큰은
+token_interval 간격으로 하나씩 생성됩니다.
+
+지연 시간과 출력 길이는 (seed, 프롬프트) 조합으로 결정되므로, 동시 실행 순서와 관계없이
+같은 입력에 대해서는 항상 같은 값을 사용합니다.
+
+예시:
+```python
+from agents.model_registry import override_chat_model
+
+model = FakeChatModel(
+    latency=0.05,
+    latency_distribution="lognormal",
+    latency_spread=0.5,
+    output_tokens=200,
+)
+with override_chat_model(model):
+    ...  # 모든 에이전트 체인이 가짜 모델을 사용
+```
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Literal
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    지정한 분포의 지연 시간 후 지정한 길이의 응답을 반환하는 가짜 채팅 모델
+
+    Attributes:
+        latency: 호출당 응답 지연 시간의 기준값 (초)
+        latency_distribution: 지연 시간 분포
+            - "fixed": 항상 latency
+            - "uniform": latency * [1 - spread, 1 + spread] 균등 분포
+            - "normal": 평균 latency, 표준편차 latency * spread (0 미만은 0)
+            - "lognormal": 중앙값 latency, 로그 표준편차 spread (긴 꼬리 분포)
+            - "exponential": 평균 latency 지수 분포
+        latency_spread: 분포의 퍼짐 정도
+        response: 응답 텍스트 (output_tokens가 지정되면 이 텍스트의 단어를 반복하여 길이를 맞춤)
+        output_tokens: 응답 토큰(단어) 수 (None이면 response를 그대로 반환)
+        output_tokens_spread: 응답 토큰 수의 상대 편차 (균등 분포)
+        token_interval: 스트리밍 시 토큰 사이의 간격 (초)
+        seed: 난수 시드
+    """
+
+    latency: float = 0.0
+    latency_distribution: Literal[
+        "fixed", "uniform", "normal", "lognormal", "exponential"
+    ] = "fixed"
+    latency_spread: float = 0.0
+    response: str = "니제(NEEDZE)의 페르소나 요약"
+    output_tokens: int | None = None
+    output_tokens_spread: float = 0.0
+    token_interval: float = 0.0
+    seed: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def _rng(self, messages: list[BaseMessage]) -> random.Random:
+        """(seed, 프롬프트)로 결정되는 난수 생성기를 반환합니다."""
+        prompt = "\n".join(str(message.content) for message in messages)
+        return random.Random(f"{self.seed}:{prompt}")
+
+    def _sample_latency(self, rng: random.Random) -> float:
+        """지연 시간 분포에서 값을 하나 추출합니다."""
+        base, spread = self.latency, self.latency_spread
+        if base <= 0:
+            return 0.0
+        match self.latency_distribution:
+            case "uniform":
+                return max(0.0, rng.uniform(base * (1 - spread), base * (1 + spread)))
+            case "normal":
+                return max(0.0, rng.gauss(base, base * spread))
+            case "lognormal":
+                return rng.lognormvariate(math.log(base), spread)
+            case "exponential":
+                return rng.expovariate(1 / base)
+            case _:
+                return base
+
+    def _sample_text(self, rng: random.Random) -> str:
+        """출력 길이 설정에 맞는 응답 텍스트를 생성합니다."""
+        if self.output_tokens is None:
+            return self.response
+        spread = self.output_tokens * self.output_tokens_spread
+        count = max(1, round(rng.uniform(-spread, spread) + self.output_tokens))
+        words = self.response.split() or ["token"]
+        return " ".join(words[index % len(words)] for index in range(count))
+
+    @staticmethod
+    def _usage(messages: list[BaseMessage], text: str) -> dict:
+        """단어 수 기준의 토큰 사용량을 계산합니다."""
+        input_tokens = sum(len(str(message.content).split()) for message in messages)
+        output_tokens = len(text.split())
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    def _make_result(self, messages: list[BaseMessage], text: str) -> ChatResult:
+        """토큰 사용량을 포함한 ChatResult를 생성합니다."""
+        message = AIMessage(content=text, usage_metadata=self._usage(messages, text))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _make_chunks(
+        self, messages: list[BaseMessage], text: str
+    ) -> list[ChatGenerationChunk]:
+        """응답 텍스트를 단어 단위 청크로 나눕니다. 마지막 청크에 토큰 사용량을 포함합니다."""
+        words = text.split(" ")
+        chunks = []
+        for index, word in enumerate(words):
+            last = index == len(words) - 1
+            chunks.append(
+                ChatGenerationChunk(
+                    message=AIMessageChunk(
+                        content=word if last else f"{word} ",
+                        usage_metadata=self._usage(messages, text) if last else None,
+                    )
+                )
+            )
+        return chunks
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        rng = self._rng(messages)
+        delay = self._sample_latency(rng)
+        if delay:
+            time.sleep(delay)
+        return self._make_result(messages, self._sample_text(rng))
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        rng = self._rng(messages)
+        delay = self._sample_latency(rng)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._make_result(messages, self._sample_text(rng))
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        rng = self._rng(messages)
+        delay = self._sample_latency(rng)
+        if delay:
+            time.sleep(delay)
+        for index, chunk in enumerate(
+            self._make_chunks(messages, self._sample_text(rng))
+        ):
+            if index and self.token_interval:
+                time.sleep(self.token_interval)
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        rng = self._rng(messages)
+        delay = self._sample_latency(rng)
+        if delay:
+            await asyncio.sleep(delay)
+        for index, chunk in enumerate(
+            self._make_chunks(messages, self._sample_text(rng))
+        ):
+            if index and self.token_interval:
+                await asyncio.sleep(self.token_interval)
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
@@ -0,0 +1,117 @@
+"""
+단위 테스트 모듈 - 팀 역할 배정 솔버 테스트
+
+헝가리안 알고리즘의 배정 비용이 전수 탐색의 최솟값과 같은지(직사각 행렬 포함),
+스킬 / 가용성 기반 역할 배정과 역할별 인원, 배정 결과가 리소스 관리 노드의 체인 입력으로 전달되는지 확인합니다.
+"""
+
+import itertools
+import json
+
+import numpy as np
+
+from agents.management.modules.assignment import assign_roles, solve_assignment
+
+
+def test_solve_assignment_matches_brute_force() -> None:
+    """
+    무작위 (정수 / 실수) 비용 행렬에서 배정 비용이 전수 탐색의 최솟값과 같은지 테스트합니다.
+
+    Returns:
+        None
+    """
+    rng = np.random.default_rng(0)
+    for trial in range(200):
+        rows, columns = (int(size) for size in rng.integers(1, 7, 2))
+        if trial % 2:
+            cost = rng.integers(0, 4, (rows, columns)).astype(float)  # 동률이 많은 행렬
+        else:
+            cost = rng.random((rows, columns))
+        row_index, column_index = solve_assignment(cost)
+
+        size = min(rows, columns)
+        assert len(set(row_index.tolist())) == len(set(column_index.tolist())) == size
+        assert row_index.tolist() == sorted(row_index.tolist())
+        smaller, larger = (cost, columns) if rows <= columns else (cost.T, rows)
+        best = min(
+            smaller[np.arange(size), list(permutation)].sum()
+            for permutation in itertools.permutations(range(larger), size)
+        )
+        assert np.isclose(cost[row_index, column_index].sum(), best)
+
+
+def test_assign_roles() -> None:
+    """
+    스킬 / 가용성 기반 배정, 역할별 인원, 가용성이 0인 구성원과 채우지 못한 역할을 테스트합니다.
+
+    Returns:
+        None
+    """
+    members = [
+        {"name": "Kim", "skills": {"편집": 0.9, "촬영": 0.6}},
+        {"name": "Lee", "skills": {"편집": 0.8}},
+        {"name": "Park", "skills": {"촬영": 0.7, "음향": 0.9}, "availability": 0.5},
+        {"name": "Choi", "skills": {"음향": 1.0}, "availability": 0},
+        "Jung",
+    ]
+    roles = [
+        {"role": "편집자", "skills": {"편집": 1.0}},
+        {"role": "촬영 감독", "skills": {"촬영": 1.0}},
+        {"role": "음향 감독", "skills": {"음향": 2.0, "편집": 1.0}, "count": 2},
+    ]
+    result = assign_roles(members, roles)
+
+    # Kim을 편집자로 두는 것(0.9 + Park 촬영 0.35)보다 Lee 편집 + Kim 촬영(0.8 + 0.6)이 총 적합도가 높음
+    assert [(a["member"], a["role"]) for a in result["assignments"]] == [
+        ("Lee", "편집자"),
+        ("Kim", "촬영 감독"),
+        ("Park", "음향 감독"),
+        ("Jung", "음향 감독"),
+    ]
+    assert result["assignments"][2]["fit"] == 0.3  # 0.9 * 2/3 * 가용성 0.5
+    assert result["unassigned_members"] == ["Choi"]
+    assert result["unfilled_roles"] == {}
+    assert result["total_fit"] == 1.7
+
+    result = assign_roles(members[:2], roles)
+    assert len(result["assignments"]) == 2
+    assert result["unfilled_roles"] == {"음향 감독": 2}
+    assert assign_roles([], roles)["unfilled_roles"] == {
+        "편집자": 1,
+        "촬영 감독": 1,
+        "음향 감독": 2,
+    }
+
+
+def test_role_assignments_in_chain_input() -> None:
+    """
+    역할과 스킬 정보가 주어지면 배정 결과가 체인 입력에 포함되고, 팀 구성원은 이름만 전달되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from agents.management.modules.nodes import ResourceManagementNode
+
+    node = ResourceManagementNode(structured=False)
+    state = {
+        "project_id": "PRJ-1",
+        "request_type": "team_management",
+        "query": "",
+        "team_members": [{"name": "Kim", "skills": {"편집": 0.9}}, "Lee"],
+        "roles": [{"role": "편집자", "skills": {"편집": 1.0}}],
+    }
+    chain_input = node._chain_input(state)
+
+    assert chain_input["team_members"] == ["Kim", "Lee"]
+    assignments = json.loads(chain_input["role_assignments"])
+    assert assignments["assignments"] == [
+        {"member": "Kim", "role": "편집자", "fit": 0.9}
+    ]
+    assert assignments["unassigned_members"] == ["Lee"]
+
+    # 스킬 정보가 있는 구성원이 없으면 적합도가 모두 0이므로 배정하지 않음
+    names_only = {**state, "team_members": ["Kim", "Lee"]}
+    assert node._chain_input(names_only)["role_assignments"] == "없음"
+
+    del state["roles"]
+    assert node._chain_input(state)["role_assignments"] == "없음"
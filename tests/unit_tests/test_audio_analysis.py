@@ -0,0 +1,149 @@
+"""
+단위 테스트 모듈 - 오디오 분석 테스트
+
+WAV 형식(PCM 8 / 16 / 24비트, float, 모노 / 스테레오)과 블록 크기에 관계없이 같은 특징을 계산하는지,
+합성 음원의 템포 / 조성 / 장르 / 분위기를 추정하는지, 음악 Workflow가 audio_path로 음악 상태를 채우는지 확인합니다.
+"""
+
+import struct
+
+import numpy as np
+import pytest
+
+from agents.music.modules.analysis import analyze_audio, extract_features, read_wav_info
+
+RATE = 44100
+A_MAJOR = (220.0, 277.18, 329.63, 440.0)
+A_MINOR = (220.0, 261.63, 329.63, 440.0)
+
+
+def _track(
+    bpm: float, seconds: float, chord, amplitude: float, noise: float
+) -> np.ndarray:
+    """화음 위에 bpm 간격의 잡음 타격음을 더한 합성 음원을 만듭니다."""
+    t = np.arange(int(RATE * seconds)) / RATE
+    signal = sum(np.sin(2 * np.pi * f * t) for f in chord) / len(chord) * amplitude
+    hits = np.exp(-(t % (60.0 / bpm)) * 30)
+    return signal + hits * np.random.default_rng(0).standard_normal(len(t)) * noise
+
+
+def _write_wav(
+    path, signal: np.ndarray, bits: int = 16, is_float: bool = False, channels: int = 2
+) -> None:
+    """signal(-1~1)을 지정한 형식의 WAV로 저장합니다. (LIST 청크 포함)"""
+    frames = np.repeat(np.clip(signal, -1, 1)[:, None], channels, axis=1)
+    if is_float:
+        data = frames.astype("<f4" if bits == 32 else "<f8").tobytes()
+    elif bits == 8:
+        data = (frames * 127 + 128).astype(np.uint8).tobytes()
+    elif bits == 24:
+        ints = (frames * (2**23 - 1)).astype("<i4").reshape(-1, 1).view(np.uint8)
+        data = ints[:, :3].tobytes()
+    else:
+        data = (frames * (2 ** (bits - 1) - 1)).astype(f"<i{bits // 8}").tobytes()
+    block_align = channels * bits // 8
+    fmt = struct.pack(
+        "<HHIIHH",
+        3 if is_float else 1,
+        channels,
+        RATE,
+        RATE * block_align,
+        block_align,
+        bits,
+    )
+    chunks = b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    chunks += b"LIST" + struct.pack("<I", 5) + b"INFOx\x00"  # 홀수 크기 청크 (패딩)
+    chunks += b"data" + struct.pack("<I", len(data)) + data
+    with open(path, "wb") as file:
+        file.write(b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks)
+
+
+def test_formats_and_blocks_agree(tmp_path) -> None:
+    """
+    같은 음원을 여러 WAV 형식으로 저장하거나 블록 크기를 바꿔도 특징이 같은지 테스트합니다.
+
+    Returns:
+        None
+    """
+    signal = _track(120, 8, A_MAJOR, 0.3, 0.4)
+    formats = {
+        "pcm16.wav": {"bits": 16},
+        "pcm24.wav": {"bits": 24, "channels": 1},
+        "pcm8.wav": {"bits": 8},
+        "float32.wav": {"bits": 32, "is_float": True, "channels": 1},
+    }
+    for name, options in formats.items():
+        _write_wav(tmp_path / name, signal, **options)
+    info = read_wav_info(tmp_path / "pcm24.wav")
+    assert (info.sample_rate, info.channels, info.frames) == (RATE, 1, len(signal))
+
+    reference = extract_features(tmp_path / "float32.wav")
+    results = {name: extract_features(tmp_path / name) for name in formats}
+    results["blocks"] = extract_features(tmp_path / "pcm16.wav", block_frames=37)
+    for name, features in results.items():
+        assert features["key"] == reference["key"] == "A major"
+        assert features["tempo"] == pytest.approx(reference["tempo"], abs=1.0)
+        assert features["loudness_db"] == pytest.approx(
+            reference["loudness_db"], abs=0.5
+        )
+        if name != "pcm8.wav":  # 8비트 양자화 잡음은 고역 성분을 더함
+            assert features["spectral_centroid"] == pytest.approx(
+                reference["spectral_centroid"], rel=0.02
+            )
+
+    (tmp_path / "text.wav").write_bytes(b"not a wav file")
+    with pytest.raises(ValueError):
+        extract_features(tmp_path / "text.wav")
+
+
+def test_infers_tempo_genre_and_mood(tmp_path) -> None:
+    """
+    빠르고 강한 장조 음원과 조용한 단조 지속음의 템포 / 조성 / 장르 / 분위기를 추정하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    _write_wav(tmp_path / "dance.wav", _track(128, 20, A_MAJOR, 0.3, 0.6))
+    _write_wav(tmp_path / "pad.wav", _track(70, 20, A_MINOR, 0.05, 0.0))
+
+    dance = analyze_audio(tmp_path / "dance.wav")
+    assert dance["features"]["tempo"] == pytest.approx(128, abs=1.5)
+    assert dance["features"]["key"] == "A major"
+    assert (dance["genre"], dance["mood"]) == ("electronic", "energetic")
+
+    pad = analyze_audio(tmp_path / "pad.wav")
+    assert pad["features"]["tempo"] == 0.0  # 온셋 변화 없음
+    assert pad["features"]["key"] == "A minor"
+    assert (pad["genre"], pad["mood"]) == ("ambient", "melancholic")
+
+
+def test_workflow_fills_music_state(tmp_path) -> None:
+    """
+    audio_path가 있으면 음악 Workflow가 분석 결과로 음악 상태를 채우고, 지정한 분위기는 유지하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from agents.music.modules.state import MusicState
+    from agents.music.workflow import MusicWorkflow
+
+    _write_wav(tmp_path / "beat.wav", _track(90, 15, A_MINOR, 0.2, 0.5))
+    graph = MusicWorkflow(MusicState)()
+    result = graph.invoke(
+        {"query": "비트", "response": [], "audio_path": str(tmp_path / "beat.wav")}
+    )
+    assert result["music_genre"] == "hip-hop"
+    assert result["music_mood"] == "tense"
+    assert result["audio_features"]["tempo"] == pytest.approx(90, abs=1.5)
+    assert "hip-hop" in result["response"][-1].content
+
+    kept = graph.invoke(
+        {
+            "query": "비트",
+            "response": [],
+            "audio_path": str(tmp_path / "beat.wav"),
+            "music_mood": "dreamy",
+        }
+    )
+    assert (kept["music_genre"], kept["music_mood"]) == ("hip-hop", "dreamy")
+    assert graph.invoke({"query": "비트", "response": []}).get("audio_features") is None
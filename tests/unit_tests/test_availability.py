@@ -0,0 +1,196 @@
+"""
+단위 테스트 모듈 - 리소스 가용성 인덱스 테스트
+
+구간 인덱스의 겹치는 예약 검색이 전체 탐색과 같은 결과를 내는지(삽입 / 삭제 후 포함),
+빈 시간대 검색과 충돌 검사, JSON / SQLite 저장소 불러오기, search_available_resources 도구를 확인합니다.
+"""
+
+import json
+import random
+import sqlite3
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from agents.management.modules.availability import (
+    AvailabilityIndex,
+    Booking,
+    IntervalTree,
+    Resource,
+    load_index,
+    set_availability_index,
+)
+
+BASE = datetime(2025, 6, 1)
+
+
+def _at(hours: float) -> datetime:
+    return BASE + timedelta(hours=hours)
+
+
+def test_interval_tree_matches_scan() -> None:
+    """
+    무작위 예약의 삽입 / 삭제 후에도 겹치는 예약 검색 결과가 전체 탐색과 같은지 테스트합니다.
+
+    Returns:
+        None
+    """
+    rng = random.Random(0)
+    bookings = []
+    for index in range(2000):
+        start = rng.uniform(0, 1000)
+        bookings.append(
+            Booking(f"b-{index}", "r", _at(start), _at(start + rng.uniform(0.5, 30)))
+        )
+    tree = IntervalTree(bookings[:1000], seed=1)
+    for booking in bookings[1000:]:
+        tree.insert(booking)
+    removed = set(rng.sample(bookings, 500))
+    for booking in removed:
+        assert tree.remove(booking)
+    assert not tree.remove(next(iter(removed)))
+    live = [booking for booking in bookings if booking not in removed]
+    assert len(tree) == len(live)
+
+    for _ in range(200):
+        start = rng.uniform(-10, 1010)
+        query = (_at(start), _at(start + rng.uniform(0, 50)))
+        expected = sorted(
+            (b for b in live if b.start < query[1] and b.end > query[0]),
+            key=lambda b: (b.start, b.end, b.booking_id),
+        )
+        assert list(tree.overlapping(*query)) == expected
+
+
+def test_availability_index() -> None:
+    """
+    유형별 가용 리소스, 빈 시간대, 같은 리소스의 예약 충돌 검사를 테스트합니다.
+
+    Returns:
+        None
+    """
+    index = AvailabilityIndex(
+        [Resource("studio-a", "studio"), Resource("studio-b", "studio")],
+        [
+            Booking("b-1", "studio-a", _at(9), _at(12)),
+            Booking("b-2", "studio-a", _at(14), _at(18)),
+        ],
+    )
+
+    def names(resources: list[Resource]) -> list[str]:
+        return [resource.resource_id for resource in resources]
+
+    assert names(index.available("studio", _at(10), _at(11))) == ["studio-b"]
+    assert names(index.available("studio", _at(12), _at(14))) == [
+        "studio-a",
+        "studio-b",
+    ]
+    assert index.available("staff", _at(0), _at(1)) == []
+
+    assert index.free_slots("studio-a", _at(8), _at(20)) == [
+        (_at(8), _at(9)),
+        (_at(12), _at(14)),
+        (_at(18), _at(20)),
+    ]
+    assert index.free_slots(
+        "studio-a", _at(10), _at(20), min_duration=timedelta(hours=2)
+    ) == [(_at(12), _at(14)), (_at(18), _at(20))]
+
+    with pytest.raises(ValueError):
+        index.add_booking(Booking("b-3", "studio-a", _at(11), _at(13)))  # b-1과 겹침
+    with pytest.raises(KeyError):
+        index.add_booking(Booking("b-3", "studio-c", _at(11), _at(13)))
+    index.add_booking(Booking("b-3", "studio-a", _at(12), _at(14)))
+    assert index.free_slots("studio-a", _at(9), _at(18)) == []
+
+    index.remove_booking("b-1")
+    assert [b.booking_id for b in index.overlapping("studio", _at(0), _at(24))] == [
+        "b-3",
+        "b-2",
+    ]
+    with pytest.raises(ValueError):
+        AvailabilityIndex(
+            [Resource("studio-a", "studio")],
+            [
+                Booking("b-1", "studio-a", _at(9), _at(12)),
+                Booking("b-2", "studio-a", _at(11), _at(13)),
+            ],
+        )
+
+
+def test_load_index_and_tool(tmp_path) -> None:
+    """
+    JSON / SQLite 저장소에서 같은 인덱스를 불러오고, search_available_resources가 이를 사용하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from agents.management.modules.tools import search_available_resources
+
+    resources = [("cam-1", "equipment", "카메라 1"), ("cam-2", "equipment", "카메라 2")]
+    bookings = [("b-1", "cam-1", _at(9).isoformat(), _at(18).isoformat())]
+
+    json_path = tmp_path / "bookings.json"
+    json_path.write_text(
+        json.dumps(
+            {
+                "resources": [
+                    dict(zip(("resource_id", "resource_type", "name"), row))
+                    for row in resources
+                ],
+                "bookings": [
+                    dict(zip(("booking_id", "resource_id", "start", "end"), row))
+                    for row in bookings
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    sqlite_path = tmp_path / "bookings.sqlite"
+    with sqlite3.connect(sqlite_path) as connection:
+        connection.execute("CREATE TABLE resources (resource_id, resource_type, name)")
+        connection.execute(
+            "CREATE TABLE bookings (booking_id, resource_id, start, end)"
+        )
+        connection.executemany("INSERT INTO resources VALUES (?, ?, ?)", resources)
+        connection.executemany("INSERT INTO bookings VALUES (?, ?, ?, ?)", bookings)
+
+    period = {"start": _at(10), "end": _at(11)}
+    for path in (json_path, sqlite_path):
+        set_availability_index(load_index(path))
+        try:
+            assert search_available_resources("equipment", period) == [
+                {
+                    "resource_id": "cam-2",
+                    "resource_type": "equipment",
+                    "name": "카메라 2",
+                }
+            ]
+            assert len(search_available_resources("equipment", {"start": _at(20)})) == 2
+            # 반열린 구간: 시작 시각에는 예약 중, 종료 시각에는 비어 있음
+            assert len(search_available_resources("equipment", {"start": _at(9)})) == 1
+            assert len(search_available_resources("equipment", {"start": _at(18)})) == 2
+            assert len(search_available_resources("equipment")) == 2  # naive 현재 시각
+        finally:
+            set_availability_index(None)
+
+
+def test_now_matches_booking_timezone() -> None:
+    """
+    현재 시각이 예약 시각과 같은 형식(naive / aware)으로 반환되어 비교할 수 있는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    resource = Resource("studio-a", "studio", "A동 스튜디오")
+    naive = AvailabilityIndex([resource], [Booking("b-1", "studio-a", _at(0), _at(1))])
+    aware_start = _at(0).replace(tzinfo=UTC)
+    aware = AvailabilityIndex(
+        [resource],
+        [Booking("b-1", "studio-a", aware_start, aware_start + timedelta(hours=1))],
+    )
+
+    assert naive.now().tzinfo is None
+    assert aware.now().tzinfo is not None
+    assert AvailabilityIndex().now().tzinfo is not None
+    assert aware.available("studio", aware.now()) == [resource]
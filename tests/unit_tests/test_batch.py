@@ -0,0 +1,72 @@
+"""
+단위 테스트 모듈 - 페르소나 일괄 추출 테스트
+
+이 모듈은 Text Agent의 일괄 추출 API가 입력 순서를 유지하고
+항목별 오류를 올바르게 보고하는지 검증합니다.
+"""
+
+import asyncio
+
+from langchain_core.runnables import RunnableLambda
+
+from agents.text.modules.batch import abatch_extract_personas, batch_extract_personas
+
+
+async def _fake_extract(inputs: dict) -> str:
+    """주제 번호가 클수록 빨리 끝나도록 하여 완료 순서를 뒤섞는 가짜 체인"""
+    if inputs["content_topic"] == "실패":
+        raise RuntimeError("추출 실패")
+    await asyncio.sleep(0.001 * (10 - len(inputs["content_topic"]) % 10))
+    return f"{inputs['content_topic']}/{inputs['content_type']}"
+
+
+def _fake_extract_sync(inputs: dict) -> str:
+    if inputs["content_topic"] == "실패":
+        raise RuntimeError("추출 실패")
+    return f"{inputs['content_topic']}/{inputs['content_type']}"
+
+
+def test_batch_preserves_order_and_reports_errors() -> None:
+    """
+    결과가 입력 순서대로 반환되고, 실패한 항목만 error를 가지는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    chain = RunnableLambda(_fake_extract_sync, afunc=_fake_extract)
+    pairs = [("봄", "블로그 글"), {"content_topic": "실패", "content_type": "이미지"}]
+    pairs += [("주제" * index, "음악") for index in range(1, 20)]
+
+    for results in (
+        asyncio.run(abatch_extract_personas(pairs, max_concurrency=4, chain=chain)),
+        batch_extract_personas(pairs, max_concurrency=4, chain=chain),
+    ):
+        assert [result.content_topic for result in results][:2] == ["봄", "실패"]
+        assert results[0].persona_extracted == "봄/블로그 글"
+        assert not results[1].ok
+        assert isinstance(results[1].error, RuntimeError)
+        assert all(result.ok for result in results[2:])
+        assert [result.persona_extracted for result in results[2:]] == [
+            f"{'주제' * index}/음악" for index in range(1, 20)
+        ]
+
+
+def test_batch_uses_current_chat_model() -> None:
+    """
+    chain을 지정하지 않으면 호출할 때의 override_chat_model() 모델을 사용하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from langchain_core.language_models import FakeListChatModel
+
+    from agents.model_registry import override_chat_model
+
+    pairs = [("여름 휴가", "블로그 글")]
+    with override_chat_model(FakeListChatModel(responses=["A"])):
+        first = batch_extract_personas(pairs)
+    with override_chat_model(FakeListChatModel(responses=["B"])):
+        second = asyncio.run(abatch_extract_personas(pairs))
+
+    assert [result.persona_extracted for result in first] == ["A"]
+    assert [result.persona_extracted for result in second] == ["B"]
@@ -0,0 +1,120 @@
+"""
+단위 테스트 모듈 - 체크포인트 테스트
+
+이 모듈은 SQLite 체크포인터로 중단된 Workflow를 재개할 때 이미 완료된 노드를
+다시 실행하지 않는지, 오래된 체크포인트가 올바르게 정리되는지 검증합니다.
+"""
+
+import asyncio
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import StateGraph
+
+from agents.base_node import BaseNode
+from agents.base_workflow import BaseWorkflow
+from agents.checkpoint import LocalCheckpointer
+
+
+class StepState(TypedDict):
+    steps: list
+
+
+class RecordNode(BaseNode):
+    """호출 횟수를 기록하고, 지정한 횟수만큼 실패하는 노드"""
+
+    def __init__(self, name: str, calls: dict, failures: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self.calls = calls
+        self.failures = failures
+
+    def execute(self, state) -> dict:
+        self.calls[self.name] = self.calls.get(self.name, 0) + 1
+        if self.calls[self.name] <= self.failures:
+            raise RuntimeError("작업자 종료")
+        return {"steps": state["steps"] + [self.name]}
+
+
+class StepWorkflow(BaseWorkflow):
+    """generate -> review 두 단계로 구성된 테스트 Workflow"""
+
+    def __init__(self, calls: dict, **options):
+        super().__init__(**options)
+        self.calls = calls
+
+    def build(self):
+        builder = StateGraph(StepState)
+        builder.add_node("generate", RecordNode("generate", self.calls))
+        builder.add_node("review", RecordNode("review", self.calls, failures=1))
+        builder.add_edge("__start__", "generate")
+        builder.add_edge("generate", "review")
+        builder.add_edge("review", "__end__")
+        workflow = builder.compile(checkpointer=self.checkpointer)
+        workflow.name = self.name
+        return workflow
+
+
+def test_resume_skips_completed_nodes(tmp_path) -> None:
+    """
+    실패한 실행을 재개하면 완료된 노드는 건너뛰고 실패한 노드부터 실행하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    calls = {}
+    workflow = StepWorkflow(calls, checkpointer=tmp_path / "checkpoints.sqlite")
+    config = {"configurable": {"thread_id": "request-1"}}
+    try:
+        with pytest.raises(RuntimeError):
+            workflow().invoke({"steps": []}, config)
+        assert calls == {"generate": 1, "review": 1}
+
+        result = workflow.resume("request-1")
+        assert result["steps"] == ["generate", "review"]
+        assert calls == {"generate": 1, "review": 2}
+
+        # 이미 완료된 실행은 다시 실행하지 않고 저장된 상태를 반환
+        assert asyncio.run(workflow.aresume("request-1")) == result
+        assert calls == {"generate": 1, "review": 2}
+
+        with pytest.raises(ValueError):
+            workflow.resume("unknown")
+    finally:
+        workflow.invalidate()
+
+
+def test_prune_checkpoints(tmp_path) -> None:
+    """
+    keep_last / max_age 기준으로 체크포인트가 정리되고, 정리 후에도 최신 상태를 읽을 수 있는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    checkpointer = LocalCheckpointer.open(tmp_path / "prune.sqlite")
+    builder = StateGraph(StepState)
+    builder.add_node("step", lambda state: {"steps": state["steps"] + ["step"]})
+    builder.add_edge("__start__", "step")
+    builder.add_edge("step", "__end__")
+    graph = builder.compile(checkpointer=checkpointer)
+
+    for thread_id in ("a", "b"):
+        config = {"configurable": {"thread_id": thread_id}}
+        for _ in range(3):
+            graph.invoke({"steps": []}, config)
+
+    def count(thread_id: str) -> int:
+        config = {"configurable": {"thread_id": thread_id}}
+        return len(list(checkpointer.list(config)))
+
+    assert count("a") == 9  # 실행당 입력 / 시작 / 노드 완료 체크포인트 3개
+
+    assert checkpointer.prune(keep_last=2) == 14
+    assert count("a") == count("b") == 2
+    latest = graph.get_state({"configurable": {"thread_id": "a"}})
+    assert latest.values["steps"] == ["step"]
+
+    # 최근에 갱신된 스레드는 삭제하지 않음
+    assert checkpointer.prune(max_age=3600) == 0
+    assert checkpointer.prune(max_age=0) == 4
+    assert count("a") == count("b") == 0
@@ -0,0 +1,127 @@
+"""
+단위 테스트 모듈 - 요청 병합 테스트
+
+입력이 같은 동시 호출이 하나의 실제 호출 결과를 공유하는지,
+병합 횟수가 카운터에 기록되는지 동기 / 비동기 경로 모두에서 확인합니다.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agents.base_node import BaseNode
+from agents.coalesce import SingleFlight, normalize_key
+
+
+def test_single_flight_sync() -> None:
+    """
+    여러 스레드의 같은 키 호출이 한 번만 실행되고, 예외도 공유되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    flight = SingleFlight("test_sync", enabled=True)
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def slow_call():
+        calls.append(1)
+        time.sleep(0.1)
+        return "결과"
+
+    def worker(results: list):
+        barrier.wait()
+        results.append(flight.do("같은 키", slow_call))
+
+    results = []
+    threads = [threading.Thread(target=worker, args=(results,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["결과"] * 8
+    assert len(calls) == 1
+    assert flight.stats() == {"leader": 1, "hit": 7, "in_flight": 0}
+
+    # 진행 중인 호출이 없으면 다시 실행
+    def failing_call():
+        raise RuntimeError("실패")
+
+    with pytest.raises(RuntimeError):
+        flight.do("같은 키", failing_call)
+    assert flight.stats()["leader"] == 2
+
+
+def test_single_flight_async() -> None:
+    """
+    같은 이벤트 루프의 같은 키 호출이 하나의 Task를 공유하고,
+    leader가 취소되어도 다른 호출은 결과를 받는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    flight = SingleFlight("test_async", enabled=True)
+    calls = []
+
+    async def slow_call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "결과"
+
+    async def run():
+        leader = asyncio.create_task(flight.ado("키", slow_call))
+        await asyncio.sleep(0)
+        followers = [flight.ado("키", slow_call) for _ in range(4)]
+        leader.cancel()
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(run()) == ["결과"] * 4
+    assert len(calls) == 1
+    assert flight.stats() == {"leader": 1, "hit": 4, "in_flight": 0}
+
+
+def test_node_coalesces_normalized_inputs() -> None:
+    """
+    coalesce를 지정한 노드에서 공백 / 대소문자만 다른 입력이 하나의 체인 호출로 병합되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    assert normalize_key({"topic": " Summer  휴가 "}) == normalize_key(
+        {"topic": "summer 휴가"}
+    )
+
+    calls = []
+
+    class SlowChain:
+        async def astream(self, chain_input):
+            calls.append(chain_input)
+            for word in ("니제는 ", "아이돌입니다."):
+                await asyncio.sleep(0.02)
+                yield word
+
+    class EchoNode(BaseNode):
+        coalesce = SingleFlight("test_node", enabled=True)
+        chain = SlowChain()
+
+        def execute(self, state) -> dict:
+            raise NotImplementedError
+
+        async def aexecute(self, state) -> dict:
+            return {"response": await self.astream_chain(self.chain, state)}
+
+    async def run():
+        node = EchoNode()
+        return await asyncio.gather(
+            node.ainvoke({"topic": "여름 휴가"}),
+            node.ainvoke({"topic": " 여름   휴가"}),
+            node.ainvoke({"topic": "가을 공연"}),
+        )
+
+    results = asyncio.run(run())
+    assert [result["response"] for result in results] == ["니제는 아이돌입니다."] * 3
+    assert len(calls) == 2
+    assert EchoNode.coalesce.stats() == {"leader": 2, "hit": 1, "in_flight": 0}
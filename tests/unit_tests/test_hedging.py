@@ -0,0 +1,88 @@
+"""
+단위 테스트 모듈 - 요청 헤징 테스트
+
+느린 요청에 추가 요청을 보내 먼저 응답한 쪽을 사용하는지, 예산을 넘지 않는지,
+스트리밍 호출은 첫 조각을 먼저 보낸 스트림을 사용하는지 확인합니다.
+"""
+
+import asyncio
+import time
+
+from agents.hedging import HedgePolicy
+
+
+def _warm_up(policy: HedgePolicy, latency: float) -> None:
+    """지연 시간 표본을 채워 헤징 대기 시간을 latency로 맞춥니다."""
+    for _ in range(policy.min_samples):
+        policy._record(latency, hedged_win=False)
+
+
+def test_hedge_cuts_slow_call() -> None:
+    """
+    첫 요청이 느리면 추가 요청의 결과를 사용하고, 예산을 다 쓰면 헤징하지 않는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    policy = HedgePolicy("test_arun", budget=0.0, enabled=True)
+    _warm_up(policy, 0.01)
+    delays = iter([1.0, 0.01, 0.05])
+    cancelled = []
+
+    async def call():
+        delay = next(delays)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return delay
+
+    async def run():
+        start = time.perf_counter()
+        result = await policy.arun(call)
+        return result, time.perf_counter() - start
+
+    result, elapsed = asyncio.run(run())
+    assert result == 0.01
+    assert elapsed < 0.5
+    assert cancelled == [1.0]  # 느린 첫 요청은 취소
+
+    # 초기 예산(1회)을 다 썼으므로 더 이상 추가 요청을 보내지 않음
+    assert asyncio.run(run())[0] == 0.05
+    stats = policy.stats()
+    assert (stats["calls"], stats["hedged"], stats["wins"]) == (2, 1, 1)
+
+
+def test_hedge_stream() -> None:
+    """
+    동기 / 비동기 스트림에서 첫 조각을 먼저 보낸 스트림의 조각만 전달되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    policy = HedgePolicy("test_stream", budget=1.0, enabled=True)
+    _warm_up(policy, 0.01)
+
+    def make_stream(first_delay: float, label: str):
+        def stream():
+            time.sleep(first_delay)
+            yield f"{label}-1"
+            yield f"{label}-2"
+
+        return stream()
+
+    streams = iter([make_stream(0.5, "slow"), make_stream(0.0, "fast")])
+    assert list(policy.stream(lambda: next(streams))) == ["fast-1", "fast-2"]
+
+    async def amake_stream(first_delay: float, label: str):
+        await asyncio.sleep(first_delay)
+        yield f"{label}-1"
+        yield f"{label}-2"
+
+    astreams = iter([amake_stream(0.5, "slow"), amake_stream(0.0, "fast")])
+
+    async def collect():
+        return [chunk async for chunk in policy.astream(lambda: next(astreams))]
+
+    assert asyncio.run(collect()) == ["fast-1", "fast-2"]
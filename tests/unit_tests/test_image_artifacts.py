@@ -0,0 +1,119 @@
+"""
+단위 테스트 모듈 - 이미지 아티팩트 저장소 테스트
+
+아티팩트 키가 프롬프트 공백 / 대소문자와 파라미터 순서에 영향을 받지 않는지, 저장 / 읽기(mmap)와
+LRU 삭제(재시작 후 순서 포함)가 올바른지, CachedImageNode가 같은 요청의 동시 실행에서 한 번만 생성하는지 확인합니다.
+"""
+
+import mmap
+import os
+import threading
+import time
+
+from agents.image.modules.artifacts import (
+    ArtifactStore,
+    artifact_key,
+    set_artifact_store,
+)
+
+
+def test_artifact_key_normalization() -> None:
+    """
+    공백 / 대소문자만 다른 프롬프트와 순서만 다른 파라미터는 같은 키, 파라미터가 다르면 다른 키인지 테스트합니다.
+
+    Returns:
+        None
+    """
+    key = artifact_key("여름 바다 Poster", size="1024x1024", seed=7)
+    assert key == artifact_key("  여름   바다 poster ", seed=7, size="1024x1024")
+    assert key != artifact_key("여름 바다 Poster", size="512x512", seed=7)
+    assert len(key) == 64
+
+
+def test_store_put_get_and_evict(tmp_path) -> None:
+    """
+    저장한 바이트를 mmap memoryview로 읽고, 최대 크기를 넘으면 가장 오래 사용하지 않은 아티팩트를
+    삭제하며, 다시 열어도 사용 순서가 유지되고 중단된 쓰기의 임시 파일이 삭제되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    store = ArtifactStore(tmp_path, max_bytes=300)
+    keys = [artifact_key(f"image {i}") for i in range(4)]
+    for i, key in enumerate(keys[:3]):
+        assert store.put(key, bytes([i]) * 100)
+        time.sleep(0.01)  # 수정 시각 순서 보장
+    assert store.get(keys[0]).tobytes() == b"\x00" * 100  # keys[0]을 최근 사용으로
+    assert isinstance(store.get(keys[0]).obj, mmap.mmap)
+    assert not any(
+        name.startswith(".tmp-") for _, _, names in os.walk(tmp_path) for name in names
+    )
+
+    store.put(keys[3], b"\x03" * 100)  # keys[1] 삭제
+    assert store.get(keys[1]) is None
+    assert [key in store for key in keys] == [True, False, True, True]
+    assert store.total_bytes == 300
+    assert not store.put(artifact_key("too large"), b"x" * 301)
+
+    time.sleep(0.01)
+    store.get(keys[2])
+    stale = tmp_path / keys[0][:2] / ".tmp-stale"
+    stale.write_bytes(b"x" * 50)
+    os.utime(stale, (0, 0))  # 쓰는 도중 종료된 프로세스가 남긴 파일
+    writing = tmp_path / keys[0][:2] / ".tmp-writing"
+    writing.write_bytes(b"x" * 50)
+    # 재시작: 가장 오래 사용하지 않은 keys[0] 삭제
+    reopened = ArtifactStore(tmp_path, max_bytes=200)
+    assert [key in reopened for key in keys] == [False, False, True, True]
+    assert len(reopened) == 2
+    assert not stale.exists() and writing.exists()
+
+
+def test_cached_node_generates_once(tmp_path, monkeypatch) -> None:
+    """
+    CachedImageNode가 같은 요청의 동시 실행에서 한 번만 생성하고, 다음 요청은 저장소에서 반환하는지 테스트합니다.
+    (LLM 요청 병합을 끈 경우에도 아티팩트 생성은 병합)
+
+    Returns:
+        None
+    """
+    from agents.image.modules.nodes import CachedImageNode
+
+    monkeypatch.setenv("LLM_COALESCE", "0")
+    calls = []
+
+    class PosterNode(CachedImageNode):
+        def generate(self, state) -> bytes:
+            calls.append(state["query"])
+            time.sleep(0.1)
+            return f"png:{state['query']}".encode()
+
+        def generation_params(self, state) -> dict:
+            return {"size": "1024x1024"}
+
+    set_artifact_store(ArtifactStore(tmp_path))
+    try:
+        node = PosterNode()
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(node.execute({"query": "여름 포스터"}))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        again = node.invoke({"query": "  여름   포스터"})
+        other = node.invoke({"query": "겨울 포스터"})
+    finally:
+        set_artifact_store(None)
+
+    assert calls == ["여름 포스터", "겨울 포스터"]
+    assert {bytes(result["image"]) for result in results} == {
+        "png:여름 포스터".encode()
+    }
+    assert again["artifact_key"] == results[0]["artifact_key"]
+    assert bytes(again["image"]) == "png:여름 포스터".encode()
+    assert bytes(other["image"]) == "png:겨울 포스터".encode()
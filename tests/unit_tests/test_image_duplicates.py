@@ -0,0 +1,140 @@
+"""
+단위 테스트 모듈 - 이미지 중복 검사 테스트
+
+지각 해시가 크기 변경 / 재압축에 강한지, 다중 인덱스 검색 결과가 전체 탐색과 같은지(추가 후 포함),
+이미지 Workflow가 참고 이미지가 있을 때 중복 검사 노드를 거쳐 duplicate_of를 기록하는지 확인합니다.
+"""
+
+import random
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from agents.image.modules.duplicates import HashIndex, hash_image, set_hash_index
+
+
+def _draw(path, seed: int, size=(640, 480)) -> None:
+    """seed마다 다른 도형 이미지를 저장합니다."""
+    rng = random.Random(seed)
+    image = Image.new("RGB", size, tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        x, y = rng.randrange(size[0]), rng.randrange(size[1])
+        draw.ellipse(
+            (x, y, x + rng.randint(40, 240), y + rng.randint(40, 240)),
+            fill=tuple(rng.randrange(256) for _ in range(3)),
+        )
+    image.save(path, quality=95)
+
+
+def test_hash_is_robust_to_resize(tmp_path) -> None:
+    """
+    크기를 줄이고 다시 압축한 이미지는 가깝고, 다른 이미지는 먼지 테스트합니다. (pHash / dHash)
+
+    Returns:
+        None
+    """
+    _draw(tmp_path / "original.jpg", seed=1)
+    _draw(tmp_path / "other.jpg", seed=2)
+    with Image.open(tmp_path / "original.jpg") as image:
+        image.resize((200, 150)).save(tmp_path / "small.jpg", quality=60)
+
+    for method in ("phash", "dhash"):
+        original, small, other = (
+            hash_image(tmp_path / name, method)
+            for name in ("original.jpg", "small.jpg", "other.jpg")
+        )
+        assert (original ^ small).bit_count() <= 6
+        assert (original ^ other).bit_count() > 12
+
+
+def test_multi_index_matches_scan() -> None:
+    """
+    무작위 해시(근접 해시 포함)에서 다중 인덱스 검색이 전체 탐색과 같은 결과를 내는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    rng = np.random.default_rng(0)
+    hashes = rng.integers(0, 2**64, 20_000, dtype=np.uint64)
+    queries = hashes[:50].copy()
+    for i in range(1, 50):  # 질의마다 거리 1~10인 해시를 여러 개 추가
+        for distance in range(1, 11):
+            bits = rng.choice(64, distance, replace=False).astype(np.uint64)
+            hashes[i * 200 + distance] = queries[i] ^ np.bitwise_or.reduce(
+                np.uint64(1) << bits
+            )
+
+    index = HashIndex((f"a-{i}" for i in range(15_000)), hashes[:15_000].tolist())
+    assert index.query(int(queries[0]), 0) == [("a-0", 0)]  # 조각 배열 생성
+    for i in range(15_000, 20_000):  # tail에 추가
+        index.add(f"a-{i}", int(hashes[i]))
+    assert len(index) == 20_000
+
+    for max_distance in (0, 3, 6, 10, 13):
+        for query in queries:
+            distances = np.bitwise_count(hashes ^ query)
+            expected = [
+                (f"a-{i}", int(distances[i]))
+                for i in np.lexsort((np.arange(len(hashes)), distances))
+                if distances[i] <= max_distance
+            ]
+            assert index.query(int(query), max_distance) == expected
+
+
+def test_workflow_checks_duplicates(tmp_path) -> None:
+    """
+    참고 이미지와 거의 같은 에셋이 있으면 duplicate_of에 기록하고, 없거나 참고 이미지를 읽을 수 없으면
+    None을 기록하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from agents.image.modules.state import ImageState
+    from agents.image.workflow import ImageWorkflow
+
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    for seed in range(5):
+        _draw(assets / f"asset-{seed}.jpg", seed)
+    index = HashIndex.from_directory(assets, workers=1)
+    assert len(index) == 5
+    index.save(tmp_path / "hashes.npz")
+
+    with Image.open(assets / "asset-3.jpg") as image:
+        image.resize((320, 240)).save(tmp_path / "draft.png")
+    _draw(tmp_path / "new.png", seed=99)
+
+    set_hash_index(HashIndex.load(tmp_path / "hashes.npz"))
+    try:
+        graph = ImageWorkflow(ImageState)()
+        duplicate = graph.invoke(
+            {
+                "query": "포스터",
+                "response": [],
+                "reference_image": str(tmp_path / "draft.png"),
+            }
+        )
+        new = graph.invoke(
+            {
+                "query": "포스터",
+                "response": [],
+                "reference_image": str(tmp_path / "new.png"),
+            }
+        )
+        plain = graph.invoke({"query": "포스터", "response": []})
+        missing = graph.invoke(
+            {
+                "query": "포스터",
+                "response": [],
+                "reference_image": str(tmp_path / "missing.png"),
+            }
+        )
+    finally:
+        set_hash_index(None)
+
+    assert duplicate["duplicate_of"]["asset_id"] == "asset-3.jpg"
+    assert "asset-3.jpg" in duplicate["response"][-1].content
+    assert new["duplicate_of"] is None
+    assert plain.get("duplicate_of") is None
+    assert missing["duplicate_of"] is None
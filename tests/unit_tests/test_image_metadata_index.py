@@ -0,0 +1,127 @@
+"""
+단위 테스트 모듈 - 이미지 메타데이터 색인 테스트
+
+헤더 메타데이터 추출, 프로세스 풀 색인 결과가 단일 프로세스 결과와 같은지,
+다시 색인할 때 바뀐 파일 / 새 파일만 읽고 사라진 파일은 삭제하는지 확인합니다.
+"""
+
+import os
+
+from PIL import Image
+
+from agents.image.modules.metadata_index import ImageMetadataIndex, walk_images
+from agents.image.modules.utils import extract_image_metadata
+
+
+def _write_images(root, count: int) -> None:
+    """형식과 크기가 다른 이미지 count개를 하위 디렉토리에 나눠 저장합니다."""
+    formats = (("png", "RGB"), ("jpg", "RGB"), ("gif", "P"), ("webp", "RGBA"))
+    for i in range(count):
+        extension, mode = formats[i % len(formats)]
+        directory = root / f"set-{i % 3}"
+        directory.mkdir(exist_ok=True)
+        Image.new(mode, (10 + i, 20 + i)).save(directory / f"image-{i}.{extension}")
+
+
+def test_extract_image_metadata(tmp_path, caplog) -> None:
+    """
+    헤더만 읽어 형식, 모드, 크기를 반환하고, 이미지가 아니면 경고 로그를 남기고 None을 반환하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    path = tmp_path / "poster.png"
+    Image.new("RGBA", (64, 32)).save(path)
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+
+    assert extract_image_metadata(str(path)) == {
+        "format": "PNG",
+        "mode": "RGBA",
+        "width": 64,
+        "height": 32,
+        "size": (64, 32),
+    }
+    assert extract_image_metadata(str(tmp_path / "broken.png")) is None
+    assert "broken.png" in caplog.text
+
+
+def test_parallel_index_matches_serial(tmp_path) -> None:
+    """
+    프로세스 풀 색인 결과가 단일 프로세스 색인 결과와 같은지 테스트합니다.
+
+    Returns:
+        None
+    """
+    _write_images(tmp_path, 40)
+    with ImageMetadataIndex(tmp_path, tmp_path / "serial.sqlite") as serial:
+        stats = serial.update(workers=1)
+        expected = list(serial.records())
+    with ImageMetadataIndex(tmp_path) as parallel:
+        parallel_stats = parallel.update(workers=2, chunk_size=8)
+        assert list(parallel.records()) == expected
+
+    assert stats.scanned == stats.extracted == parallel_stats.extracted == 40
+    assert stats.failed == 0
+    assert expected[0] == {
+        "path": "set-0/image-0.png",
+        "format": "PNG",
+        "mode": "RGB",
+        "width": 10,
+        "height": 20,
+    }
+
+
+def test_incremental_update(tmp_path) -> None:
+    """
+    다시 색인할 때 바뀐 파일 / 새 파일만 읽고, 사라진 파일은 삭제하며, 읽지 못한 파일은 기록하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    _write_images(tmp_path, 12)
+    with ImageMetadataIndex(tmp_path) as index:
+        index.update(workers=1)
+
+    changed = tmp_path / "set-0" / "image-0.png"
+    Image.new("L", (99, 99)).save(changed)
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    (tmp_path / "set-1" / "image-1.jpg").unlink()
+    (tmp_path / "set-2" / "broken.png").write_bytes(b"not an image")
+
+    with ImageMetadataIndex(tmp_path) as index:  # 사이드카 색인을 다시 열어 갱신
+        stats = index.update(workers=1)
+        assert (stats.scanned, stats.extracted, stats.unchanged) == (12, 2, 10)
+        assert (stats.removed, stats.failed) == (1, 1)
+        assert len(index) == 12
+        assert index.get("set-0/image-0.png") == {
+            "format": "PNG",
+            "mode": "L",
+            "width": 99,
+            "height": 99,
+        }
+        assert index.get("set-1/image-1.jpg") is None
+        assert "error" in index.get("set-2/broken.png")
+
+        stats = index.update(workers=1)
+        assert (stats.extracted, stats.unchanged, stats.removed) == (0, 12, 0)
+
+
+def test_walk_skips_unreadable_entries(tmp_path, caplog) -> None:
+    """
+    끊어진 심볼릭 링크가 있어도 순회 / 색인이 중단되지 않고 경고를 남기는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    _write_images(tmp_path, 3)
+    (tmp_path / "set-0" / "dangling.png").symlink_to(tmp_path / "missing.png")
+
+    paths = sorted(path for path, _, _ in walk_images(str(tmp_path)))
+    assert len(paths) == 3
+    assert "set-0/dangling.png" not in paths
+    assert "dangling.png" in caplog.text
+
+    with ImageMetadataIndex(tmp_path) as index:
+        stats = index.update(workers=1)
+        assert (stats.scanned, stats.failed) == (3, 0)
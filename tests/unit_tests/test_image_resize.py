@@ -0,0 +1,141 @@
+"""
+단위 테스트 모듈 - 이미지 일괄 리사이즈 테스트
+
+한 번의 디코딩으로 여러 크기를 만드는지(비율 유지, 확대 없음), 출력 형식별 모드 변환,
+프로세스 풀 파이프라인이 파일 목록을 처리 중인 작업 수만큼만 소비하는지(backpressure) 확인합니다.
+"""
+
+from PIL import Image
+
+from agents.image.modules.resize import (
+    fit_size,
+    render_sizes,
+    resize_directory,
+    resize_images,
+)
+from agents.image.modules.utils import resize_image
+
+SIZES = {"thumb": (128, 128), "preview": (512, 512)}
+
+
+def test_render_sizes(tmp_path) -> None:
+    """
+    큰 JPEG / 작은 팔레트 PNG에서 크기별 출력 파일의 크기, 형식, 모드를 테스트합니다.
+
+    Returns:
+        None
+    """
+    photo = tmp_path / "photo.jpg"
+    Image.linear_gradient("L").resize((2000, 1500)).convert("RGB").save(photo)
+    icon = tmp_path / "icon.png"
+    Image.new("RGBA", (300, 100), (255, 0, 0, 128)).convert("P").save(icon)
+
+    outputs = render_sizes(str(photo), str(tmp_path / "out" / "photo"), SIZES)
+    assert outputs == {
+        "thumb": str(tmp_path / "out" / "photo_thumb.jpg"),
+        "preview": str(tmp_path / "out" / "photo_preview.jpg"),
+    }
+    with (
+        Image.open(outputs["thumb"]) as thumb,
+        Image.open(outputs["preview"]) as preview,
+    ):
+        assert (thumb.format, thumb.size) == ("JPEG", (128, 96))
+        assert preview.size == (512, 384)
+
+    outputs = render_sizes(
+        str(icon), str(tmp_path / "out" / "icon"), SIZES, format="PNG"
+    )
+    with (
+        Image.open(outputs["preview"]) as preview,
+        Image.open(outputs["thumb"]) as thumb,
+    ):
+        # 원본보다 크게 늘리지 않음
+        assert (preview.size, preview.mode) == ((300, 100), "RGBA")
+        assert (thumb.size, thumb.mode) == ((128, 43), "RGBA")
+
+    assert fit_size((100, 400), (128, 128)) == (32, 128)
+    assert resize_image(str(photo), 64, 64, str(tmp_path / "square.jpg"))
+    with Image.open(tmp_path / "square.jpg") as square:
+        assert square.size == (64, 64)
+
+
+def test_resize_directory_in_parallel(tmp_path) -> None:
+    """
+    프로세스 풀에서 하위 디렉토리 구조를 유지하여 모든 이미지를 처리하고, 실패한 파일을 보고하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    source = tmp_path / "assets"
+    for i in range(8):
+        directory = source / f"set-{i % 2}"
+        directory.mkdir(parents=True, exist_ok=True)
+        Image.new("RGB", (800, 600), (i * 30, 0, 0)).save(directory / f"image-{i}.jpg")
+    (source / "set-0" / "broken.jpg").write_bytes(b"not an image")
+
+    results = list(
+        resize_directory(
+            str(source), str(tmp_path / "out"), SIZES, workers=2, max_pending=2
+        )
+    )
+    assert len(results) == 9
+    failed = [result for result in results if result.error]
+    assert [result.source for result in failed] == [
+        str(source / "set-0" / "broken.jpg")
+    ]
+    assert sorted(
+        path.relative_to(tmp_path / "out").as_posix()
+        for path in (tmp_path / "out").rglob("*.jpg")
+    ) == sorted(
+        f"set-{i % 2}/image-{i}.jpg_{name}.jpg" for i in range(8) for name in SIZES
+    )
+
+
+def test_output_paths_do_not_collide(tmp_path) -> None:
+    """
+    확장자만 다른 원본은 서로 다른 출력 파일을 쓰고, root 없이 이름이 같은 원본은 덮어쓰지 않고 오류로 보고하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    for directory, color in (("a", (255, 0, 0)), ("b", (0, 0, 255))):
+        (tmp_path / directory).mkdir()
+        Image.new("RGB", (64, 64), color).save(tmp_path / directory / "teaser.jpg")
+    Image.new("RGB", (64, 64)).save(tmp_path / "a" / "teaser.png")
+    sources = [
+        str(tmp_path / "a" / "teaser.jpg"),
+        str(tmp_path / "a" / "teaser.png"),
+        str(tmp_path / "b" / "teaser.jpg"),
+    ]
+
+    results = list(resize_images(sources, str(tmp_path / "out"), SIZES, workers=1))
+    assert [result.error is None for result in results] == [True, True, False]
+    assert results[0].outputs["thumb"] != results[1].outputs["thumb"]
+    with Image.open(results[0].outputs["thumb"]) as thumb:
+        assert thumb.getpixel((0, 0))[0] > 200  # b/teaser.jpg가 덮어쓰지 않음
+
+
+def test_backpressure(tmp_path) -> None:
+    """
+    파이프라인이 파일 목록을 처리 중인 작업 수(max_pending)보다 많이 미리 읽지 않는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    for i in range(20):
+        Image.new("RGB", (64, 64)).save(tmp_path / f"image-{i}.png")
+    consumed = 0
+
+    def sources():
+        nonlocal consumed
+        for i in range(20):
+            consumed += 1
+            yield str(tmp_path / f"image-{i}.png")
+
+    results = resize_images(
+        sources(), str(tmp_path / "out"), SIZES, workers=2, max_pending=3
+    )
+    next(results)
+    assert consumed <= 4  # 처리 중인 작업 3개 + 다음 작업을 기다리는 파일 1개
+    assert sum(1 for _ in results) == 19
+    assert consumed == 20
@@ -0,0 +1,157 @@
+"""
+단위 테스트 모듈 - LLM 스케줄러 테스트
+
+LLM 호출이 요청 한도를 지키는지, 에이전트 사이에서 공정하게 실행 순서를 받는지,
+429 응답과 지연 시간에 따라 동시 실행 수가 조정되는지 확인합니다.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import (
+    FakeMessagesListChatModel,
+    GenericFakeChatModel,
+)
+from langchain_core.messages import AIMessage
+
+from agents.llm_scheduler import (
+    LLMScheduler,
+    ScheduledChatModel,
+    SchedulerConfig,
+    Slot,
+)
+from agents.metrics import track_node
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_scheduler_fair_queue() -> None:
+    """
+    동시 실행 수가 1일 때, 먼저 대기열에 쌓인 에이전트가 있어도 에이전트끼리 번갈아 실행되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    config = SchedulerConfig(
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        initial_concurrency=1,
+        max_concurrency=1,
+        poll_interval=0.01,
+    )
+    scheduler = LLMScheduler("test-model", config)
+    order = []
+
+    def call(agent: str):
+        with track_node(agent, "node"), scheduler.slot(10):
+            order.append(agent)
+            time.sleep(0.01)
+
+    threads = []
+    with scheduler.slot(10):  # 실행 권한을 잡아 두고 대기열을 쌓음
+        for agent in ("Text", "Text", "Text", "Music"):
+            thread = threading.Thread(target=call, args=(agent,))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.02)
+        assert scheduler.stats()["queued"] == {"Text": 3, "Music": 1}
+    for thread in threads:
+        thread.join()
+
+    assert order == ["Text", "Music", "Text", "Text"]
+    assert scheduler.stats()["in_flight"] == 0
+
+
+def test_scheduler_rate_limits() -> None:
+    """
+    분당 요청 한도를 넘는 호출은 기다리고, 429 응답을 받으면 동시 실행 수가 줄어드는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    config = SchedulerConfig(
+        requests_per_minute=600,  # 초당 10회
+        tokens_per_minute=None,
+        burst_seconds=0.1,  # 한 번에 1회까지
+        initial_concurrency=8,
+        rate_limit_pause=0.05,
+        poll_interval=0.01,
+    )
+    scheduler = LLMScheduler("test-model", config)
+
+    async def call():
+        async with scheduler.aslot(10):
+            pass
+
+    async def run():
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(4)))
+        return time.perf_counter() - start
+
+    assert asyncio.run(run()) >= 0.25
+
+    with pytest.raises(RateLimitError), scheduler.slot(10):
+        raise RateLimitError()
+    assert scheduler.limit < config.initial_concurrency
+
+
+def test_scheduled_chat_model() -> None:
+    """
+    ScheduledChatModel이 감싼 모델의 응답을 그대로 반환하고, 실행 권한을 반납하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    scheduler = LLMScheduler("test-model", SchedulerConfig())
+    model = ScheduledChatModel(
+        llm=FakeMessagesListChatModel(responses=[AIMessage(content="안녕하세요")]),
+        scheduler=scheduler,
+    )
+
+    assert model.invoke("안녕").content == "안녕하세요"
+    assert asyncio.run(model.ainvoke("안녕")).content == "안녕하세요"
+    assert scheduler.stats()["in_flight"] == 0
+    assert scheduler.stats()["baseline_latency"] is not None
+
+
+def test_scheduler_latency_per_output_token() -> None:
+    """
+    긴 응답은 출력 토큰 수로 나눈 지연 시간으로 판단해 동시 실행 수를 줄이지 않고,
+    스트리밍 호출은 소비하는 쪽의 처리 시간을 지연 시간에 넣지 않는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    config = SchedulerConfig(
+        requests_per_minute=None, tokens_per_minute=None, initial_concurrency=8
+    )
+    scheduler = LLMScheduler("test-model", config)
+    short = AIMessage(content="", usage_metadata=_usage(10))
+    long = AIMessage(content="", usage_metadata=_usage(1000))
+    for message, elapsed in ((short, 0.5), (long, 10.0), (long, 12.0)):
+        slot = Slot("Text", 10)
+        slot.record_usage(message)
+        scheduler.in_flight += 1
+        scheduler._release(slot, elapsed, None)
+    assert scheduler.stats()["baseline_latency"] == pytest.approx(0.01, rel=0.05)
+    assert scheduler.limit > config.initial_concurrency
+
+    model = ScheduledChatModel(
+        llm=GenericFakeChatModel(messages=iter([AIMessage(content="a b c d")])),
+        scheduler=LLMScheduler("stream-model", config),
+    )
+    for _ in model.stream("안녕"):
+        time.sleep(0.05)  # 소비하는 쪽의 처리 시간
+    assert model.scheduler.stats()["baseline_latency"] < 0.05 / 32
+
+
+def _usage(output_tokens: int) -> dict:
+    return {
+        "input_tokens": 10,
+        "output_tokens": output_tokens,
+        "total_tokens": 10 + output_tokens,
+    }
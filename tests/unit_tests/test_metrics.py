@@ -0,0 +1,92 @@
+"""
+단위 테스트 모듈 - 메트릭 테스트
+
+노드 실행 시간, 오류 수, 노드 내부 LLM 호출의 토큰 수가
+(workflow, node) 라벨별로 기록되고 내보내지는지 확인합니다.
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import (
+    FakeMessagesListChatModel,
+)
+from langchain_core.messages import AIMessage
+
+from agents import metrics
+from agents.base_node import BaseNode
+
+
+def _sample(name: str, node: str) -> dict:
+    """스냅샷에서 노드 라벨에 해당하는 샘플을 찾습니다."""
+    samples = metrics.snapshot()[name]["samples"]
+    return next(sample for sample in samples if sample["labels"]["node"] == node)
+
+
+def test_node_metrics() -> None:
+    """
+    노드 실행 시 실행 시간, 토큰 수, 오류 수가 기록되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    metrics.REGISTRY.reset()
+    model = FakeMessagesListChatModel(
+        responses=[
+            AIMessage(
+                content="안녕하세요",
+                usage_metadata={
+                    "input_tokens": 120,
+                    "output_tokens": 30,
+                    "total_tokens": 150,
+                },
+            )
+        ]
+    )
+
+    class ChatNode(BaseNode):
+        def execute(self, state) -> dict:
+            return {"response": model.invoke("안녕").content}
+
+        async def aexecute(self, state) -> dict:
+            return {"response": (await model.ainvoke("안녕")).content}
+
+    class FailingNode(BaseNode):
+        def execute(self, state) -> dict:
+            raise RuntimeError("실패")
+
+    node = ChatNode(workflow="TestWorkflow")
+    node({})
+    asyncio.run(node.ainvoke({}))
+    with pytest.raises(RuntimeError):
+        FailingNode(workflow="TestWorkflow")({})
+
+    duration = _sample("agents_node_duration_seconds", "ChatNode")
+    assert duration["labels"] == {"workflow": "TestWorkflow", "node": "ChatNode"}
+    assert duration["count"] == 2
+    assert _sample("agents_llm_prompt_tokens", "ChatNode")["sum"] == 240
+    assert _sample("agents_llm_completion_tokens", "ChatNode")["sum"] == 60
+    assert _sample("agents_node_errors_total", "FailingNode")["value"] == 1
+
+    exported = metrics.export_prometheus()
+    assert "# TYPE agents_node_duration_seconds histogram" in exported
+    assert (
+        'agents_node_errors_total{workflow="TestWorkflow",node="FailingNode"} 1.0'
+        in exported
+    )
+
+
+def test_histogram_quantile() -> None:
+    """
+    히스토그램 분위수 추정이 버킷 경계 안에서 이루어지는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    histogram = metrics.Histogram(buckets=(1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert 1.0 <= histogram.quantile(0.5) <= 2.0
+    assert 2.0 <= histogram.quantile(0.99) <= 4.0
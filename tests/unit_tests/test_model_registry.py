@@ -0,0 +1,67 @@
+"""
+단위 테스트 모듈 - 모델 레지스트리 테스트
+
+이 모듈은 공유 LLM 클라이언트 레지스트리가 모델 인스턴스와
+HTTP 커넥션 풀을 올바르게 재사용하는지 검증합니다.
+"""
+
+from agents import model_registry
+from agents.management.modules.models import get_openai_model as management_model
+from agents.text.modules.models import get_openai_model as text_model
+
+
+def test_registry_shares_instances_and_pool() -> None:
+    """
+    같은 설정이면 에이전트가 달라도 같은 인스턴스를 공유하고,
+    설정이 다른 인스턴스도 같은 HTTP 커넥션 풀을 사용하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    model_registry.clear_registry()
+
+    assert text_model() is management_model()
+
+    creative = text_model(temperature=1.0)
+    assert creative is not text_model()
+    assert creative.scheduler is text_model().scheduler  # 같은 모델은 스케줄러 공유
+    assert creative.llm.http_client is text_model().llm.http_client
+    assert creative.llm.http_async_client is text_model().llm.http_async_client
+
+
+def test_configure_pool_resets_registry() -> None:
+    """
+    커넥션 풀 설정을 변경하면 새 인스턴스가 생성되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    original = model_registry.get_pool_config()
+    before = text_model()
+    try:
+        config = model_registry.configure_pool(max_keepalive_connections=5)
+        assert config.max_keepalive_connections == 5
+        assert text_model() is not before
+    finally:
+        model_registry.configure_pool(**vars(original))
+
+
+def test_override_chat_model() -> None:
+    """
+    override_chat_model() 블록 안에서만 교체된 모델이 반환되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    fake = FakeListChatModel(responses=["가짜 응답"])
+    original = text_model()
+    with model_registry.override_chat_model(fake):
+        assert text_model() is fake
+        assert management_model() is fake
+    assert text_model() is original
+
+    with model_registry.override_chat_model(lambda model, temperature, top_p: fake):
+        assert text_model(temperature=1.0) is fake
+    assert text_model() is original
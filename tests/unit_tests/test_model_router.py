@@ -0,0 +1,143 @@
+"""
+단위 테스트 모듈 - 모델 라우터 테스트
+
+요청 특성으로 모델 등급을 고르는지, 등급의 지연 시간이 목표를 넘으면 fallback 등급으로 내리는지,
+조건부 에지에서 결정한 등급이 노드의 체인과 최종 상태까지 전달되는지 확인합니다.
+"""
+
+from agents.model_router import (
+    LONG_QUERY_CHARS,
+    ModelRouter,
+    ModelTier,
+    default_tiers,
+)
+
+
+def _router(**kwargs) -> ModelRouter:
+    """테스트용 등급 목록을 가진 라우터를 생성합니다."""
+    tiers = {
+        "light": ModelTier("light", "small", 300),
+        "standard": ModelTier("standard", "small", 1200),
+        "heavy": ModelTier(
+            "heavy", "large", 2500, latency_slo=1.0, fallback="standard"
+        ),
+    }
+    return ModelRouter(tiers, **kwargs)
+
+
+def test_router_classify() -> None:
+    """
+    콘텐츠 유형, 요청 유형, 쿼리 길이에 따라 등급과 생성 토큰 상한이 결정되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    router = _router()
+
+    social = router.decide(
+        "TextWorkflow", content_type="소셜 미디어 포스트", query="짧게"
+    )
+    assert social == {
+        "tier": "light",
+        "model": "small",
+        "max_tokens": 300,
+        "reason": "content_type",
+    }
+    assert router.decide("TextWorkflow", content_type="블로그 글")["tier"] == "standard"
+    assert (
+        router.decide("ManagementWorkflow", request_type="resource_allocation")["tier"]
+        == "heavy"
+    )
+
+    # 긴 쿼리는 한 등급 올림 (가장 높은 등급은 그대로)
+    long_query = "가" * (LONG_QUERY_CHARS + 1)
+    upgraded = router.decide("TextWorkflow", content_type="캡션", query=long_query)
+    assert (upgraded["tier"], upgraded["reason"]) == ("standard", "query_length")
+    assert router.classify(request_type="team_management", query=long_query) == (
+        "heavy",
+        "request_type",
+    )
+
+
+def test_default_tiers_keep_small_model(monkeypatch) -> None:
+    """
+    기본 heavy 등급은 비용이 늘지 않도록 작은 모델을 쓰고, 환경변수로 지정해야 큰 모델을 쓰는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    monkeypatch.delenv("LLM_ROUTER_MODEL_HEAVY", raising=False)
+    assert {tier.model for tier in default_tiers().values()} == {"gpt-4o-mini"}
+    monkeypatch.setenv("LLM_ROUTER_MODEL_HEAVY", "gpt-4o")
+    assert default_tiers()["heavy"].model == "gpt-4o"
+
+
+def test_router_latency_fallback() -> None:
+    """
+    등급의 최근 p95 지연 시간이 목표를 넘으면 fallback 등급으로 내리고,
+    probe_every번에 한 번은 원래 등급으로 보내는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    router = _router(min_samples=5, probe_every=4)
+    heavy = router.decide("ManagementWorkflow", request_type="resource_allocation")
+    for _ in range(4):
+        router.record_outcome("ManagementWorkflow", heavy, 0.5)
+    # 표본이 부족하면 보호를 적용하지 않음
+    assert router._p95("heavy") is None
+    router.record_outcome("ManagementWorkflow", heavy, 5.0)
+    assert router._p95("heavy") == 5.0
+
+    tiers = [
+        router.decide("ManagementWorkflow", request_type="resource_allocation")
+        for _ in range(8)
+    ]
+    assert [route["tier"] for route in tiers].count("heavy") == 2  # 4번에 1번 probe
+    assert {route["reason"] for route in tiers if route["tier"] == "standard"} == {
+        "latency"
+    }
+
+    # 지연 시간이 회복되면 원래 등급 사용
+    for _ in range(200):
+        router.record_outcome("ManagementWorkflow", heavy, 0.1)
+    route = router.decide("ManagementWorkflow", request_type="resource_allocation")
+    assert route["tier"] == "heavy"
+
+
+def test_routed_workflow() -> None:
+    """
+    조건부 에지의 라우팅 결정이 최종 상태에 기록되고, 노드가 등급별 체인을 한 번만 생성하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from agents.base_workflow import BaseWorkflow
+    from agents.model_registry import override_chat_model
+    from agents.text.modules.nodes import PersonaExtractionNode
+    from agents.text.modules.state import TextState
+    from agents.text.workflow import TextWorkflow
+
+    state = {
+        "content_topic": "여름 휴가",
+        "content_type": "소셜 미디어 포스트",
+        "query": "",
+        "response": [],
+    }
+    with override_chat_model(FakeListChatModel(responses=["페르소나"])):
+        BaseWorkflow.clear_cache()
+        try:
+            result = TextWorkflow(TextState)().invoke(state)
+        finally:
+            BaseWorkflow.clear_cache()
+
+        assert result["model_route"]["tier"] == "light"
+        assert result["response"][-1].content == "페르소나"
+
+        node = PersonaExtractionNode(name="persona_extraction")
+        route = {"tier": "light", "model": "small", "max_tokens": 300, "reason": "test"}
+        routed = {**state, "model_route": route}
+        assert node.routed_chain(routed) is node.routed_chain(routed)
+        assert node.routed_chain(state) is node.chain
@@ -23,3 +23,49 @@ def test_node_empty() -> None:
     """
     # 예외가 발생하지 않으면 테스트 통과
     PersonaExtractionNode()
+
+
+def test_node_async_path() -> None:
+    """
+    LangGraph가 실행 방식에 따라 execute / aexecute를 자동으로 선택하는지 테스트합니다.
+
+    동기 실행(invoke)은 execute()를, 비동기 실행(ainvoke)은 aexecute()를 호출해야 합니다.
+    aexecute()를 구현하지 않은 노드는 execute()로 대체 실행되어야 합니다.
+
+    Returns:
+        None
+    """
+    import asyncio
+    from typing import TypedDict
+
+    from langgraph.graph import StateGraph
+
+    from agents.base_node import BaseNode
+
+    class PathState(TypedDict):
+        path: str
+
+    class AsyncAwareNode(BaseNode):
+        def execute(self, state) -> dict:
+            return {"path": "sync"}
+
+        async def aexecute(self, state) -> dict:
+            return {"path": "async"}
+
+    class SyncOnlyNode(BaseNode):
+        def execute(self, state) -> dict:
+            return {"path": "sync"}
+
+    def build(node):
+        builder = StateGraph(PathState)
+        builder.add_node("node", node)
+        builder.add_edge("__start__", "node")
+        builder.add_edge("node", "__end__")
+        return builder.compile()
+
+    graph = build(AsyncAwareNode())
+    assert graph.invoke({"path": ""})["path"] == "sync"
+    assert asyncio.run(graph.ainvoke({"path": ""}))["path"] == "async"
+
+    fallback = build(SyncOnlyNode())
+    assert asyncio.run(fallback.ainvoke({"path": ""}))["path"] == "sync"
@@ -0,0 +1,70 @@
+"""
+단위 테스트 모듈 - 페르소나 섹션 인덱스 테스트
+
+이 모듈은 PERSONA가 섹션 단위로 올바르게 분리되고,
+콘텐츠 유형에 따라 관련 섹션만 선택되는지 검증합니다.
+"""
+
+from agents.text.modules.persona import (
+    PERSONA,
+    PERSONA_SECTIONS,
+    classify_content_type,
+    get_persona_details,
+)
+
+
+def test_persona_sections_indexed() -> None:
+    """
+    PERSONA의 모든 섹션이 인덱스에 포함되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    assert list(PERSONA_SECTIONS) == [
+        "profile",
+        "vocal",
+        "music",
+        "lyrics",
+        "fashion",
+        "photo_style",
+        "big_five",
+        "hobbies",
+        "speech_style",
+        "guidelines",
+    ]
+
+
+def test_persona_sliced_by_content_type() -> None:
+    """
+    콘텐츠 유형에 관련된 섹션만 포함되고, 알 수 없는 유형은 전체 PERSONA를 사용하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    image = get_persona_details("이미지")
+    assert "### Fashion Style" in image
+    assert "### Social Media Feed Style" in image
+    assert "### Basic Personal Details" in image
+    assert "#### Music Genres" not in image
+
+    music = get_persona_details("음악")
+    assert music.count("### Voice & Music Style") == 1
+    assert "#### Voice and Timbre" in music
+    assert "### Fashion Style" not in music
+
+    assert get_persona_details("알 수 없는 유형") == PERSONA
+
+
+def test_content_type_keywords_match_whole_words() -> None:
+    """
+    영문 키워드는 단어 단위로, 한글 키워드는 조사가 붙어도 분류되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    # "post"를 포함하지만 소셜이 아님
+    assert classify_content_type("Movie Poster") == "image"
+    assert classify_content_type("Instagram posts") == "social"
+    assert classify_content_type("postcard") is None
+    assert classify_content_type("포스터를 위한 사진") == "image"
+    assert classify_content_type("소셜 미디어 포스트") == "social"
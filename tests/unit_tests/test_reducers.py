@@ -0,0 +1,69 @@
+"""
+단위 테스트 모듈 - 리듀서 테스트
+
+이 모듈은 bounded_messages 리듀서가 메시지 수 / 토큰 수 상한을 지키면서
+add_messages와 같은 방식으로 메시지를 병합하는지 검증합니다.
+"""
+
+from typing import Annotated, TypedDict
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import StateGraph
+
+from agents.reducers import SUMMARY_ID, bounded_messages
+
+
+def test_bounded_messages_trim() -> None:
+    """
+    상한을 넘으면 오래된 메시지가 삭제되고, 같은 ID의 메시지는 교체되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    reducer = bounded_messages(3)
+    messages = []
+    for index in range(5):
+        messages = reducer(messages, [HumanMessage(f"질문 {index}", id=str(index))])
+    assert [message.content for message in messages] == ["질문 2", "질문 3", "질문 4"]
+
+    messages = reducer(messages, [HumanMessage("수정된 질문", id="4")])
+    assert [message.content for message in messages][-1] == "수정된 질문"
+    assert len(messages) == 3
+
+    # 토큰 상한: 가장 최근 메시지는 상한을 넘더라도 유지
+    by_tokens = bounded_messages(max_tokens=10)
+    messages = by_tokens([], [AIMessage("짧은 답"), AIMessage("아주 " * 50)])
+    assert len(messages) == 1
+
+
+def test_bounded_messages_summarize() -> None:
+    """
+    삭제되는 메시지가 맨 앞의 요약 메시지 하나에 누적되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+
+    class ChatState(TypedDict):
+        response: Annotated[list, bounded_messages(2, strategy="summarize")]
+
+    builder = StateGraph(ChatState)
+    builder.add_node("answer", lambda state: {"response": [AIMessage("답변")]})
+    builder.add_edge("__start__", "answer")
+    builder.add_edge("answer", "__end__")
+    graph = builder.compile()
+
+    messages = []
+    for index in range(3):
+        state = {"response": messages + [HumanMessage(f"질문 {index}")]}
+        messages = graph.invoke(state)["response"]
+
+    summary, *recent = messages
+    assert summary.id == SUMMARY_ID
+    assert [message.content for message in recent] == ["질문 2", "답변"]
+    assert summary.content.splitlines() == [
+        "- human: 질문 0",
+        "- ai: 답변",
+        "- human: 질문 1",
+        "- ai: 답변",
+    ]
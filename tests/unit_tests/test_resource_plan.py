@@ -0,0 +1,131 @@
+"""
+단위 테스트 모듈 - 리소스 계획 구조화 출력 테스트
+
+구조화 출력 모드의 리소스 관리 노드가 JSON 출력을 검증하여 resource_plan에 딕셔너리로 저장하는지,
+산문 모드는 기존처럼 텍스트를 저장하는지 확인합니다.
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from agents.management.modules.schemas import parse_resource_plan
+
+PLAN = {
+    "overview": "여름 캠페인 영상 제작을 6주 안에 완료합니다.",
+    "allocations": [
+        {"category": "human", "item": "편집자", "detail": "Kim이 편집을 전담합니다."}
+    ],
+    "risks": [{"risk": "촬영 지연", "mitigation": "예비 촬영일을 확보합니다."}],
+    "implementation_steps": ["기획 확정", "촬영", "편집"],
+    "recommendations": ["주간 점검 회의를 진행합니다."],
+}
+STATE = {
+    "project_id": "PRJ-2023-001",
+    "request_type": "resource_allocation",
+    "query": "여름 캠페인 리소스 계획",
+    "team_members": ["Kim", "Lee"],
+    "response": [],
+}
+
+
+def test_parse_resource_plan() -> None:
+    """
+    코드 블록으로 감싼 JSON도 검증하고, 스키마와 맞지 않으면 예외가 발생하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    text = json.dumps(PLAN, ensure_ascii=False)
+    assert parse_resource_plan(text) == PLAN
+    assert parse_resource_plan(f"```json\n{text}\n```") == PLAN
+
+    with pytest.raises(ValidationError):
+        parse_resource_plan("## 1. PROJECT OVERVIEW")
+    with pytest.raises(ValidationError):
+        parse_resource_plan('{"allocations": []}')  # overview 누락
+
+
+def test_structured_resource_management_node() -> None:
+    """
+    구조화 출력 모드에서는 resource_plan이 딕셔너리, 산문 모드에서는 텍스트인지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from agents.management.modules.nodes import ResourceManagementNode
+    from agents.model_registry import override_chat_model
+
+    text = json.dumps(PLAN, ensure_ascii=False)
+    with override_chat_model(FakeListChatModel(responses=[text])):
+        structured = ResourceManagementNode(structured=True).execute(dict(STATE))
+        prose = ResourceManagementNode(structured=False).execute(dict(STATE))
+
+    assert structured["resource_plan"] == PLAN
+    assert structured["response"] == text
+    assert prose["resource_plan"] == text
+
+
+def test_truncated_structured_plan_falls_back() -> None:
+    """
+    생성 토큰 상한에서 잘린 JSON은 더 큰 상한으로 다시 생성하고, 그래도 실패하면 산문 계획을 사용하는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from agents.management.modules.nodes import ResourceManagementNode
+    from agents.model_registry import override_chat_model
+
+    text = json.dumps(PLAN, ensure_ascii=False)
+    truncated = text[: len(text) // 2]
+    with override_chat_model(FakeListChatModel(responses=[truncated, text])):
+        retried = ResourceManagementNode(structured=True).execute(dict(STATE))
+    with override_chat_model(
+        FakeListChatModel(responses=[truncated, truncated, "## 1. PROJECT OVERVIEW"])
+    ):
+        prose = ResourceManagementNode(structured=True).execute(dict(STATE))
+
+    assert retried["resource_plan"] == PLAN
+    assert prose["resource_plan"] == prose["response"] == "## 1. PROJECT OVERVIEW"
+
+
+def test_fallback_streams_only_accepted_output(monkeypatch) -> None:
+    """
+    구조화 출력이 검증에 실패해 다시 생성하거나 산문 체인으로 대체해도, 전달된 스트림 조각을
+    이어 붙이면 response와 같은지 테스트합니다.
+
+    Returns:
+        None
+    """
+    import asyncio
+
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from agents import base_node
+    from agents.management.modules.nodes import ResourceManagementNode
+    from agents.model_registry import override_chat_model
+
+    events = []
+    monkeypatch.setattr(base_node, "_stream_writer", lambda: events.append)
+    text = json.dumps(PLAN, ensure_ascii=False)
+    truncated = text[: len(text) // 2]
+    cases = [
+        [text],
+        [truncated, text],
+        [truncated, truncated, "## 1. PROJECT OVERVIEW"],
+    ]
+    for responses in cases:
+        for run in (
+            lambda node: node.execute(dict(STATE)),
+            lambda node: asyncio.run(node.aexecute(dict(STATE))),
+        ):
+            events.clear()
+            with override_chat_model(FakeListChatModel(responses=responses)):
+                output = run(ResourceManagementNode(structured=True))
+            assert "".join(event["chunk"] for event in events) == output["response"]
+            assert output["response"] == responses[-1]
@@ -0,0 +1,138 @@
+"""
+단위 테스트 모듈 - 프로젝트 일정 엔진 테스트
+
+주 공정과 여유 시간 계산, 작업 기간 변경 시 증분 계산 결과가 전체 재계산과 같은지,
+리소스 평준화가 용량을 지키는지, 일정 요약이 리소스 관리 노드의 체인 입력으로 전달되는지 확인합니다.
+"""
+
+import random
+from datetime import datetime
+from itertools import pairwise
+
+import numpy as np
+import pytest
+
+from agents.management.modules.schedule import ScheduleEngine, set_schedule_engines
+
+TASKS = [
+    {"task_id": "plan", "name": "기획", "duration": 5},
+    {"task_id": "shoot", "name": "촬영", "duration": 10, "depends_on": ["plan"]},
+    {
+        "task_id": "music",
+        "name": "음악",
+        "duration": 4,
+        "depends_on": ["plan"],
+        "resource": "editor",
+    },
+    {
+        "task_id": "edit",
+        "name": "편집",
+        "duration": 6,
+        "depends_on": ["shoot"],
+        "resource": "editor",
+    },
+    {
+        "task_id": "teaser",
+        "name": "티저",
+        "duration": 3,
+        "depends_on": ["shoot"],
+        "resource": "editor",
+    },
+    {
+        "task_id": "release",
+        "name": "공개",
+        "duration": 1,
+        "depends_on": ["edit", "music", "teaser"],
+    },
+]
+
+
+def test_critical_path_and_slack() -> None:
+    """
+    주 공정, 여유 시간, 리소스 평준화 일정과 순환 검사를 테스트합니다.
+
+    Returns:
+        None
+    """
+    engine = ScheduleEngine.from_tasks(TASKS, start=datetime(2025, 6, 1))
+    assert engine.duration == 22
+    assert engine.critical_path() == ["plan", "shoot", "edit", "release"]
+    assert engine.slack.tolist() == [0, 0, 12, 0, 3, 0]
+
+    # editor 용량 1: 편집과 티저가 겹치지 않도록 하나가 늦춰짐
+    start, finish = engine.leveled()
+    editor = [engine.task_ids.index(t) for t in ("music", "edit", "teaser")]
+    intervals = sorted(zip(start[editor], finish[editor]))
+    assert all(a[1] <= b[0] for a, b in pairwise(intervals))
+    summary = engine.summary()
+    assert summary["leveled_duration_days"] == 25.0
+    assert summary["end"] == "2025-06-23"
+    assert summary["resource_delay_days"] == {"editor": 6.0}
+
+    # 요약은 캐시되고, 작업 기간이 바뀌면 다시 계산됨
+    assert engine.summary() == summary
+    assert engine.summary()["critical_path"] is summary["critical_path"]
+    engine.update_duration("shoot", 13)
+    assert engine.summary()["duration_days"] == 25.0
+
+    # 용량 2이면 평준화로 늦어지지 않음
+    relaxed = ScheduleEngine.from_tasks(TASKS, capacities={"editor": 2})
+    assert relaxed.summary()["leveled_duration_days"] == 22.0
+
+    with pytest.raises(ValueError):
+        ScheduleEngine(["a", "b"], [1, 1], [("a", "b"), ("b", "a")])
+
+
+def test_incremental_update_matches_rebuild() -> None:
+    """
+    무작위 DAG에서 작업 기간을 바꿀 때 증분 계산 결과가 새로 만든 엔진과 같은지 테스트합니다.
+
+    Returns:
+        None
+    """
+    rng = random.Random(0)
+    size = 400
+    task_ids = [f"t{i}" for i in range(size)]
+    durations = [rng.uniform(0, 10) for _ in range(size)]
+    dependencies = [
+        (f"t{j}", f"t{i}")
+        for i in range(1, size)
+        for j in rng.sample(range(i), min(i, rng.randint(0, 3)))
+    ]
+    engine = ScheduleEngine(task_ids, durations, dependencies)
+    for _ in range(30):
+        task = rng.randrange(size)
+        durations[task] = rng.uniform(0, 20)
+        engine.update_duration(task_ids[task], durations[task])
+
+    rebuilt = ScheduleEngine(task_ids, durations, dependencies)
+    assert engine.duration == pytest.approx(rebuilt.duration)
+    assert np.allclose(engine.earliest_start, rebuilt.earliest_start)
+    assert np.allclose(engine.latest_start, rebuilt.latest_start)
+    assert engine.critical_path() == rebuilt.critical_path()
+
+
+def test_schedule_summary_in_chain_input() -> None:
+    """
+    get_project_schedule 도구의 요약이 리소스 관리 노드의 체인 입력에 포함되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    import json
+
+    from agents.management.modules.nodes import ResourceManagementNode
+    from agents.management.modules.tools import get_project_schedule
+
+    state = {"project_id": "PRJ-1", "request_type": "resource_allocation", "query": ""}
+    set_schedule_engines({"PRJ-1": ScheduleEngine.from_tasks(TASKS)})
+    try:
+        summary = get_project_schedule("PRJ-1")
+        chain_input = ResourceManagementNode(structured=False)._chain_input(state)
+        assert get_project_schedule("PRJ-404") == {}
+    finally:
+        set_schedule_engines(None)
+
+    assert summary["project_id"] == "PRJ-1"
+    assert summary["critical_path"] == ["기획", "촬영", "편집", "공개"]
+    assert json.loads(chain_input["schedule_summary"]) == summary
@@ -0,0 +1,77 @@
+"""
+단위 테스트 모듈 - 스트리밍 테스트
+
+LLM 노드가 생성한 조각을 사용자 정의 스트림 이벤트로 즉시 전달하는지,
+첫 토큰까지의 시간(TTFT)이 전체 생성 시간보다 충분히 짧은지 확인합니다.
+"""
+
+import asyncio
+import time
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+
+from agents.model_registry import override_chat_model
+from agents.text.workflow import text_workflow
+
+FIRST_TOKEN_DELAY = 0.05  # 첫 토큰까지의 지연 시간 (초)
+TOKEN_INTERVAL = 0.02  # 이후 토큰 사이의 간격 (초)
+WORDS = ["니제는", "밝고", "에너지", "넘치는", "버추얼", "아이돌입니다."] * 3
+
+
+class SlowStreamingModel(GenericFakeChatModel):
+    """
+    첫 토큰 전에 지연이 있고, 이후 토큰을 일정 간격으로 생성하는 가짜 모델
+    """
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(FIRST_TOKEN_DELAY)
+        for index, word in enumerate(WORDS):
+            if index:
+                await asyncio.sleep(TOKEN_INTERVAL)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=f"{word} "))
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+
+def test_persona_extraction_streams_tokens() -> None:
+    """
+    text_workflow를 스트리밍 실행했을 때 조각이 즉시 전달되고,
+    최종 상태에는 전체 텍스트가 포함되는지 테스트합니다.
+
+    Returns:
+        None
+    """
+    model = SlowStreamingModel(messages=iter([AIMessage(content="")]))
+    state = {
+        "content_topic": "여름 휴가",
+        "content_type": "블로그 글",
+        "query": "",
+        "response": [],
+    }
+
+    async def run() -> tuple[float, float, list[str], dict]:
+        start = time.perf_counter()
+        first_token, chunks, final = None, [], None
+        async for mode, data in text_workflow().astream(
+            state, stream_mode=["custom", "values"]
+        ):
+            if mode == "custom":
+                first_token = first_token or time.perf_counter() - start
+                chunks.append(data["chunk"])
+            else:
+                final = data
+        return first_token, time.perf_counter() - start, chunks, final
+
+    with override_chat_model(model):
+        text_workflow.invalidate()
+        try:
+            ttft, total, chunks, final = asyncio.run(run())
+        finally:
+            text_workflow.invalidate()
+
+    assert len(chunks) == len(WORDS)
+    assert ttft < total / 2, f"TTFT {ttft:.3f}s / total {total:.3f}s"
+    assert final["response"][-1].content == "".join(chunks)
@@ -0,0 +1,116 @@
+"""
+단위 테스트 모듈 - Workflow 테스트
+
+이 모듈은 BaseWorkflow의 컴파일된 그래프 캐시 동작을 검증합니다.
+"""
+
+import pytest
+
+from agents.base_workflow import BaseWorkflow
+from agents.image.modules.state import ImageState
+from agents.image.workflow import ImageWorkflow
+from agents.music.modules.state import MusicState
+from agents.music.workflow import MusicWorkflow
+
+
+def test_workflow_graph_is_cached() -> None:
+    """
+    같은 클래스, 상태, 빌드 옵션이면 동일한 컴파일된 그래프를 재사용하는지 테스트합니다.
+    """
+    BaseWorkflow.clear_cache()
+
+    first = ImageWorkflow(ImageState)()
+    second = ImageWorkflow(ImageState)()
+    assert first is second
+
+    # 빌드 옵션이 다르면 별도의 그래프가 생성됨
+    assert ImageWorkflow(ImageState, variant="other")() is not first
+
+
+def test_workflow_cache_key_options_and_checkpointer(tmp_path, monkeypatch) -> None:
+    """
+    해시할 수 없는 빌드 옵션은 거부하고, 환경변수로 지정한 체크포인터가 바뀌면 다른 그래프를 사용하는지 테스트합니다.
+    """
+    BaseWorkflow.clear_cache()
+    with pytest.raises(TypeError):
+        ImageWorkflow(ImageState, variant=bytearray(b"x"))()
+
+    monkeypatch.delenv("WORKFLOW_CHECKPOINT_DB", raising=False)
+    plain = ImageWorkflow(ImageState)()
+    monkeypatch.setenv("WORKFLOW_CHECKPOINT_DB", str(tmp_path / "checkpoints.sqlite"))
+    checkpointed = ImageWorkflow(ImageState)()
+    assert checkpointed is not plain
+    assert checkpointed.checkpointer is not None
+    assert ImageWorkflow(ImageState)() is checkpointed
+
+
+def test_workflow_cache_invalidation() -> None:
+    """
+    invalidate()와 clear_cache()가 캐시를 올바르게 삭제하는지 테스트합니다.
+    """
+    BaseWorkflow.clear_cache()
+
+    image_workflow = ImageWorkflow(ImageState)
+    music_workflow = MusicWorkflow(MusicState)
+    image_graph = image_workflow()
+    music_graph = music_workflow()
+
+    assert image_workflow.invalidate() is True
+    assert image_workflow.invalidate() is False
+    assert image_workflow() is not image_graph
+
+    # 하위 클래스에서 호출하면 해당 클래스의 캐시만 삭제
+    ImageWorkflow.clear_cache()
+    assert music_workflow() is music_graph
+
+
+def test_main_workflow_fan_out() -> None:
+    """
+    메인 Workflow가 에이전트 분기를 병렬로 실행하고,
+    제한 시간을 넘긴 분기만 agent_errors에 기록하는지 테스트합니다.
+    """
+    import asyncio
+    import time
+
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from agents.main_state import MainState
+    from agents.model_registry import override_chat_model
+    from agents.workflow import MainWorkflow
+
+    latency = 0.2  # 분기별 LLM 응답 지연 시간 (초)
+    state = {
+        "content_topic": "여름 휴가",
+        "content_type": "블로그 글",
+        "project_id": "PRJ-2023-001",
+        "request_type": "resource_allocation",
+        "query": "여름 캠페인 준비",
+        "response": [],
+    }
+
+    with override_chat_model(FakeListChatModel(responses=["완"], sleep=latency)):
+        BaseWorkflow.clear_cache()
+        try:
+            graph = MainWorkflow(MainState, agents=("text", "management"))()
+            start = time.perf_counter()
+            result = asyncio.run(graph.ainvoke(state))
+            elapsed = time.perf_counter() - start
+
+            timed_out = MainWorkflow(
+                MainState, agents=("text", "management"), timeouts={"management": 0.05}
+            )()
+            partial = asyncio.run(timed_out.ainvoke(state))
+            partial_sync = timed_out.invoke(state)  # 동기 실행: 단계마다 제한 시간 확인
+        finally:
+            BaseWorkflow.clear_cache()
+
+    # 두 분기가 동시에 실행되므로 전체 시간은 지연 시간의 합보다 짧음
+    assert elapsed < latency * 2
+    assert result["agent_outputs"] == {"text": "완", "management": "완"}
+    assert not result["agent_errors"]
+
+    assert partial["agent_outputs"]["text"] == "완"
+    assert partial["agent_outputs"]["management"] is None
+    assert set(partial["agent_errors"]) == {"management"}
+    assert partial_sync["agent_outputs"] == {"text": "완", "management": None}
+    assert set(partial_sync["agent_errors"]) == {"management"}